@@ -0,0 +1,44 @@
+
+# concept_space_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'COMMA LBR LPAREN PLUS RBR RPAREN SYMBOL TILDA TIMESexpr : litexpr : LPAREN prod RPARENexpr : LPAREN sum RPARENterm : SYMBOLterms : terms : termterms : terms COMMA termatom : SYMBOL LPAREN terms RPARENlit : atomlit : TILDA atomprod : expr TIMES exprprod : prod TIMES exprsum : expr PLUS exprsum : sum PLUS expr'
+    
+_lr_action_items = {'RPAREN':([2,5,7,9,10,11,15,16,18,19,20,21,22,23,24,25,27,],[-1,-9,-10,15,16,-5,-3,-2,-6,-4,25,-13,-11,-14,-12,-8,-7,]),'SYMBOL':([0,3,4,11,12,13,14,17,26,],[6,6,6,19,6,6,6,6,19,]),'TIMES':([2,5,7,8,10,15,16,22,24,25,],[-1,-9,-10,13,17,-3,-2,-11,-12,-8,]),'TILDA':([0,4,12,13,14,17,],[3,3,3,3,3,3,]),'PLUS':([2,5,7,8,9,15,16,21,23,25,],[-1,-9,-10,12,14,-3,-2,-13,-14,-8,]),'LPAREN':([0,4,6,12,13,14,17,],[4,4,11,4,4,4,4,]),'COMMA':([11,18,19,20,27,],[-5,-6,-4,26,-7,]),'$end':([1,2,5,7,15,16,25,],[0,-1,-9,-10,-3,-2,-8,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'term':([11,26,],[18,27,]),'terms':([11,],[20,]),'expr':([0,4,12,13,14,17,],[1,8,21,22,23,24,]),'sum':([4,],[9,]),'lit':([0,4,12,13,14,17,],[2,2,2,2,2,2,]),'atom':([0,3,4,12,13,14,17,],[5,7,5,5,5,5,5,]),'prod':([4,],[10,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> expr","S'",1,None,None,None),
+  ('expr -> lit','expr',1,'p_expr_lit','ivy_concept_space.py',123),
+  ('expr -> LPAREN prod RPAREN','expr',3,'p_expr_prod','ivy_concept_space.py',127),
+  ('expr -> LPAREN sum RPAREN','expr',3,'p_expr_sum','ivy_concept_space.py',131),
+  ('term -> SYMBOL','term',1,'p_term_symbol','ivy_concept_space.py',135),
+  ('terms -> <empty>','terms',0,'p_terms','ivy_concept_space.py',139),
+  ('terms -> term','terms',1,'p_terms_term','ivy_concept_space.py',143),
+  ('terms -> terms COMMA term','terms',3,'p_terms_terms_term','ivy_concept_space.py',147),
+  ('atom -> SYMBOL LPAREN terms RPAREN','atom',4,'p_atom_terms','ivy_concept_space.py',152),
+  ('lit -> atom','lit',1,'p_lit_atom','ivy_concept_space.py',156),
+  ('lit -> TILDA atom','lit',2,'p_lit_tilda_atom','ivy_concept_space.py',160),
+  ('prod -> expr TIMES expr','prod',3,'p_prod_expr_expr','ivy_concept_space.py',164),
+  ('prod -> prod TIMES expr','prod',3,'p_prod_prod_expr','ivy_concept_space.py',168),
+  ('sum -> expr PLUS expr','sum',3,'p_sum_expr_expr','ivy_concept_space.py',173),
+  ('sum -> sum PLUS expr','sum',3,'p_sum_sum_expr','ivy_concept_space.py',177),
+]
@@ -0,0 +1,51 @@
+
+# ev_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'COLON COMMA GT LBR LCB LPAREN LT RBR RCB RPAREN SEMI SYMBOLevents : events : events eventevent : optdir SYMBOL optargs optsubsoptdir : optdir : GToptdir : LToptsubs : optsubs : SEMIoptsubs : LCB events RCBvalue : SYMBOLvalue : SYMBOL LPAREN list RPARENlist : valuelist : list COMMA valuevalue : LBR RBRvalue : LBR list RBRdict : SYMBOL COLON valuedict : dict COMMA SYMBOL COLON valuevalue : LCB RCBvalue : LCB dict RCBoptargs : optargs : LPAREN list RPAREN'
+    
+_lr_action_items = {'GT':([0,1,3,6,8,14,15,16,20,25,32,],[-1,2,-2,-20,-7,-8,-3,-1,-21,2,-9,]),'RPAREN':([10,11,12,18,24,26,27,28,31,33,],[-10,20,-12,-14,-18,-15,33,-13,-19,-11,]),'SEMI':([6,8,20,],[-20,14,-21,]),'SYMBOL':([0,1,2,3,4,5,6,7,8,9,13,14,15,16,19,20,21,25,29,30,32,36,],[-1,-4,-5,-2,-6,6,-20,10,-7,10,22,-8,-3,-1,10,-21,10,-4,10,35,-9,10,]),'COLON':([22,35,],[29,36,]),'RBR':([9,10,12,17,18,24,26,28,31,33,],[18,-10,-12,26,-14,-18,-15,-13,-19,-11,]),'LT':([0,1,3,6,8,14,15,16,20,25,32,],[-1,4,-2,-20,-7,-8,-3,-1,-21,4,-9,]),'LBR':([7,9,19,21,29,36,],[9,9,9,9,9,9,]),'LCB':([6,7,8,9,19,20,21,29,36,],[-20,13,16,13,13,-21,13,13,13,]),'LPAREN':([6,10,],[7,19,]),'COMMA':([10,11,12,17,18,23,24,26,27,28,31,33,34,37,],[-10,21,-12,21,-14,30,-18,-15,21,-13,-19,-11,-16,-17,]),'RCB':([3,6,8,10,13,14,15,16,18,20,23,24,25,26,31,32,33,34,37,],[-2,-20,-7,-10,24,-8,-3,-1,-14,-21,31,-18,32,-15,-19,-9,-11,-16,-17,]),'$end':([0,1,3,6,8,14,15,20,32,],[-1,0,-2,-20,-7,-8,-3,-21,-9,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'list':([7,9,19,],[11,17,27,]),'optsubs':([8,],[15,]),'value':([7,9,19,21,29,36,],[12,12,12,28,34,37,]),'event':([1,25,],[3,3,]),'dict':([13,],[23,]),'events':([0,16,],[1,25,]),'optdir':([1,25,],[5,5,]),'optargs':([6,],[8,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> events","S'",1,None,None,None),
+  ('events -> <empty>','events',0,'p_events','ivy_ev_parser.py',457),
+  ('events -> events event','events',2,'p_events_events_event','ivy_ev_parser.py',461),
+  ('event -> optdir SYMBOL optargs optsubs','event',4,'p_event_optdir_name_optargs_optsubs','ivy_ev_parser.py',466),
+  ('optdir -> <empty>','optdir',0,'p_optdir','ivy_ev_parser.py',470),
+  ('optdir -> GT','optdir',1,'p_optdir_gt','ivy_ev_parser.py',474),
+  ('optdir -> LT','optdir',1,'p_optdir_lt','ivy_ev_parser.py',478),
+  ('optsubs -> <empty>','optsubs',0,'p_optsubs','ivy_ev_parser.py',482),
+  ('optsubs -> SEMI','optsubs',1,'p_optsubs_semi','ivy_ev_parser.py',486),
+  ('optsubs -> LCB events RCB','optsubs',3,'p_optsubs_lcb_events_rcb','ivy_ev_parser.py',490),
+  ('value -> SYMBOL','value',1,'p_value_symbol','ivy_ev_parser.py',494),
+  ('value -> SYMBOL LPAREN list RPAREN','value',4,'p_value_symbol_lparen_list_rparen','ivy_ev_parser.py',498),
+  ('list -> value','list',1,'p_list_value','ivy_ev_parser.py',502),
+  ('list -> list COMMA value','list',3,'p_list_list_comma_value','ivy_ev_parser.py',506),
+  ('value -> LBR RBR','value',2,'p_value_lbr_rbr','ivy_ev_parser.py',511),
+  ('value -> LBR list RBR','value',3,'p_value_lbr_list_rbr','ivy_ev_parser.py',515),
+  ('dict -> SYMBOL COLON value','dict',3,'p_dict_symbol_colon_value','ivy_ev_parser.py',519),
+  ('dict -> dict COMMA SYMBOL COLON value','dict',5,'p_dict_dict_comma_key_colon_value','ivy_ev_parser.py',523),
+  ('value -> LCB RCB','value',2,'p_value_lcb_rcb','ivy_ev_parser.py',528),
+  ('value -> LCB dict RCB','value',3,'p_value_lcb_dict_rcb','ivy_ev_parser.py',532),
+  ('optargs -> <empty>','optargs',0,'p_optargs','ivy_ev_parser.py',536),
+  ('optargs -> LPAREN list RPAREN','optargs',3,'p_optargs_lp_args_rp','ivy_ev_parser.py',540),
+]
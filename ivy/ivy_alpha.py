@@ -3,6 +3,7 @@
 #
 import sys
 import itertools
+import weakref
 from collections import defaultdict
 import z3
 
@@ -11,42 +12,128 @@ from ivy_solver import *
 from ivy_logic_utils import *
 from ivy_concept_space import *
 from ivy_utils import Parameter
+import logic as lg
 
 test_bottom = True
 
+opt_jobs = Parameter("alpha_jobs","1")
+
+# The results of cube tests are cached per domain, so that they are
+# shared by all the states of the domain, for example the states of an
+# AnalysisGraph. See TheoryIndex for the keys.
+
+cube_caches = weakref.WeakKeyDictionary()
+
 def alpha(state):
 #    print "prestate: {}".format(state.clauses)
-    d = ProgressiveDomain(state.domain.concept_spaces,verbose = False)
+    cache = cube_caches.setdefault(state.domain,dict())
+    d = ProgressiveDomain(state.domain.concept_spaces,verbose = False,cache = cache)
     state.clauses = d.post(state.clauses,state.domain.background_theory(state.in_scope),{},[])
 #    print "poststate: {}".format(state.clauses)
     
 #log = Parameter("log.alpha")
 log = False
 
+def dependencies_ast(ast,res):
+    """ Add to res the symbols in ast, and the sorts of its variables
+    and equalities, since these can constrain the size of a sort """
+    if isinstance(ast,Variable):
+        res.add(ast.sort)
+    elif is_eq(ast):
+        if ast.args[0].sort != lg.Boolean:
+            res.add(ast.args[0].sort)
+    elif is_app(ast):
+        res.add(ast.rep)
+    for arg in ast.args:
+        dependencies_ast(arg,res)
+
+class TheoryIndex(object):
+    """ Splits the formulas of a theory into components that have no
+    dependencies in common. Whether a cube is satisfiable in the
+    theory depends only on the components sharing a dependency with
+    the cube, and the formulas with no dependencies (such as
+    false). The set of these components is a structural key for the
+    part of the theory relevant to the cube, so states that differ
+    only in the facts about other symbols share results. """
+
+    def __init__(self,fmlas):
+        reps = dict()
+        def find(x):
+            while reps[x] is not x:
+                x = reps[x]
+            return x
+        fmla_deps = []
+        common = []
+        for fmla in fmlas:
+            deps = set()
+            dependencies_ast(fmla,deps)
+            if not deps:
+                common.append(fmla)
+                continue
+            fmla_deps.append((fmla,deps))
+            roots = set(find(reps.setdefault(d,d)) for d in deps)
+            root = roots.pop()
+            for r in roots:
+                reps[r] = root
+        comps = defaultdict(list)
+        for fmla,deps in fmla_deps:
+            comps[find(next(iter(deps)))].append(fmla)
+        comp_keys = dict((r,frozenset(fs)) for r,fs in comps.iteritems())
+        self.component = dict((d,comp_keys[find(d)]) for d in reps)
+        self.common = frozenset(common)
+        self.all = (self.common,frozenset(comp_keys.values()))
+
+    def key(self,deps):
+        return (self.common,frozenset(self.component[d] for d in deps if d in self.component))
+
+def space_refs(space):
+    """ The names of the concept spaces that a concept space refers to """
+    if isinstance(space,NamedSpace):
+        atom = space.lit.atom
+        return set([atom.relname]) if space.lit.polarity == 1 and is_atom(atom) else set()
+    return set().union(*[space_refs(s) for s in space.args])
+
+def independent_waves(concept_spaces):
+    """ Group the concept spaces into waves, such that each space
+    refers only to spaces in earlier waves """
+    level = dict()
+    levels = []
+    for atom,cs in concept_spaces:
+        lvl = 1 + max([level[n] for n in space_refs(cs) if n in level] + [-1])
+        level[atom.relname] = lvl
+        levels.append(lvl)
+    return [[x for x,l in zip(concept_spaces,levels) if l == lvl]
+            for lvl in range(max(levels + [-1]) + 1)]
+
+# The domain being evaluated by the worker processes.
+worker_domain = None
+
+def enumerate_in_worker(idx):
+    return worker_domain.enumerate_space(worker_domain.wave[idx])
+
 class ProgressiveDomain(object):
-    def __init__(self, cs = [], verbose = True):
+    def __init__(self, cs = [], verbose = True, cache = None):
         self.concept_spaces = cs
         self.verbose = verbose
+        self.cache = cache if cache is not None else dict()
     
     def add_concept_space(self, atom, space):
         self.concept_spaces.append((atom, space))
 
-    #TODO: this breaks abstraction. need to be able to hash formulas
-    def cube_id(self,cube):
-        z3_cube = cube_to_z3(cube)
-        self.z3_cubes.append(z3_cube) # just to bump reference count
-        id = get_id(z3_cube)
-#        print "id: %s: %s" % (cube,id)
-        return id
+    def cube_key(self,cube):
+        deps = set()
+        for lit in cube:
+            dependencies_ast(lit,deps)
+        return (tuple((lit.polarity,lit.atom) for lit in cube),self.index.key(deps))
 
     def inhabited_cube(self,cube,truth=True,witness=None):
-        cube = canonize_clause(cube)
-        id = self.cube_id(cube)
-        if id not in self.inhabited_cubes:
+        cube = canonize_clause(rename_clause(cube,self.new_sym))
+        key = self.cube_key(cube)
+        if key not in self.inhabited_cubes:
             if log:
                 print "inhabited: %s" % cube
 #            print "witness: %s" % witness
-            self.inhabited_cubes[id] = truth
+            self.inhabited_cubes[key] = truth
 
     def model_check(self):
         return
@@ -68,68 +155,129 @@ class ProgressiveDomain(object):
     def inhabited_lit(self,lit):
         self.inhabited_cube([lit])
 
+    def get_solver(self):
+        if self.solver is None:
+            self.solver = new_solver()
+            add_clauses(self.solver, self.theory)
+        return self.solver
 
     def unfold_defs(self,cube):
+        """ Add the definition instances for cube to the solver. Returns
+        true if there are none. """
         insts = definition_instances(cube_to_formula(cube))
-        add_clauses(self.solver, insts)
-
+        add_clauses(self.get_solver(), insts)
+        return not insts.fmlas
 
     def test_cube(self,cube):
-        canon_cube = canonize_clause(cube)
+        rcube = rename_clause(cube,self.new_sym)
+        canon_cube = canonize_clause(rcube)
         if log:
             print "cube: {}".format([str(c) for c in canon_cube])
-        my_id = self.cube_id(canon_cube)
-        if my_id in self.inhabited_cubes:
+        key = self.cube_key(canon_cube)
+        if key in self.inhabited_cubes:
             if log:
                 print "cached: %s" % [str(c) for c in cube]
-            return self.inhabited_cubes[my_id]
-        if log:
-            print "test: %s" % [str(c) for c in cube]
-        cube = rename_clause(cube,self.new_sym)
-        vs = used_variables_clause(cube)
-        # TODO: these constants need to have right sorts
-        subs = dict((v.rep,var_to_skolem('__c',v)) for v in vs)
-        scube = substitute_clause(cube,subs)
-        self.unfold_defs(scube)
-        res = check_cube(self.solver,scube,self.cube_memo,memo_unsat_only = True)
-        if res:
-            if len(cube) <= 4:
-                self.model_check()
+            return self.inhabited_cubes[key]
+        if key in self.cache:
+            res = self.cache[key]
         else:
-            self.inferred.append([~lit for lit in cube])
+            if log:
+                print "test: %s" % [str(c) for c in cube]
+            vs = used_variables_clause(rcube)
+            # TODO: these constants need to have right sorts
+            subs = dict((v.rep,var_to_skolem('__c',v)) for v in vs)
+            scube = substitute_clause(rcube,subs)
+            exact = self.unfold_defs(scube)
+            res = check_cube(self.get_solver(),scube,self.cube_memo,memo_unsat_only = True)
+            if res:
+                if len(cube) <= 4:
+                    self.model_check()
+            # A cube found inhabited may be spurious if definitions
+            # were instantiated, since the instances are only
+            # partial, so we cache only exact results.
+            if not res or exact:
+                self.cache[key] = res
+                self.added.append((key,res))
+        if not res:
+            self.inferred.append([~lit for lit in rcube])
             if log:
                 print "uninhabited: %s" % [str(c) for c in canon_cube]
-            self.inhabited_cubes[my_id] = False
+            self.inhabited_cubes[key] = False
         return res
 
     def post_init(self,theory,background_theory,new_sym,to_keep):
         self.new_sym = new_sym
-        self.solver = new_solver()        
+        self.theory = and_clauses(theory,background_theory)
+        self.index = TheoryIndex(self.theory.fmlas + [d.to_constraint() for d in self.theory.defs])
+        self.solver = None
         self.cube_memo = dict()
         self.inhabited_cubes = dict()
-        self.z3_cubes = []
+        self.added = []
         self.memo = dict()
         if log:
             print "concrete state: %s" % theory
             print "background: %s" % background_theory
-        add_clauses(self.solver, and_clauses(theory,background_theory))
-        self.unsat = test_bottom and self.solver.check() == z3.unsat
-        if self.unsat:
-            print "core: %s" % unsat_core(and_clauses(theory,background_theory),true_clauses())
-        
+        self.unsat = False
+        if test_bottom:
+            key = ('bottom',self.index.all)
+            if key not in self.cache:
+                self.cache[key] = self.get_solver().check() == z3.unsat
+                if self.cache[key]:
+                    print "core: %s" % unsat_core(and_clauses(theory,background_theory),true_clauses())
+            self.unsat = self.cache[key]
+
+    def enumerate_space(self,concept_space):
+        """ Enumerate the concepts of a space. Returns the concepts, the
+        clauses inferred and the new cache entries. """
+        atom,cs = concept_space
+        self.inferred = []
+        self.added = []
+        if log:
+            print "concept space: %s" % atom
+        concepts = cs.enumerate(self.memo,self.test_cube)
+        if log:
+            print "result: {}".format([str(c) for c in concepts])
+        return concepts,self.inferred,self.added
+
+    def enumerate_wave(self,wave,jobs):
+        """ Enumerate independent concept spaces in worker processes """
+        global worker_domain
+        import multiprocessing
+        self.wave = wave
+        solver,cube_memo = self.solver,self.cube_memo
+        self.solver,self.cube_memo = None,dict() # workers create their own solvers
+        worker_domain = self
+        try:
+            pool = multiprocessing.Pool(min(jobs,len(wave)))
+            results = pool.map(enumerate_in_worker,range(len(wave)))
+            pool.close()
+            pool.join()
+        finally:
+            worker_domain = None
+            self.solver,self.cube_memo = solver,cube_memo
+            del self.wave
+        for concepts,inferred,added in results:
+            for key,res in added:
+                self.cache[key] = res
+                if not res:
+                    self.inhabited_cubes[key] = False
+        return results
+
     def post_step(self,concept_spaces):
         if self.unsat:
             return false_clauses()
-        self.inferred = []
+        res = []
 #        print "cs: {}".format(concept_spaces)
-        for atom,cs in concept_spaces:
-            if log:
-                print "concept space: %s" % atom
-            concepts = cs.enumerate(self.memo,self.test_cube)
-            if log:
-                print "result: {}".format([str(c) for c in concepts])
-            self.memo[atom.relname] = ([t.rep for t in atom.args], concepts)
-        res = self.inferred
+        jobs = int(opt_jobs.get())
+        waves = independent_waves(concept_spaces) if jobs > 1 else [[x] for x in concept_spaces]
+        for wave in waves:
+            if len(wave) > 1:
+                results = self.enumerate_wave(wave,jobs)
+            else:
+                results = [self.enumerate_space(x) for x in wave]
+            for (atom,cs),(concepts,inferred,added) in zip(wave,results):
+                self.memo[atom.relname] = ([t.rep for t in atom.args], concepts)
+                res.extend(inferred)
         if log:
             print "inferred: {}".format([[str(c) for c in cls] for cls in res])
         del self.inferred
@@ -137,9 +285,11 @@ class ProgressiveDomain(object):
 
     def post_quit(self):
         del self.new_sym
+        del self.theory
+        del self.index
         del self.cube_memo
         del self.inhabited_cubes
-        del self.z3_cubes
+        del self.added
         del self.solver
         del self.unsat
         del self.memo
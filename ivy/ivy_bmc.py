@@ -2,24 +2,246 @@
 # Copyright (c) Microsoft Corporation. All Rights Reserved.
 #
 """
-Script to create a new notebook for a given .ivy file, that is
-used to BMC the conjectures to debug the model.
+Bounded model checking of an Ivy program.
 
 Usage:
-python ivy_bmc.py ivy_filename
+ivy_bmc [isolate=iso] [bound=n] [format=text|json] [jobs=n] file.ivy
+ivy_bmc notebook=true file.ivy
+
+For each isolate (or for the whole program if there are none), the
+exported actions are unrolled in a single incremental solver, one
+transition frame per action call. The depth of a counterexample is
+the number of action calls in its trace, including the call whose
+assertion fails, and is at most "bound" (default 10). After k calls,
+the solver checks that the conjectures hold and then that no
+assertion of the next call fails. The shortest counterexample is
+printed as a trace, in text or JSON format. With jobs=n, the choice of the first action is split among n
+worker processes, each unrolling with its own solver.
+
+With notebook=true, a notebook for debugging the conjectures with
+BMC is created and opened instead.
 """
 
 import re
 import sys
 import os
+import json
 from os.path import dirname, join, pardir, pathsep, abspath
 
-import IPython
+import z3
+
+import ivy_init
+import ivy_logic as lg
+import ivy_logic_utils as lut
+import ivy_utils as iu
+import ivy_module as im
+import ivy_actions as act
+import ivy_solver as slv
+import ivy_transrel as itr
+import ivy_compiler
+import ivy_isolate
+import ivy_ast
+import ivy_theory as ith
+
+opt_bound = iu.Parameter("bound","10")
+opt_format = iu.EnumeratedParameter("format",["text","json"],"text")
+opt_jobs = iu.Parameter("jobs","1")
+opt_notebook = iu.BooleanParameter("notebook",False)
+
+def usage():
+    print "usage: \n  {} [isolate=iso] [bound=n] [format=text|json] [jobs=n] file.ivy".format(sys.argv[0])
+    sys.exit(1)
+
+def at_step(sym,k):
+    return sym.rename(lambda s: '{}@{}'.format(s,k))
+
+def pretty_action(name):
+    return name[4:] if name.startswith('ext:') else name
+
+class Unrolling(object):
+    """ An unrolling of the exported actions of the current module in
+    an incremental solver. State k is represented by the state symbols
+    renamed with at_step(sym,k). The transition from state k to
+    state k+1 calls one action, chosen by the selector literals of
+    step k. With "first", the first action called is fixed. """
+
+    def __init__(self,mod,first=None):
+        self.axioms = mod.background_theory()
+        self.actions = []
+        for name in sorted(mod.public_actions):
+            action = mod.actions[name]
+            upd = itr.bind_olds_action(action.int_update(mod,None))
+            self.actions.append((name,getattr(action,'formal_params',[]),upd))
+        self.state = set(sym for name,params,upd in self.actions for sym in upd[0])
+        self.conjs = [(lf,lut.formula_to_clauses(lf.formula)) for lf in mod.labeled_conjs]
+        self.state_axioms = lut.clauses_using_symbols(self.state,self.axioms)
+        self.first = first
+        self.solver = z3.Solver()
+        self.selectors = []
+        self.solver.add(slv.clauses_to_z3(self.axioms))
+        self.add_state(0)
+        init = mod.init_cond
+        if mod.initializers:
+            action = act.Sequence(*[a for n,a in mod.initializers])
+            init = itr.forward_image(init,self.axioms,action.update(mod,None))
+        self.solver.add(slv.clauses_to_z3(self.rename(init,0,'init')))
+
+    def rename(self,clauses,k,tag,post=True):
+        """ Rename the state symbols in clauses to state k and, if post
+        is true, the new state symbols to state k+1. The formal
+        parameters, locals and skolems are renamed apart using tag,
+        as are the new state symbols if post is false. """
+        rn = dict()
+        for sym in lut.used_symbols_clauses(clauses):
+            if sym in self.state:
+                rn[sym] = at_step(sym,k)
+            elif post and itr.is_new(sym) and itr.new_of(sym) in self.state:
+                rn[sym] = at_step(itr.new_of(sym),k+1)
+            elif sym.is_skolem() or itr.is_new(sym) or sym.name.startswith(('fml:','loc:')):
+                rn[sym] = at_step(sym,tag)
+        return lut.rename_clauses(clauses,rn)
+
+    def add_state(self,k):
+        self.solver.add(slv.clauses_to_z3(self.rename(self.state_axioms,k,k)))
+
+    def add_step(self):
+        """ Add the transition from the last state to a new state """
+        k = len(self.selectors)
+        sels = [z3.Bool('__bmc_{}_{}'.format(k,i)) for i in range(len(self.actions))]
+        for i,(name,params,upd) in enumerate(self.actions):
+            updated,tr,fail = upd
+            frame = itr.frame([s for s in self.state if s not in updated],None,itr.new)
+            trans = self.rename(lut.and_clauses(tr,frame),k,'{}_{}'.format(k,i))
+            self.solver.add(z3.Implies(sels[i],slv.clauses_to_z3(trans)))
+        for i in range(len(sels)):
+            for j in range(i):
+                self.solver.add(z3.Or(z3.Not(sels[i]),z3.Not(sels[j])))
+        self.solver.add(sels[self.first] if k == 0 and self.first is not None else z3.Or(sels))
+        self.selectors.append(sels)
+        self.add_state(k+1)
 
+    def bad(self,k,calls=False):
+        """ Return a literal that implies that some conjecture is false
+        in state k or, if calls is true, that some action fails when
+        called in state k. The literals of the individual violations
+        are kept in self.violations. """
+        self.violations = []
+        if not calls:
+            for j,(lf,c) in enumerate(self.conjs):
+                lit = z3.Bool('__bmc_conj_{}_{}'.format(k,j))
+                self.solver.add(z3.Implies(lit,slv.not_clauses_to_z3(self.rename(c,k,'{}_conj{}'.format(k,j)))))
+                self.violations.append((lit,'conjecture',j))
+        else:
+            for i,(name,params,upd) in enumerate(self.actions):
+                fail = upd[2]
+                if not fail.is_false() and (k > 0 or self.first in (None,i)):
+                    lit = z3.Bool('__bmc_fail_{}_{}'.format(k,i))
+                    fail = self.rename(fail,k,'{}_{}_fail'.format(k,i),post=False)
+                    self.solver.add(z3.Implies(lit,slv.clauses_to_z3(fail)))
+                    self.violations.append((lit,'assertion',i))
+        lit = z3.Bool('__bmc_bad_{}_{}'.format(k,int(calls)))
+        self.solver.add(z3.Implies(lit,z3.Or([v for v,kind,idx in self.violations])))
+        return lit
 
-if __name__ == '__main__':
-    #ivy_filename = abspath(sys.argv[1])
-    ivy_filename = sys.argv[1]
+    def check(self,bound):
+        """ Return the shortest counterexample of depth at most bound,
+        or None. A conjecture violated after k calls is a counterexample
+        of depth k and a failing call after k calls one of depth k+1. """
+        for k in range(bound+1):
+            for calls in ([False,True] if k < bound else [False]):
+                if slv.decide(self.solver,[self.bad(k,calls)]) == z3.sat:
+                    return self.trace(k,self.solver.model())
+            self.add_step()
+        return None
+
+    def call(self,model,i,tag):
+        name,params,upd = self.actions[i]
+        args = []
+        for p in params:
+            val = model.eval(slv.term_to_z3(lg.Constant(at_step(p,tag))),model_completion=True)
+            args.append((p.name[4:] if p.name.startswith('fml:') else p.name,str(val)))
+        return {'action':pretty_action(name),'args':args}
+
+    def trace(self,k,model):
+        """ Return the counterexample of model, with a violation in
+        state k. Its depth is the number of its steps. """
+        steps = []
+        for j in range(k):
+            for i,sel in enumerate(self.selectors[j]):
+                if z3.is_true(model.eval(sel,model_completion=True)):
+                    steps.append(self.call(model,i,'{}_{}'.format(j,i)))
+        res = {'steps':steps}
+        for lit,kind,idx in self.violations:
+            if z3.is_true(model.eval(lit,model_completion=True)):
+                if kind == 'conjecture':
+                    lf = self.conjs[idx][0]
+                    res['conjecture'] = {'label':lf.label and str(lf.label),
+                                         'file':lf.lineno.filename,'line':lf.lineno.line}
+                else:
+                    steps.append(self.call(model,idx,'{}_{}_fail'.format(k,idx)))
+                    res['assertion'] = steps[-1]['action']
+                break
+        res['depth'] = len(steps)
+        return res
+
+def check_first(first):
+    return Unrolling(im.module,first).check(int(opt_bound.get()))
+
+def bmc_isolate():
+    mod = im.module
+    ith.check_theory()
+    with mod.theory_context():
+        jobs = int(opt_jobs.get())
+        if jobs > 1 and len(mod.public_actions) > 1:
+            import multiprocessing
+            pool = multiprocessing.Pool(jobs)
+            cexs = pool.map(check_first,range(len(mod.public_actions)))
+            pool.close()
+            cexs = [c for c in cexs if c is not None]
+            return min(cexs,key=lambda c: c['depth']) if cexs else None
+        return check_first(None)
+
+def print_trace(cex):
+    print "counterexample of depth {}:".format(cex['depth'])
+    for step in cex['steps']:
+        print "    {}({})".format(step['action'],','.join('{}={}'.format(n,v) for n,v in step['args']))
+    if 'conjecture' in cex:
+        conj = cex['conjecture']
+        print "{}: line {}: conjecture {} is false".format(conj['file'],conj['line'],conj['label'] or '(no name)')
+    else:
+        print "assertion failed in {}".format(cex['assertion'])
+
+def bmc_module():
+    isolate = ivy_compiler.isolate.get()
+    if isolate != None:
+        isolates = [isolate]
+    else:
+        isolates = sorted(list(im.module.isolates))
+        if len(isolates) == 0:
+            isolates = [None]
+    failures = 0
+    for isolate in isolates:
+        if isolate != None and isolate in im.module.isolates:
+            idef = im.module.isolates[isolate]
+            if len(idef.verified()) == 0 or isinstance(idef,ivy_ast.TrustedIsolateDef):
+                continue # skip if nothing to verify
+        with im.module.copy():
+            ivy_isolate.create_isolate(isolate)
+            cex = bmc_isolate()
+        failures += cex is not None
+        if opt_format.get() == 'json':
+            print json.dumps({'isolate':isolate,'counterexample':cex})
+            continue
+        if isolate:
+            print "\nIsolate {}:".format(isolate)
+        if cex is not None:
+            print_trace(cex)
+        else:
+            print "no counterexample of depth <= {}".format(opt_bound.get())
+    return failures
+
+def notebook(ivy_filename):
+    import IPython
 
     notebook_source = r"""{
  "cells": [
@@ -109,3 +331,25 @@ if __name__ == '__main__':
     sys.argv = ['ipython', 'notebook', notebook_filename]
     sys.argv[0] = re.sub(r'(-script\.pyw|\.exe)?$', '', sys.argv[0])
     sys.exit(IPython.start_ipython())
+
+def main():
+    import signal
+    signal.signal(signal.SIGINT,signal.SIG_DFL)
+    ivy_init.read_params()
+    if len(sys.argv) != 2 or not sys.argv[1].endswith('ivy'):
+        usage()
+    if opt_notebook.get():
+        notebook(sys.argv[1])
+    with im.Module():
+        with iu.ErrorPrinter():
+            ivy_init.source_file(sys.argv[1],ivy_init.open_read(sys.argv[1]),create_isolate=False)
+            failures = bmc_module()
+            if failures and opt_format.get() == 'text':
+                raise iu.IvyError(None,"failed checks: {}".format(failures))
+    if failures:
+        sys.exit(1)
+    if opt_format.get() == 'text':
+        print "OK"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,443 @@
+#
+# Copyright (c) Microsoft Corporation. All Rights Reserved.
+#
+"""
+Native build of the code generated by ivy_to_cpp (build=true).
+
+The isolates of a module are compiled as independent jobs, up to
+"build_jobs" at a time (by default, one per processor).
+
+On POSIX systems, the following are also supported with g++:
+
+- The product of each isolate (executable or object file) is cached
+  in the directory "build_cache_dir" (by default ".ivy_build" in the
+  output directory), keyed by a hash of the generated source, header
+  and compiler command. An isolate whose generated code has not
+  changed is copied from the cache instead of being rebuilt. Headers
+  included by native code are not part of the key, so use
+  build_cache=false after changing them. After each build, the least
+  recently used entries are removed until the cache holds at most
+  "build_cache_size" megabytes (by default 512, 0 for no limit). The
+  cache directory can also be deleted at any time.
+
+- With pch=true, the system headers, z3++.h and the hash table
+  template shared by all generated files are compiled once into a
+  precompiled header, which is included in each compilation with
+  -include. The generated code is not changed.
+
+- The build profile is selected by "build_profile": "debug" (-g, the
+  default), "release" (-O2) or "lto" (-O2 with link-time optimization).
+
+- If the code of an isolate was split into several implementation
+  files (ivy_to_cpp shards=N), the files are compiled in parallel and
+  cached separately, then linked.
+
+- With pgo=true, the isolates are built with profile-guided
+  optimization (see build_pgo below).
+"""
+
+import os
+import sys
+import time
+import shutil
+import hashlib
+import platform
+import subprocess
+
+import ivy_utils as iu
+
+opt_build_jobs = iu.Parameter("build_jobs","0")
+opt_build_profile = iu.EnumeratedParameter("build_profile",["debug","release","lto"],"debug")
+opt_build_cache = iu.BooleanParameter("build_cache",True)
+opt_build_cache_dir = iu.Parameter("build_cache_dir","")
+opt_build_cache_size = iu.Parameter("build_cache_size","512")
+opt_pch = iu.BooleanParameter("pch",False)
+opt_pgo = iu.BooleanParameter("pgo",False)
+opt_pgo_trace = iu.Parameter("pgo_trace","")
+
+profile_flags = {
+    'debug' : '-g',
+    'release' : '-O2',
+    'lto' : '-O2 -flto',
+}
+
+# The headers included by all generated code, in the order in which
+# the generated code includes them.
+
+pch_includes = """
+#include <string>
+#include <vector>
+#include <iterator>
+#include <fstream>
+#include <sstream>
+#include <algorithm>
+#include <iostream>
+#include <map>
+#include <list>
+#include <queue>
+#include <stdlib.h>
+#include <sys/types.h>
+#include <sys/stat.h>
+#include <fcntl.h>
+#include <sys/socket.h>
+#include <netinet/in.h>
+#include <netinet/ip.h>
+#include <sys/select.h>
+#include <unistd.h>
+#include <string.h>
+#include <stdio.h>
+"""
+
+class BuildJob(object):
+    """ One command of the build. If cache_key is given, the file
+    product is stored in the cache under that key when the command
+    succeeds. """
+    def __init__(self,name,cmd,product=None,cache_key=None):
+        self.name,self.cmd,self.product,self.cache_key = name,cmd,product,cache_key
+
+def num_jobs():
+    try:
+        jobs = int(opt_build_jobs.get())
+    except ValueError:
+        raise iu.IvyError(None,"bad parameter value: build_jobs={}".format(opt_build_jobs.get()))
+    if jobs > 0:
+        return jobs
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+def run_jobs(jobs,cache_dir=None):
+    """ Run the commands of the jobs, at most num_jobs() at a time.
+    Returns the list of jobs that failed. """
+    width = num_jobs()
+    pending = list(reversed(jobs))
+    running = []
+    failed = []
+    while pending or running:
+        while pending and len(running) < width:
+            job = pending.pop()
+            print job.cmd
+            sys.stdout.flush()
+            running.append((job,subprocess.Popen(job.cmd,shell=True)))
+        still_running = []
+        for job,proc in running:
+            status = proc.poll()
+            if status is None:
+                still_running.append((job,proc))
+            elif status:
+                failed.append(job)
+            elif cache_dir and job.cache_key:
+                store(cache_dir,job.cache_key,job.product)
+        running = still_running
+        if running:
+            time.sleep(0.02)
+    return failed
+
+def hash_files(names,extra):
+    h = hashlib.sha1()
+    for name in names:
+        with open(name,'rb') as f:
+            h.update(f.read())
+        h.update('\0')
+    h.update(extra)
+    return h.hexdigest()
+
+def cached_name(cache_dir,key):
+    return os.path.join(cache_dir,key)
+
+def store(cache_dir,key,product):
+    # copy to a temporary name first, so that a concurrent build never
+    # sees a partial file
+    tmp = cached_name(cache_dir,key) + '.tmp{}'.format(os.getpid())
+    shutil.copy2(product,tmp)
+    os.rename(tmp,cached_name(cache_dir,key))
+
+def fetch(cache_dir,key,product):
+    name = cached_name(cache_dir,key)
+    try:
+        shutil.copy2(name,product)
+        os.utime(name,None)  # for eviction, the last use is the time stamp
+    except (IOError,OSError):
+        return False  # not cached, or evicted by a concurrent build
+    return True
+
+def entry_size(name):
+    if not os.path.isdir(name):
+        return os.path.getsize(name)
+    return sum(os.path.getsize(os.path.join(d,f)) for d,_,fs in os.walk(name) for f in fs)
+
+def evict(cache_dir):
+    """ Remove the least recently used entries (products and
+    precompiled headers) until the cache is within build_cache_size """
+    try:
+        limit = int(opt_build_cache_size.get()) << 20
+    except ValueError:
+        raise iu.IvyError(None,"bad parameter value: build_cache_size={}".format(opt_build_cache_size.get()))
+    if not limit or not os.path.isdir(cache_dir):
+        return
+    entries = []
+    for name in os.listdir(cache_dir):
+        path = os.path.join(cache_dir,name)
+        try:
+            entries.append((os.path.getmtime(path),entry_size(path),path))
+        except OSError:
+            pass  # removed by a concurrent build
+    total = sum(size for _,size,_ in entries)
+    for _,size,path in sorted(entries):
+        if total <= limit:
+            break
+        if os.path.isdir(path):
+            shutil.rmtree(path,ignore_errors=True)
+        elif os.path.exists(path):
+            os.remove(path)
+        total -= size
+
+def z3_paths():
+    if 'Z3DIR' in os.environ:
+        return '-I $Z3DIR/include','-L $Z3DIR/lib -Wl,-rpath=$Z3DIR/lib'
+    _dir = os.path.dirname(os.path.abspath(__file__))
+    return '-I {}'.format(_dir),'-L {} -Wl,-rpath={}'.format(_dir,_dir)
+
+def build_pch(cache_dir,header,cflags):
+    """ Build the precompiled header, if it is not already in the cache.
+    Returns the flag needed to use it, or the empty string on failure. """
+    key = hashlib.sha1(header + '\0' + cflags).hexdigest()
+    pch_dir = os.path.join(cache_dir,'pch-' + key)
+    name = os.path.join(pch_dir,'ivy_pch.h')
+    if os.path.exists(name + '.gch'):
+        os.utime(pch_dir,None)
+    else:
+        if not os.path.isdir(pch_dir):
+            os.makedirs(pch_dir)
+        with open(name,'w') as f:
+            f.write(header)
+        job = BuildJob('pch','g++ {} -x c++-header -o {}.gch {}'.format(cflags,name,name))
+        if run_jobs([job]):
+            print "warning: failed to build precompiled header, continuing without it"
+            if os.path.exists(name + '.gch'):
+                os.remove(name + '.gch')
+            return ''
+    return '-include {}'.format(name)
+
+def cached_job(cache_dir,name,cmd,product,inputs):
+    """ Returns a job running cmd to build product from the input files,
+    or None if the product is found in the cache """
+    if cache_dir is None:
+        return BuildJob(name,cmd,product)
+    key = hash_files(inputs,cmd)
+    if fetch(cache_dir,key,product):
+        print '{}: unchanged, using cached build'.format(product)
+        return None
+    return BuildJob(name,cmd,product,key)
+
+def build_posix(basenames,sources,outfile,emit_main,use_z3,pch_header):
+    incpath,libpath = z3_paths()
+    cflags = '{} {} -pthread'.format(incpath,profile_flags[opt_build_profile.get()])
+    libs = ' -lz3' if use_z3 else ''
+    cache_dir = (opt_build_cache_dir.get() or outfile('.ivy_build'))
+    if (opt_build_cache.get() or opt_pch.get()) and not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir)
+    pchflag = build_pch(cache_dir,pch_header,cflags) if opt_pch.get() else ''
+    cache_root = cache_dir
+    if not opt_build_cache.get():
+        cache_dir = None
+    jobs = []
+    link_jobs = []
+    for basename in basenames:
+        srcs = [outfile(name) for name in sources[basename]]
+        headers = [outfile(basename + '.h')]
+        if len(srcs) == 1 and emit_main:
+            product = outfile(basename)
+            cmd = 'g++ {} {} -o {} {} {}{}'.format(cflags,pchflag,product,srcs[0],libpath,libs)
+            jobs.append(cached_job(cache_dir,basename,cmd,product,srcs + headers))
+            continue
+        # with several translation units, compile each separately, then link
+        if len(srcs) > 1:
+            headers.append(outfile(basename + '_shard.h'))
+        objs = []
+        for src in srcs:
+            obj = src[:-len('.cpp')] + '.o'
+            cmd = 'g++ {} {} -c -o {} {}'.format(cflags,pchflag,obj,src)
+            jobs.append(cached_job(cache_dir,basename,cmd,obj,[src] + headers))
+            objs.append(obj)
+        if emit_main:
+            product = outfile(basename)
+            cmd = 'g++ {} -o {} {} {}{}'.format(cflags,product,' '.join(objs),libpath,libs)
+            link_jobs.append(BuildJob(basename,cmd,product))
+    failed = run_jobs([job for job in jobs if job is not None],cache_dir)
+    evict(cache_root)
+    if failed:
+        return failed
+    return run_jobs(link_jobs)
+
+def build_windows(basenames,sources,outdir,use_z3,find_vs,compiler):
+    if 'Z3DIR' in os.environ:
+        z3incspec = '/I %Z3DIR%\\include'
+        z3libspec = '/LIBPATH:%Z3DIR%\\lib /LIBPATH:%Z3DIR%\\bin'
+    else:
+        import z3
+        z3path = os.path.dirname(os.path.abspath(z3.__file__))
+        z3incspec = '/I {}'.format(z3path)
+        z3libspec = '/LIBPATH:{}'.format(z3path)
+    vsdir = find_vs()
+    jobs = []
+    for basename in basenames:
+        srcs = ' '.join(sources[basename])
+        if compiler != 'g++':
+            cmd = '"{}\\VC\\vcvarsall.bat"& cl /EHsc /Zi /Fe{}.exe {} ws2_32.lib'.format(vsdir,basename,srcs)
+            if use_z3:
+                cmd = '"{}\\VC\\vcvarsall.bat"& cl /EHsc /Zi {} /Fe{}.exe {} ws2_32.lib libz3.lib /link {}'.format(vsdir,z3incspec,basename,srcs,z3libspec)
+        else:
+            cmd = "g++ -I %Z3DIR%/include -L %Z3DIR%/lib -L %Z3DIR%/bin -g -o {} {} -lws2_32".format(basename,srcs)
+            if use_z3:
+                cmd = cmd + ' -lz3'
+        if outdir:
+            cmd = 'cd {} & '.format(outdir) + cmd
+        jobs.append(BuildJob(basename,cmd))
+    return run_jobs(jobs)
+
+# Profile-guided optimization uses the randomized tester of the isolate
+# as a source of realistic workloads. For each isolate:
+#
+# 1. The tester is built (target=test, with the same parameters) and
+#    run, with the number of iterations given by test_iters. Instead,
+#    an existing trace can be given with pgo_trace=file.
+#
+# 2. The calls of exported actions in the trace become the commands of
+#    a REPL script. Calls that lead to imported actions returning
+#    values are left out, since the REPL would ask for the values.
+#
+# 3. The isolate is compiled with -fprofile-generate and run on the
+#    script. For target=class, which has no main, the REPL version of
+#    the isolate is generated for this step, in the directory
+#    <basename>_pgo of the output directory, and its profile is copied
+#    to the output directory. The methods of both versions are
+#    identical, so the profile applies to them, and g++ warns about the
+#    functions of the REPL that the class does not have.
+#
+# 4. The isolate is compiled again with -fprofile-use.
+#
+# The g++ profile of an object file must come from the same source file
+# name, so each step compiles in the directory of its sources, using
+# the file names of the final build. The built products are not
+# cached, as they depend on the profile.
+
+def pgo_cflags():
+    profile = opt_build_profile.get()
+    incpath,libpath = z3_paths()
+    return '{} {} -pthread'.format(incpath,profile_flags['release' if profile == 'debug' else profile])
+
+def generate(args):
+    cmd = ['ivy_to_cpp'] + args
+    print ' '.join(cmd)
+    sys.stdout.flush()
+    if subprocess.call(cmd):
+        raise iu.IvyError(None,"failed to generate code: {}".format(' '.join(cmd)))
+
+def run_pgo_tester(basename,isolate,outdir,filename,params,outfile):
+    tester = basename + '_pgo_tester'
+    args = ['target=test','build=true','classname=' + tester] + params
+    if isolate:
+        args.append('isolate=' + isolate)
+    if outdir:
+        args.append('outdir=' + outdir)
+    generate(args + [filename])
+    trace = outfile(basename + '.pgo.iev')
+    cmd = [os.path.abspath(outfile(tester)),'seed=1','out=' + trace]
+    print ' '.join(cmd)
+    sys.stdout.flush()
+    if subprocess.call(cmd):
+        print "warning: tester {} failed, using its partial trace".format(tester)
+    return trace
+
+def trace_to_workload(trace,workload,skip_imports):
+    """ Write the exported calls in a tester trace to a REPL script,
+    returning the number of commands """
+    import ivy_ev_parser
+    cmds = list(ivy_ev_parser.trace_commands(trace,skip_imports))
+    with open(workload,'w') as f:
+        for cmd in cmds:
+            f.write(cmd + '\n')
+    return len(cmds)
+
+def compile_objs(basename,srcs,cflags,srcdir):
+    """ Compile the sources in directory srcdir (if not empty),
+    returning the object files """
+    cd = 'cd {} && '.format(srcdir) if srcdir else ''
+    jobs = [BuildJob(basename,cd + 'g++ {} -c -o {} {}'.format(cflags,src[:-len('.cpp')] + '.o',src)) for src in srcs]
+    if run_jobs(jobs):
+        raise iu.IvyError(None,"build of {} failed".format(basename))
+    return [os.path.join(srcdir,src[:-len('.cpp')] + '.o') for src in srcs]
+
+def link(basename,product,objs,cflags,libs):
+    incpath,libpath = z3_paths()
+    job = BuildJob(basename,'g++ {} -o {} {} {}{}'.format(cflags,product,' '.join(objs),libpath,libs))
+    if run_jobs([job]):
+        raise iu.IvyError(None,"build of {} failed".format(basename))
+
+def build_pgo(basenames,isolates,sources,outdir,emit_main,filename,params,skip_imports):
+    """ Build the isolates with profile-guided optimization. The
+    isolate names, implementation files, source file name and the
+    parameters to pass to ivy_to_cpp are needed to build the tester. """
+    if platform.system() == 'Windows':
+        raise iu.IvyError(None,"pgo=true is only supported with g++ on POSIX systems")
+    outfile = lambda name: os.path.join(outdir,name) if outdir else name
+    cflags = pgo_cflags()
+    for basename,isolate in zip(basenames,isolates):
+        trace = opt_pgo_trace.get() or run_pgo_tester(basename,isolate,outdir,filename,params,outfile)
+        workload = outfile(basename + '.pgo.in')
+        print '{}: training on {} commands from {}'.format(basename,trace_to_workload(trace,workload,skip_imports),trace)
+        srcs = sources[basename]
+        train_dir = outdir
+        if not emit_main:
+            train_dir = outfile(basename + '_pgo')
+            if not os.path.isdir(train_dir):
+                os.makedirs(train_dir)
+            args = ['target=repl','classname=' + basename,'outdir=' + train_dir] + params
+            if isolate:
+                args.append('isolate=' + isolate)
+            generate(args + [filename])
+        for src in srcs:
+            gcda = os.path.join(train_dir,src[:-len('.cpp')] + '.gcda')
+            if os.path.exists(gcda):
+                os.remove(gcda)
+        objs = compile_objs(basename,srcs,cflags + ' -fprofile-generate',train_dir)
+        exe = os.path.join(train_dir,basename + '_pgo_train')
+        link(basename,exe,objs,cflags + ' -fprofile-generate','')
+        print '{} < {}'.format(exe,workload)
+        sys.stdout.flush()
+        with open(workload) as inp:
+            with open(os.devnull,'w') as out:
+                status = subprocess.call([os.path.abspath(exe)],stdin=inp,stdout=out)
+        if status:
+            print "warning: training run of {} failed".format(basename)
+        os.remove(exe)
+        if train_dir != outdir:
+            for src in srcs:
+                gcda = src[:-len('.cpp')] + '.gcda'
+                if os.path.exists(outfile(gcda)):
+                    os.remove(outfile(gcda))
+                if os.path.exists(os.path.join(train_dir,gcda)):
+                    shutil.copy2(os.path.join(train_dir,gcda),outfile(gcda))
+            shutil.rmtree(train_dir)
+        objs = compile_objs(basename,srcs,cflags + ' -fprofile-use -fprofile-correction'
+                            ' -Wno-error=coverage-mismatch',outdir)
+        if emit_main:
+            link(basename,outfile(basename),objs,cflags,'')
+
+def build(basenames,sources,outdir,emit_main,use_z3,pch_header,find_vs,compiler):
+    """ Build the generated code for the given basenames in directory
+    outdir (if not empty). The implementation files of each basename are
+    given by the dictionary sources. Exits with status 1 if any build
+    fails. """
+    if platform.system() == 'Windows':
+        failed = build_windows(basenames,sources,outdir,use_z3,find_vs,compiler)
+    else:
+        outfile = lambda name: os.path.join(outdir,name) if outdir else name
+        failed = build_posix(basenames,sources,outfile,emit_main,use_z3,pch_header)
+    if failed:
+        for job in failed:
+            print "build of {} failed".format(job.name)
+        exit(1)
@@ -17,8 +17,10 @@ import ivy_isolate
 import ivy_ast
 import ivy_theory as ith
 import ivy_transrel as itr
+import ivy_solver as slv
 
 import sys
+import z3
 from collections import defaultdict
 
 diagnose = iu.BooleanParameter("diagnose",False)
@@ -87,19 +89,17 @@ def has_temporal_stuff(f):
     
 def check_temporals():
     props = im.module.labeled_props
-    proved = []
-    for prop in props:
-        if prop.temporal:
-            from ivy_l2s import l2s
-            mod = im.module.copy()
-            mod.labeled_axioms.extend(proved)
-            mod.labeled_props = []
-            l2s(mod, prop)
-            mod.concept_spaces = []
-            mod.update_conjs()
-            with mod:
-                check_isolate()
-        proved.append(prop)
+    temporals = [prop for prop in props if prop.temporal]
+    if temporals:
+        from ivy_l2s import l2s
+        mod = im.module.copy()
+        mod.labeled_axioms.extend(prop for prop in props if not prop.temporal)
+        mod.labeled_props = []
+        l2s(mod, temporals)
+        mod.concept_spaces = []
+        mod.update_conjs()
+        with mod:
+            check_isolate()
     # filter out any temporal stuff from conjectures and concept spaces
     im.module.labeled_conjs = [x for x in im.module.labeled_conjs if not has_temporal_stuff(x.formula)]
     im.module.concept_spaces = [x for x in im.module.concept_spaces if not has_temporal_stuff(x[1])]
@@ -139,6 +139,7 @@ def print_dots():
     
 
 class Checker(object):
+    indent = 12
     def __init__(self,conj,report_pass=True):
         self.fc = lut.dual_clauses(lut.formula_to_clauses(conj))
         self.report_pass = report_pass
@@ -147,8 +148,11 @@ class Checker(object):
     def start(self):
         if self.report_pass:
             print_dots()
-    def sat(self):
+    def sat(self,model):
         print('FAIL')
+        lf = temporal_of_model(model)
+        if lf is not None:
+            print (self.indent+4)*' ' + "for temporal property {}".format(pretty_lf(lf,0))
         global failures
         failures += 1
         return not diagnose.get() # ignore failures if not diagnosing
@@ -158,6 +162,18 @@ class Checker(object):
     def assume(self):
         return False
 
+# The pairs (selector,property) of the temporal properties reduced to
+# safety in the current isolate. In a counterexample, the selector of
+# the property that the counterexample violates is true.
+
+temporal_selectors = []
+
+def temporal_of_model(model):
+    for sel,lf in temporal_selectors:
+        if z3.is_true(model.eval(slv.formula_to_z3(sel),model_completion=True)):
+            return lf
+    return None
+
 def pretty_label(label):
     return "(no name)" if label is None else label
 
@@ -207,6 +223,63 @@ def check_safety_in_state(mod,ag,post,report_pass=True):
     return check_fcs_in_state(mod,ag,post,[Checker(lg.Or(),report_pass=report_pass)])
 
 opt_summary = iu.BooleanParameter("summary",False)
+opt_houdini = iu.BooleanParameter("houdini",False)
+
+class HoudiniSolver(object):
+    """ A solver for the consecution of a set of conjectures under
+    a transition. Each conjecture is guarded by an assumption literal
+    in the pre-state and another one in the post-state, so that
+    checking any subset of the conjectures reuses the same solver. """
+    def __init__(self,conjs,axioms,update):
+        updated,tr,pre = update
+        rn = dict((x,itr.new(x)) for x in updated)
+        self.solver = z3.Solver()
+        self.solver.add(slv.clauses_to_z3(axioms))
+        self.solver.add(slv.clauses_to_z3(tr))
+        self.solver.add(slv.clauses_to_z3(lut.rename_clauses(lut.clauses_using_symbols(updated,axioms),rn)))
+        self.pre,self.post = [],[]
+        for i,conj in enumerate(conjs):
+            a,b = z3.Bool('__hpre{}'.format(i)),z3.Bool('__hpost{}'.format(i))
+            self.solver.add(z3.Implies(a,slv.clauses_to_z3(conj)))
+            self.solver.add(z3.Implies(b,slv.not_clauses_to_z3(lut.rename_clauses(conj,rn))))
+            self.pre.append(a)
+            self.post.append(b)
+    def preserves(self,alive,i):
+        """ True if the conjectures in alive imply conjecture i after
+        the transition """
+        res = slv.decide(self.solver,[self.pre[j] for j in alive] + [self.post[i]])
+        return res == z3.unsat
+
+def houdini(mod,actnames):
+    """ Compute the largest inductive subset of the conjectures,
+    returning the surviving conjectures and a list of pairs of a
+    dropped conjecture and the reason it was dropped. """
+    conjs = mod.conjs
+    axioms = mod.background_theory()
+    dropped = []
+    with itp.EvalContext(check=False):
+        ag = ivy_art.AnalysisGraph(initializer=lambda x:None)
+        init = lut.and_clauses(ag.states[0].clauses,axioms)
+    alive = []
+    for i,t in enumerate(slv.clauses_imply_list(init,conjs)):
+        if t:
+            alive.append(i)
+        else:
+            dropped.append((i,'false initially'))
+    solvers = [(actname,HoudiniSolver(conjs,axioms,mod.actions[actname].update(mod,None)))
+               for actname in actnames]
+    changed = True
+    while changed:
+        changed = False
+        for actname,solver in solvers:
+            for i in list(alive):
+                if not solver.preserves(alive,i):
+                    alive.remove(i)
+                    prettyname = actname[4:] if actname.startswith('ext:') else actname
+                    dropped.append((i,'not preserved by {}'.format(prettyname)))
+                    changed = True
+    lfs = mod.labeled_conjs
+    return [lfs[i] for i in alive],[(lfs[i],reason) for i,reason in dropped]
 
 def summarize_isolate(mod):
 
@@ -247,6 +320,13 @@ def summarize_isolate(mod):
     im.module.labeled_axioms.extend(im.module.labeled_props)
     im.module.update_theory()
 
+    if check and opt_houdini.get() and mod.labeled_conjs:
+        mod.labeled_conjs,dropped = houdini(mod,get_checked_actions())
+        if dropped:
+            print "\n    The following conjectures are not inductive and were dropped:"
+            for lf,reason in dropped:
+                print pretty_lf(lf) + "  [{}]".format(reason)
+
 
     if mod.labeled_inits:
         print "\n    The following properties are assumed initially:"
@@ -380,13 +460,13 @@ def summarize_isolate(mod):
 
 
 def check_isolate():
+    global temporal_selectors
     temporals = [p for p in im.module.labeled_props if p.temporal]
     mod = im.module
+    temporal_selectors = []
     if temporals:
-        if len(temporals) > 1:
-            raise IvyError(None,'multiple temporal properties in an isolate not supported yet')
         from ivy_l2s import l2s
-        l2s(mod, temporals[0])
+        temporal_selectors = l2s(mod, temporals)
         mod.concept_spaces = []
         mod.update_conjs()
     ith.check_theory()
@@ -2,21 +2,54 @@
 # Copyright (c) Microsoft Corporation. All Rights Reserved.
 #
 from ivy_logic import *
-from collections import defaultdict
+import logic as lg
 
-class UndoRep(object):
-    def __init__(self,node,rep):
-        self.node = node
-        self.rep = rep
-    def undoit(self):
-        self.node[1] = self.rep
+def is_ground_term(term):
+    return not isinstance(term,Variable) and all(is_ground_term(a) for a in getattr(term,'args',[]))
+
+def restore_attr(obj,attr,val):
+    setattr(obj,attr,val)
+
+missing = object()
+
+def restore_item(dct,key,val):
+    if val is missing:
+        del dct[key]
+    else:
+        dct[key] = val
+
+def restore_len(lst,n):
+    del lst[n:]
+
+class CCNode(object):
+    """
+    A node of the congruence closure, standing for a ground term. A
+    node that is the representative of its class has the list of
+    members of the class, the applications having a member as
+    argument (the use list) and the label of the class (the least
+    member in term order). The proof forest edges (proof,reason)
+    record why the node was merged.
+    """
+    def __init__(self,term,args):
+        self.term = term
+        self.args = args
+        self.rep = self
+        self.members = [self]
+        self.parents = []
+        self.label = term
+        self.proof = None
+        self.reason = None
 
 class CongClos(object):
     """
-    Congruence closure structure. For now we have no function symbols
-    so this is just union-find. Representative terms are minimal in
-    term order, which for the moment is ascii sorting order.
-    
+    Congruence closure structure, in the style of Downey, Sethi and
+    Tarjan: every class has a list of its members, and the class of an
+    application is determined by its signature, the function symbol
+    and the classes of its arguments. Classes are merged by size, and
+    every change is recorded on a trail so it can be undone by
+    pop. Representative terms are minimal in term order, which for the
+    moment is ascii sorting order.
+
     >>> c = CongClos()
     >>> c.union(to_term("v"),to_term("w"))
     >>> c.find(to_term("w"))
@@ -24,62 +57,146 @@ class CongClos(object):
     """
 
     def __init__(self):
-        self.tab = defaultdict(list)
+        self.tab = dict()
+        self.sigs = dict()
         self.trail = []
         self.pushes = []
+        self.version = 0 # changes whenever the equivalence classes change
+
+    # undoable updates
+
+    def set_attr(self,obj,attr,val):
+        self.trail.append((restore_attr,(obj,attr,getattr(obj,attr))))
+        setattr(obj,attr,val)
+
+    def set_item(self,dct,key,val):
+        self.trail.append((restore_item,(dct,key,dct.get(key,missing))))
+        dct[key] = val
+
+    def del_item(self,dct,key):
+        self.trail.append((restore_item,(dct,key,dct[key])))
+        del dct[key]
+
+    def extend(self,lst,vals):
+        self.trail.append((restore_len,(lst,len(lst))))
+        lst.extend(vals)
+
+    def signature(self,node):
+        return (node.term.func,) + tuple(a.rep for a in node.args)
+
+    def get_node(self,term):
+        node = self.tab.get(term)
+        if node is None:
+            is_app = isinstance(term,lg.Apply)
+            args = [self.get_node(a) for a in term.args] if is_app else []
+            node = CCNode(term,args)
+            self.set_item(self.tab,term,node)
+            if is_app:
+                for a in args:
+                    self.extend(a.rep.parents,[node])
+                sig = self.signature(node)
+                other = self.sigs.get(sig)
+                if other is None:
+                    self.set_item(self.sigs,sig,node)
+                else:
+                    self.merge(node,other,('congruence',node,other))
+        return node
 
-    def set_rep(self,node,rep):
-        if node[1] != rep:
-            self.trail.append(UndoRep(node,node[1]))
-            node[1] = rep
-
-    def get_rep_rec(self,node):
-        if node[1] == None:
-            return node
-        rep = self.get_rep_rec(node[1])
-        self.set_rep(node,rep)
-        return rep
-
-    def get_rep_node(self,term):
-        name = term.rep
-        node = self.tab[name]
-        if not node:
-            node.append(term)
-            node.append(None)
-        return self.get_rep_rec(node)
-            
     def find(self,term):
-        return self.get_rep_node(term)[0]
+        if not is_ground_term(term):
+            return term
+        return self.get_node(term).rep.label
 
     def find_by_name(self,name):
         """ Same as find, but looks up a constant by name, creating a
         constant with the given name if needed. """
-        node = self.tab[name]
-        if not node:
-            node.append(Constant(name))
-            node.append(None)
-        return self.get_rep_rec(node)[0]
+        return self.find(Constant(name))
 
     def union(self,term1,term2):
-        rep1 = self.get_rep_node(term1)
-        rep2 = self.get_rep_node(term2)
-        if rep1 is not rep2:
-            if rep1[0].rep < rep2[0].rep:
-                self.set_rep(rep2,rep1)
-            else:
-                self.set_rep(rep1,rep2)
+        self.merge(self.get_node(term1),self.get_node(term2),('given',term1,term2))
+
+    def merge(self,node1,node2,reason):
+        pending = [(node1,node2,reason)]
+        while pending:
+            node1,node2,reason = pending.pop()
+            rep1,rep2 = node1.rep,node2.rep
+            if rep1 is rep2:
+                continue
+            self.version += 1
+            if len(rep1.members) > len(rep2.members):
+                node1,node2,rep1,rep2 = node2,node1,rep2,rep1
+            # node1 is in the smaller class, so it is merged into node2's
+            self.reroot(node1)
+            self.set_attr(node1,'proof',node2)
+            self.set_attr(node1,'reason',reason)
+            for p in rep1.parents:
+                sig = self.signature(p)
+                if self.sigs.get(sig) is p:
+                    self.del_item(self.sigs,sig)
+            for m in rep1.members:
+                self.set_attr(m,'rep',rep2)
+            self.extend(rep2.members,rep1.members)
+            if str(rep1.label) < str(rep2.label):
+                self.set_attr(rep2,'label',rep1.label)
+            for p in rep1.parents:
+                sig = self.signature(p)
+                other = self.sigs.get(sig)
+                if other is None:
+                    self.set_item(self.sigs,sig,p)
+                elif other.rep is not p.rep:
+                    pending.append((p,other,('congruence',p,other)))
+            self.extend(rep2.parents,rep1.parents)
+
+    def reroot(self,node):
+        """ Make node the root of its proof tree by reversing the path
+        to the root """
+        prev,reason = None,None
+        while node is not None:
+            succ,succ_reason = node.proof,node.reason
+            self.set_attr(node,'proof',prev)
+            self.set_attr(node,'reason',reason)
+            prev,reason,node = node,succ_reason,succ
+
+    def explain(self,term1,term2):
+        """ Return a list of pairs of terms given to union that imply
+        term1 = term2, or None if the terms are not equal. """
+        node1,node2 = self.get_node(term1),self.get_node(term2)
+        if node1.rep is not node2.rep:
+            return None
+        res = []
+        seen = set()
+        todo = [(node1,node2)]
+        while todo:
+            node1,node2 = todo.pop()
+            ancestors = set()
+            node = node1
+            while node is not None:
+                ancestors.add(node)
+                node = node.proof
+            common = node2
+            while common not in ancestors:
+                common = common.proof
+            for node in [node1,node2]:
+                while node is not common:
+                    reason = node.reason
+                    if reason[0] == 'given':
+                        if reason not in seen:
+                            seen.add(reason)
+                            res.append(reason[1:])
+                    else:
+                        todo.extend(zip(reason[1].args,reason[2].args))
+                    node = node.proof
+        return res
 
     def add_equality(self,lit):
         self.union(lit.atom.args[0],lit.atom.args[1])
 
     def theory(self):
         result = []
-        for name in self.tab:
-            node = self.tab[name]
-            var = node[0]
-            rep = self.get_rep_rec(node)[0]
-            if var is not rep:
-                result.append(Literal(1,Atom("=",[var,rep])))
+        for term,node in self.tab.iteritems():
+            rep = node.rep.label
+            if term is not rep:
+                result.append(Literal(1,Atom(equals,[term,rep])))
         return result
 
     def lit_rep(self,lit):
@@ -94,9 +211,11 @@ class CongClos(object):
 
     def pop(self):
         new_len = self.pushes.pop()
+        self.version += 1
         while len(self.trail) > new_len:
-            self.trail.pop().undoit()
-        
+            fun,args = self.trail.pop()
+            fun(*args)
+
 
 if __name__ == "__main__":
     c = CongClos()
@@ -0,0 +1,164 @@
+#
+# Copyright (c) Microsoft Corporation. All Rights Reserved.
+#
+"""
+Merge and report coverage data produced by testers compiled with
+"ivy_to_cpp coverage=true".
+
+Usage:
+ivy_coverage [out=merged.cov] [uncovered=true] X.cov.map run1.cov run2.cov ...
+
+The map file is written by ivy_to_cpp next to the generated code. It
+has a header line followed by one line per coverage site, with the
+tab-separated fields:
+
+    index kind location description
+
+Each run of the tester writes a binary counter file (by default
+"<basename>.cov", or as given by the tester option coverage=...). Its
+format is the 8-byte magic "IVYCOV01", the 32-bit little-endian map
+fingerprint, the 32-bit little-endian number of sites, and then one
+LEB128 varint counter per site.
+
+The counters of all runs are summed. If "out" is given, the sum is
+written there in the same binary format, so merged files can be merged
+again. A report mapping the counters back to source locations is
+printed, followed by a summary per kind of site and the generator
+calls wasted on unsatisfiable preconditions.
+"""
+
+import sys
+import struct
+from collections import defaultdict
+
+import ivy_utils as iu
+
+opt_out = iu.Parameter("out","")
+opt_uncovered = iu.BooleanParameter("uncovered",False)
+
+magic = 'IVYCOV01'
+
+def usage():
+    print "usage: \n  {} [out=file.cov] [uncovered=true] file.cov.map file.cov ...".format(sys.argv[0])
+    sys.exit(1)
+
+class CoverageMap(object):
+    def __init__(self,fingerprint,sites):
+        self.fingerprint,self.sites = fingerprint,sites
+
+def read_map(fname):
+    with open(fname) as f:
+        header = f.readline().split()
+        try:
+            fields = dict(h.split('=',1) for h in header if '=' in h)
+            fingerprint = int(fields['fingerprint'],16)
+            num = int(fields['sites'])
+        except (KeyError,ValueError):
+            raise iu.IvyError(None,"{}: not a coverage map".format(fname))
+        sites = []
+        for line in f:
+            idx,kind,loc,desc = (line.rstrip('\n').split('\t') + ['','',''])[:4]
+            sites.append((kind,loc,desc))
+    if len(sites) != num:
+        raise iu.IvyError(None,"{}: expected {} sites, found {}".format(fname,num,len(sites)))
+    return CoverageMap(fingerprint,sites)
+
+def read_varint(data,pos):
+    res = 0
+    shift = 0
+    while True:
+        if pos >= len(data):
+            raise ValueError
+        byte = ord(data[pos])
+        pos += 1
+        res |= (byte & 0x7f) << shift
+        if not (byte & 0x80):
+            return res,pos
+        shift += 7
+
+def read_counters(fname):
+    with open(fname,'rb') as f:
+        data = f.read()
+    try:
+        if data[:8] != magic:
+            raise ValueError
+        fingerprint,num = struct.unpack('<II',data[8:16])
+        pos = 16
+        counts = []
+        for idx in range(num):
+            c,pos = read_varint(data,pos)
+            counts.append(c)
+    except (ValueError,struct.error):
+        raise iu.IvyError(None,"{}: not a coverage file".format(fname))
+    return fingerprint,counts
+
+def write_varint(res,x):
+    while x >= 0x80:
+        res.append(chr((x & 0x7f) | 0x80))
+        x >>= 7
+    res.append(chr(x))
+
+def write_counters(fname,fingerprint,counts):
+    res = [magic,struct.pack('<II',fingerprint,len(counts))]
+    for c in counts:
+        write_varint(res,c)
+    with open(fname,'wb') as f:
+        f.write(''.join(res))
+
+def merge(cmap,fnames):
+    total = [0] * len(cmap.sites)
+    for fname in fnames:
+        fingerprint,counts = read_counters(fname)
+        if fingerprint != cmap.fingerprint or len(counts) != len(total):
+            raise iu.IvyError(None,"{}: does not match the coverage map".format(fname))
+        total = [x+y for x,y in zip(total,counts)]
+    return total
+
+def report(cmap,counts):
+    for idx,((kind,loc,desc),count) in enumerate(zip(cmap.sites,counts)):
+        if opt_uncovered.get() and count:
+            continue
+        print '{:>12} {:<11} {}{}'.format(count,kind,loc + ': ' if loc else '',desc)
+    print
+    print 'Summary:'
+    hit = defaultdict(int)
+    total = defaultdict(int)
+    for (kind,loc,desc),count in zip(cmap.sites,counts):
+        total[kind] += 1
+        if count:
+            hit[kind] += 1
+    for kind in sorted(total):
+        print '    {:<11} {}/{} covered'.format(kind,hit[kind],total[kind])
+    calls = dict((desc,count) for (kind,loc,desc),count in zip(cmap.sites,counts) if kind == 'gen_call')
+    unsats = dict((desc,count) for (kind,loc,desc),count in zip(cmap.sites,counts) if kind == 'gen_unsat')
+    wasted = [(unsats[name],calls.get(name,0),name) for name in unsats if unsats[name]]
+    if wasted:
+        print
+        print 'Unsatisfiable generator calls:'
+        for unsat,call,name in sorted(wasted,reverse=True):
+            print '    {}: {}/{} calls ({:.0f}%)'.format(name,unsat,call,100.0*unsat/call if call else 0.0)
+
+def read_params():
+    # like ivy_init.read_params, but without loading the compiler
+    args = sys.argv[1:]
+    ps = dict()
+    while args and '=' in args[0]:
+        key,val = args[0].split('=',1)
+        ps[key] = val
+        args = args[1:]
+    iu.set_parameters(ps)
+    sys.argv = sys.argv[0:1] + args
+
+def main():
+    with iu.ErrorPrinter():
+        read_params()
+        if len(sys.argv) < 2 or not sys.argv[1].endswith('.map'):
+            usage()
+        cmap = read_map(sys.argv[1])
+        counts = merge(cmap,sys.argv[2:])
+        if opt_out.get():
+            write_counters(opt_out.get(),cmap.fingerprint,counts)
+        report(cmap,counts)
+
+if __name__ == "__main__":
+    main()
@@ -79,6 +79,10 @@ static void cleanup() {
 #endif""".replace('BITS',str(bits)).replace('CLASSNAME',classname))
     
  
+    def declarations(self):
+        """ Declarations of the operators defined by emit_templates """
+        return 'std::ostream &operator <<(std::ostream &s, const {} &t);\n'.format(self.short_name())
+
     def emit_templates(self):
        add_impl(
 """
@@ -216,6 +220,11 @@ class VariantType(CppClass):
     def rand(self):
         return self.short_name()+'()'
 
+    def declarations(self):
+        """ Declarations of the operators defined by emit_templates """
+        return ('std::ostream &operator <<(std::ostream &s, const {} &t);\n'.format(self.short_name()) +
+                'bool operator ==(const {} &s, const {} &t);\n'.format(self.short_name(),self.short_name()))
+
     def emit_templates(self):
        add_impl(
 """
@@ -2,6 +2,8 @@
 # Copyright (c) Microsoft Corporation. All Rights Reserved.
 #
 import itertools
+import array
+import collections
 import ivy_utils as iu
 
 def mymap(fun,obj):
@@ -179,7 +181,7 @@ class EventFwdGen(object):
                 yield (cs[0]+'/'+a,t)
         else:
             num = -1
-        for idx in range(num+1,len(things)):
+        for idx in xrange(num+1,len(things)):
             thing = things[idx]
             yield str(idx+start),thing
             for a,t in self.rec(thing.children,None,start=1):
@@ -209,6 +211,8 @@ class Anchor(object):
 def filter(evs,pats,anchor=None):
     if anchor != None:
         pats = [e.map(Anchor(anchor)) for e in pats]
+    if isinstance(evs,EventIndex):
+        evs = EventGen()(evs.candidates(pats))
     for e in evs:
         if any(e.match(pat) for pat in pats):
             yield e
@@ -221,6 +225,205 @@ def find(evs,pats,anchor=None):
             return a,e
     return None
 
+# A trace file may be too large to parse as a whole. An EventIndex is
+# a read-only sequence of the top-level events of a trace file, in
+# either the text format or the binary format written by testers
+# compiled with trace_format=binary. The file is scanned incrementally
+# to record the offsets of the top-level events, and each event is
+# parsed only when it is accessed. The most recently used events are
+# cached.
+#
+# In the text format, a top-level event is a line, possibly followed by
+# lines enclosed in braces (the opening brace may end the line of the
+# event or be on the next line). In the binary format, after an 8-byte
+# header, each line is a record consisting of its length as a varint
+# followed by its text.
+
+trace_magic = 'IVYTRC01'
+
+class EventIndex(object):
+    def __init__(self,fname,cache_size=256):
+        self.fname = fname
+        self.file = open(fname,'rb')
+        self.binary = self.file.read(len(trace_magic)) == trace_magic
+        self.starts = array.array('L')
+        self.ends = array.array('L')
+        self.linenos = array.array('L')
+        self.cache = collections.OrderedDict()
+        self.cache_size = cache_size
+        self.scan_file = open(fname,'rb')
+        self.scanner = self.scan()
+
+    def lines(self):
+        """ Generate the lines of the trace with their offsets in the file """
+        f = self.scan_file
+        if not self.binary:
+            pos = 0
+            for line in f:
+                yield pos,pos+len(line),line
+                pos += len(line)
+            return
+        pos = len(trace_magic)
+        f.seek(pos)
+        buf = ''
+        while True:
+            rec = read_record(buf,0)
+            if rec is None:
+                more = f.read(1 << 16)
+                if not more:
+                    return
+                buf += more
+                continue
+            line,used = rec
+            yield pos,pos+used,line
+            pos += used
+            buf = buf[used:]
+
+    def scan(self):
+        """ Generate the offsets (start,end) of the top-level events,
+        with the line number of their start """
+        depth = 0
+        pending = None
+        for lineno,(start,end,line) in enumerate(self.lines(),1):
+            s = line.strip()
+            if not s:
+                continue
+            if depth == 0:
+                if s == '{' and pending is not None:
+                    depth,pending = 1,(pending[0],None,pending[2])
+                    continue
+                if pending is not None:
+                    yield pending
+                pending = (start,end,lineno)
+                if s.endswith('{'):
+                    depth,pending = 1,(start,None,lineno)
+            else:
+                if s.startswith('}'):
+                    depth -= 1
+                elif s.endswith('{'):
+                    depth += 1
+                if depth == 0:
+                    yield (pending[0],end,pending[2])
+                    pending = None
+        if pending is not None:
+            yield (pending[0],pending[1] if pending[1] is not None else end,pending[2])
+
+    def available(self,num):
+        """ Scan until num events are indexed or the end of the file is
+        reached. Returns the number of events available, up to num. """
+        while len(self.starts) < num and self.scanner is not None:
+            try:
+                start,end,lineno = next(self.scanner)
+            except StopIteration:
+                self.scanner = None
+                break
+            self.starts.append(start)
+            self.ends.append(end)
+            self.linenos.append(lineno)
+        return min(num,len(self.starts))
+
+    def __len__(self):
+        while self.scanner is not None:
+            self.available(len(self.starts) + 4096)
+        return len(self.starts)
+
+    def raw(self,idx):
+        """ The text of top-level event idx """
+        if idx < 0:
+            idx += len(self)
+        if idx < 0 or self.available(idx+1) <= idx:
+            raise IndexError(idx)
+        self.file.seek(self.starts[idx])
+        data = self.file.read(self.ends[idx] - self.starts[idx])
+        if not self.binary:
+            return data
+        lines = []
+        pos = 0
+        while pos < len(data):
+            line,used = read_record(data,pos)
+            lines.append(line)
+            pos += used
+        return '\n'.join(lines)
+
+    def head(self,idx):
+        """ The first line of top-level event idx, without parsing it """
+        line = self.raw(idx).split('\n',1)[0].strip()
+        if line[:2] in ['> ','< ']:
+            line = line[2:]
+        if line.endswith('{'):
+            line = line[:-1].rstrip()
+        return line
+
+    def __getitem__(self,idx):
+        if idx in self.cache:
+            res = self.cache.pop(idx)
+        else:
+            text = self.raw(idx)
+            with iu.SourceFile(self.fname):
+                evs = parse(text,self.linenos[idx])
+            res = evs[0] if len(evs) == 1 else Event(text.strip(),[],evs)
+        self.cache[idx] = res
+        if len(self.cache) > self.cache_size:
+            self.cache.popitem(last=False)
+        return res
+
+    def __iter__(self):
+        idx = 0
+        while self.available(idx+1) > idx:
+            yield self[idx]
+            idx += 1
+
+    def candidates(self,pats):
+        """ Generate the top-level events whose text may contain an event
+        matching one of the patterns, without parsing the others. """
+        names = set(p.rep for p in pats)
+        if '*' in names:
+            for e in self:
+                yield e
+            return
+        idx = 0
+        while self.available(idx+1) > idx:
+            text = self.raw(idx)
+            if any(name in text for name in names):
+                yield self[idx]
+            idx += 1
+
+def read_record(buf,pos):
+    """ Read a record of a binary trace at position pos of buf. Returns the
+    text of the record and the number of bytes used, or None if the record
+    is incomplete. """
+    length = 0
+    shift = 0
+    start = pos
+    while True:
+        if pos >= len(buf):
+            return None
+        byte = ord(buf[pos])
+        pos += 1
+        length |= (byte & 0x7f) << shift
+        shift += 7
+        if not (byte & 0x80):
+            break
+    if pos + length > len(buf):
+        return None
+    return buf[pos:pos+length],pos+length-start
+
+def trace_commands(fname,skip_imports=()):
+    """ Generate the calls of exported actions in a trace, as REPL
+    commands. A call is dropped if it is followed by a call of one of
+    the imports in skip_imports, since the REPL cannot replay it. """
+    cmd = None
+    for start,end,line in EventIndex(fname).lines():
+        line = line.strip()
+        if line.startswith('> '):
+            if cmd is not None:
+                yield cmd
+            cmd = line[2:].rstrip('{').strip()
+        elif line.startswith('< ') and line[2:].split('(')[0] in skip_imports:
+            cmd = None
+    if cmd is not None:
+        yield cmd
+
 
 import ply.lex as lex
 
@@ -387,10 +590,13 @@ def p_error(token):
     else:
         report_error(ParseError(None,None,'unexpected end of input'));
 
-def parse(s):
+def parse(s,lineno=1):
+    """ Parse the text s, whose first line has number lineno in the
+    current source file """
     global error_list
     error_list = []
-    res = parser.parse(s)
+    lexer.lineno = lineno
+    res = parser.parse(s,lexer=lexer)
     if error_list:
         print error_list
         raise iu.ErrorList(error_list)
@@ -6,6 +6,9 @@ import ivy_ui_util as uu
 
 Event = ev.Event
 
+# number of top-level events shown at once
+page_size = 1000
+
 class UI(object):
     def __init__(self,tk,root):
         self.tk,self.root = tk,root
@@ -35,22 +38,48 @@ class EventTree(Tix.Tree,uu.WithMenuBar):
         Tix.Tree.__init__(self,root,options='separator "/"')
         self.evs = evs
         self.notebook = notebook
-        for idx,entry in enumerate(evs):
-            adddir(self, str(idx) ,entry)
+        self.show_page(0)
 
     def menus(self):
         return [("menu","Events",
                  [("button","Filter...",self.filter),
                   ("button","Find reverse...",self.find_reverse),
+                  ("button","Next page",self.next_page),
+                  ("button","Previous page",self.prev_page),
                  ],
                 ),
                ]
+
+    # Only one page of top-level events is added to the tree, so that
+    # large traces can be opened without reading them entirely. If the
+    # events are an EventIndex, the top-level entries are shown without
+    # parsing the events.
+
+    def show_page(self,page):
+        self.page = page
+        self.hlist.delete_all()
+        start = page * page_size
+        for idx in range(start,num_available(self.evs,start+page_size)):
+            if isinstance(self.evs,ev.EventIndex):
+                self.hlist.add(str(idx), text=self.evs.head(idx))
+                self.setmode(str(idx), 'open')
+            else:
+                adddir(self, str(idx), self.evs[idx])
+
+    def next_page(self):
+        if num_available(self.evs,(self.page+1)*page_size+1) > (self.page+1)*page_size:
+            self.show_page(self.page+1)
+
+    def prev_page(self):
+        if self.page > 0:
+            self.show_page(self.page-1)
                  
     def filter(self):
         ask_pat(self,self.do_filter,"Filter")
 
     def do_filter(self,pat_evs):
-        result = list(ev.filter(ev.EventGen()(self.evs),pat_evs))
+        evs = self.evs if isinstance(self.evs,ev.EventIndex) else ev.EventGen()(self.evs)
+        result = list(ev.filter(evs,pat_evs))
         self.notebook.new_sheet(list(result))
 
     def find_reverse(self):
@@ -77,6 +106,9 @@ class EventTree(Tix.Tree,uu.WithMenuBar):
         self.hlist.see(a)
 
     def uncover(self,addr):
+        page = int(addr.split('/',1)[0]) // page_size
+        if page != self.page:
+            self.show_page(page)
         if '/' in addr:
             cs = addr.rsplit('/',1)
             self.uncover(cs[0])
@@ -192,6 +224,9 @@ def adddir(tree, dir, thing):
     if thing.subs:
         tree.setmode(dir, 'open')
 
+def num_available(evs,num):
+    return evs.available(num) if isinstance(evs,ev.EventIndex) else min(num,len(evs))
+
 def lookup(things,dir):
     cs = dir.split('/',1)
     thing = things[int(cs[0])]
@@ -235,21 +270,26 @@ def main():
         usage()
         exit(1)
     fn = sys.argv[1]
-    import chardet # $ pip install chardet
     try:
-        f = open(fn,'r')
-    except:
+        evs = ev.EventIndex(fn)
+    except IOError:
         print "not found: %s" % fn
         sys.exit(1)
-
-    with iu.ErrorPrinter():
-        with iu.SourceFile(fn):
-            s = f.read()
-            evs = ev.parse(s)
     global tk
     tk = Tix.Tk()
-    RunSample(tk,evs)
+    tk.report_callback_exception = report_callback_exception
+    with iu.ErrorPrinter():
+        RunSample(tk,evs)
     tk.mainloop()
 
+def report_callback_exception(exc,val,tb):
+    """ Events are parsed when the tree is expanded, so parse errors
+    are reported here, as ErrorPrinter does """
+    if isinstance(val,iu.IvyError):
+        print str(val)
+        exit(1)
+    import traceback
+    traceback.print_exception(exc,val,tb)
+
 if __name__ == '__main__':
     main()
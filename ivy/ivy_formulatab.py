@@ -0,0 +1,96 @@
+
+# ivy_formulatab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'fmlaleftSEMIleftGLOBALLYEVENTUALLYleftIFleftELSEleftORleftANDleftTILDAleftEQLELTGEGTleftTILDAEQleftCOLONleftPLUSleftMINUSleftTIMESleftDIVleftDOLLARACTION ACTION AFTER ALIAS AND AROUND ARROW ASSERT ASSIGN ASSUME ATTRIBUTE AXIOM BEFORE CALL COLON COMMA CONCEPT CONJECTURE DECREASES DEFINITION DELEGATE DERIVED DESTRUCTOR DIV DOLLAR DOT DOTDOTDOT DOTS ELSE ENSURE ENSURES ENTRY EQ EVENTUALLY EXISTS EXPORT EXTRACT FALSE FORALL FRESH FROM FUNCTION GE GHOST GLOBALLY GT IF IFF IMPLEMENT IMPLEMENTATION IMPORT IN INCLUDE INDIV INIT INSTANTIATE INSTANTIATE INTERPRET INVARIANT ISOLATE LABEL LCB LE LET LOCAL LPAREN LT MACRO MATCH MAXIMIZING MINIMIZING MINUS MIXIN MIXIN MIXORD MODIFIES MODULE MODULE NAMED NATIVEQUOTE NULL OBJECT OF OLD OR PARAMETER PARAMS PLUS PRIVATE PROGRESS PROOF PROPERTY PTO RCB RELATION RELY REQUIRE REQUIRES RETURNS RPAREN SCENARIO SCHEMA SEMI SET SOME SPECIFICATION STATE STRUCT SYMBOL TEMPORAL THIS TILDA TILDAEQ TIMES TRUE TRUSTED TYPE UPDATE USING VAR VARIABLE VARIANT WHILE WITHaterm : SYMBOLaterm : aterm LPAREN terms RPARENatype : SYMBOLatype : atype DOT SYMBOLatype : THISvar : VARIABLEvar : VARIABLE COLON atypesimplevar : VARIABLEsimplevar : VARIABLE COLON SYMBOLterm : atermaterm : term DOT atermterm : OLD atermterm : varterm : term PLUS termterm : term MINUS termterm : term TIMES termterm : term DIV termterm : term IF fmla ELSE termterms : terms : termterms : terms COMMA termterm : LPAREN term RPARENvars : varvars : vars COMMA varsimplevars : simplevarsimplevars : simplevars COMMA simplevarapp : SYMBOLapp : SYMBOL LPAREN terms RPARENapp : term infix termapps : appapps : apps COMMA appatom : SYMBOLatom : SYMBOL LPAREN terms RPARENatoms : atomatoms : atoms COMMA atomlit : atomlit : SYMBOL EQ SYMBOLlit : SYMBOL TILDAEQ SYMBOLlit : TILDA litrelop : EQrelop : LErelop : LTrelop : GErelop : GTrelop : PTOinfix : PLUSinfix : MINUSinfix : TIMESinfix : DIVfmla : termfmla : term relop termfmla : term TILDAEQ termfmla : LPAREN fmla RPARENfmla : TRUEfmla : FALSEfmla : TILDA fmlafmla : fmla AND fmlafmla : fmla OR fmlafmla : fmla ARROW fmlafmla : fmla IFF fmlafmla : FORALL simplevars DOT fmla %prec SEMIfmla : EXISTS simplevars DOT fmla %prec SEMIfmla : GLOBALLY fmlafmla : EVENTUALLY fmlaterm : LPAREN DOLLAR SYMBOL simplevars DOT fmla RPAREN LPAREN terms RPARENterm : DOLLAR SYMBOL DOT fmla %prec SEMI'
+    
+_lr_action_items = {'ARROW':([2,4,5,7,8,13,15,16,17,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,76,78,81,83,84,89,90,91,95,],[-1,-54,-10,25,-13,-6,-50,-55,25,-50,-63,-56,-64,-12,-53,-22,-57,25,25,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,25,-2,-62,-66,-61,-4,-18,25,-65,]),'SYMBOL':([0,1,3,6,9,11,14,18,21,23,24,25,26,33,35,37,38,39,40,41,42,43,44,45,46,47,48,49,50,61,62,63,64,79,85,86,87,93,],[2,2,2,2,2,31,2,52,2,2,2,2,2,66,2,-45,2,2,-43,2,-42,-41,2,-44,2,-40,2,2,2,2,82,2,2,2,89,2,2,2,]),'GLOBALLY':([0,1,3,6,9,23,24,25,26,50,61,63,64,87,],[3,3,3,3,3,3,3,3,3,3,3,3,3,3,]),'IFF':([2,4,5,7,8,13,15,16,17,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,76,78,81,83,84,89,90,91,95,],[-1,-54,-10,24,-13,-6,-50,-55,24,-50,-63,-56,-64,-12,-53,-22,-57,24,24,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,24,-2,-62,-66,-61,-4,-18,24,-65,]),'COLON':([13,30,],[33,62,]),'DIV':([2,4,5,8,13,15,16,19,20,22,27,34,36,51,53,55,56,57,58,59,65,66,67,68,69,70,71,72,73,74,75,78,81,83,84,88,89,90,95,],[-1,-54,-10,-13,-6,46,-55,46,-63,-56,-64,46,-10,-53,-22,46,-57,-60,-59,-58,-5,-3,-7,46,46,46,46,46,-17,46,-10,-2,-62,-66,-61,46,-4,46,-65,]),'TRUE':([0,1,3,6,9,23,24,25,26,50,61,63,64,87,],[4,4,4,4,4,4,4,4,4,4,4,4,4,4,]),'MINUS':([2,4,5,8,13,15,16,19,20,22,27,34,36,51,53,55,56,57,58,59,65,66,67,68,69,70,71,72,73,74,75,78,81,83,84,88,89,90,95,],[-1,-54,-10,-13,-6,48,-55,48,-63,-56,-64,48,-10,-53,-22,48,-57,-60,-59,-58,-5,-3,-7,48,48,48,-16,48,-17,-15,-10,-2,-62,-66,-61,48,-4,48,-65,]),'DOT':([2,4,5,8,13,15,16,19,20,22,27,28,29,30,31,32,34,36,51,52,53,55,56,57,58,59,65,66,67,68,69,70,71,72,73,74,75,77,78,80,81,82,83,84,88,89,90,95,],[-1,-54,-10,-13,-6,49,-55,49,-63,-56,-64,-25,61,-8,63,64,49,-10,-53,63,-22,49,-57,-60,-59,-58,-5,-3,-7,49,-52,49,-16,-14,-17,-15,-10,87,-2,-26,-62,-9,-66,-61,49,-4,-18,-65,]),'PTO':([2,4,5,8,13,15,16,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,78,81,83,84,89,90,95,],[-1,-54,-10,-13,-6,37,-55,37,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-4,-18,-65,]),'TILDAEQ':([2,4,5,8,13,15,16,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,78,81,83,84,89,90,95,],[-1,-54,-10,-13,-6,38,-55,38,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-4,-18,-65,]),'OLD':([0,1,3,6,9,14,21,23,24,25,26,35,37,38,39,40,41,42,43,44,45,46,47,48,49,50,61,63,64,79,86,87,93,],[14,14,14,14,14,14,14,14,14,14,14,14,-45,14,14,-43,14,-42,-41,14,-44,14,-40,14,14,14,14,14,14,14,14,14,14,]),'LT':([2,4,5,8,13,15,16,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,78,81,83,84,89,90,95,],[-1,-54,-10,-13,-6,42,-55,42,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-4,-18,-65,]),'TILDA':([0,1,3,6,9,23,24,25,26,50,61,63,64,87,],[6,6,6,6,6,6,6,6,6,6,6,6,6,6,]),'PLUS':([2,4,5,8,13,15,16,19,20,22,27,34,36,51,53,55,56,57,58,59,65,66,67,68,69,70,71,72,73,74,75,78,81,83,84,88,89,90,95,],[-1,-54,-10,-13,-6,44,-55,44,-63,-56,-64,44,-10,-53,-22,44,-57,-60,-59,-58,-5,-3,-7,44,44,44,-16,-14,-17,-15,-10,-2,-62,-66,-61,44,-4,44,-65,]),'FORALL':([0,1,3,6,9,23,24,25,26,50,61,63,64,87,],[12,12,12,12,12,12,12,12,12,12,12,12,12,12,]),'COMMA':([2,4,5,8,13,15,16,20,21,22,27,28,29,30,32,36,51,53,54,55,56,57,58,59,65,66,67,69,70,71,72,73,74,75,77,78,80,81,82,83,84,88,89,90,93,94,95,],[-1,-54,-10,-13,-6,-50,-55,-63,-19,-56,-64,-25,60,-8,60,-12,-53,-22,79,-20,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,60,-2,-26,-62,-9,-66,-61,-21,-4,-18,-19,79,-65,]),'$end':([2,4,5,7,8,13,15,16,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,78,81,83,84,89,90,95,],[-1,-54,-10,0,-13,-6,-50,-55,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-4,-18,-65,]),'EVENTUALLY':([0,1,3,6,9,23,24,25,26,50,61,63,64,87,],[9,9,9,9,9,9,9,9,9,9,9,9,9,9,]),'GT':([2,4,5,8,13,15,16,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,78,81,83,84,89,90,95,],[-1,-54,-10,-13,-6,45,-55,45,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-4,-18,-65,]),'EXISTS':([0,1,3,6,9,23,24,25,26,50,61,63,64,87,],[10,10,10,10,10,10,10,10,10,10,10,10,10,10,]),'DOLLAR':([0,1,3,6,9,14,21,23,24,25,26,35,37,38,39,40,41,42,43,44,45,46,47,48,49,50,61,63,64,79,86,87,93,],[11,18,11,11,11,11,11,11,11,11,11,18,-45,11,11,-43,11,-42,-41,11,-44,11,-40,11,11,11,11,11,11,11,11,11,11,]),'ELSE':([2,4,5,8,13,15,16,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,76,78,81,83,84,89,90,95,],[-1,-54,-10,-13,-6,-50,-55,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,86,-2,-62,-66,-61,-4,-18,-65,]),'GE':([2,4,5,8,13,15,16,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,78,81,83,84,89,90,95,],[-1,-54,-10,-13,-6,40,-55,40,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-4,-18,-65,]),'LE':([2,4,5,8,13,15,16,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,78,81,83,84,89,90,95,],[-1,-54,-10,-13,-6,43,-55,43,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-4,-18,-65,]),'LPAREN':([0,1,2,3,5,6,9,14,21,23,24,25,26,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,61,63,64,75,78,79,86,87,92,93,],[1,1,-1,1,21,1,1,35,35,1,1,1,1,35,21,-45,35,35,-43,35,-42,-41,35,-44,35,-40,35,35,1,1,1,1,21,-2,35,35,1,93,35,]),'VARIABLE':([0,1,3,6,9,10,12,14,21,23,24,25,26,35,37,38,39,40,41,42,43,44,45,46,47,48,49,50,52,60,61,63,64,79,86,87,93,],[13,13,13,13,13,30,30,13,13,13,13,13,13,13,-45,13,13,-43,13,-42,-41,13,-44,13,-40,13,13,13,30,30,13,13,13,13,13,13,13,]),'RPAREN':([2,4,5,8,13,15,16,17,19,20,21,22,27,36,51,53,54,55,56,57,58,59,65,66,67,68,69,70,71,72,73,74,75,78,81,83,84,88,89,90,91,93,94,95,],[-1,-54,-10,-13,-6,-50,-55,51,53,-63,-19,-56,-64,-12,-53,-22,78,-20,-57,-60,-59,-58,-5,-3,-7,53,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-21,-4,-18,92,-19,95,-65,]),'TIMES':([2,4,5,8,13,15,16,19,20,22,27,34,36,51,53,55,56,57,58,59,65,66,67,68,69,70,71,72,73,74,75,78,81,83,84,88,89,90,95,],[-1,-54,-10,-13,-6,41,-55,41,-63,-56,-64,41,-10,-53,-22,41,-57,-60,-59,-58,-5,-3,-7,41,41,41,-16,41,-17,41,-10,-2,-62,-66,-61,41,-4,41,-65,]),'EQ':([2,4,5,8,13,15,16,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,78,81,83,84,89,90,95,],[-1,-54,-10,-13,-6,47,-55,47,-63,-56,-64,-12,-53,-22,-57,-60,-59,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,-2,-62,-66,-61,-4,-18,-65,]),'IF':([2,4,5,8,13,15,16,19,20,22,27,34,36,51,53,55,56,57,58,59,65,66,67,68,69,70,71,72,73,74,75,78,81,83,84,88,89,90,95,],[-1,-54,-10,-13,-6,50,-55,50,-63,-56,-64,50,-10,-53,-22,50,-57,-60,-59,-58,-5,-3,-7,50,-52,50,-16,-14,-17,-15,-10,-2,-62,-66,-61,50,-4,-18,-65,]),'AND':([2,4,5,7,8,13,15,16,17,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,76,78,81,83,84,89,90,91,95,],[-1,-54,-10,23,-13,-6,-50,-55,23,-50,23,-56,23,-12,-53,-22,-57,23,23,23,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,23,-2,23,23,23,-4,-18,23,-65,]),'FALSE':([0,1,3,6,9,23,24,25,26,50,61,63,64,87,],[16,16,16,16,16,16,16,16,16,16,16,16,16,16,]),'THIS':([33,],[65,]),'OR':([2,4,5,7,8,13,15,16,17,19,20,22,27,36,51,53,56,57,58,59,65,66,67,69,70,71,72,73,74,75,76,78,81,83,84,89,90,91,95,],[-1,-54,-10,26,-13,-6,-50,-55,26,-50,26,-56,26,-12,-53,-22,-57,26,26,-58,-5,-3,-7,-52,-51,-16,-14,-17,-15,-11,26,-2,26,26,26,-4,-18,26,-65,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'term':([0,1,3,6,9,14,21,23,24,25,26,35,38,39,41,44,46,48,49,50,61,63,64,79,86,87,93,],[15,19,15,15,15,34,55,15,15,15,15,68,69,70,71,72,73,74,34,15,15,15,15,88,90,15,55,]),'simplevar':([10,12,52,60,],[28,28,28,80,]),'relop':([15,19,],[39,39,]),'atype':([33,],[67,]),'aterm':([0,1,3,6,9,14,21,23,24,25,26,35,38,39,41,44,46,48,49,50,61,63,64,79,86,87,93,],[5,5,5,5,5,36,5,5,5,5,5,5,5,5,5,5,5,5,75,5,5,5,5,5,5,5,5,]),'fmla':([0,1,3,6,9,23,24,25,26,50,61,63,64,87,],[7,17,20,22,27,56,57,58,59,76,81,83,84,91,]),'var':([0,1,3,6,9,14,21,23,24,25,26,35,38,39,41,44,46,48,49,50,61,63,64,79,86,87,93,],[8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),'terms':([21,93,],[54,94,]),'simplevars':([10,12,52,],[29,32,77,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> fmla","S'",1,None,None,None),
+  ('aterm -> SYMBOL','aterm',1,'p_aterm_symbol','ivy_logic_parser.py',16),
+  ('aterm -> aterm LPAREN terms RPAREN','aterm',4,'p_aterm_aterm_terms','ivy_logic_parser.py',21),
+  ('atype -> SYMBOL','atype',1,'p_atype_symbol','ivy_logic_parser.py',41),
+  ('atype -> atype DOT SYMBOL','atype',3,'p_atype_atype_dot_symbol','ivy_logic_parser.py',46),
+  ('atype -> THIS','atype',1,'p_atype_this','ivy_logic_parser.py',52),
+  ('var -> VARIABLE','var',1,'p_var_variable','ivy_logic_parser.py',57),
+  ('var -> VARIABLE COLON atype','var',3,'p_var_variable_colon_symbol','ivy_logic_parser.py',62),
+  ('simplevar -> VARIABLE','simplevar',1,'p_simplevar_variable','ivy_logic_parser.py',67),
+  ('simplevar -> VARIABLE COLON SYMBOL','simplevar',3,'p_simplevar_variable_colon_symbol','ivy_logic_parser.py',72),
+  ('term -> aterm','term',1,'p_term_aterm','ivy_logic_parser.py',77),
+  ('aterm -> term DOT aterm','aterm',3,'p_term_term_dot_aterm','ivy_logic_parser.py',82),
+  ('term -> OLD aterm','term',2,'p_aterm_old_symbol','ivy_logic_parser.py',90),
+  ('term -> var','term',1,'p_term_var','ivy_logic_parser.py',95),
+  ('term -> term PLUS term','term',3,'p_term_term_PLUS_term','ivy_logic_parser.py',101),
+  ('term -> term MINUS term','term',3,'p_term_term_MINUS_term','ivy_logic_parser.py',106),
+  ('term -> term TIMES term','term',3,'p_term_term_TIMES_term','ivy_logic_parser.py',111),
+  ('term -> term DIV term','term',3,'p_term_term_DIV_term','ivy_logic_parser.py',116),
+  ('term -> term IF fmla ELSE term','term',5,'p_term_if_fmla_else_term','ivy_logic_parser.py',121),
+  ('terms -> <empty>','terms',0,'p_terms','ivy_logic_parser.py',147),
+  ('terms -> term','terms',1,'p_terms_term','ivy_logic_parser.py',151),
+  ('terms -> terms COMMA term','terms',3,'p_terms_terms_term','ivy_logic_parser.py',155),
+  ('term -> LPAREN term RPAREN','term',3,'p_term_lp_term_lp','ivy_logic_parser.py',161),
+  ('vars -> var','vars',1,'p_vars_var','ivy_logic_parser.py',165),
+  ('vars -> vars COMMA var','vars',3,'p_vars_vars_comma_var','ivy_logic_parser.py',169),
+  ('simplevars -> simplevar','simplevars',1,'p_simplevars_simplevar','ivy_logic_parser.py',174),
+  ('simplevars -> simplevars COMMA simplevar','simplevars',3,'p_simplevars_simplevars_comma_simplevar','ivy_logic_parser.py',178),
+  ('app -> SYMBOL','app',1,'p_app_symbol','ivy_logic_parser.py',185),
+  ('app -> SYMBOL LPAREN terms RPAREN','app',4,'p_app_symbol_lp_terms_rp','ivy_logic_parser.py',190),
+  ('app -> term infix term','app',3,'p_app_term_infix_term','ivy_logic_parser.py',195),
+  ('apps -> app','apps',1,'p_apps_app','ivy_logic_parser.py',201),
+  ('apps -> apps COMMA app','apps',3,'p_apps_apps_app','ivy_logic_parser.py',205),
+  ('atom -> SYMBOL','atom',1,'p_atom_symbol','ivy_logic_parser.py',212),
+  ('atom -> SYMBOL LPAREN terms RPAREN','atom',4,'p_atom_symbol_lp_terms_rp','ivy_logic_parser.py',217),
+  ('atoms -> atom','atoms',1,'p_atoms_atom','ivy_logic_parser.py',222),
+  ('atoms -> atoms COMMA atom','atoms',3,'p_atoms_atoms_atom','ivy_logic_parser.py',226),
+  ('lit -> atom','lit',1,'p_lit_atom','ivy_logic_parser.py',233),
+  ('lit -> SYMBOL EQ SYMBOL','lit',3,'p_lit_term_eq_term','ivy_logic_parser.py',238),
+  ('lit -> SYMBOL TILDAEQ SYMBOL','lit',3,'p_lit_term_tildaeq_term','ivy_logic_parser.py',243),
+  ('lit -> TILDA lit','lit',2,'p_lit_tilda_atom','ivy_logic_parser.py',248),
+  ('relop -> EQ','relop',1,'p_relop_eq','ivy_logic_parser.py',253),
+  ('relop -> LE','relop',1,'p_relop_le','ivy_logic_parser.py',257),
+  ('relop -> LT','relop',1,'p_relop_lt','ivy_logic_parser.py',261),
+  ('relop -> GE','relop',1,'p_relop_ge','ivy_logic_parser.py',265),
+  ('relop -> GT','relop',1,'p_relop_gt','ivy_logic_parser.py',269),
+  ('relop -> PTO','relop',1,'p_relop_pto','ivy_logic_parser.py',273),
+  ('infix -> PLUS','infix',1,'p_infix_plus','ivy_logic_parser.py',277),
+  ('infix -> MINUS','infix',1,'p_infix_minus','ivy_logic_parser.py',281),
+  ('infix -> TIMES','infix',1,'p_infix_times','ivy_logic_parser.py',285),
+  ('infix -> DIV','infix',1,'p_infix_div','ivy_logic_parser.py',289),
+  ('fmla -> term','fmla',1,'p_fmla_term','ivy_logic_parser.py',295),
+  ('fmla -> term relop term','fmla',3,'p_fmla_term_relop_term','ivy_logic_parser.py',299),
+  ('fmla -> term TILDAEQ term','fmla',3,'p_fmla_term_tildaeq_term','ivy_logic_parser.py',304),
+  ('fmla -> LPAREN fmla RPAREN','fmla',3,'p_fmla_lparen_fmla_rparen','ivy_logic_parser.py',309),
+  ('fmla -> TRUE','fmla',1,'p_fmla_true','ivy_logic_parser.py',313),
+  ('fmla -> FALSE','fmla',1,'p_fmla_false','ivy_logic_parser.py',318),
+  ('fmla -> TILDA fmla','fmla',2,'p_fmla_not_fmla','ivy_logic_parser.py',323),
+  ('fmla -> fmla AND fmla','fmla',3,'p_fmla_fmla_and_fmla','ivy_logic_parser.py',328),
+  ('fmla -> fmla OR fmla','fmla',3,'p_fmla_fmla_or_fmla','ivy_logic_parser.py',337),
+  ('fmla -> fmla ARROW fmla','fmla',3,'p_fmla_fmla_arrow_fmla','ivy_logic_parser.py',348),
+  ('fmla -> fmla IFF fmla','fmla',3,'p_fmla_fmla_iff_fmla','ivy_logic_parser.py',353),
+  ('fmla -> FORALL simplevars DOT fmla','fmla',4,'p_fmla_forall_vars_dot_fmla','ivy_logic_parser.py',372),
+  ('fmla -> EXISTS simplevars DOT fmla','fmla',4,'p_fmla_exists_vars_dot_fmla','ivy_logic_parser.py',377),
+  ('fmla -> GLOBALLY fmla','fmla',2,'p_fmla_globally_fmla','ivy_logic_parser.py',382),
+  ('fmla -> EVENTUALLY fmla','fmla',2,'p_fmla_eventually_fmla','ivy_logic_parser.py',387),
+  ('term -> LPAREN DOLLAR SYMBOL simplevars DOT fmla RPAREN LPAREN terms RPAREN','term',10,'p_term_namedbinder_vars_dot_fmla','ivy_logic_parser.py',392),
+  ('term -> DOLLAR SYMBOL DOT fmla','term',4,'p_term_namedbinder_dot_fmla','ivy_logic_parser.py',399),
+]
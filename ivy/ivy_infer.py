@@ -0,0 +1,312 @@
+#
+# Copyright (c) Microsoft Corporation. All Rights Reserved.
+#
+"""
+Infer universally quantified invariants for an Ivy program.
+
+Usage:
+ivy_infer [isolate=iso] [max_frames=n] file.ivy
+
+For each isolate (or for the whole program if there are none), this
+searches for an inductive invariant that proves the conjectures and
+the assertions of the exported actions, using property-directed
+reachability (IC3/PDR) over the transition relations of the exported
+actions. Frames are sets of universally quantified clauses. A bad
+state is blocked by computing its diagram, blocking the diagrams of
+its predecessors in the previous frame, and then generalizing the
+diagram using unsat cores of the transition relation. Clauses are
+pushed to later frames as long as they are relatively inductive.
+
+The invariant found is printed as "conjecture" declarations that can
+be added to the program. If a bad state is found to be reachable, the
+program is incorrect, and a counterexample trace is printed, as by
+ivy_bmc. If no universal invariant is found within max_frames frames,
+the program may need invariants that are not universally quantified.
+"""
+
+import sys
+
+import ivy_init
+import ivy_logic as lg
+import ivy_logic_utils as lut
+import ivy_utils as iu
+import ivy_module as im
+import ivy_actions as act
+import ivy_solver as slv
+import ivy_transrel as itr
+import ivy_compiler
+import ivy_isolate
+import ivy_ast
+import ivy_theory as ith
+import ivy_bmc
+
+opt_max_frames = iu.Parameter("max_frames","20")
+
+def usage():
+    print "usage: \n  {} [isolate=iso] [max_frames=n] file.ivy".format(sys.argv[0])
+    sys.exit(1)
+
+class InferenceFailed(Exception):
+    pass
+
+class Counterexample(Exception):
+    """ A bad state is reachable from the initial states in at most
+    depth steps """
+    def __init__(self,depth):
+        self.depth = depth
+
+def cube_to_lemma(cube):
+    """ Return the negation of a diagram, with the elements it names
+    turned into universally quantified variables, numbered in order
+    of the names of the elements """
+    consts = sorted((c for c in lut.used_constants_clauses(cube) if c.is_skolem()),key=str)
+    renaming = dict((c,lg.Variable('V'+str(i),c.sort)) for i,c in enumerate(consts))
+    cube = lut.substitute_constants_clauses(cube,renaming)
+    return lut.Clauses([lg.Or(*[lut.negate(f) for f in cube.fmlas])])
+
+def name_elements(cube,numerals):
+    """ Replace the numerals that a diagram uses to name the elements
+    of uninterpreted sorts with skolem constants, making the
+    distinctness of the elements explicit """
+    elems = [c for c in lut.used_constants_clauses(cube)
+             if c.is_numeral() and not lg.is_interpreted_sort(c.sort) and c not in numerals]
+    renaming = dict((c,lg.Constant(c.rename(lambda s,c=c:'__' + str(c.sort) + s))) for c in elems)
+    fmlas = [lut.substitute_constants_ast(f,renaming) for f in cube.fmlas]
+    for i,c in enumerate(elems):
+        for d in elems[:i]:
+            if c.sort == d.sort:
+                fmlas.append(lg.Not(lg.Equals(renaming[d],renaming[c])))
+    return lut.Clauses(fmlas)
+
+def lemma_to_conjecture(lemma):
+    # Or orders its disjuncts by identity, so sort them by name to
+    # print the same conjecture on every run
+    fmla = lut.clauses_to_formula(lemma)
+    if isinstance(fmla,lg.Or):
+        return 'conjecture (' + ' | '.join(sorted(str(f) for f in fmla.args)) + ')'
+    return 'conjecture ' + str(fmla)
+
+class Frames(object):
+    """ Frames of the PDR algorithm, with delta encoding: lemmas[i]
+    holds the lemmas that are valid up to frame i, so frame i (i > 0)
+    is the conjunction of the lemmas at levels >= i. Frame 0 is the
+    set of initial states. """
+
+    def __init__(self,init,actions,props,axioms):
+        self.init = init
+        self.actions = actions
+        self.props = props
+        self.axioms = axioms
+        self.lemmas = [[],[]]
+        used = set()
+        for clauses in [init,axioms] + [p for l,p in props] + [c for n,u in actions for c in u[1:]]:
+            used.update(lut.used_constants_clauses(clauses))
+        self.numerals = set(c for c in used if c.is_numeral())
+
+    @property
+    def top(self):
+        return len(self.lemmas) - 1
+
+    def frame(self,i):
+        if i == 0:
+            return self.init
+        return lut.and_clauses(*[l for ls in self.lemmas[i:] for l in ls])
+
+    def model(self,clauses):
+        return itr.small_model_clauses(lut.and_clauses(clauses,self.axioms),shrink=False)
+
+    def diagram(self,clauses,model):
+        ignore = lambda s: s.is_skolem() or itr.is_new(s)
+        cube = slv.clauses_model_to_diagram(clauses,ignore,model=model,axioms=self.axioms,
+                                            weaken=True,numerals=True)
+        return name_elements(cube,self.numerals)
+
+    def state_diagram(self,clauses):
+        """ Return a diagram of a state satisfying clauses, or None """
+        model = self.model(clauses)
+        if model is None:
+            return None
+        return self.diagram(clauses,model)
+
+    def bad_cube(self,i):
+        """ Return a diagram of a state in frame i that violates a
+        conjecture or fails an assertion, or None """
+        fi = self.frame(i)
+        for label,prop in self.props:
+            cube = self.state_diagram(lut.and_clauses(fi,lut.dual_clauses(prop)))
+            if cube is not None:
+                return cube
+        for name,(updated,tr,fail) in self.actions:
+            if not fail.is_false():
+                cube = self.state_diagram(lut.and_clauses(fi,fail))
+                if cube is not None:
+                    return cube
+        return None
+
+    def predecessor(self,cube,i):
+        """ Return a diagram of a state in frame i-1 with a successor
+        in cube, or None """
+        pre = lut.and_clauses(self.frame(i-1),cube_to_lemma(cube))
+        for name,upd in self.actions:
+            res = self.state_diagram(lut.and_clauses(pre,itr.reverse_image(cube,self.axioms,upd)))
+            if res is not None:
+                return res
+        return None
+
+    def core(self,cube,clauses):
+        return slv.unsat_core(cube,lut.and_clauses(itr.rename_distinct(clauses,cube),self.axioms))
+
+    def generalize(self,cube,i):
+        """ Return the literals of cube needed to show that cube is
+        unreachable from frame i-1 and from the initial states """
+        pre = lut.and_clauses(self.frame(i-1),cube_to_lemma(cube))
+        used = set()
+        cores = [self.core(cube,self.init)]
+        for name,upd in self.actions:
+            cores.append(self.core(cube,itr.forward_image(pre,self.axioms,upd)))
+        for core in cores:
+            used.update(core.fmlas)
+        return lut.Clauses([f for f in cube.fmlas if f in used])
+
+    def inductive(self,lemma,i):
+        """ True if lemma holds after any action from frame i """
+        fi = self.frame(i)
+        return all(slv.clauses_imply(lut.and_clauses(itr.forward_image(fi,self.axioms,upd),self.axioms),lemma)
+                   for name,upd in self.actions)
+
+    def block(self,cube,i):
+        """ Add lemmas to frames 1..i excluding cube """
+        stack = [(cube,i)]
+        while stack:
+            cube,i = stack[-1]
+            if i == 0 or slv.clauses_sat(lut.and_clauses(self.init,cube,self.axioms)):
+                raise Counterexample(len(stack))
+            pred = self.predecessor(cube,i)
+            if pred is not None:
+                stack.append((pred,i-1))
+                continue
+            stack.pop()
+            lemma = cube_to_lemma(self.generalize(cube,i))
+            while i < self.top and self.inductive(lemma,i):
+                i += 1
+            self.add_lemma(lemma,i)
+
+    def add_lemma(self,lemma,i):
+        key = str(lemma)
+        for j,ls in enumerate(self.lemmas):
+            if any(str(l) == key for l in ls):
+                if j >= i:
+                    return
+                ls[:] = [l for l in ls if str(l) != key]
+        self.lemmas[i].append(lemma)
+
+    def propagate(self):
+        """ Push lemmas forward. Return the level of an inductive frame,
+        or None """
+        for i in range(1,self.top):
+            for lemma in list(self.lemmas[i]):
+                if self.inductive(lemma,i):
+                    self.add_lemma(lemma,i+1)
+            if not self.lemmas[i]:
+                return i + 1
+        return None
+
+    def invariant(self,max_frames):
+        """ Return the lemmas of an inductive invariant """
+        if self.bad_cube(0) is not None:
+            raise Counterexample(1)
+        while self.top <= max_frames:
+            cube = self.bad_cube(self.top)
+            if cube is not None:
+                self.block(cube,self.top)
+                continue
+            self.lemmas.append([])
+            level = self.propagate()
+            if level is not None:
+                lemmas = [l for ls in self.lemmas[level:] for l in ls]
+                self.check_invariant(lut.and_clauses(*lemmas))
+                return lemmas
+        raise InferenceFailed()
+
+    def check_invariant(self,inv):
+        """ Check that inv is an inductive invariant that proves the
+        properties """
+        ok = (slv.clauses_imply(lut.and_clauses(self.init,self.axioms),inv)
+              and all(slv.clauses_imply(lut.and_clauses(inv,self.axioms),p) for l,p in self.props)
+              and not any(slv.clauses_sat(lut.and_clauses(inv,fail,self.axioms))
+                          for n,(u,t,fail) in self.actions)
+              and all(slv.clauses_imply(lut.and_clauses(itr.forward_image(inv,self.axioms,upd),self.axioms),inv)
+                      for n,upd in self.actions))
+        if not ok:
+            raise iu.IvyError(None,'internal error: inferred invariant is not inductive')
+
+def initial_states(mod,axioms):
+    init = mod.init_cond
+    if mod.initializers:
+        action = act.Sequence(*[a for n,a in mod.initializers])
+        init = itr.forward_image(init,axioms,action.update(mod,None))
+    return init
+
+def infer_isolate():
+    mod = im.module
+    if any(p.temporal for p in mod.labeled_props):
+        raise iu.IvyError(None,'invariant inference does not support temporal properties')
+    ith.check_theory()
+    with mod.theory_context():
+        axioms = mod.background_theory()
+        actions = [(name,mod.actions[name].update(mod,None)) for name in sorted(mod.public_actions)]
+        props = [(c.label,lut.formula_to_clauses(c.formula)) for c in mod.labeled_conjs]
+        frames = Frames(initial_states(mod,axioms),actions,props,axioms)
+        try:
+            lemmas = frames.invariant(int(opt_max_frames.get()))
+        except InferenceFailed:
+            raise iu.IvyError(None,'no universal invariant found in {} frames'.format(frames.top))
+        except Counterexample as e:
+            # the bad cubes are exact enough for their path to be a
+            # real one, so bounded model checking finds the trace
+            cex = ivy_bmc.Unrolling(mod).check(e.depth)
+            if cex is None:
+                raise iu.IvyError(None,'internal error: no counterexample of depth {}'.format(e.depth))
+            print "FAIL"
+            ivy_bmc.print_trace(cex)
+            return 1
+        for lemma in lemmas:
+            print lemma_to_conjecture(lemma)
+        return 0
+
+def infer_module():
+    isolate = ivy_compiler.isolate.get()
+    if isolate != None:
+        isolates = [isolate]
+    else:
+        isolates = sorted(list(im.module.isolates))
+        if len(isolates) == 0:
+            isolates = [None]
+    failures = 0
+    for isolate in isolates:
+        if isolate != None and isolate in im.module.isolates:
+            idef = im.module.isolates[isolate]
+            if len(idef.verified()) == 0 or isinstance(idef,ivy_ast.TrustedIsolateDef):
+                continue # skip if nothing to verify
+        if isolate:
+            print "\n# isolate {}:".format(isolate)
+        with im.module.copy():
+            ivy_isolate.create_isolate(isolate)
+            failures += infer_isolate()
+    return failures
+
+def main():
+    import signal
+    signal.signal(signal.SIGINT,signal.SIG_DFL)
+    ivy_init.read_params()
+    if len(sys.argv) != 2 or not sys.argv[1].endswith('ivy'):
+        usage()
+    with im.Module():
+        with iu.ErrorPrinter():
+            ivy_init.source_file(sys.argv[1],ivy_init.open_read(sys.argv[1]),create_isolate=False)
+            failures = infer_module()
+            if failures:
+                raise iu.IvyError(None,"failed checks: {}".format(failures))
+
+if __name__ == "__main__":
+    main()
@@ -195,6 +195,83 @@ def vstartswith_eq_some(s,prefixes,mod):
     res = vstartswith_eq_some_rec(s,prefixes,mod)
     return res
 
+class NameTrie(object):
+    """ The hierarchy of a set of compound names. Each name in the trie
+    is a child of its longest proper prefix, and names with no prefix
+    are children of None. This lets us compute startswith_eq_some for
+    all the names at once, by walking down the trie from the prefixes,
+    instead of walking up the hierarchy from each name. """
+
+    def __init__(self,names):
+        self.parent = dict()
+        self.children = defaultdict(list)
+        for name in names:
+            self.add(name)
+
+    def add(self,name):
+        while name not in self.parent:
+            parts = name.rsplit(iu.ivy_compose_character,1)
+            parent = parts[0] if len(parts)==2 else None
+            self.parent[name] = parent
+            self.children[parent].append(name)
+            if parent is None:
+                break
+            name = parent
+
+    def members(self,prefixes,privates):
+        """ Returns the set of names s in the trie such that s is in
+        prefixes, or s is not private and its parent is a member. The
+        parent of the top-level names is a member if 'this' is in
+        prefixes. This is the set of names for which startswith_eq_some_rec
+        is true. """
+        res = set()
+        todo = list(self.children[None]) if 'this' in prefixes else []
+        todo.extend(name for name in prefixes if name in self.parent)
+        while todo:
+            name = todo.pop()
+            if name in res or (name not in prefixes and name in privates):
+                continue
+            res.add(name)
+            todo.extend(self.children[name])
+        return res
+
+    def vmembers(self,prefixes,mod):
+        """ The set of names for which vstartswith_eq_some_rec is true """
+        if iu.version_le(iu.get_string_version(),"1.6"):
+            return self.members(prefixes,mod.privates)
+        return self.members(prefixes,mod.privates | vprivates)
+
+def action_trie(mod):
+    return NameTrie(list(mod.actions) + implementation_map.values())
+
+def impl_members(names,members):
+    """ Filter names by membership of their implementations """
+    res = set(a for a in members if a in names and a not in implementation_map)
+    res.update(a for a,b in implementation_map.iteritems() if b in members and a in names)
+    return res
+
+def isolate_actions_key(mod):
+    """ The state that determines the actions in the isolates """
+    return (frozenset(mod.actions),frozenset(mod.privates),
+            frozenset(implementation_map.iteritems()))
+
+def get_isolate_actions_present(mod,iso_name,isolate,trie=None,key=None):
+    """ Returns the sets of actions verified and present in an
+    isolate. The result is cached in the module, so it is computed
+    once by check_isolate_completeness and reused by create_isolate.
+    The sets are shared, and should not be modified. """
+    key = (iso_name,key or isolate_actions_key(mod))
+    if key not in mod.isolate_actions:
+        trie = trie or action_trie(mod)
+        verified,present = get_isolate_info(mod,isolate,'impl')
+        save_privates = mod.privates
+        set_privates(mod,isolate)
+        verified_actions = impl_members(mod.actions,trie.vmembers(verified,mod))
+        present_actions = impl_members(mod.actions,trie.members(present,mod.privates))
+        mod.privates = save_privates
+        mod.isolate_actions[key] = (verified_actions,present_actions)
+    return mod.isolate_actions[key]
+
 def strip_map_lookup(name,strip_map,with_dot=False):
     name = canon_act(name)
     for prefix in strip_map:
@@ -642,8 +719,10 @@ def set_privates(mod,isolate,suff=None):
     mod.privates = set(mod.privates)
     if suff in mod.hierarchy:
         mod.privates.add(suff)
+    mode = isolate_mode.get()
+    attributed = set(p for p,c in map(iu.parent_child_name,mod.attributes) if c == mode)
     for n,l in mod.hierarchy.iteritems():
-        nsuff = get_private_from_attributes(mod,n,suff)
+        nsuff = get_private_from_attributes(mod,n,suff) if n in attributed else suff
         if nsuff in l:
             mod.privates.add(iu.compose_names(n,nsuff))
     for name in mod.attributes:
@@ -678,7 +757,9 @@ def get_props_proved_in_isolate(mod,isolate):
                 ovn = other_verified.relname
                 if startswith_some(ovn,verified,mod):
                     mod.privates.add(ovn)
-    check_pr = lambda name: (name is None or vstartswith_eq_some(name.rep,verified,mod))
+    labels = [implementation_map.get(a.label.rep,a.label.rep) for a in mod.labeled_props if a.label]
+    members = NameTrie(labels).vmembers(verified,mod)
+    check_pr = lambda name: (name is None or implementation_map.get(name.rep,name.rep) in members)
     not_proved = [a for a in mod.labeled_props if not check_pr(a.label)]
     proved = [a for a in mod.labeled_props if check_pr(a.label)]
     mod.privates = save_privates
@@ -1413,13 +1494,8 @@ def create_isolate(iso,mod = None,**kwargs):
 
             if iso and iso in mod.isolates:
                 isolate = mod.isolates[iso]
-                verified,present = get_isolate_info(mod,isolate,'impl')
-                save_privates = mod.privates
-                set_privates(mod,isolate)
-                verified_actions = set(a for a in mod.actions if vstartswith_eq_some(a,verified,mod))
-                present_actions = set(a for a in mod.actions if startswith_eq_some(a,present,mod))
-                present_actions.update(verified_actions)
-                mod.privates = save_privates
+                verified_actions,present_actions = get_isolate_actions_present(mod,iso,isolate)
+                present_actions = present_actions | verified_actions
                 for actname in present_actions:
                     for called in im.module.actions[actname].iter_calls():
                         if called not in present_actions:
@@ -1596,13 +1672,10 @@ def check_isolate_completeness(mod = None):
                     raise IvyError(m,'action {} not defined'.format(foo))
             implementation_map[m.mixee()] = m.mixer()
     
+    trie = action_trie(mod)
+    key = isolate_actions_key(mod)
     for iso_name,isolate in mod.isolates.iteritems():
-        verified,present = get_isolate_info(mod,isolate,'impl')
-        save_privates = mod.privates
-        set_privates(mod,isolate)
-        verified_actions = set(a for a in mod.actions if vstartswith_eq_some(a,verified,mod))
-        present_actions = set(a for a in mod.actions if startswith_eq_some(a,present,mod))
-        mod.privates = save_privates
+        verified_actions,present_actions = get_isolate_actions_present(mod,iso_name,isolate,trie,key)
 
         for a in verified_actions:
             if a not in delegates:
@@ -1627,8 +1700,9 @@ def check_isolate_completeness(mod = None):
         if lbl:
             trusted.add(lbl.rep)
             
+    trusted_actions = impl_members(mod.actions,trie.members(trusted,mod.privates))
     for actname,action in mod.actions.iteritems():
-        if startswith_eq_some(actname,trusted,mod):
+        if actname in trusted_actions:
             continue
         for callee in action.iter_calls():
             if not (callee in checked or not has_assertions(mod,callee)
@@ -1644,7 +1718,7 @@ def check_isolate_completeness(mod = None):
                         missing.append((actname,mixin,ia.RequiresAction))
                 if not has_assertions(mod,mixed) or isinstance(mixin,ivy_ast.MixinImplementDef):
                     continue
-                if not isinstance(mixin,ivy_ast.MixinBeforeDef) and startswith_eq_some(callee,trusted,mod):
+                if not isinstance(mixin,ivy_ast.MixinBeforeDef) and callee in trusted_actions:
                     continue
                 verifier = actname if isinstance(mixin,ivy_ast.MixinBeforeDef) else callee
                 verifier = implementation_map.get(verifier,verifier)
@@ -13,8 +13,6 @@ TODO's and open issues:
 * automatically add basic conjectures about the monitor (e.g. states
   are mutually exclusive)
 
-* handle multiple temporal properties
-
 * temporal axioms?
 
 * support nesting structure?
@@ -50,6 +48,7 @@ from ivy_printer import print_module
 from ivy_actions import (AssignAction, Sequence, ChoiceAction,
                          AssumeAction, AssertAction, HavocAction,
                          concat_actions)
+from ivy_ast import LabeledFormula, Atom
 import logic as lg
 import ivy_logic_utils as ilu
 import ivy_utils as iu
@@ -60,10 +59,25 @@ def forall(vs, body):
     return lg.ForAll(vs, body) if len(vs) > 0 else body
 
 
-def l2s(mod, lf):
+def l2s(mod, lfs):
 
     # modify mod in place
 
+    # All the temporal properties in lfs are reduced together, using
+    # one monitor. A property to violate is chosen using a selector
+    # l2s_p_i for each property i. The selectors are never updated,
+    # and an axiom states that exactly one of them is true, so every
+    # counterexample is for one property. The fair cycle is asserted
+    # not to exist separately for each selector, with the line number
+    # of the property. The monitor state, the tableau and the waited
+    # and saved formulas are shared, so the conjectures are checked
+    # once for all the properties. A conjecture that holds only for
+    # property i can be guarded by the negation of the property. With
+    # a single property, no selector is needed.
+    #
+    # Returns the list of pairs (selector,property), so that the
+    # checker can tell which property a counterexample is for.
+
     # module pass helper funciton
     def mod_pass(transform):
         mod.labeled_conjs = [transform(x) for x in mod.labeled_conjs]
@@ -105,7 +119,17 @@ def l2s(mod, lf):
         return res
     replace_temporals_by_l2s_g = lambda ast: ilu.replace_temporals_by_named_binder_g_ast(ast, _l2s_g)
     mod_pass(replace_temporals_by_l2s_g)
-    not_lf = replace_temporals_by_l2s_g(lg.Not(lf.formula))
+    not_lfs = [replace_temporals_by_l2s_g(lg.Not(lf.formula)) for lf in lfs]
+    if len(lfs) == 1:
+        selectors = [lg.true]
+    else:
+        selectors = [lg.Const('l2s_p_{}'.format(i), lg.Boolean) for i in range(len(lfs))]
+        one_selector = lg.And(lg.Or(*selectors),*[
+            lg.Not(lg.And(s1, s2))
+            for i, s1 in enumerate(selectors)
+            for s2 in selectors[:i]
+        ])
+        mod.labeled_axioms.append(LabeledFormula(Atom("l2s_selector", []), one_selector))
     if debug.get():
         print "=" * 80 +"\nafter replace_temporals_by_named_binder_g_ast"+ "\n"*3
         print "=" * 80 + "\nl2s_gs:"
@@ -219,8 +243,12 @@ def l2s(mod, lf):
             isinstance(t.sort, lg.FunctionSort) and isinstance(t.sort.range, lg.UninterpretedSort)
         )
     ]
-    assert_no_fair_cycle = AssertAction(lg.Not(lg.And(*fair_cycle)))
-    assert_no_fair_cycle.lineno = lf.lineno
+    assert_no_fair_cycle = []
+    for sel, lf in zip(selectors, lfs):
+        conds = fair_cycle if sel == lg.true else [sel] + fair_cycle
+        asrt = AssertAction(lg.Not(lg.And(*conds)))
+        asrt.lineno = lf.lineno
+        assert_no_fair_cycle.append(asrt)
 
     monitor_edge = lambda s1, s2: [
         AssumeAction(s1),
@@ -317,7 +345,7 @@ def l2s(mod, lf):
             assume_g_axioms +
             add_consts_to_d +
             update_w +
-            [assert_no_fair_cycle]
+            assert_no_fair_cycle
         ))
         new_action.lineno = action.lineno
         new_action.formal_params = action.formal_params
@@ -332,7 +360,10 @@ def l2s(mod, lf):
     l2s_init += add_consts_to_d
     l2s_init += reset_w
     l2s_init += assume_g_axioms
-    l2s_init += [AssumeAction(not_lf)]
+    if len(lfs) == 1:
+        l2s_init += [AssumeAction(not_lfs[0])]
+    else:
+        l2s_init += [AssumeAction(lg.Implies(sel, not_lf)) for sel, not_lf in zip(selectors, not_lfs)]
     mod.initializers.append(('l2s_init', Sequence(*l2s_init)))
 
     if debug.get():
@@ -372,3 +403,5 @@ def l2s(mod, lf):
         print "=" * 80 + "\nafter replace_named_binders" + "\n"*3
         print_module(mod)
         print "=" * 80 + "\n"*3
+
+    return zip(selectors, lfs)
@@ -76,6 +76,7 @@ class Module(object):
         self.subgoals = [] # (labeled formula * labeled formula list) list
         self.isolate_info = None # IsolateInfo or None
         self.conj_actions = dict() # map from conj names to action name list
+        self.isolate_actions = dict() # cache of verified and present actions of isolates
 
         
         self.sig = il.sig.copy() # capture the current signature
@@ -0,0 +1,381 @@
+
+# ivy_parsetab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'topleftSEMIleftGLOBALLYEVENTUALLYleftIFleftELSEleftORleftANDleftTILDAleftEQLELTGEGTPTOleftTILDAEQleftCOLONleftPLUSleftMINUSleftTIMESleftDIVleftDOLLARACTION ACTION AFTER ALIAS AND AROUND ARROW ASSERT ASSIGN ASSUME ATTRIBUTE AXIOM BEFORE CALL COLON COMMA CONCEPT CONJECTURE DECREASES DEFINITION DELEGATE DERIVED DESTRUCTOR DIV DOLLAR DOT DOTDOTDOT DOTS ELSE ENSURE ENSURES ENTRY EQ EVENTUALLY EXISTS EXPORT EXTRACT FALSE FORALL FRESH FROM FUNCTION GE GHOST GLOBALLY GT IF IFF IMPLEMENT IMPLEMENTATION IMPORT IN INCLUDE INDIV INIT INSTANTIATE INSTANTIATE INTERPRET INVARIANT ISOLATE LABEL LCB LE LET LOCAL LPAREN LT MACRO MATCH MAXIMIZING MINIMIZING MINUS MIXIN MIXIN MIXORD MODIFIES MODULE MODULE NAMED NATIVEQUOTE NULL OBJECT OF OLD OR PARAMETER PARAMS PLUS PRIVATE PROGRESS PROOF PROPERTY PTO RCB RELATION RELY REQUIRE REQUIRES RETURNS RPAREN SCENARIO SCHEMA SEMI SET SOME SPECIFICATION STATE STRUCT SYMBOL TEMPORAL THIS TILDA TILDAEQ TIMES TRUE TRUSTED TYPE UPDATE USING VAR VARIABLE VARIANT WHILE WITHaterm : SYMBOLaterm : aterm LPAREN terms RPARENaterm : aterm DOT SYMBOLatype : SYMBOLatype : atype DOT SYMBOLatype : THISvar : VARIABLEvar : VARIABLE COLON atypesimplevar : VARIABLEsimplevar : VARIABLE COLON SYMBOLterm : atermterm : OLD atermterm : varterm : term PLUS termterm : term MINUS termterm : term TIMES termterm : term DIV termterm : term IF fmla ELSE termterms : terms : termterms : terms COMMA termterm : LPAREN term RPARENvars : varvars : vars COMMA varsimplevars : simplevarsimplevars : simplevars COMMA simplevarapp : SYMBOLapp : SYMBOL LPAREN terms RPARENapp : term infix termapps : appapps : apps COMMA appatom : SYMBOLatom : SYMBOL LPAREN terms RPARENatoms : atomatoms : atoms COMMA atomlit : atomlit : SYMBOL EQ SYMBOLlit : SYMBOL TILDAEQ SYMBOLlit : TILDA littop :relop : EQrelop : LEtop : top USING SYMBOLrelop : LTrelop : GEtop : top INCLUDE SYMBOLrelop : GTrelop : PTOinfix : PLUSlabeledfmla : fmlainfix : MINUSlabeledfmla : LABEL fmlainfix : TIMESopttemporal : infix : DIVopttemporal : TEMPORALfmla : termfmla : term relop termfmla : term TILDAEQ termfmla : LPAREN fmla RPARENfmla : TRUEtop : top opttemporal AXIOM labeledfmlafmla : FALSEfmla : TILDA fmlaoptskolem : fmla : fmla AND fmlaoptskolem : NAMED defnlhstop : top opttemporal PROPERTY labeledfmla optskolem optprooffmla : fmla OR fmlatop : top CONJECTURE labeledfmlafmla : fmla ARROW fmlafmla : fmla IFF fmlafmla : FORALL simplevars DOT fmlamodulestart :fmla : EXISTS simplevars DOT fmlamoduleend :top : top MODULE modulestart atom EQ LCB top RCB moduleendoptdotdotdot : fmla : GLOBALLY fmlaoptdotdotdot : DOTDOTDOTfmla : EVENTUALLY fmlaobjectargs : optargsterm : LPAREN DOLLAR SYMBOL simplevars DOT fmla RPAREN LPAREN terms RPARENobjectend :term : DOLLAR SYMBOL DOT fmla %prec SEMItop : top OBJECT SYMBOL objectargs EQ LCB optdotdotdot top RCB objectendoptsemi : optsemi : SEMItop : top MACRO atom EQ sequenceschdefnrhs : fmlaschdecl : FUNCTION funsschdecl : FRESH FUNCTION funsschdecl : RELATION relsschdecl : FRESH RELATION relsschdecl : TYPE SYMBOLschdecl : PROPERTY labeledfmlaschconc : DEFINITION defnschconc : PROPERTY fmlaschdecls :schdecls : schdecls schdeclschdefnrhs : LCB schdecls schconc RCBschdefn : defnlhs EQ schdefnrhstop : top SCHEMA schdefntop : top INSTANTIATE instsinsts : instinsts : insts COMMA instpname : atypepname : varpname : infixpname : reloppname : THISpnames : pnames : pnamepnames : pnames COMMA pnamemodinst : SYMBOLmodinst : SYMBOL LPAREN pnames RPARENinst : modinstinst : modinst COLON modinsttop : top symdeclsymdecl : constantdeclsymdecl : DESTRUCTOR ttermsconstantdecl : INDIV ttermsconstantdecl : VAR ttermsconstantdecl : PARAMETER ttermsrel : defnlhsrel : defnrels : relrels : rels COMMA reltop : top RELATION relstatoms : tatomtatoms : tatoms COMMA tatomtatom : SYMBOLtatom : SYMBOL targstatom : LPAREN var relop var RPARENfun : typeddefnfun : typeddefn EQ defnrhsfuns : funfuns : funs COMMA funtop : top FUNCTION funstop : top DERIVED defnsproofstep : SYMBOLmatch : defnmatch : var EQ fmlamatches : matchmatches : matches COMMA matchproofstep : SYMBOL WITH matchesproofstep : proofstep SEMI proofstepoptproof :optproof : PROOF proofsteptop : top DEFINITION defns optprooftop : top PROGRESS defnstop : top RELY atom ARROW atomtop : top MIXORD callatom ARROW callatomtop : top RELY atomtop : top CONCEPT cdefnstop : top INIT labeledfmlatop : top UPDATE apps FROM apps upaxesoptghost : optghost : GHOSTtypesymbol : SYMBOLtypesymbol : THIStop : top optghost TYPE typesymboltop : top optghost TYPE typesymbol EQ sorttsyms : vartsyms : tsyms COMMA vartargs : LPAREN RPARENtargs : LPAREN tsyms RPARENparam : SYMBOL COLON SYMBOLparams : paramparams : params COMMA paramoptargs : optargs : LPAREN lparams RPARENoptreturns :optreturns : RETURNS LPAREN lparams RPARENoptactualreturns :optactualreturns : callatoms ASSIGNtapp : SYMBOLtapp : SYMBOL targstapp : LPAREN var infix var RPARENtterm : tapptterm : tapp COLON atypetterms : ttermtterms : tterms COMMA ttermsort : LCB names RCBsort : STRUCT LCB tterms RCBsort : STRUCT LCB RCBnames : SYMBOLnames : names COMMA SYMBOLupaxes : upaxes : upaxes upaxupax : PARAMS tterms IN action ARROW requires ensuresrequires : requires : REQUIRES fmlamodifies : modifies : MODIFIES LCB RCBmodifies : MODIFIES TIMESmodifies : MODIFIES atomsensures : ENSURES fmlaoptactiondef : topseq : sequencetopseq : LCB NATIVEQUOTE RCBoptactiondef : EQ topseqoptimpex : optimpex : EXPORToptimpex : IMPORTtop : top optimpex ACTION SYMBOL optargs optreturns optactiondeftop : top MIXIN callatom BEFORE callatomtop : top MIXIN callatom AFTER callatomtop : top BEFORE atype optargs optreturns sequencetop : top AFTER atype optargs optreturns topseqtop : top AFTER INIT optargs topseqtop : top IMPLEMENT atype optargs optreturns topseqtop : top IMPLEMENT TYPE SYMBOL WITH SYMBOLopttrusted :opttrusted : TRUSTEDtop : top opttrusted ISOLATE SYMBOL optargs EQ callatomstop : top opttrusted ISOLATE SYMBOL optargs EQ callatoms WITH callatomsoptwith : optwith : WITH callatomstop : top opttrusted ISOLATE SYMBOL optargs EQ LCB top RCB optwithtop : top EXTRACT SYMBOL optargs EQ callatomstop : top EXPORT callatomtop : top IMPORT callatomtop : top PRIVATE callatomoptdelegee :optdelegee : ARROW callatomtop : top DELEGATE callatoms optdelegeetop : top ALIAS SYMBOL EQ callatomtop : top STATE SYMBOL EQ state_exprassert_rhs : LCB requires modifies ensures RCBassert_rhs : fmlatop : top ASSERT SYMBOL ARROW assert_rhsoper : atypeoper : relopoper : infixoper : NATIVEQUOTEtop : top INTERPRET oper ARROW opertop : top INTERPRET oper ARROW LCB SYMBOL DOTS SYMBOL RCBtop : top NATIVEQUOTEtop : top ATTRIBUTE callatom EQ callatomtop : top VARIANT SYMBOL OF SYMBOLtop : top VARIANT SYMBOL OF SYMBOL EQ sortplaces : SYMBOLplaces : places COMMA SYMBOLsceninit : ARROW placesscenariomixin : BEFORE atype optargs optreturns sequencescenariomixin : AFTER atype optargs optreturns sequencescentranss : scentranss : scentranss places ARROW places COLON scenariomixinscentranss : scentranss places COLON scenariomixintop : top SCENARIO LCB sceninit SEMI scentranss RCBloc : loc : SYMBOLactseq : actionactseq : actseq SEMI actionsequence : LCB RCBsequence : LCB actseq RCBsequence : LCB actseq SEMI RCBaction : sequenceaction : ASSUME fmlaaction : ASSERT fmlaaction : ENSURES fmlaaction : SET litaction : term ASSIGN fmlatermtuple : LPAREN term COMMA terms RPARENaction : termtuple ASSIGN callatomaction : term ASSIGN TIMESsomefmla : fmlabounds : params DOTbounds : LPAREN lparams RPARENsomefmla : SOME bounds fmlasomefmla : SOME bounds fmla MINIMIZING termsomefmla : SOME bounds fmla MAXIMIZING termaction : IF somefmla sequenceaction : IF somefmla sequence ELSE actioninvariants : invariants : invariants INVARIANT fmladecreases : DECREASES fmladecreases : action : WHILE fmla invariants decreases sequenceaction : IF TIMES sequence ELSE actionaction : INSTANTIATE callatomcallatom : atomcallatom : THIScallatom : callatom DOT callatomcallatoms : callatomcallatoms : callatoms COMMA callatomaction : CALL callatomaction : CALL callatom ASSIGN callatomlparam : SYMBOL COLON atypelparams : lparamlparams : lparams COMMA lparamaction : LOCAL lparams sequenceopttypedsym : SYMBOLopttypedsym : SYMBOL COLON atypeoptinit : optinit : ASSIGN fmlaaction : VAR opttypedsym optiniteqn : SYMBOL EQ SYMBOLeqns : eqneqns : eqns COMMA eqnaction : LET eqns sequencesymbols : SYMBOLsymbols : symbols COMMA SYMBOLcdefns : cdefncdefns : cdefns COMMA cdefncdefn : atom EQ exprdefns : defndefns : defns COMMA defndotsym : SYMBOLdotsym : dotsym DOT SYMBOLdefnlhs : dotsymdefnlhs : dotsym LPAREN defargs RPARENdefargs : defargdefargs : defargs COMMA defargdefarg : lparamdefarg : vardefnlhs : LPAREN defarg relop defarg RPARENdefnlhs : LPAREN defarg infix defarg RPARENtypeddefn : defnlhstypeddefn : defnlhs COLON atypedefnrhs : fmladefnrhs : somevarfmladefnrhs :  NATIVEQUOTEdefn : typeddefn EQ defnrhsoptin : optin : IN fmlaoptelse : optelse : ELSE fmlasomevarfmla : SOME simplevar DOT fmla optin optelseexpr : LCB fmla RCBexprterm : atermexprterm : varexpr : exprtermexpr : exprterm relop exprtermexpr : exprterm TILDAEQ exprtermexpr : TILDA exprexpr : LPAREN expr RPARENexpr : prodexpr : sumprod : expr TIMES exprprod : prod TIMES exprsum : expr PLUS exprsum : sum PLUS exprstate_expr : TRUEstate_expr : FALSEstate_expr : SYMBOLstate_expr : SYMBOL LPAREN state_expr RPARENstate_expr : state_expr OR state_exprstate_expr : LCB requires modifies ensures RCBstate_expr : ENTRY'
+    
+_lr_action_items = {'CONJECTURE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,2,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,2,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,2,-202,-326,-76,-174,-258,2,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'OBJECT':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,3,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,3,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,3,-202,-326,-76,-174,-258,3,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'MINIMIZING':([51,54,56,63,64,66,67,95,97,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,374,378,379,380,455,609,669,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-2,-73,-75,-85,-18,645,-83,]),'INVARIANT':([51,54,56,63,64,66,67,95,97,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,374,378,379,380,455,495,565,652,669,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-2,-73,-75,-85,-18,-276,617,-277,-83,]),'TRUE':([2,8,50,52,53,55,59,69,70,165,166,167,168,183,199,217,239,240,245,266,267,268,367,404,409,413,418,421,433,434,436,453,464,493,512,553,557,570,581,598,611,616,617,640,647,],[54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,54,349,54,54,54,54,54,54,54,54,54,54,349,54,349,54,54,54,54,54,54,54,54,54,-269,54,54,54,-270,]),'MINUS':([16,51,54,56,63,64,66,67,95,97,120,124,159,161,162,172,176,195,197,198,204,210,215,222,254,256,258,259,260,261,262,263,269,270,271,272,273,274,275,315,330,374,378,379,380,391,396,419,454,455,485,662,663,669,],[103,-1,-61,-11,-13,-7,182,-63,-6,-4,-1,227,182,-79,-64,-81,-12,-316,103,-317,103,103,103,182,-60,-22,182,-3,-66,-72,-71,-69,-8,182,182,-16,182,-17,-15,-5,182,-2,-73,-75,-85,-290,103,182,182,182,182,182,182,-83,]),'RELY':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,6,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,6,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,6,-202,-326,-76,-174,-258,6,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'RPAREN':([51,54,56,63,64,66,67,95,97,102,103,104,105,106,107,108,109,110,112,157,159,161,162,163,172,176,190,195,198,204,207,219,222,254,256,257,258,259,260,261,262,263,269,270,271,272,273,274,275,278,279,283,286,287,301,302,303,304,305,306,307,311,312,315,327,344,347,348,349,360,362,363,364,368,374,378,379,380,391,392,393,400,443,445,454,455,458,461,465,467,469,485,514,518,524,525,526,527,528,529,530,531,535,551,587,605,612,627,637,660,669,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-55,-51,-48,-42,-44,-49,-47,-53,-45,-41,254,256,-79,-64,-19,-81,-12,-19,-316,-317,-112,310,-19,256,-60,-22,374,-20,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,384,-291,388,-314,389,-108,395,-113,-109,-110,-6,-107,399,-164,-5,425,-346,-351,-347,-345,-340,-332,-333,-339,-334,-2,-73,-75,-85,-290,462,463,468,-337,526,-21,-18,-292,-315,-114,-165,540,256,-349,587,-344,-342,-338,-343,-341,-331,-335,-336,595,-19,-348,642,647,-350,-19,669,-83,]),'DERIVED':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,7,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,7,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,7,-202,-326,-76,-174,-258,7,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'INIT':([0,1,14,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,8,99,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,8,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,8,-202,-326,-76,-174,-258,8,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'PLUS':([16,51,54,56,63,64,66,67,95,97,120,124,159,161,162,172,176,195,197,198,204,210,215,222,254,256,258,259,260,261,262,263,269,270,271,272,273,274,275,315,330,360,362,363,364,366,368,374,378,379,380,391,396,419,443,445,454,455,485,524,525,526,527,528,529,530,531,662,663,669,],[107,-1,-61,-11,-13,-7,180,-63,-6,-4,-1,224,180,-79,-64,-81,-12,-316,107,-317,107,107,107,180,-60,-22,180,-3,-66,-72,-71,-69,-8,180,180,-16,-14,-17,-15,-5,180,442,-332,-333,-339,446,-334,-2,-73,-75,-85,-290,107,180,446,446,180,180,180,-344,-342,-338,-343,-341,-331,-335,-336,180,180,-83,]),'ACTION':([0,1,5,9,25,31,38,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,-203,71,-205,-120,-119,-204,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,-203,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,-203,-202,-326,-76,-174,-258,-203,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'IMPORT':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,9,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,9,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,9,-202,-326,-76,-174,-258,9,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'INSTANTIATE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,321,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,357,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,473,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,613,614,618,619,620,621,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,10,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,407,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,407,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,10,-179,407,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,10,-202,-326,-76,-174,-258,10,-101,-348,-186,-184,-84,-328,-77,407,407,-238,-217,-218,407,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'GT':([16,51,54,56,63,64,66,67,95,97,159,161,162,172,176,195,197,198,204,215,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,362,363,368,374,378,379,380,391,396,455,669,],[108,-1,-61,-11,-13,-7,108,-63,-6,-4,108,-79,-64,-81,-12,-316,108,-317,108,108,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-332,-333,108,-2,-73,-75,-85,-290,108,-18,-83,]),'ISOLATE':([0,1,18,25,28,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,-214,119,-120,-215,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,-214,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,-214,-202,-326,-76,-174,-258,-214,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'MODULE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,11,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,11,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,11,-202,-326,-76,-174,-258,11,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'GE':([16,51,54,56,63,64,66,67,95,97,159,161,162,172,176,195,197,198,204,215,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,362,363,368,374,378,379,380,391,396,455,669,],[110,-1,-61,-11,-13,-7,110,-63,-6,-4,110,-79,-64,-81,-12,-316,110,-317,110,110,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-332,-333,110,-2,-73,-75,-85,-290,110,-18,-83,]),'ARROW':([51,54,56,57,63,64,66,67,72,73,82,84,95,97,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,128,129,130,140,155,157,159,160,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,276,293,298,315,334,341,352,371,374,378,379,380,388,406,411,448,455,470,472,474,475,479,480,481,483,484,486,487,491,495,515,532,534,535,538,541,542,545,549,552,555,561,563,564,578,602,603,604,606,607,609,622,626,641,648,649,650,651,652,655,661,669,],[-1,-61,-11,167,-13,-7,-57,-63,-32,191,-284,-283,-6,-4,215,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,230,-286,232,245,253,167,-57,167,-79,-64,-81,-12,-60,-22,-3,-66,167,167,-69,-8,-59,-58,-16,-14,-17,-15,167,167,-285,-5,-287,167,167,-243,-2,167,167,-85,-33,-259,-256,167,-18,167,-282,-257,167,-32,-263,-36,167,-288,-296,-294,167,167,167,593,-244,167,167,-266,-258,-302,-39,-298,-293,-274,167,-267,167,-38,-37,-289,167,-295,167,167,167,167,-275,-281,-280,167,167,665,167,-83,]),'VAR':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,321,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,357,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,473,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,613,614,618,619,620,621,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,12,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,416,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,416,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,12,-179,416,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,12,-202,-326,-76,-174,-258,12,-101,-348,-186,-184,-84,-328,-77,416,416,-238,-217,-218,416,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'ENTRY':([240,433,436,],[347,347,347,]),'BEFORE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,131,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,594,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,657,661,664,669,673,],[-40,13,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,235,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,13,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,13,-202,-326,-76,-174,-258,13,-101,-348,-186,-184,636,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,636,-329,-219,-83,-191,]),'THIS':([9,13,14,16,20,22,23,24,32,38,41,139,175,192,201,204,206,215,230,231,232,234,235,241,248,289,340,396,407,414,424,471,550,554,567,635,636,654,],[82,95,95,95,95,82,82,82,82,82,82,242,95,95,82,306,95,95,82,82,82,82,82,82,82,95,82,306,82,82,82,82,82,95,82,95,95,82,]),'OF':([143,],[246,]),'AFTER':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,131,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,594,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,657,661,664,669,673,],[-40,14,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,234,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,14,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,14,-202,-326,-76,-174,-258,14,-101,-348,-186,-184,635,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,635,-329,-219,-83,-191,]),'PROGRESS':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,15,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,15,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,15,-202,-326,-76,-174,-258,15,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'PROPERTY':([0,1,4,25,31,34,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,342,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,432,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,509,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,572,574,575,578,579,580,587,589,591,596,597,599,618,619,620,622,623,624,625,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,-54,69,-120,-119,-56,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-99,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,512,-163,-337,-18,-80,-40,-206,-318,-319,-54,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-100,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,-54,-202,-326,-76,-174,-258,-54,-91,-95,-101,-50,-96,-93,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-92,-94,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'OR':([51,54,56,57,63,64,66,67,95,97,157,159,160,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,276,293,315,341,344,345,347,348,349,352,374,378,379,380,448,455,470,475,483,491,495,514,515,518,535,538,563,578,587,606,609,622,626,627,641,651,652,661,669,],[-1,-61,-11,168,-13,-7,-57,-63,-6,-4,168,-57,168,168,-64,168,-12,-60,-22,-3,-66,168,168,-69,-8,-59,-58,-16,-14,-17,-15,168,168,-5,168,-346,433,-351,-347,-345,168,-2,168,168,168,168,-18,168,168,168,168,168,-349,168,433,168,168,168,168,-348,168,168,168,168,-350,168,168,168,168,-83,]),'INTERPRET':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,16,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,16,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,16,-202,-326,-76,-174,-258,16,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'DOTS':([423,],[496,]),'ENSURES':([51,54,56,63,64,66,67,72,95,97,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,321,346,354,357,374,378,379,380,388,435,440,455,473,515,516,522,583,585,586,613,614,621,629,656,665,669,670,],[-1,-61,-11,-13,-7,-57,-63,-32,-6,-4,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,404,-192,-192,404,-2,-73,-75,-85,-33,-194,-194,-18,404,-193,581,581,-197,-34,-196,404,404,404,-195,-35,-192,-83,581,]),'SOME':([199,217,418,],[292,292,489,]),'DECREASES':([51,54,56,63,64,66,67,95,97,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,374,378,379,380,455,495,565,652,669,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-2,-73,-75,-85,-18,-276,616,-277,-83,]),'LABEL':([2,8,69,70,512,],[52,52,52,52,52,]),'IFF':([51,54,56,57,63,64,66,67,95,97,157,159,160,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,276,293,315,341,352,374,378,379,380,448,455,470,475,483,491,495,515,535,538,563,578,606,609,622,626,641,651,652,661,669,],[-1,-61,-11,166,-13,-7,-57,-63,-6,-4,166,-57,166,-79,-64,-81,-12,-60,-22,-3,-66,166,166,-69,-8,-59,-58,-16,-14,-17,-15,166,166,-5,166,166,-2,166,166,-85,166,-18,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,166,-83,]),'PTO':([16,51,54,56,63,64,66,67,95,97,159,161,162,172,176,195,197,198,204,215,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,362,363,368,374,378,379,380,391,396,455,669,],[104,-1,-61,-11,-13,-7,104,-63,-6,-4,104,-79,-64,-81,-12,-316,104,-317,104,104,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-332,-333,104,-2,-73,-75,-85,-290,104,-18,-83,]),'ASSUME':([321,357,473,613,614,621,],[413,413,413,413,413,413,]),'WITH':([72,82,84,129,229,298,334,338,388,497,620,],[-32,-284,-283,-286,332,-285,-287,429,-33,567,654,]),'COLON':([64,74,75,76,87,88,90,92,148,170,196,208,288,310,371,389,395,399,462,463,468,487,532,534,556,633,],[175,192,-310,-312,203,-115,206,-177,192,264,289,-178,-311,-166,-243,-313,-116,-167,-318,-319,-179,554,594,-244,608,657,]),'LET':([321,357,473,613,614,621,],[410,410,410,410,410,410,]),'MODIFIES':([51,54,56,63,64,66,67,95,97,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,346,354,374,378,379,380,435,440,455,515,669,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-192,-192,-2,-73,-75,-85,517,517,-18,-193,-83,]),'REQUIRES':([346,354,665,],[434,434,434,]),'$end':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,384,385,386,387,388,389,395,399,402,403,411,425,426,427,428,431,437,443,455,459,462,463,468,474,494,497,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,537,538,539,540,542,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,0,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-172,-67,-68,-199,-33,-313,-116,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-206,-318,-319,-179,-257,-201,-216,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,-202,-326,-76,-174,-258,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'FUNCTION':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,342,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,432,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,509,511,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,572,574,575,578,579,580,587,589,591,596,597,599,618,619,620,622,623,624,625,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,17,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-99,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,506,-163,-337,-18,-80,-40,-206,-318,-319,17,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-100,576,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,17,-202,-326,-76,-174,-258,17,-91,-95,-101,-50,-96,-93,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-92,-94,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'UPDATE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,19,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,19,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,19,-202,-326,-76,-174,-258,19,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'ELSE':([51,54,56,63,64,66,67,95,97,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,276,315,374,378,379,380,411,455,474,538,542,561,562,597,641,669,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,381,-5,-2,-73,-75,-85,-256,-18,-257,-326,-258,613,614,640,-327,-83,]),'IMPLEMENT':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,20,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,20,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,20,-202,-326,-76,-174,-258,20,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'INCLUDE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,21,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,21,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,21,-202,-326,-76,-174,-258,21,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'EQ':([16,51,54,56,63,64,66,67,68,72,74,75,76,79,82,84,95,97,118,133,134,136,137,146,147,148,153,159,161,162,172,176,184,186,189,195,197,198,204,205,215,218,238,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,282,285,288,298,315,326,355,362,363,368,374,378,379,380,384,387,388,389,391,396,455,462,463,476,479,501,540,669,],[112,-1,-61,-11,-13,-7,112,-63,-171,-32,-320,-310,-312,199,-284,-283,-6,-4,217,-171,239,240,241,247,248,-320,250,112,-79,-64,-81,-12,277,-82,-171,-316,112,-317,112,308,112,-171,340,-161,351,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-173,-321,-311,-285,-5,424,441,-332,-333,112,-2,-73,-75,-85,-172,460,-33,-313,-290,112,-18,-318,-319,544,548,570,-174,-83,]),'AND':([51,54,56,57,63,64,66,67,95,97,157,159,160,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,276,293,315,341,352,374,378,379,380,448,455,470,475,483,491,495,515,535,538,563,578,606,609,622,626,641,651,652,661,669,],[-1,-61,-11,165,-13,-7,-57,-63,-6,-4,165,-57,165,165,-64,165,-12,-60,-22,-3,-66,165,165,165,-8,-59,-58,-16,-14,-17,-15,165,165,-5,165,165,-2,165,165,165,165,-18,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,165,-83,]),'MAXIMIZING':([51,54,56,63,64,66,67,95,97,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,374,378,379,380,455,609,669,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-2,-73,-75,-85,-18,644,-83,]),'MIXORD':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,22,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,22,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,22,-202,-326,-76,-174,-258,22,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'TEMPORAL':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,34,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,34,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,34,-202,-326,-76,-174,-258,34,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'LCB':([48,51,54,56,63,64,66,67,95,96,97,98,99,125,161,162,172,176,212,213,214,215,228,239,240,245,247,250,254,256,259,260,261,262,263,269,270,271,272,273,274,275,277,279,308,315,317,318,321,331,351,357,361,365,374,378,379,380,384,391,424,433,436,438,441,442,444,446,447,455,458,460,473,477,478,488,490,491,492,495,517,540,565,600,601,609,613,614,615,621,651,652,658,659,662,663,667,668,669,671,672,],[155,-1,-61,-11,-13,-7,-57,-63,-6,-171,-4,-171,-171,-171,-79,-64,-81,-12,-173,-173,321,323,-173,342,346,354,357,367,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,382,-291,397,-5,357,321,357,321,439,357,367,367,-2,-73,-75,-85,-172,-290,498,346,346,519,439,367,367,367,367,-18,-292,321,357,357,-300,357,357,-268,357,-276,584,-174,-279,-299,-301,-271,357,357,357,357,-278,-277,-171,-171,-273,-272,-173,-173,-83,357,357,]),'DELEGATE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,23,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,23,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,23,-202,-326,-76,-174,-258,23,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'MIXIN':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,24,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,24,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,24,-202,-326,-76,-174,-258,24,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'SYMBOL':([2,3,6,7,8,9,10,11,12,13,14,15,16,17,19,20,21,22,23,24,26,27,29,30,32,33,37,38,39,40,41,42,43,44,45,46,49,50,52,53,55,59,61,65,69,70,71,78,89,102,103,104,105,106,107,108,109,110,112,119,123,126,139,158,163,164,165,166,167,168,175,177,178,179,180,181,182,183,185,190,191,192,193,194,199,200,201,202,203,204,206,209,211,215,216,217,219,220,221,223,224,225,226,227,230,231,232,234,235,237,239,240,241,245,246,248,249,250,251,253,264,266,267,268,280,289,290,291,321,323,332,340,357,361,365,367,370,375,381,383,390,396,401,404,407,409,410,411,412,413,414,415,416,417,418,421,424,429,430,433,434,436,439,442,444,446,447,449,450,451,452,453,464,471,473,474,482,489,493,496,499,506,507,508,512,513,517,519,542,544,546,547,548,550,551,553,554,557,560,567,570,571,576,577,581,590,593,598,608,610,611,613,614,616,617,621,628,634,635,636,637,640,644,645,647,654,666,674,675,],[51,68,72,75,51,72,88,-74,92,97,97,75,97,75,120,97,127,72,72,72,75,133,75,136,72,138,140,72,92,143,72,92,72,147,75,72,92,51,51,51,51,51,174,51,51,51,189,196,72,-55,-51,-48,-42,-44,-49,-47,-53,-45,-41,218,51,229,244,255,51,259,51,51,51,51,97,51,51,51,51,51,51,51,196,51,72,97,196,288,51,75,72,88,88,97,97,92,315,97,75,51,51,120,120,-53,-49,-55,51,-51,72,72,72,72,72,338,51,348,72,51,355,72,75,51,72,371,376,51,51,51,75,97,196,196,51,423,428,72,51,51,51,51,-248,51,51,196,196,97,196,51,72,51,476,-256,479,51,72,51,487,196,51,51,72,75,338,348,51,348,520,51,51,51,51,51,51,371,534,51,51,72,51,-257,479,556,51,566,92,75,75,574,51,75,72,92,-258,600,476,602,603,72,51,51,97,51,196,72,51,75,75,75,51,631,371,51,643,556,-269,51,51,51,51,51,72,-250,97,97,51,51,51,51,-270,72,-249,-247,-246,]),'GLOBALLY':([2,8,50,52,53,55,59,69,70,165,166,167,168,183,199,217,239,245,266,267,268,367,404,409,413,418,421,434,453,464,493,512,553,557,570,581,598,611,616,617,640,647,],[53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,53,-269,53,53,53,-270,]),'WHILE':([321,357,473,613,614,621,],[421,421,421,421,421,421,]),'DOT':([51,56,72,75,76,82,83,84,95,96,97,98,115,120,125,128,129,131,137,141,144,169,170,171,173,174,176,255,259,269,285,288,298,306,307,309,315,333,334,335,336,337,350,358,362,373,374,376,377,388,391,394,472,484,541,558,559,604,607,643,646,658,659,],[-1,164,-32,-310,194,-284,201,-283,-6,211,-4,211,211,-1,211,201,201,201,201,201,201,-25,-9,266,267,268,164,268,-3,211,211,-311,201,-6,211,211,-5,201,201,201,201,201,201,201,164,453,-2,-10,-26,-33,211,464,201,201,201,-169,611,201,211,-168,-170,211,211,]),'DEFINITION':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,342,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,432,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,509,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,572,574,575,578,579,580,587,589,591,596,597,599,618,619,620,622,623,624,625,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,26,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-99,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,507,-163,-337,-18,-80,-40,-206,-318,-319,26,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-100,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,26,-202,-326,-76,-174,-258,26,-91,-95,-101,-50,-96,-93,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-92,-94,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'SET':([321,357,473,613,614,621,],[412,412,412,412,412,412,]),'OLD':([2,8,19,50,52,53,55,59,69,70,104,105,106,108,110,112,123,163,165,166,167,168,177,178,179,180,181,182,183,190,199,217,219,220,221,223,224,225,226,227,239,245,266,267,268,321,357,367,375,381,404,409,413,415,418,421,434,453,464,473,493,512,551,553,557,570,581,598,611,613,614,616,617,621,637,640,644,645,647,],[65,65,65,65,65,65,65,65,65,65,-48,-42,-44,-47,-45,-41,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-53,-49,-55,65,-51,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,65,-269,65,65,65,65,65,65,65,65,65,-270,]),'TILDA':([2,8,50,52,53,55,59,69,70,165,166,167,168,183,199,217,239,245,250,266,267,268,361,365,367,404,409,412,413,418,421,434,442,444,446,447,453,464,482,493,512,553,557,570,581,598,611,616,617,640,647,],[55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,55,361,55,55,55,361,361,55,55,55,482,55,55,55,55,361,361,361,361,55,55,482,55,55,55,55,55,55,55,-269,55,55,55,-270,]),'FORALL':([2,8,50,52,53,55,59,69,70,165,166,167,168,183,199,217,239,245,266,267,268,367,404,409,413,418,421,434,453,464,493,512,553,557,570,581,598,611,616,617,640,647,],[58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,58,-269,58,58,58,-270,]),'EXTRACT':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,27,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,27,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,27,-202,-326,-76,-174,-258,27,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'TRUSTED':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,28,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,28,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,28,-202,-326,-76,-174,-258,28,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'SCHEMA':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,29,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,29,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,29,-202,-326,-76,-174,-258,29,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'GHOST':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,35,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,35,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,35,-202,-326,-76,-174,-258,35,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'STATE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,30,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,30,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,30,-202,-326,-76,-174,-258,30,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'NAMED':([51,54,56,57,63,64,66,67,95,97,160,161,162,172,176,187,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,374,378,379,380,455,669,],[-1,-61,-11,-50,-13,-7,-57,-63,-6,-4,-52,-79,-64,-81,-12,280,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-2,-73,-75,-85,-18,-83,]),'FRESH':([51,54,56,63,64,66,67,74,75,76,95,97,117,118,148,150,151,160,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,285,288,293,294,295,296,315,324,325,342,359,374,378,379,380,389,432,455,462,463,509,538,572,574,578,579,580,597,624,625,639,641,661,669,],[-1,-61,-11,-13,-7,-57,-63,-320,-310,-312,-6,-4,-137,-135,-125,-127,-126,-52,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-321,-311,-322,-325,-324,-323,-5,-138,-136,-99,-128,-2,-73,-75,-85,-313,511,-18,-318,-319,-100,-326,-91,-95,-50,-96,-93,-328,-92,-94,-330,-327,-329,-83,]),'FROM':([51,54,56,63,64,66,67,95,97,120,121,122,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,329,330,374,378,379,380,425,455,669,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-27,220,-30,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-31,-29,-2,-73,-75,-85,-28,-18,-83,]),'FALSE':([2,8,50,52,53,55,59,69,70,165,166,167,168,183,199,217,239,240,245,266,267,268,367,404,409,413,418,421,433,434,436,453,464,493,512,553,557,570,581,598,611,616,617,640,647,],[67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,67,344,67,67,67,67,67,67,67,67,67,67,344,67,344,67,67,67,67,67,67,67,67,67,-269,67,67,67,-270,]),'PARAMS':([51,54,56,63,64,66,67,95,97,120,122,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,328,329,330,374,378,379,380,425,426,455,500,626,669,673,],[-1,-61,-11,-13,-7,-57,-63,-6,-4,-27,-30,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-189,-31,-29,-2,-73,-75,-85,-28,499,-18,-190,-198,-83,-191,]),'ATTRIBUTE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,32,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,32,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,32,-202,-326,-76,-174,-258,32,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'USING':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,33,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,33,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,33,-202,-326,-76,-174,-258,33,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'TYPE':([0,1,20,25,31,35,36,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,342,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,432,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,509,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,572,574,575,578,579,580,587,589,591,596,597,599,618,619,620,622,623,624,625,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,-158,126,-120,-119,-159,139,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-99,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,508,-163,-337,-18,-80,-40,-206,-318,-319,-158,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-100,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,-158,-202,-326,-76,-174,-258,-158,-91,-95,-101,-50,-96,-93,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-92,-94,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'DOTDOTDOT':([382,],[456,]),'ASSERT':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,321,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,357,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,473,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,613,614,618,619,620,621,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,37,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,409,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,409,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,37,-179,409,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,37,-202,-326,-76,-174,-258,37,-101,-348,-186,-184,-84,-328,-77,409,409,-238,-217,-218,409,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'EXPORT':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,38,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,38,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,38,-202,-326,-76,-174,-258,38,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'DIV':([16,51,54,56,63,64,66,67,95,97,120,124,159,161,162,172,176,195,197,198,204,210,215,222,254,256,258,259,260,261,262,263,269,270,271,272,273,274,275,315,330,374,378,379,380,391,396,419,454,455,485,662,663,669,],[102,-1,-61,-11,-13,-7,181,-63,-6,-4,-1,225,181,-79,-64,-81,-12,-316,102,-317,102,102,102,181,-60,-22,181,-3,-66,-72,-71,-69,-8,181,181,181,181,-17,181,-5,181,-2,-73,-75,-85,-290,102,181,181,181,181,181,181,-83,]),'PARAMETER':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,39,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,39,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,39,-202,-326,-76,-174,-258,39,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'AXIOM':([0,1,4,25,31,34,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,-54,70,-120,-119,-56,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,-54,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,-54,-202,-326,-76,-174,-258,-54,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'RCB':([25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,321,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,357,358,359,360,362,363,364,366,368,369,370,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,406,408,411,420,422,425,426,427,428,431,437,443,448,451,455,456,457,459,462,463,466,468,470,472,473,474,475,479,480,481,483,484,486,487,494,497,498,500,502,503,504,505,510,514,519,520,521,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,541,542,543,545,549,552,555,561,563,564,566,568,573,575,578,582,584,587,588,589,591,592,596,597,599,602,603,604,606,607,618,619,620,622,623,626,627,630,631,632,634,638,639,641,648,649,650,653,661,664,666,669,673,674,675,],[-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,411,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,411,-228,-128,-340,-332,-333,-339,-307,-334,-306,-248,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-259,474,-256,494,-254,-28,-157,-212,-213,-221,-163,-337,529,533,-18,-80,-40,-206,-318,-319,539,-179,-262,-282,542,-257,-261,-32,-263,-36,-260,-288,-296,-294,-201,-216,-40,-190,-144,-146,-142,-147,575,-349,589,-187,591,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,596,-202,-326,-76,-174,-266,-258,-255,-302,-39,-298,-293,-274,-264,-267,618,620,-97,-101,-98,627,629,-348,630,-186,-184,632,-84,-328,-77,-38,-37,-289,-297,-295,-238,-217,-218,-143,-145,-198,-350,-185,-188,-230,-250,-86,-330,-327,-275,-281,-280,-220,-329,-219,-249,-83,-191,-247,-246,]),'PROOF':([51,54,56,57,63,64,66,67,75,76,77,95,97,132,160,161,162,172,176,187,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,288,293,294,295,296,297,315,374,378,379,380,385,389,455,462,463,538,597,639,641,661,669,],[-1,-61,-11,-50,-13,-7,-57,-63,-310,-312,-308,-6,-4,237,-52,-79,-64,-81,-12,-65,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,237,-311,-322,-325,-324,-323,-309,-5,-2,-73,-75,-85,-67,-313,-18,-318,-319,-326,-328,-330,-327,-329,-83,]),'LE':([16,51,54,56,63,64,66,67,95,97,159,161,162,172,176,195,197,198,204,215,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,362,363,368,374,378,379,380,391,396,455,669,],[105,-1,-61,-11,-13,-7,105,-63,-6,-4,105,-79,-64,-81,-12,-316,105,-317,105,105,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-332,-333,105,-2,-73,-75,-85,-290,105,-18,-83,]),'SEMI':([51,54,56,63,64,66,67,72,82,84,95,97,161,162,172,176,252,254,256,259,260,261,262,263,269,270,271,272,273,274,275,293,294,295,296,298,315,338,339,371,372,374,378,379,380,388,406,408,411,422,455,470,472,474,475,479,480,481,483,484,486,487,502,503,504,505,534,538,541,542,543,545,549,552,555,561,563,564,597,602,603,604,606,607,622,623,639,641,648,649,650,661,669,],[-1,-61,-11,-13,-7,-57,-63,-32,-284,-283,-6,-4,-79,-64,-81,-12,370,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-322,-325,-324,-323,-285,-5,-141,430,-243,-245,-2,-73,-75,-85,-33,-259,473,-256,-254,-18,-262,-282,-257,-261,-32,-263,-36,-260,-288,-296,-294,-144,-146,-142,-147,-244,-326,-266,-258,-255,-302,-39,-298,-293,-274,-264,-267,-328,-38,-37,-289,-297,-295,-143,-145,-330,-327,-275,-281,-280,-329,-83,]),'VARIANT':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,40,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,40,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,40,-202,-326,-76,-174,-258,40,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'PRIVATE':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,41,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,41,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,41,-202,-326,-76,-174,-258,41,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'LT':([16,51,54,56,63,64,66,67,95,97,159,161,162,172,176,195,197,198,204,215,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,362,363,368,374,378,379,380,391,396,455,669,],[106,-1,-61,-11,-13,-7,106,-63,-6,-4,106,-79,-64,-81,-12,-316,106,-317,106,106,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-332,-333,106,-2,-73,-75,-85,-290,106,-18,-83,]),'COMMA':([51,54,56,63,64,66,67,72,74,75,76,77,80,82,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,112,116,117,118,120,121,122,129,130,132,142,145,148,149,150,151,152,154,156,161,162,163,169,170,171,172,173,176,190,195,198,204,208,219,254,256,257,258,259,260,261,262,263,269,270,271,272,273,274,275,278,279,283,285,286,287,288,293,294,295,296,297,298,299,300,301,302,303,304,305,306,307,309,310,311,312,313,315,324,325,327,328,329,330,334,359,360,362,363,364,366,368,369,371,372,373,374,376,377,378,379,380,388,389,391,395,399,425,431,443,454,455,458,461,462,463,465,467,468,469,477,478,485,488,497,502,503,504,520,521,524,525,526,527,528,529,530,531,532,534,538,551,558,559,569,572,580,583,585,588,597,600,601,605,612,619,622,623,624,625,631,633,637,639,641,643,646,656,660,661,664,669,],[-1,-61,-11,-13,-7,-57,-63,-32,-320,-310,-312,-308,200,-284,-283,202,-105,-117,-115,-180,-182,-177,209,-6,-4,200,-55,-51,-48,-42,-44,-49,-47,-53,-45,-41,216,-137,-135,-27,221,-30,-286,231,200,209,209,-125,249,-127,-126,-305,251,209,-79,-64,-19,-25,-9,265,-81,265,-12,-19,-316,-317,-112,-178,-19,-60,-22,375,-20,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,383,-291,375,-321,-314,390,-311,-322,-325,-324,-323,-309,-285,-106,-118,-108,396,-113,-109,-110,-6,-107,-181,-166,398,-164,-183,-5,-138,-136,375,221,-31,-29,-287,-128,-340,-332,-333,-339,-307,-334,-306,-243,452,265,-2,-10,-26,-73,-75,-85,-33,-313,-290,-116,-167,-28,231,-337,-21,-18,-292,-315,-318,-319,-114,-165,-179,383,546,-300,551,383,231,-144,571,-142,-187,590,-344,-342,-338,-343,-341,-331,-335,-336,452,-244,-326,-19,-169,610,209,216,249,628,-34,209,-328,-299,-301,375,383,231,-143,-145,216,249,-188,452,-19,-330,-327,-168,-170,-35,375,-329,231,-83,]),'INDIV':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,42,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,42,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,42,-202,-326,-76,-174,-258,42,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'ASSIGN':([51,54,56,63,64,66,67,72,82,84,95,97,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,298,315,374,378,379,380,388,405,419,455,484,486,487,607,642,669,],[-1,-61,-11,-13,-7,-57,-63,-32,-284,-283,-6,-4,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-285,-5,-2,-73,-75,-85,-33,471,493,-18,550,553,-294,-295,-265,-83,]),'EVENTUALLY':([2,8,50,52,53,55,59,69,70,165,166,167,168,183,199,217,239,245,266,267,268,367,404,409,413,418,421,434,453,464,493,512,553,557,570,581,598,611,616,617,640,647,],[59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,59,-269,59,59,59,-270,]),'EXISTS':([2,8,50,52,53,55,59,69,70,165,166,167,168,183,199,217,239,245,266,267,268,367,404,409,413,418,421,434,453,464,493,512,553,557,570,581,598,611,616,617,640,647,],[60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,60,-269,60,60,60,-270,]),'MACRO':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,43,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,43,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,43,-202,-326,-76,-174,-258,43,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'DOLLAR':([2,8,19,50,52,53,55,59,69,70,104,105,106,108,110,112,123,163,165,166,167,168,177,178,179,180,181,182,183,190,199,217,219,220,221,223,224,225,226,227,239,245,266,267,268,321,357,367,375,381,404,409,413,415,418,421,434,453,464,473,493,512,551,553,557,570,581,598,611,613,614,616,617,621,637,640,644,645,647,],[61,61,61,158,61,61,61,61,61,61,-48,-42,-44,-47,-45,-41,158,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,61,158,61,61,61,61,61,61,61,61,61,61,61,61,61,61,-269,61,61,61,61,61,61,61,61,61,-270,]),'TIMES':([16,51,54,56,63,64,66,67,95,97,120,124,159,161,162,172,176,195,197,198,204,210,215,222,254,256,258,259,260,261,262,263,269,270,271,272,273,274,275,315,330,360,362,363,364,366,368,374,378,379,380,391,396,418,419,443,445,454,455,485,493,517,524,525,526,527,528,529,530,531,662,663,669,],[109,-1,-61,-11,-13,-7,179,-63,-6,-4,-1,223,179,-79,-64,-81,-12,-316,109,-317,109,109,109,179,-60,-22,179,-3,-66,-72,-71,-69,-8,179,179,-16,179,-17,179,-5,179,-340,-332,-333,444,447,-334,-2,-73,-75,-85,-290,109,492,179,447,447,179,179,179,564,586,447,-342,-338,447,-341,-331,-335,-336,179,179,-83,]),'ALIAS':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,44,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,44,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,44,-202,-326,-76,-174,-258,44,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'TILDAEQ':([51,54,56,63,64,66,67,95,97,159,161,162,172,176,254,256,259,260,261,262,263,269,270,271,272,273,274,275,315,362,363,368,374,378,379,380,455,479,669,],[-1,-61,-11,-13,-7,177,-63,-6,-4,177,-79,-64,-81,-12,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-5,-332,-333,450,-2,-73,-75,-85,-18,547,-83,]),'RELATION':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,342,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,432,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,509,511,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,572,574,575,578,579,580,587,589,591,596,597,599,618,619,620,622,623,624,625,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,45,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-99,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,513,-163,-337,-18,-80,-40,-206,-318,-319,45,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-100,577,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,45,-202,-326,-76,-174,-258,45,-91,-95,-101,-50,-96,-93,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-92,-94,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'LPAREN':([2,7,8,12,15,17,19,26,29,39,42,45,49,50,51,52,53,55,56,59,68,69,70,72,75,76,88,92,95,96,97,98,99,104,105,106,108,110,112,120,123,125,133,163,165,166,167,168,176,177,178,179,180,181,182,183,189,190,199,200,209,216,217,218,219,220,221,223,224,225,226,227,239,245,249,250,259,266,267,268,280,288,315,316,321,348,357,361,362,365,367,374,375,381,404,409,413,415,418,421,429,434,442,444,446,447,453,464,473,479,489,493,499,506,507,512,513,519,551,553,557,570,571,576,577,581,595,598,611,613,614,616,617,621,637,640,644,645,647,658,659,],[50,78,50,94,78,78,123,78,78,94,94,78,94,50,-1,50,50,50,163,50,185,50,50,190,-310,193,204,207,-6,185,-4,185,185,-48,-42,-44,-47,-45,-41,219,123,185,185,123,50,50,50,50,163,123,123,123,123,123,123,50,185,123,50,78,94,78,50,185,123,123,123,-53,-49,-55,123,-51,50,50,78,365,-3,50,50,50,78,-311,-5,401,415,436,415,365,163,365,50,-2,123,123,50,50,50,123,50,50,78,50,365,365,365,365,50,50,415,190,560,50,94,78,78,50,78,94,123,50,50,50,78,78,78,50,637,50,-269,415,415,50,50,415,123,50,123,123,-270,185,185,]),'IN':([51,54,56,63,64,66,67,90,91,92,95,97,161,162,172,176,208,254,256,259,260,261,262,263,269,270,271,272,273,274,275,309,310,313,315,374,378,379,380,399,455,468,538,569,669,],[-1,-61,-11,-13,-7,-57,-63,-180,-182,-177,-6,-4,-79,-64,-81,-12,-178,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-181,-166,-183,-5,-2,-73,-75,-85,-167,-18,-179,598,621,-83,]),'VARIABLE':([2,8,19,50,52,53,55,58,59,60,69,70,78,94,102,103,104,105,106,107,108,109,110,112,123,163,165,166,167,168,177,178,179,180,181,182,183,190,193,199,204,207,217,219,220,221,223,224,225,226,227,239,245,250,255,265,266,267,268,290,291,292,314,321,357,361,365,367,375,381,390,396,398,404,409,413,415,418,421,429,434,442,444,446,447,449,450,453,464,473,493,512,551,553,557,570,571,581,598,611,613,614,616,617,621,637,640,644,645,647,],[64,64,64,64,64,64,64,170,64,170,64,64,64,64,-55,-51,-48,-42,-44,-49,-47,-53,-45,-41,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-53,-49,-55,64,-51,64,64,64,170,170,64,64,64,64,64,170,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,64,-269,64,64,64,64,64,64,64,64,64,-270,]),'LOCAL':([321,357,473,613,614,621,],[417,417,417,417,417,417,]),'IF':([51,54,56,63,64,66,67,95,97,120,124,159,161,162,172,176,222,254,256,258,259,260,261,262,263,269,270,271,272,273,274,275,315,321,330,357,374,378,379,380,419,454,455,473,485,613,614,621,662,663,669,],[-1,-61,-11,-13,-7,183,-63,-6,-4,-1,183,183,-79,-64,-81,-12,183,-60,-22,183,-3,-66,-72,-71,-69,-8,-59,183,-16,-14,-17,-15,-5,418,183,418,-2,-73,-75,-85,183,183,-18,418,183,418,418,418,183,183,-83,]),'CONCEPT':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,46,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,46,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,46,-202,-326,-76,-174,-258,46,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'NATIVEQUOTE':([0,1,16,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,199,208,215,217,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,321,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,47,113,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,295,-178,113,295,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,420,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,47,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,47,-202,-326,-76,-174,-258,47,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'STRUCT':([351,441,],[438,438,]),'SCENARIO':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,48,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,48,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,48,-202,-326,-76,-174,-258,48,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'RETURNS':([95,96,97,98,125,189,212,213,228,282,315,384,658,659,667,668,],[-6,-171,-4,-171,-171,-171,316,316,316,316,-5,-172,-171,-171,316,316,]),'DESTRUCTOR':([0,1,25,31,47,51,54,56,57,62,63,64,66,67,72,73,74,75,76,77,80,81,82,83,84,85,86,87,88,90,91,92,93,95,97,100,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,120,122,127,129,130,132,135,138,141,142,144,145,148,149,150,151,152,154,156,160,161,162,172,176,187,188,189,208,233,236,242,243,244,254,256,259,260,261,262,263,269,270,271,272,273,274,275,281,282,284,285,288,293,294,295,296,297,298,299,300,309,310,313,315,319,320,322,324,325,328,329,330,333,334,335,336,337,338,339,341,343,344,345,347,348,349,350,352,353,355,356,358,359,360,362,363,364,366,368,369,374,378,379,380,382,384,385,386,387,388,389,395,397,399,402,403,411,425,426,427,428,431,437,443,455,456,457,459,462,463,466,468,474,494,497,498,500,502,503,504,505,514,523,524,525,526,527,528,529,530,531,533,536,537,538,539,540,542,568,575,587,589,591,596,597,599,618,619,620,622,623,626,627,630,632,638,639,641,653,661,664,669,673,],[-40,49,-120,-119,-239,-1,-61,-11,-50,-70,-13,-7,-57,-63,-32,-154,-320,-310,-312,-308,-140,-156,-284,-223,-283,-104,-105,-117,-115,-180,-182,-177,-123,-6,-4,-151,-55,-51,-48,-42,-44,-49,-47,-53,-45,-235,-41,-236,-234,-233,-139,-137,-135,-27,-30,-46,-286,-225,-148,-103,-43,-222,-124,-224,-122,-125,-129,-127,-126,-305,-155,-121,-52,-79,-64,-81,-12,-65,-62,-171,-178,-227,-150,-161,-162,-160,-60,-22,-3,-66,-72,-71,-69,-8,-59,-58,-16,-14,-17,-15,-148,-173,-152,-321,-311,-322,-325,-324,-323,-309,-285,-106,-118,-181,-166,-183,-5,-211,-200,-237,-138,-136,-189,-31,-29,-153,-287,-226,-208,-207,-141,-149,-90,-102,-346,-229,-351,-347,-345,-240,-231,-232,-241,-89,-228,-128,-340,-332,-333,-339,-307,-334,-306,-2,-73,-75,-85,-78,-172,-67,-68,-199,-33,-313,-116,-40,-167,-209,-210,-256,-28,-157,-212,-213,-221,-163,-337,-18,-80,-40,-206,-318,-319,49,-179,-257,-201,-216,-40,-190,-144,-146,-142,-147,-349,-242,-344,-342,-338,-343,-341,-331,-335,-336,-251,49,-202,-326,-76,-174,-258,49,-101,-348,-186,-184,-84,-328,-77,-238,-217,-218,-143,-145,-198,-350,-185,-230,-86,-330,-327,-220,-329,-219,-83,-191,]),'CALL':([321,357,473,613,614,621,],[414,414,414,414,414,414,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'termtuple':([321,357,473,613,614,621,],[405,405,405,405,405,405,]),'state_expr':([240,433,436,],[345,514,518,]),'opttemporal':([1,466,536,568,],[4,4,4,4,]),'optimpex':([1,466,536,568,],[5,5,5,5,]),'defargs':([193,],[287,]),'somefmla':([418,],[490,]),'tapp':([12,39,42,49,209,499,519,],[90,90,90,90,90,90,90,]),'moduleend':([539,],[599,]),'callatom':([9,22,23,24,32,38,41,201,230,231,232,234,235,241,248,340,407,414,424,471,550,567,654,],[83,128,129,131,137,141,144,298,333,334,335,336,337,350,358,129,472,484,129,541,604,129,129,]),'param':([489,610,],[558,646,]),'defarg':([78,193,290,291,390,],[197,286,392,393,461,]),'upax':([426,],[500,]),'optinit':([486,],[552,]),'typeddefn':([7,15,17,26,45,200,216,249,429,506,507,513,571,576,577,],[79,79,118,79,79,79,118,79,79,118,79,79,79,118,79,]),'match':([429,571,],[502,623,]),'pnames':([204,],[302,]),'matches':([429,],[503,]),'labeledfmla':([2,8,69,70,512,],[62,81,187,188,579,]),'modinst':([10,202,203,],[87,87,300,]),'scentranss':([370,],[451,]),'term':([2,8,19,50,52,53,55,59,69,70,123,163,165,166,167,168,177,178,179,180,181,182,183,190,199,217,219,220,221,223,224,225,226,227,239,245,266,267,268,321,357,367,375,381,404,409,413,415,418,421,434,453,464,473,493,512,551,553,557,570,581,598,613,614,616,617,621,637,640,644,645,],[66,66,124,159,66,66,66,66,66,66,222,258,66,66,66,66,270,271,272,273,274,275,66,258,66,66,258,124,124,272,273,274,330,275,66,66,66,66,66,419,419,66,454,455,66,66,66,485,66,66,66,66,66,419,66,66,258,66,66,66,66,66,419,419,66,66,419,258,66,662,663,]),'tsyms':([207,],[311,]),'invariants':([495,],[565,]),'defnrhs':([199,217,],[294,325,]),'tterms':([12,39,42,49,499,519,],[93,142,145,156,569,588,]),'exprterm':([250,361,365,442,444,446,447,449,450,],[368,368,368,368,368,368,368,530,531,]),'schdefnrhs':([239,],[343,]),'topseq':([214,318,331,460,],[319,403,427,537,]),'tterm':([12,39,42,49,209,499,519,],[91,91,91,91,313,91,91,]),'targs':([92,],[208,]),'schdecls':([342,],[432,]),'aterm':([2,8,19,50,52,53,55,59,65,69,70,123,163,165,166,167,168,177,178,179,180,181,182,183,190,199,217,219,220,221,223,224,225,226,227,239,245,250,266,267,268,321,357,361,365,367,375,381,404,409,413,415,418,421,434,442,444,446,447,449,450,453,464,473,493,512,551,553,557,570,581,598,613,614,616,617,621,637,640,644,645,],[56,56,56,56,56,56,56,56,176,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,362,56,56,56,56,56,362,362,56,56,56,56,56,56,56,56,56,56,362,362,362,362,362,362,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,56,]),'scenariomixin':([594,657,],[634,666,]),'optproof':([132,281,],[236,386,]),'sum':([250,361,365,442,444,446,447,],[360,360,360,360,360,360,360,]),'schdefn':([29,],[135,]),'rel':([45,249,513,577,],[150,359,150,150,]),'prod':([250,361,365,442,444,446,447,],[364,364,364,364,364,364,364,]),'lparams':([185,401,417,560,],[278,469,488,612,]),'terms':([163,190,219,551,637,],[257,283,327,605,660,]),'opttrusted':([1,466,536,568,],[18,18,18,18,]),'cdefn':([46,251,],[152,369,]),'atoms':([517,],[583,]),'infix':([16,124,197,204,210,215,396,],[111,226,291,304,314,111,304,]),'proofstep':([237,430,],[339,505,]),'opttypedsym':([416,],[486,]),'optreturns':([212,213,228,282,667,668,],[317,318,331,387,671,672,]),'eqns':([410,],[477,]),'action':([321,357,473,613,614,621,],[422,422,543,648,649,655,]),'oper':([16,215,],[101,322,]),'optelse':([597,],[639,]),'constantdecl':([1,466,536,568,],[25,25,25,25,]),'insts':([10,],[85,]),'apps':([19,220,],[121,328,]),'app':([19,220,221,],[122,122,329,]),'names':([439,],[521,]),'optargs':([68,96,98,99,125,133,189,218,658,659,],[186,212,213,214,228,238,282,326,667,668,]),'ensures':([516,522,670,],[582,592,673,]),'rels':([45,513,577,],[149,580,625,]),'top':([0,397,457,498,],[1,466,536,568,]),'sequence':([214,247,317,318,321,331,357,460,473,477,488,490,492,613,614,615,621,671,672,],[320,356,402,320,406,320,406,320,406,545,555,561,562,406,406,650,406,674,675,]),'objectargs':([68,],[184,]),'dotsym':([7,15,17,26,29,45,200,216,249,280,429,506,507,513,571,576,577,],[76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,76,]),'eqn':([410,546,],[478,601,]),'var':([2,8,19,50,52,53,55,59,69,70,78,94,123,163,165,166,167,168,177,178,179,180,181,182,183,190,193,199,204,207,217,219,220,221,223,224,225,226,227,239,245,250,266,267,268,290,291,314,321,357,361,365,367,375,381,390,396,398,404,409,413,415,418,421,429,434,442,444,446,447,449,450,453,464,473,493,512,551,553,557,570,571,581,598,613,614,616,617,621,637,640,644,645,],[63,63,63,63,63,63,63,63,63,63,198,210,63,63,63,63,63,63,63,63,63,63,63,63,63,63,198,63,301,312,63,63,63,63,63,63,63,63,63,63,63,363,63,63,63,198,198,400,63,63,363,363,63,63,63,198,301,467,63,63,63,63,63,63,501,63,363,363,363,363,363,363,63,63,63,63,63,63,63,63,63,501,63,63,63,63,63,63,63,63,63,63,63,]),'params':([489,],[559,]),'sort':([351,441,],[437,523,]),'funs':([17,506,576,],[116,572,624,]),'sceninit':([155,],[252,]),'callatoms':([23,340,424,567,654,],[130,431,497,619,664,]),'pname':([204,396,],[303,465,]),'typesymbol':([139,],[243,]),'atom':([6,9,22,23,24,32,38,41,43,46,89,191,201,230,231,232,234,235,241,248,251,340,407,412,414,424,471,482,517,550,567,628,654,],[73,84,84,84,84,84,84,84,146,153,205,284,84,84,84,84,84,84,84,84,153,84,84,481,84,84,84,481,585,84,84,656,84,]),'optdelegee':([130,],[233,]),'symdecl':([1,466,536,568,],[31,31,31,31,]),'simplevar':([58,60,255,265,292,],[169,169,169,377,394,]),'places':([253,451,593,],[372,532,633,]),'optskolem':([187,],[281,]),'expr':([250,361,365,442,444,446,447,],[366,443,445,524,525,527,528,]),'bounds':([489,],[557,]),'fun':([17,216,506,576,],[117,324,117,117,]),'modifies':([435,440,],[516,522,]),'somevarfmla':([199,217,],[296,296,]),'optghost':([1,466,536,568,],[36,36,36,36,]),'optwith':([620,],[653,]),'atype':([13,14,16,20,175,192,204,206,215,289,396,554,635,636,],[96,98,115,125,269,285,307,309,115,391,307,607,658,659,]),'actseq':([321,357,],[408,408,]),'objectend':([596,],[638,]),'cdefns':([46,],[154,]),'lparam':([78,185,193,290,291,383,390,401,417,560,],[195,279,195,195,195,458,195,279,279,279,]),'defnlhs':([7,15,17,26,29,45,200,216,249,280,429,506,507,513,571,576,577,],[74,74,74,74,134,148,74,74,148,385,74,74,74,148,74,74,148,]),'lit':([412,482,],[480,549,]),'fmla':([2,8,50,52,53,55,59,69,70,165,166,167,168,183,199,217,239,245,266,267,268,367,404,409,413,418,421,434,453,464,493,512,553,557,570,581,598,616,617,640,],[57,57,157,160,161,162,172,57,57,260,261,262,263,276,293,293,341,352,378,379,380,448,470,475,483,491,495,515,535,538,563,578,606,609,622,626,641,651,652,661,]),'decreases':([565,],[615,]),'defns':([7,15,26,],[80,100,132,]),'optdotdotdot':([382,],[457,]),'upaxes':([328,],[426,]),'schdecl':([432,],[509,]),'optin':([538,],[597,]),'optactiondef':([387,],[459,]),'inst':([10,202,],[86,299,]),'defn':([7,15,26,45,200,249,429,507,513,571,577,],[77,77,77,151,297,151,504,573,151,504,151,]),'relop':([16,66,159,197,204,215,368,396,],[114,178,178,290,305,114,449,305,]),'modulestart':([11,],[89,]),'assert_rhs':([245,],[353,]),'requires':([346,354,665,],[435,440,670,]),'schconc':([432,],[510,]),'simplevars':([58,60,255,],[171,173,373,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> top","S'",1,None,None,None),
+  ('aterm -> SYMBOL','aterm',1,'p_aterm_symbol','ivy_logic_parser.py',16),
+  ('aterm -> aterm LPAREN terms RPAREN','aterm',4,'p_aterm_aterm_terms','ivy_logic_parser.py',21),
+  ('aterm -> aterm DOT SYMBOL','aterm',3,'p_term_term_dot_term','ivy_logic_parser.py',36),
+  ('atype -> SYMBOL','atype',1,'p_atype_symbol','ivy_logic_parser.py',41),
+  ('atype -> atype DOT SYMBOL','atype',3,'p_atype_atype_dot_symbol','ivy_logic_parser.py',46),
+  ('atype -> THIS','atype',1,'p_atype_this','ivy_logic_parser.py',52),
+  ('var -> VARIABLE','var',1,'p_var_variable','ivy_logic_parser.py',57),
+  ('var -> VARIABLE COLON atype','var',3,'p_var_variable_colon_symbol','ivy_logic_parser.py',62),
+  ('simplevar -> VARIABLE','simplevar',1,'p_simplevar_variable','ivy_logic_parser.py',67),
+  ('simplevar -> VARIABLE COLON SYMBOL','simplevar',3,'p_simplevar_variable_colon_symbol','ivy_logic_parser.py',72),
+  ('term -> aterm','term',1,'p_term_aterm','ivy_logic_parser.py',77),
+  ('term -> OLD aterm','term',2,'p_aterm_old_symbol','ivy_logic_parser.py',90),
+  ('term -> var','term',1,'p_term_var','ivy_logic_parser.py',95),
+  ('term -> term PLUS term','term',3,'p_term_term_PLUS_term','ivy_logic_parser.py',101),
+  ('term -> term MINUS term','term',3,'p_term_term_MINUS_term','ivy_logic_parser.py',106),
+  ('term -> term TIMES term','term',3,'p_term_term_TIMES_term','ivy_logic_parser.py',111),
+  ('term -> term DIV term','term',3,'p_term_term_DIV_term','ivy_logic_parser.py',116),
+  ('term -> term IF fmla ELSE term','term',5,'p_term_if_fmla_else_term','ivy_logic_parser.py',121),
+  ('terms -> <empty>','terms',0,'p_terms','ivy_logic_parser.py',147),
+  ('terms -> term','terms',1,'p_terms_term','ivy_logic_parser.py',151),
+  ('terms -> terms COMMA term','terms',3,'p_terms_terms_term','ivy_logic_parser.py',155),
+  ('term -> LPAREN term RPAREN','term',3,'p_term_lp_term_lp','ivy_logic_parser.py',161),
+  ('vars -> var','vars',1,'p_vars_var','ivy_logic_parser.py',165),
+  ('vars -> vars COMMA var','vars',3,'p_vars_vars_comma_var','ivy_logic_parser.py',169),
+  ('simplevars -> simplevar','simplevars',1,'p_simplevars_simplevar','ivy_logic_parser.py',174),
+  ('simplevars -> simplevars COMMA simplevar','simplevars',3,'p_simplevars_simplevars_comma_simplevar','ivy_logic_parser.py',178),
+  ('app -> SYMBOL','app',1,'p_app_symbol','ivy_logic_parser.py',185),
+  ('app -> SYMBOL LPAREN terms RPAREN','app',4,'p_app_symbol_lp_terms_rp','ivy_logic_parser.py',190),
+  ('app -> term infix term','app',3,'p_app_term_infix_term','ivy_logic_parser.py',195),
+  ('apps -> app','apps',1,'p_apps_app','ivy_logic_parser.py',201),
+  ('apps -> apps COMMA app','apps',3,'p_apps_apps_app','ivy_logic_parser.py',205),
+  ('atom -> SYMBOL','atom',1,'p_atom_symbol','ivy_logic_parser.py',212),
+  ('atom -> SYMBOL LPAREN terms RPAREN','atom',4,'p_atom_symbol_lp_terms_rp','ivy_logic_parser.py',217),
+  ('atoms -> atom','atoms',1,'p_atoms_atom','ivy_logic_parser.py',222),
+  ('atoms -> atoms COMMA atom','atoms',3,'p_atoms_atoms_atom','ivy_logic_parser.py',226),
+  ('lit -> atom','lit',1,'p_lit_atom','ivy_logic_parser.py',233),
+  ('lit -> SYMBOL EQ SYMBOL','lit',3,'p_lit_term_eq_term','ivy_logic_parser.py',238),
+  ('lit -> SYMBOL TILDAEQ SYMBOL','lit',3,'p_lit_term_tildaeq_term','ivy_logic_parser.py',243),
+  ('lit -> TILDA lit','lit',2,'p_lit_tilda_atom','ivy_logic_parser.py',248),
+  ('top -> <empty>','top',0,'p_top','ivy_parser.py',252),
+  ('relop -> EQ','relop',1,'p_relop_eq','ivy_logic_parser.py',253),
+  ('relop -> LE','relop',1,'p_relop_le','ivy_logic_parser.py',257),
+  ('top -> top USING SYMBOL','top',3,'p_top_using_symbol','ivy_parser.py',257),
+  ('relop -> LT','relop',1,'p_relop_lt','ivy_logic_parser.py',261),
+  ('relop -> GE','relop',1,'p_relop_ge','ivy_logic_parser.py',265),
+  ('top -> top INCLUDE SYMBOL','top',3,'p_top_include_symbol','ivy_parser.py',266),
+  ('relop -> GT','relop',1,'p_relop_gt','ivy_logic_parser.py',269),
+  ('relop -> PTO','relop',1,'p_relop_pto','ivy_logic_parser.py',273),
+  ('infix -> PLUS','infix',1,'p_infix_plus','ivy_logic_parser.py',277),
+  ('labeledfmla -> fmla','labeledfmla',1,'p_labeledfmla_fmla','ivy_parser.py',278),
+  ('infix -> MINUS','infix',1,'p_infix_minus','ivy_logic_parser.py',281),
+  ('labeledfmla -> LABEL fmla','labeledfmla',2,'p_labeledfmla_label_fmla','ivy_parser.py',283),
+  ('infix -> TIMES','infix',1,'p_infix_times','ivy_logic_parser.py',285),
+  ('opttemporal -> <empty>','opttemporal',0,'p_opttemporal','ivy_parser.py',288),
+  ('infix -> DIV','infix',1,'p_infix_div','ivy_logic_parser.py',289),
+  ('opttemporal -> TEMPORAL','opttemporal',1,'p_opttemporal_symbol','ivy_parser.py',292),
+  ('fmla -> term','fmla',1,'p_fmla_term','ivy_logic_parser.py',295),
+  ('fmla -> term relop term','fmla',3,'p_fmla_term_relop_term','ivy_logic_parser.py',299),
+  ('fmla -> term TILDAEQ term','fmla',3,'p_fmla_term_tildaeq_term','ivy_logic_parser.py',304),
+  ('fmla -> LPAREN fmla RPAREN','fmla',3,'p_fmla_lparen_fmla_rparen','ivy_logic_parser.py',309),
+  ('fmla -> TRUE','fmla',1,'p_fmla_true','ivy_logic_parser.py',313),
+  ('top -> top opttemporal AXIOM labeledfmla','top',4,'p_top_axiom_labeledfmla','ivy_parser.py',317),
+  ('fmla -> FALSE','fmla',1,'p_fmla_false','ivy_logic_parser.py',318),
+  ('fmla -> TILDA fmla','fmla',2,'p_fmla_not_fmla','ivy_logic_parser.py',323),
+  ('optskolem -> <empty>','optskolem',0,'p_optskolem','ivy_parser.py',325),
+  ('fmla -> fmla AND fmla','fmla',3,'p_fmla_fmla_and_fmla','ivy_logic_parser.py',328),
+  ('optskolem -> NAMED defnlhs','optskolem',2,'p_optskolem_symbol','ivy_parser.py',329),
+  ('top -> top opttemporal PROPERTY labeledfmla optskolem optproof','top',6,'p_top_property_labeledfmla','ivy_parser.py',334),
+  ('fmla -> fmla OR fmla','fmla',3,'p_fmla_fmla_or_fmla','ivy_logic_parser.py',337),
+  ('top -> top CONJECTURE labeledfmla','top',3,'p_top_conjecture_labeledfmla','ivy_parser.py',346),
+  ('fmla -> fmla ARROW fmla','fmla',3,'p_fmla_fmla_arrow_fmla','ivy_logic_parser.py',348),
+  ('fmla -> fmla IFF fmla','fmla',3,'p_fmla_fmla_iff_fmla','ivy_logic_parser.py',353),
+  ('fmla -> FORALL simplevars DOT fmla','fmla',4,'p_fmla_forall_vars_dot_fmla','ivy_logic_parser.py',360),
+  ('modulestart -> <empty>','modulestart',0,'p_modulestart','ivy_parser.py',362),
+  ('fmla -> EXISTS simplevars DOT fmla','fmla',4,'p_fmla_exists_vars_dot_fmla','ivy_logic_parser.py',365),
+  ('moduleend -> <empty>','moduleend',0,'p_moduleend','ivy_parser.py',367),
+  ('top -> top MODULE modulestart atom EQ LCB top RCB moduleend','top',9,'p_top_module_atom_eq_lcb_top_rcb','ivy_parser.py',371),
+  ('optdotdotdot -> <empty>','optdotdotdot',0,'p_optdotdotdot','ivy_parser.py',380),
+  ('fmla -> GLOBALLY fmla','fmla',2,'p_fmla_globally_fmla','ivy_logic_parser.py',382),
+  ('optdotdotdot -> DOTDOTDOT','optdotdotdot',1,'p_optdotdotdot_dotdotdot','ivy_parser.py',384),
+  ('fmla -> EVENTUALLY fmla','fmla',2,'p_fmla_eventually_fmla','ivy_logic_parser.py',387),
+  ('objectargs -> optargs','objectargs',1,'p_objectargs_optargs','ivy_parser.py',388),
+  ('term -> LPAREN DOLLAR SYMBOL simplevars DOT fmla RPAREN LPAREN terms RPAREN','term',10,'p_term_namedbinder_vars_dot_fmla','ivy_logic_parser.py',392),
+  ('objectend -> <empty>','objectend',0,'p_objectend','ivy_parser.py',393),
+  ('term -> DOLLAR SYMBOL DOT fmla','term',4,'p_term_namedbinder_dot_fmla','ivy_logic_parser.py',399),
+  ('top -> top OBJECT SYMBOL objectargs EQ LCB optdotdotdot top RCB objectend','top',10,'p_top_object_symbol_eq_lcb_top_rcb','ivy_parser.py',411),
+  ('optsemi -> <empty>','optsemi',0,'p_optsemi','ivy_parser.py',416),
+  ('optsemi -> SEMI','optsemi',1,'p_optsemi_semi','ivy_parser.py',420),
+  ('top -> top MACRO atom EQ sequence','top',5,'p_top_macro_atom_eq_lcb_action_rcb','ivy_parser.py',424),
+  ('schdefnrhs -> fmla','schdefnrhs',1,'p_schdefnrhs_fmla','ivy_parser.py',430),
+  ('schdecl -> FUNCTION funs','schdecl',2,'p_schdecl_funcdecl','ivy_parser.py',434),
+  ('schdecl -> FRESH FUNCTION funs','schdecl',3,'p_schdecl_fresh_funcdecl','ivy_parser.py',438),
+  ('schdecl -> RELATION rels','schdecl',2,'p_schdecl_relation_rel','ivy_parser.py',442),
+  ('schdecl -> FRESH RELATION rels','schdecl',3,'p_schdecl_fresh_relation_rel','ivy_parser.py',446),
+  ('schdecl -> TYPE SYMBOL','schdecl',2,'p_schdecl_typedecl','ivy_parser.py',450),
+  ('schdecl -> PROPERTY labeledfmla','schdecl',2,'p_schdecl_propdecl','ivy_parser.py',458),
+  ('schconc -> DEFINITION defn','schconc',2,'p_schconc_defdecl','ivy_parser.py',462),
+  ('schconc -> PROPERTY fmla','schconc',2,'p_schconc_propdecl','ivy_parser.py',466),
+  ('schdecls -> <empty>','schdecls',0,'p_schdecls','ivy_parser.py',470),
+  ('schdecls -> schdecls schdecl','schdecls',2,'p_schdecls_schdecls_schdecl','ivy_parser.py',474),
+  ('schdefnrhs -> LCB schdecls schconc RCB','schdefnrhs',4,'p_schdefnrhs_lcb_schdecls_rcb','ivy_parser.py',479),
+  ('schdefn -> defnlhs EQ schdefnrhs','schdefn',3,'p_schdefn_atom_eq_fmla','ivy_parser.py',483),
+  ('top -> top SCHEMA schdefn','top',3,'p_top_schema_defn','ivy_parser.py',488),
+  ('top -> top INSTANTIATE insts','top',3,'p_top_instantiate_insts','ivy_parser.py',493),
+  ('insts -> inst','insts',1,'p_insts_inst','ivy_parser.py',498),
+  ('insts -> insts COMMA inst','insts',3,'p_insts_insts_comma_inst','ivy_parser.py',502),
+  ('pname -> atype','pname',1,'p_pname_symbol','ivy_parser.py',507),
+  ('pname -> var','pname',1,'p_pname_var','ivy_parser.py',512),
+  ('pname -> infix','pname',1,'p_pname_infix','ivy_parser.py',516),
+  ('pname -> relop','pname',1,'p_pname_relop','ivy_parser.py',521),
+  ('pname -> THIS','pname',1,'p_pname_this','ivy_parser.py',526),
+  ('pnames -> <empty>','pnames',0,'p_pnames','ivy_parser.py',531),
+  ('pnames -> pname','pnames',1,'p_pnames_pname','ivy_parser.py',535),
+  ('pnames -> pnames COMMA pname','pnames',3,'p_pnames_pnames_pname','ivy_parser.py',539),
+  ('modinst -> SYMBOL','modinst',1,'p_modinst_symbol','ivy_parser.py',544),
+  ('modinst -> SYMBOL LPAREN pnames RPAREN','modinst',4,'p_modinst_symbol_lp_pnames_rp','ivy_parser.py',549),
+  ('inst -> modinst','inst',1,'p_inst_modinst','ivy_parser.py',554),
+  ('inst -> modinst COLON modinst','inst',3,'p_inst_atom_colon_modinst','ivy_parser.py',558),
+  ('top -> top symdecl','top',2,'p_top_symdecl','ivy_parser.py',562),
+  ('symdecl -> constantdecl','symdecl',1,'p_symdecl_constantdecl','ivy_parser.py',567),
+  ('symdecl -> DESTRUCTOR tterms','symdecl',2,'p_symdecl_destructor_tterms','ivy_parser.py',571),
+  ('constantdecl -> INDIV tterms','constantdecl',2,'p_constantdecl_constant_tterms','ivy_parser.py',575),
+  ('constantdecl -> VAR tterms','constantdecl',2,'p_constantdecl_var_tterms','ivy_parser.py',579),
+  ('constantdecl -> PARAMETER tterms','constantdecl',2,'p_constantdecl_parameter_tterms','ivy_parser.py',583),
+  ('rel -> defnlhs','rel',1,'p_rel_defnlhs','ivy_parser.py',587),
+  ('rel -> defn','rel',1,'p_rel_defn','ivy_parser.py',592),
+  ('rels -> rel','rels',1,'p_rels_rel','ivy_parser.py',596),
+  ('rels -> rels COMMA rel','rels',3,'p_rels_rels_comma_rel','ivy_parser.py',600),
+  ('top -> top RELATION rels','top',3,'p_top_relation_rels','ivy_parser.py',605),
+  ('tatoms -> tatom','tatoms',1,'p_tatoms_tatom','ivy_parser.py',611),
+  ('tatoms -> tatoms COMMA tatom','tatoms',3,'p_tatoms_tatoms_comma_tatom','ivy_parser.py',615),
+  ('tatom -> SYMBOL','tatom',1,'p_tatom_symbol','ivy_parser.py',620),
+  ('tatom -> SYMBOL targs','tatom',2,'p_tatom_symbol_targs','ivy_parser.py',625),
+  ('tatom -> LPAREN var relop var RPAREN','tatom',5,'p_tatom_lp_symbol_relop_symbol_rp','ivy_parser.py',630),
+  ('fun -> typeddefn','fun',1,'p_fun_defnlhs_colon_atype','ivy_parser.py',635),
+  ('fun -> typeddefn EQ defnrhs','fun',3,'p_fun_defn','ivy_parser.py',640),
+  ('funs -> fun','funs',1,'p_funs_fun','ivy_parser.py',646),
+  ('funs -> funs COMMA fun','funs',3,'p_funs_funs_comma_fun','ivy_parser.py',650),
+  ('top -> top FUNCTION funs','top',3,'p_top_function_tapp_colon_atype','ivy_parser.py',655),
+  ('top -> top DERIVED defns','top',3,'p_top_derived_defns','ivy_parser.py',666),
+  ('proofstep -> SYMBOL','proofstep',1,'p_proofstep_symbol','ivy_parser.py',671),
+  ('match -> defn','match',1,'p_match_defn','ivy_parser.py',678),
+  ('match -> var EQ fmla','match',3,'p_match_var_eq_fmla','ivy_parser.py',682),
+  ('matches -> match','matches',1,'p_matches','ivy_parser.py',687),
+  ('matches -> matches COMMA match','matches',3,'p_matches_matches_comma_match','ivy_parser.py',691),
+  ('proofstep -> SYMBOL WITH matches','proofstep',3,'p_proofstep_symbol_with_defns','ivy_parser.py',696),
+  ('proofstep -> proofstep SEMI proofstep','proofstep',3,'p_proofstep_proofstep_semi_proofstep','ivy_parser.py',703),
+  ('optproof -> <empty>','optproof',0,'p_optproof','ivy_parser.py',707),
+  ('optproof -> PROOF proofstep','optproof',2,'p_optproof_symbol','ivy_parser.py',711),
+  ('top -> top DEFINITION defns optproof','top',4,'p_top_definition_defns','ivy_parser.py',715),
+  ('top -> top PROGRESS defns','top',3,'p_top_progress_defns','ivy_parser.py',722),
+  ('top -> top RELY atom ARROW atom','top',5,'p_top_rely_atom_arrow_atom','ivy_parser.py',727),
+  ('top -> top MIXORD callatom ARROW callatom','top',5,'p_top_mixord_callatom_arrow_callatom','ivy_parser.py',732),
+  ('top -> top RELY atom','top',3,'p_top_rely_atom','ivy_parser.py',737),
+  ('top -> top CONCEPT cdefns','top',3,'p_top_concept_cdefns','ivy_parser.py',742),
+  ('top -> top INIT labeledfmla','top',3,'p_top_init_fmla','ivy_parser.py',749),
+  ('top -> top UPDATE apps FROM apps upaxes','top',6,'p_top_update_terms_from_terms_upaxes','ivy_parser.py',757),
+  ('optghost -> <empty>','optghost',0,'p_optghost','ivy_parser.py',766),
+  ('optghost -> GHOST','optghost',1,'p_optghost_ghost','ivy_parser.py',770),
+  ('typesymbol -> SYMBOL','typesymbol',1,'p_typesymbol_symbol','ivy_parser.py',774),
+  ('typesymbol -> THIS','typesymbol',1,'p_typesymbol_this','ivy_parser.py',778),
+  ('top -> top optghost TYPE typesymbol','top',4,'p_top_type_symbol','ivy_parser.py',783),
+  ('top -> top optghost TYPE typesymbol EQ sort','top',6,'p_top_type_symbol_eq_sort','ivy_parser.py',792),
+  ('tsyms -> var','tsyms',1,'p_tsyms_tsym','ivy_parser.py',801),
+  ('tsyms -> tsyms COMMA var','tsyms',3,'p_tsyms_tsyms_comma_tsym','ivy_parser.py',805),
+  ('targs -> LPAREN RPAREN','targs',2,'p_targs_lparen_rparen','ivy_parser.py',810),
+  ('targs -> LPAREN tsyms RPAREN','targs',3,'p_targs_lparen_tsyms_rparen','ivy_parser.py',814),
+  ('param -> SYMBOL COLON SYMBOL','param',3,'p_param_term_colon_symbol','ivy_parser.py',825),
+  ('params -> param','params',1,'p_params_param','ivy_parser.py',832),
+  ('params -> params COMMA param','params',3,'p_params_params_comma_param','ivy_parser.py',836),
+  ('optargs -> <empty>','optargs',0,'p_optargs','ivy_parser.py',841),
+  ('optargs -> LPAREN lparams RPAREN','optargs',3,'p_optargs_params','ivy_parser.py',845),
+  ('optreturns -> <empty>','optreturns',0,'p_optreturns','ivy_parser.py',849),
+  ('optreturns -> RETURNS LPAREN lparams RPAREN','optreturns',4,'p_optreturns_tsyms','ivy_parser.py',853),
+  ('optactualreturns -> <empty>','optactualreturns',0,'p_optactualreturns','ivy_parser.py',857),
+  ('optactualreturns -> callatoms ASSIGN','optactualreturns',2,'p_optactualreturns_callatoms_assign','ivy_parser.py',861),
+  ('tapp -> SYMBOL','tapp',1,'p_tapp_symbol','ivy_parser.py',865),
+  ('tapp -> SYMBOL targs','tapp',2,'p_tapp_symbol_targs','ivy_parser.py',870),
+  ('tapp -> LPAREN var infix var RPAREN','tapp',5,'p_tapp_lp_symbol_infix_symbol_rp','ivy_parser.py',875),
+  ('tterm -> tapp','tterm',1,'p_tterm_term','ivy_parser.py',881),
+  ('tterm -> tapp COLON atype','tterm',3,'p_tterm_term_colon_symbol','ivy_parser.py',885),
+  ('tterms -> tterm','tterms',1,'p_tterms_tterm','ivy_parser.py',890),
+  ('tterms -> tterms COMMA tterm','tterms',3,'p_tterms_tterms_comma_tterm','ivy_parser.py',894),
+  ('sort -> LCB names RCB','sort',3,'p_sort_lcb_names_rcb','ivy_parser.py',899),
+  ('sort -> STRUCT LCB tterms RCB','sort',4,'p_sort_struct_lcb_names_rcb','ivy_parser.py',903),
+  ('sort -> STRUCT LCB RCB','sort',3,'p_sort_struct_lcb_rcb','ivy_parser.py',907),
+  ('names -> SYMBOL','names',1,'p_names_symbol','ivy_parser.py',911),
+  ('names -> names COMMA SYMBOL','names',3,'p_names_names_comma_symbol','ivy_parser.py',915),
+  ('upaxes -> <empty>','upaxes',0,'p_upaxes','ivy_parser.py',920),
+  ('upaxes -> upaxes upax','upaxes',2,'p_upaxes_upaxes_upax','ivy_parser.py',924),
+  ('upax -> PARAMS tterms IN action ARROW requires ensures','upax',7,'p_upax_params_apps_in_action_arrow_ensures_fmla','ivy_parser.py',930),
+  ('requires -> <empty>','requires',0,'p_requires','ivy_parser.py',939),
+  ('requires -> REQUIRES fmla','requires',2,'p_requires_requires_fmla','ivy_parser.py',943),
+  ('modifies -> <empty>','modifies',0,'p_modifies','ivy_parser.py',947),
+  ('modifies -> MODIFIES LCB RCB','modifies',3,'p_modifies_modifies_lcb_rcb','ivy_parser.py',951),
+  ('modifies -> MODIFIES TIMES','modifies',2,'p_modifies_modofies_times','ivy_parser.py',955),
+  ('modifies -> MODIFIES atoms','modifies',2,'p_modifies_modifies_atoms','ivy_parser.py',959),
+  ('ensures -> ENSURES fmla','ensures',2,'p_ensures_ensures_fmla','ivy_parser.py',967),
+  ('optactiondef -> <empty>','optactiondef',0,'p_optactiondef','ivy_parser.py',978),
+  ('topseq -> sequence','topseq',1,'p_topseq_sequence','ivy_parser.py',982),
+  ('topseq -> LCB NATIVEQUOTE RCB','topseq',3,'p_topseq_lcb_nativequote_rcb','ivy_parser.py',986),
+  ('optactiondef -> EQ topseq','optactiondef',2,'p_optactiondef_eq_topseq','ivy_parser.py',992),
+  ('optimpex -> <empty>','optimpex',0,'p_optimpex','ivy_parser.py',996),
+  ('optimpex -> EXPORT','optimpex',1,'p_optimpex_export','ivy_parser.py',1000),
+  ('optimpex -> IMPORT','optimpex',1,'p_optimpex_import','ivy_parser.py',1004),
+  ('top -> top optimpex ACTION SYMBOL optargs optreturns optactiondef','top',7,'p_top_optimpex_action_symbol_optargs_optreturns_eq_action','ivy_parser.py',1008),
+  ('top -> top MIXIN callatom BEFORE callatom','top',5,'p_top_mixin_callatom_before_callatom','ivy_parser.py',1058),
+  ('top -> top MIXIN callatom AFTER callatom','top',5,'p_top_mixin_callatom_after_callatom','ivy_parser.py',1062),
+  ('top -> top BEFORE atype optargs optreturns sequence','top',6,'p_top_before_callatom_lcb_action_rcb','ivy_parser.py',1066),
+  ('top -> top AFTER atype optargs optreturns topseq','top',6,'p_top_after_callatom_lcb_action_rcb','ivy_parser.py',1072),
+  ('top -> top AFTER INIT optargs topseq','top',5,'p_top_after_init_optargs_lcb_action_rcb','ivy_parser.py',1098),
+  ('top -> top IMPLEMENT atype optargs optreturns topseq','top',6,'p_top_implement_callatom_lcb_action_rcb','ivy_parser.py',1104),
+  ('top -> top IMPLEMENT TYPE SYMBOL WITH SYMBOL','top',6,'p_top_implement_type_symbol_with_symbol','ivy_parser.py',1110),
+  ('opttrusted -> <empty>','opttrusted',0,'p_opttrusted','ivy_parser.py',1121),
+  ('opttrusted -> TRUSTED','opttrusted',1,'p_opttrusted_trusted','ivy_parser.py',1124),
+  ('top -> top opttrusted ISOLATE SYMBOL optargs EQ callatoms','top',7,'p_top_opttrusted_isolate_callatom_eq_callatoms','ivy_parser.py',1127),
+  ('top -> top opttrusted ISOLATE SYMBOL optargs EQ callatoms WITH callatoms','top',9,'p_top_opttrusted_isolate_callatom_eq_callatoms_with_callatoms','ivy_parser.py',1135),
+  ('optwith -> <empty>','optwith',0,'p_optwith','ivy_parser.py',1143),
+  ('optwith -> WITH callatoms','optwith',2,'p_optwith_with_callatoms','ivy_parser.py',1146),
+  ('top -> top opttrusted ISOLATE SYMBOL optargs EQ LCB top RCB optwith','top',10,'p_top_opttrusted_isolate_callatom_eq_lcb_top_rcb_optwith','ivy_parser.py',1149),
+  ('top -> top EXTRACT SYMBOL optargs EQ callatoms','top',6,'p_top_extract_callatom_eq_callatoms','ivy_parser.py',1158),
+  ('top -> top EXPORT callatom','top',3,'p_top_export_callatom','ivy_parser.py',1165),
+  ('top -> top IMPORT callatom','top',3,'p_top_import_callatom','ivy_parser.py',1172),
+  ('top -> top PRIVATE callatom','top',3,'p_top_private_callatom','ivy_parser.py',1180),
+  ('optdelegee -> <empty>','optdelegee',0,'p_optdelegee','ivy_parser.py',1186),
+  ('optdelegee -> ARROW callatom','optdelegee',2,'p_optdelegee_callatom','ivy_parser.py',1189),
+  ('top -> top DELEGATE callatoms optdelegee','top',4,'p_top_delegate_callatom_opt','ivy_parser.py',1192),
+  ('top -> top ALIAS SYMBOL EQ callatom','top',5,'p_top_aliase_symbol_eq_callatom','ivy_parser.py',1236),
+  ('top -> top STATE SYMBOL EQ state_expr','top',5,'p_top_state_symbol_eq_state_expr','ivy_parser.py',1243),
+  ('assert_rhs -> LCB requires modifies ensures RCB','assert_rhs',5,'p_assert_rhs_lcb_requires_modifies_ensures_rcb','ivy_parser.py',1248),
+  ('assert_rhs -> fmla','assert_rhs',1,'p_assert_rhs_fmla','ivy_parser.py',1252),
+  ('top -> top ASSERT SYMBOL ARROW assert_rhs','top',5,'p_top_assert_symbol_arrow_assert_rhs','ivy_parser.py',1256),
+  ('oper -> atype','oper',1,'p_oper_symbol','ivy_parser.py',1263),
+  ('oper -> relop','oper',1,'p_oper_relop','ivy_parser.py',1267),
+  ('oper -> infix','oper',1,'p_oper_infix','ivy_parser.py',1271),
+  ('oper -> NATIVEQUOTE','oper',1,'p_oper_nativequote','ivy_parser.py',1275),
+  ('top -> top INTERPRET oper ARROW oper','top',5,'p_top_interpret_symbol_arrow_symbol','ivy_parser.py',1281),
+  ('top -> top INTERPRET oper ARROW LCB SYMBOL DOTS SYMBOL RCB','top',9,'p_top_interpret_symbol_arrow_lcb_symbol_dots_symbol_rcb','ivy_parser.py',1290),
+  ('top -> top NATIVEQUOTE','top',2,'p_top_nativequote','ivy_parser.py',1316),
+  ('top -> top ATTRIBUTE callatom EQ callatom','top',5,'p_top_attribute_callatom_eq_callatom','ivy_parser.py',1326),
+  ('top -> top VARIANT SYMBOL OF SYMBOL','top',5,'p_top_variant_symbol_of_symbol','ivy_parser.py',1335),
+  ('top -> top VARIANT SYMBOL OF SYMBOL EQ sort','top',7,'p_top_variant_symbol_of_symbol_eq_sort','ivy_parser.py',1346),
+  ('places -> SYMBOL','places',1,'p_places_symbol','ivy_parser.py',1357),
+  ('places -> places COMMA SYMBOL','places',3,'p_places_places_comma_symbol','ivy_parser.py',1362),
+  ('sceninit -> ARROW places','sceninit',2,'p_sceninit_arrow_places','ivy_parser.py',1368),
+  ('scenariomixin -> BEFORE atype optargs optreturns sequence','scenariomixin',5,'p_scenariomixin_before_callatom_lcb_action_rcb','ivy_parser.py',1373),
+  ('scenariomixin -> AFTER atype optargs optreturns sequence','scenariomixin',5,'p_scenariomixin_after_callatom_lcb_action_rcb','ivy_parser.py',1383),
+  ('scentranss -> <empty>','scentranss',0,'p_scentranss','ivy_parser.py',1394),
+  ('scentranss -> scentranss places ARROW places COLON scenariomixin','scentranss',6,'p_scentranss_scentranss_places_arrow_places_colon_scenariomixin','ivy_parser.py',1398),
+  ('scentranss -> scentranss places COLON scenariomixin','scentranss',4,'p_scentranss_scentranss_places_colon_scenariomixin','ivy_parser.py',1405),
+  ('top -> top SCENARIO LCB sceninit SEMI scentranss RCB','top',7,'p_top_scenario_lcb_sceninit_semi_scentranss_rcb','ivy_parser.py',1412),
+  ('loc -> <empty>','loc',0,'p_loc','ivy_parser.py',1419),
+  ('loc -> SYMBOL','loc',1,'p_loc_symbol','ivy_parser.py',1423),
+  ('actseq -> action','actseq',1,'p_actseq_action','ivy_parser.py',1427),
+  ('actseq -> actseq SEMI action','actseq',3,'p_actseq_actseq_semi_action','ivy_parser.py',1431),
+  ('sequence -> LCB RCB','sequence',2,'p_sequence_lcb_rcb','ivy_parser.py',1457),
+  ('sequence -> LCB actseq RCB','sequence',3,'p_sequence_lcb_actseq_rcb','ivy_parser.py',1462),
+  ('sequence -> LCB actseq SEMI RCB','sequence',4,'p_sequence_lcb_actseq_semi_rcb','ivy_parser.py',1471),
+  ('action -> sequence','action',1,'p_action_sequence','ivy_parser.py',1476),
+  ('action -> ASSUME fmla','action',2,'p_action_assume','ivy_parser.py',1480),
+  ('action -> ASSERT fmla','action',2,'p_action_assert','ivy_parser.py',1485),
+  ('action -> ENSURES fmla','action',2,'p_action_ensures','ivy_parser.py',1491),
+  ('action -> SET lit','action',2,'p_action_set_lit','ivy_parser.py',1506),
+  ('action -> term ASSIGN fmla','action',3,'p_action_term_assign_fmla','ivy_parser.py',1511),
+  ('termtuple -> LPAREN term COMMA terms RPAREN','termtuple',5,'p_termtuple_lp_term_comma_terms_rp','ivy_parser.py',1516),
+  ('action -> termtuple ASSIGN callatom','action',3,'p_action_termtuple_assign_fmla','ivy_parser.py',1521),
+  ('action -> term ASSIGN TIMES','action',3,'p_action_term_assign_times','ivy_parser.py',1526),
+  ('somefmla -> fmla','somefmla',1,'p_somefmla_fmla','ivy_parser.py',1546),
+  ('bounds -> params DOT','bounds',2,'p_bounds_params_dot','ivy_parser.py',1550),
+  ('bounds -> LPAREN lparams RPAREN','bounds',3,'p_bounds_lparen_lparams_rparen','ivy_parser.py',1554),
+  ('somefmla -> SOME bounds fmla','somefmla',3,'p_somefmla_some_bounds_fmla','ivy_parser.py',1558),
+  ('somefmla -> SOME bounds fmla MINIMIZING term','somefmla',5,'p_somefmla_some_bounds_fmla_minimizing_term','ivy_parser.py',1566),
+  ('somefmla -> SOME bounds fmla MAXIMIZING term','somefmla',5,'p_somefmla_some_bounds_fmla_maximizing_term','ivy_parser.py',1575),
+  ('action -> IF somefmla sequence','action',3,'p_action_if_somefmla_lcb_action_rcb','ivy_parser.py',1591),
+  ('action -> IF somefmla sequence ELSE action','action',5,'p_action_if_somefmla_lcb_action_rcb_else_LCB_action_RCB','ivy_parser.py',1597),
+  ('invariants -> <empty>','invariants',0,'p_invariants','ivy_parser.py',1603),
+  ('invariants -> invariants INVARIANT fmla','invariants',3,'p_invariant_invariant_fmla','ivy_parser.py',1607),
+  ('decreases -> DECREASES fmla','decreases',2,'p_decreases_decreases_fmla','ivy_parser.py',1615),
+  ('decreases -> <empty>','decreases',0,'p_decreases','ivy_parser.py',1621),
+  ('action -> WHILE fmla invariants decreases sequence','action',5,'p_action_while_fmla_invariants_decreases_lcb_action_rcb','ivy_parser.py',1625),
+  ('action -> IF TIMES sequence ELSE action','action',5,'p_action_if_times_lcb_action_rcb_else_LCB_action_RCB','ivy_parser.py',1630),
+  ('action -> INSTANTIATE callatom','action',2,'p_action_instantiate_atom','ivy_parser.py',1658),
+  ('callatom -> atom','callatom',1,'p_callatom_atom','ivy_parser.py',1664),
+  ('callatom -> THIS','callatom',1,'p_callatom_this','ivy_parser.py',1669),
+  ('callatom -> callatom DOT callatom','callatom',3,'p_callatom_callatom_dot_callatom','ivy_parser.py',1684),
+  ('callatoms -> callatom','callatoms',1,'p_callatoms_callatom','ivy_parser.py',1690),
+  ('callatoms -> callatoms COMMA callatom','callatoms',3,'p_callatoms_callatoms_callatom','ivy_parser.py',1694),
+  ('action -> CALL callatom','action',2,'p_action_call_callatom','ivy_parser.py',1704),
+  ('action -> CALL callatom ASSIGN callatom','action',4,'p_action_call_callatom_assign_callatom','ivy_parser.py',1709),
+  ('lparam -> SYMBOL COLON atype','lparam',3,'p_lparam_variable_colon_symbol','ivy_parser.py',1715),
+  ('lparams -> lparam','lparams',1,'p_lparams_lparam','ivy_parser.py',1721),
+  ('lparams -> lparams COMMA lparam','lparams',3,'p_lparams_lparams_comma_lparam','ivy_parser.py',1725),
+  ('action -> LOCAL lparams sequence','action',3,'p_action_local_params_lcb_action_rcb','ivy_parser.py',1731),
+  ('opttypedsym -> SYMBOL','opttypedsym',1,'p_opttypedsym_symbol','ivy_parser.py',1741),
+  ('opttypedsym -> SYMBOL COLON atype','opttypedsym',3,'p_opttypedsym_symbol_colon_atype','ivy_parser.py',1747),
+  ('optinit -> <empty>','optinit',0,'p_optinit','ivy_parser.py',1753),
+  ('optinit -> ASSIGN fmla','optinit',2,'p_optinit_assign_fmla','ivy_parser.py',1757),
+  ('action -> VAR opttypedsym optinit','action',3,'p_action_var_opttypedsym_assign_fmla','ivy_parser.py',1761),
+  ('eqn -> SYMBOL EQ SYMBOL','eqn',3,'p_eqn_SYMBOL_EQ_SYMBOL','ivy_parser.py',1766),
+  ('eqns -> eqn','eqns',1,'p_eqns_eqn','ivy_parser.py',1770),
+  ('eqns -> eqns COMMA eqn','eqns',3,'p_eqns_eqns_comma_eqn','ivy_parser.py',1774),
+  ('action -> LET eqns sequence','action',3,'p_action_let_eqns_lcb_action_rcb','ivy_parser.py',1779),
+  ('symbols -> SYMBOL','symbols',1,'p_symbols','ivy_parser.py',1783),
+  ('symbols -> symbols COMMA SYMBOL','symbols',3,'p_symbols_symbols_symbol','ivy_parser.py',1787),
+  ('cdefns -> cdefn','cdefns',1,'p_cdefns_cdefn','ivy_parser.py',1792),
+  ('cdefns -> cdefns COMMA cdefn','cdefns',3,'p_cdefns_cdefns_comma_cdefn','ivy_parser.py',1796),
+  ('cdefn -> atom EQ expr','cdefn',3,'p_cdefn_atom_expr','ivy_parser.py',1801),
+  ('defns -> defn','defns',1,'p_defns_defn','ivy_parser.py',1806),
+  ('defns -> defns COMMA defn','defns',3,'p_defns_defns_comma_defn','ivy_parser.py',1810),
+  ('dotsym -> SYMBOL','dotsym',1,'p_dotsym_symbol','ivy_parser.py',1815),
+  ('dotsym -> dotsym DOT SYMBOL','dotsym',3,'p_dotsym_dotsym_dot_symbol','ivy_parser.py',1819),
+  ('defnlhs -> dotsym','defnlhs',1,'p_defnlhs_symbol','ivy_parser.py',1823),
+  ('defnlhs -> dotsym LPAREN defargs RPAREN','defnlhs',4,'p_defnlhs_symbol_lparen_defargs_rparen','ivy_parser.py',1828),
+  ('defargs -> defarg','defargs',1,'p_defargs_defarg','ivy_parser.py',1833),
+  ('defargs -> defargs COMMA defarg','defargs',3,'p_defargs_defargs_comma_defarg','ivy_parser.py',1837),
+  ('defarg -> lparam','defarg',1,'p_defarg_lparam','ivy_parser.py',1842),
+  ('defarg -> var','defarg',1,'p_defarg_var','ivy_parser.py',1846),
+  ('defnlhs -> LPAREN defarg relop defarg RPAREN','defnlhs',5,'p_defnlhs_lp_term_relop_term_rp','ivy_parser.py',1850),
+  ('defnlhs -> LPAREN defarg infix defarg RPAREN','defnlhs',5,'p_defnlhs_lp_term_infix_term_rp','ivy_parser.py',1855),
+  ('typeddefn -> defnlhs','typeddefn',1,'p_typeddefn_defnlhs','ivy_parser.py',1860),
+  ('typeddefn -> defnlhs COLON atype','typeddefn',3,'p_typeddefn_defnlhs_colon_atype','ivy_parser.py',1864),
+  ('defnrhs -> fmla','defnrhs',1,'p_defnrhs_fmla','ivy_parser.py',1869),
+  ('defnrhs -> somevarfmla','defnrhs',1,'p_defnrhs_somevarfmla','ivy_parser.py',1873),
+  ('defnrhs -> NATIVEQUOTE','defnrhs',1,'p_defnrhs_nativequote','ivy_parser.py',1877),
+  ('defn -> typeddefn EQ defnrhs','defn',3,'p_defn_atom_fmla','ivy_parser.py',1883),
+  ('optin -> <empty>','optin',0,'p_optin','ivy_parser.py',1894),
+  ('optin -> IN fmla','optin',2,'p_optin_in_fmla','ivy_parser.py',1898),
+  ('optelse -> <empty>','optelse',0,'p_optelse','ivy_parser.py',1902),
+  ('optelse -> ELSE fmla','optelse',2,'p_optelse_else_fmla','ivy_parser.py',1906),
+  ('somevarfmla -> SOME simplevar DOT fmla optin optelse','somevarfmla',6,'p_somevarfmla_some_simplevar_dot_fmla','ivy_parser.py',1910),
+  ('expr -> LCB fmla RCB','expr',3,'p_expr_fmla','ivy_parser.py',1915),
+  ('exprterm -> aterm','exprterm',1,'p_exprterm_aterm','ivy_parser.py',1919),
+  ('exprterm -> var','exprterm',1,'p_exprterm_var','ivy_parser.py',1923),
+  ('expr -> exprterm','expr',1,'p_expr_exprterm','ivy_parser.py',1927),
+  ('expr -> exprterm relop exprterm','expr',3,'p_expr_exprterm_relop_exprterm','ivy_parser.py',1931),
+  ('expr -> exprterm TILDAEQ exprterm','expr',3,'p_expr_exprterm_tildaeq_exprterm','ivy_parser.py',1936),
+  ('expr -> TILDA expr','expr',2,'p_expr_tilda_atom','ivy_parser.py',1941),
+  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_lparen_expr_rparen','ivy_parser.py',1949),
+  ('expr -> prod','expr',1,'p_expr_prod','ivy_parser.py',1953),
+  ('expr -> sum','expr',1,'p_expr_sum','ivy_parser.py',1957),
+  ('prod -> expr TIMES expr','prod',3,'p_prod_expr_expr','ivy_parser.py',1961),
+  ('prod -> prod TIMES expr','prod',3,'p_prod_prod_expr','ivy_parser.py',1965),
+  ('sum -> expr PLUS expr','sum',3,'p_sum_expr_expr','ivy_parser.py',1970),
+  ('sum -> sum PLUS expr','sum',3,'p_sum_sum_expr','ivy_parser.py',1974),
+  ('state_expr -> TRUE','state_expr',1,'p_state_expr_true','ivy_parser.py',1979),
+  ('state_expr -> FALSE','state_expr',1,'p_state_expr_false','ivy_parser.py',1983),
+  ('state_expr -> SYMBOL','state_expr',1,'p_state_expr_symbol','ivy_parser.py',1987),
+  ('state_expr -> SYMBOL LPAREN state_expr RPAREN','state_expr',4,'p_state_expr_symbol_lparen_state_expr_rparen','ivy_parser.py',1991),
+  ('state_expr -> state_expr OR state_expr','state_expr',3,'p_state_expr_state_expr_or_state_expr','ivy_parser.py',1995),
+  ('state_expr -> LCB requires modifies ensures RCB','state_expr',5,'p_state_expr_lcb_requires_modifies_ensures_rcb','ivy_parser.py',2003),
+  ('state_expr -> ENTRY','state_expr',1,'p_state_expr_entry','ivy_parser.py',2007),
+]
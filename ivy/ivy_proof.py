@@ -37,6 +37,8 @@ class ProofChecker(object):
         self.definitions = dict((d.formula.defines(),d) for d in definitions)
         self.schemata = dict(schemata.iteritems())
         self.deps = set()  # set of dependencies of existing definitions
+        self.schema_keys = dict((name,schema_key(schema)) for name,schema in self.schemata.iteritems())
+        self.matches = dict() # memo of match_schema, including failures
 
     def admit_definition(self,defn,proof=None):
         """ Admits a definition if it is non-recursive or match a definition schema. 
@@ -111,7 +113,16 @@ class ProofChecker(object):
         schemaname = proof.schemaname()
         if schemaname not in self.schemata:
             raise ProofError(proof,"No schema {} exists".format(schemaname))
-        schema = self.schemata[schemaname]
+        if not keys_match(self.schema_keys[schemaname],fmla_key(decl,set())):
+            return None
+        memo_key = (schemaname,decl,tuple(str(m) for m in proof.match()))
+        if memo_key not in self.matches:
+            self.matches[memo_key] = self.compute_match(self.schemata[schemaname],decl,proof)
+        res = self.matches[memo_key]
+        return None if res is None else list(res)
+
+    def compute_match(self,schema,decl,proof):
+        schemaname = proof.schemaname()
         schema = transform_defn_schema(schema,decl)
         prob = match_problem(schema,decl)
         prob = transform_defn_match(prob)
@@ -157,12 +168,44 @@ def show_match(m):
         print '{} : {}'.format(x,y)
     print '}'
         
-def match_problem(schema,decl):
-    """ Creating a matching problem from a schema and a declaration """
+def schema_freesyms(schema):
+    """ The symbols, sorts and variables of a schema that a match may
+    assign """
     freesyms = set(x.args[0] for x in schema.prems() if isinstance(x,ia.ConstantDecl))
     freesyms.update(x for x in schema.prems() if isinstance(x,il.UninterpretedSort))
     freesyms.update(lu.variables_ast(schema.conc()))
-    return MatchProblem(schema.conc(),decl,freesyms,set(lu.variables_ast(decl)))
+    return freesyms
+
+def match_problem(schema,decl):
+    """ Creating a matching problem from a schema and a declaration """
+    return MatchProblem(schema.conc(),decl,schema_freesyms(schema),set(lu.variables_ast(decl)))
+
+# To avoid trying to match a goal to a schema whose conclusion cannot
+# match it, we key the conclusions of schemata and the goals by their
+# top-level operator. The key of an application is its head symbol and
+# sort signature, with None for the free sorts. The key is None if the
+# formula can match anything: its head is a free symbol, or it is a
+# definition, since definition schemata are transformed before
+# matching.
+
+def fmla_key(fmla,freesyms):
+    if isinstance(fmla,il.Definition) or il.is_variable(fmla):
+        return None
+    if il.is_app(fmla):
+        if fmla.rep in freesyms:
+            return None
+        return (fmla.rep.name,tuple(None if s in freesyms else s for s in func_sorts(fmla.rep)))
+    return ((type(fmla),len(fmla.args)),())
+
+def schema_key(schema):
+    return fmla_key(schema.conc(),schema_freesyms(schema))
+
+def keys_match(pat,inst):
+    """ True if a formula with key pat may match a formula with key inst """
+    if pat is None or inst is None:
+        return True
+    return (pat[0] == inst[0] and len(pat[1]) == len(inst[1])
+            and all(x is None or x == y for x,y in zip(pat[1],inst[1])))
 
 def transform_defn_schema(schema,decl):
     """ Transform definition schema to match a definition. """
@@ -348,9 +391,15 @@ def extract_terms(inst,terms):
         for term,var in zip(terms,vars):
             if term == inst:
                 return var
-        return inst.clone(map(rec,inst.args))
+        return clone_if_changed(inst,map(rec,inst.args))
     return il.Lambda(vars,rec(inst))
 
+def clone_if_changed(ast,args):
+    """ Clone ast with new args, or return ast if the args are the same """
+    if all(x is y for x,y in zip(args,ast.args)):
+        return ast
+    return ast.clone(args)
+
 def fo_match(pat,inst,freesyms,constants):
     """ Compute a partial first-order match. Matches free FO variables to ground terms,
     but ignores variable occurrences under free second-order symbols. """
@@ -417,12 +466,18 @@ def match_sort(pat,inst,freesyms):
     return dict() if pat == inst else None
 
 def merge_matches(*matches):
-    if len(matches) == 0:
-        return dict()
+    """ Merge matches, returning None if they conflict. The matches
+    are fresh results of matching subterms, so the largest is updated
+    in place rather than copied. """
     if any(match is None for match in matches):
         return None
-    res = dict(matches[0].iteritems())
-    for match2 in matches[1:]:
+    matches = [match for match in matches if match]
+    if len(matches) == 0:
+        return dict()
+    res = max(matches,key=len)
+    for match2 in matches:
+        if match2 is res:
+            continue
         for sym,lmda in match2.iteritems():
             if sym in res:
                 if not equiv_alpha(lmda,res[sym]):
@@ -0,0 +1,193 @@
+#
+# Copyright (c) Microsoft Corporation. All Rights Reserved.
+#
+"""
+Convert a trace into a command file for the replay mode of a REPL
+compiled with "ivy_to_cpp target=repl".
+
+Usage:
+ivy_replay [format=binary|text] [skip=imp1,imp2,...] trace.iev out.ivr
+
+The calls of exported actions in the trace (the lines beginning with
+"> ") become the commands, in order. The trace may be in the text
+format or in the binary format written by testers compiled with
+trace_format=binary. A call followed by a call of one of the imports
+listed in "skip" is dropped, since the REPL cannot replay the values
+returned by the import.
+
+With format=text, the commands are written one per line, as the REPL
+reads them. With format=binary (the default), the output is the 8-byte
+magic "IVYCMD01", the number of action names and the names, and then
+one record per command: the index of its action name, the number of
+arguments and the arguments. A value is a tag followed by its
+contents: 0 for an atom (its text), 1 for an array (the number of
+elements and the elements) and 2 for a struct (the number of fields
+and, for each field, its name and its value). Numbers are unsigned
+LEB128 varints and texts are prefixed by their length.
+
+The REPL replays the file with the option replay=out.ivr.
+"""
+
+import sys
+
+import ivy_utils as iu
+import ivy_ev_parser
+
+opt_format = iu.EnumeratedParameter("format",["binary","text"],"binary")
+opt_skip = iu.Parameter("skip","")
+
+magic = 'IVYCMD01'
+
+def usage():
+    print "usage: \n  {} [format=binary|text] [skip=imp1,imp2,...] trace.iev out.ivr".format(sys.argv[0])
+    sys.exit(1)
+
+class CommandSyntaxError(Exception):
+    pass
+
+def is_ident(c):
+    return c == '_' or c == '.' or c.isalnum()
+
+class CommandParser(object):
+    """ Parse a command as the REPL does. The fields of structs are kept
+    in order, since the REPL matches them by position. """
+    def __init__(self,text):
+        self.text,self.pos = text,0
+    def peek(self):
+        self.white()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+    def white(self):
+        while self.pos < len(self.text) and self.text[self.pos] in ' \t\r\n':
+            self.pos += 1
+    def expect(self,c):
+        if self.peek() != c:
+            raise CommandSyntaxError(self.pos)
+        self.pos += 1
+    def ident(self):
+        self.white()
+        start = self.pos
+        while self.pos < len(self.text) and is_ident(self.text[self.pos]):
+            self.pos += 1
+        if self.pos == start:
+            raise CommandSyntaxError(self.pos)
+        return self.text[start:self.pos]
+    def value(self):
+        c = self.peek()
+        if c == '[':
+            elems = []
+            self.pos += 1
+            while self.peek() != ']':
+                elems.append(self.value())
+                if self.peek() != ']':
+                    self.expect(',')
+            self.pos += 1
+            return (1,elems)
+        if c == '{':
+            fields = []
+            self.pos += 1
+            while True:
+                name = self.ident()
+                self.expect(':')
+                fields.append((name,self.value()))
+                if self.peek() == '}':
+                    break
+                self.expect(',')
+            self.pos += 1
+            return (2,fields)
+        if c == '"':
+            end = self.text.find('"',self.pos+1)
+            if end < 0:
+                raise CommandSyntaxError(self.pos)
+            res = self.text[self.pos+1:end]
+            self.pos = end + 1
+            return (0,res)
+        return (0,self.ident())
+    def command(self):
+        name = self.ident()
+        args = []
+        if self.peek() == '(':
+            self.pos += 1
+            args.append(self.value())
+            while self.peek() == ',':
+                self.pos += 1
+                args.append(self.value())
+            self.expect(')')
+        if self.peek():
+            raise CommandSyntaxError(self.pos)
+        return name,args
+
+def varint(num):
+    res = []
+    while num >= 0x80:
+        res.append(chr((num & 0x7f) | 0x80))
+        num >>= 7
+    res.append(chr(num))
+    return ''.join(res)
+
+def text(s):
+    return varint(len(s)) + s
+
+def encode_value(val):
+    tag,contents = val
+    if tag == 0:
+        return varint(0) + text(contents)
+    if tag == 1:
+        return varint(1) + varint(len(contents)) + ''.join(encode_value(v) for v in contents)
+    return varint(2) + varint(len(contents)) + ''.join(text(n) + encode_value(v) for n,v in contents)
+
+def write_binary(cmds,out):
+    """ Write the commands to the file out in the binary format,
+    returning the number of commands """
+    names = []
+    index = {}
+    records = []
+    for cmd in cmds:
+        try:
+            name,args = CommandParser(cmd).command()
+        except CommandSyntaxError as err:
+            raise iu.IvyError(None,"syntax error in command at column {}: {}".format(err.args[0],cmd))
+        if name not in index:
+            index[name] = len(names)
+            names.append(name)
+        records.append(varint(index[name]) + varint(len(args)) + ''.join(encode_value(a) for a in args))
+    with open(out,'wb') as f:
+        f.write(magic)
+        f.write(varint(len(names)))
+        for name in names:
+            f.write(text(name))
+        for rec in records:
+            f.write(rec)
+    return len(records)
+
+def write_text(cmds,out):
+    num = 0
+    with open(out,'w') as f:
+        for cmd in cmds:
+            f.write(cmd + '\n')
+            num += 1
+    return num
+
+def read_params():
+    # like ivy_init.read_params, but without loading the compiler
+    args = sys.argv[1:]
+    ps = dict()
+    while args and '=' in args[0]:
+        key,val = args[0].split('=',1)
+        ps[key] = val
+        args = args[1:]
+    iu.set_parameters(ps)
+    sys.argv = sys.argv[0:1] + args
+
+def main():
+    with iu.ErrorPrinter():
+        read_params()
+        if len(sys.argv) != 3:
+            usage()
+        skip = set(x for x in opt_skip.get().split(',') if x)
+        cmds = ivy_ev_parser.trace_commands(sys.argv[1],skip)
+        write = write_binary if opt_format.get() == 'binary' else write_text
+        num = write(cmds,sys.argv[2])
+        print "{}: {} commands".format(sys.argv[2],num)
+
+if __name__ == "__main__":
+    main()
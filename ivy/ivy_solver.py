@@ -772,31 +772,22 @@ def clauses_case(clauses1):
     if s.check() == z3.unsat:
         return [[]]
     m = get_model(s)
-#    print "clauses_case: after SAT check"
-##    print "clauses1: {}".format(clauses1)
-    clauses = Clauses([clause_model_simp(m,c) for c in clauses1.clauses])
-    clauses = remove_duplicates_clauses(clauses)
-    while True:
-#        print "clause_case: starting iteration"
-#        print "clauses: {}".format(clauses)
-        num_old_clauses = len(clauses.clauses)
-        r = ur.UnitRes(clauses.clauses)
-        with r.context():
+    memo = dict()
+    simp = lambda c: clause_model_simp(m,c,memo)
+    r = ur.UnitRes([simp(c) for c in clauses1.clauses])
+    with r.context():
+        r.propagate()
+        while r.simplify(simp):
             r.propagate()
-#        print "clause_case: after propagation"
-        new_clauses = Clauses([[l] for l in r.unit_queue] + r.clauses)
-#        print "new_clauses: {}".format(new_clauses)
-        clauses = Clauses([clause_model_simp(m,c) for c in new_clauses.clauses])
-#        print "clause_case: after model-based simplification"
-        clauses = remove_duplicates_clauses(clauses)
-#        print "clause_case: after duplicate removal"
-        if len(clauses.clauses) <= num_old_clauses:
-            return clauses
-
-
-
-def clause_model_simp(m,c):
-    """ Simplify a clause by dropping literals while maintaining its truth in a model. """
+    clauses = Clauses([simp(c) for c in r.consequences()])
+    return Clauses(list(iu.unique(clauses.fmlas)))
+
+def clause_model_simp(m,c,memo=None):
+    """ Simplify a clause by dropping literals while maintaining its
+    truth in a model. The values of the literals are cached in memo,
+    if given. """
+    if memo is None:
+        memo = dict()
     res = []
     for l in c:
         if not is_ground_lit(l):
@@ -804,7 +795,10 @@ def clause_model_simp(m,c):
             continue
 #        if isinstance(l.atom,ivy_logic.And):
 #            print "clause_model_simp: {}".format(c)
-        v = m.eval(literal_to_z3(l))
+        key = (l.polarity,l.atom)
+        if key not in memo:
+            memo[key] = m.eval(literal_to_z3(l))
+        v = memo[key]
         if z3.is_true(v):
             return [l]
         if not z3.is_false(v):
@@ -925,7 +919,7 @@ def get_small_model(clauses, sorts_to_minimize, relations_to_minimize, final_con
 
         cond():  returns a final condition as a clauses object
         start(): called before starting
-        sat(): called if sat, return True if should ignore result
+        sat(model): called if sat with the z3 model, return True if should ignore result
         unsat() : called if unsat
         assume() : if returns true, assume rather than check
 
@@ -949,7 +943,7 @@ def get_small_model(clauses, sorts_to_minimize, relations_to_minimize, final_con
                     s.add(clauses_to_z3(fc.cond()))
                     res = decide(s)
                     if res != z3.unsat:
-                        if fc.sat():
+                        if fc.sat(s.model()):
                             res = z3.unsat
                         else:
                             break
@@ -1002,32 +996,45 @@ def model_universe_facts(h,sort,upclose):
     return uc+dc
 
 
+class ModelFacts(object):
+    """ The facts describing the values in a Herbrand model h of the
+    symbols of clauses1. The symbols of clauses1 are collected once,
+    and the facts of each symbol are computed at most once, so that
+    the facts for several sets of symbols (for example, the symbols
+    of each state in a history) can be extracted cheaply. """
+    def __init__(self,h,clauses1,upclose=False):
+        self.h = h
+        # define the universe for each sort:
+        self.uc = [fact for s in h.sorts() for fact in model_universe_facts(h,s,upclose)]
+        self.consts = [c for c in used_constants_clauses(clauses1) if c not in ivy_logic.sig.constructors]
+        urc = dict((ivy_logic.normalize_symbol(r),n) for r,n in used_relations_clauses(clauses1).iteritems())
+        self.rels = list(urc.iteritems())
+        self.fns = list(set(f for (f,arity) in functions_clauses(clauses1) if arity >= 1))
+        self.memo = dict()
+
+    def symbol_facts(self,sym,get):
+        if sym not in self.memo:
+            self.memo[sym] = get()
+        return self.memo[sym]
+
+    def facts(self,ignore):
+        """ Return the facts for the symbols not ignored """
+        h = self.h
+        # values of constants in formula
+        vc = [[ivy_logic._eq_lit(ivy_logic.Constant(c),get_model_constant(h.model,ivy_logic.Constant(c)))]
+              for c in self.consts if not ignore(c)]
+        # values of relations in formula
+        vr = [[l]
+              for (r,n) in self.rels
+              if not ignore(r)
+              for l in self.symbol_facts(r,lambda: relation_model_to_clauses(h,r,n))]
+        # values of functions in formula
+        vf = [[l] for f in self.fns if not ignore(f)
+              for l in self.symbol_facts(f,lambda: function_model_to_clauses(h,f))]
+        return Clauses(self.uc + vc + vr + vf)
+
 def model_facts(h,ignore,clauses1,upclose=False):
-    # define the universe for each sort:
-    uc = [fact for s in h.sorts() for fact in model_universe_facts(h,s,upclose)]
-    # values of constants in formula
-    temp = [[(ivy_logic.Constant(c),
-                             get_model_constant(h.model,ivy_logic.Constant(c)))]
-          for c in used_constants_clauses(clauses1)
-          if not ignore(c) and c not in ivy_logic.sig.constructors]
-#    print "temp = {}".format(temp)
-    vc = [[ivy_logic._eq_lit(ivy_logic.Constant(c),
-                             get_model_constant(h.model,ivy_logic.Constant(c)))]
-          for c in used_constants_clauses(clauses1)
-          if not ignore(c) and c not in ivy_logic.sig.constructors]
-#    print "model_facts vc = {}".format(vc)
-    # values of relations in formula
-#    print "used_relations_clauses = {}".format(used_relations_clauses(clauses1))
-    urc = dict((ivy_logic.normalize_symbol(r),n) for r,n in used_relations_clauses(clauses1).iteritems())
-    vr = [[l]
-          for (r,n) in urc.iteritems()
-          if not ignore(r)
-          for l in relation_model_to_clauses(h,r,n)]
-    # values of functions in formula
-    fns = set(f for (f,arity) in functions_clauses(clauses1) if not ignore(f) and arity >= 1)
-    vf = [[l] for f in fns for l in function_model_to_clauses(h,f)]
-    res = uc + vc + vr + vf
-    return Clauses(res)
+    return ModelFacts(h,clauses1,upclose).facts(ignore)
 
 #def numeral_assign(h):
 #    return m = dict((c.rep,ivy_logic.Constant(c.rep.rename(lambda s:str(i))))
@@ -1079,6 +1086,11 @@ def clauses_model_to_clauses(clauses1,ignore = None, implied = None,model = None
     ignore = ignore if ignore is not None else lambda x: False
     res = model_facts(h,ignore,clauses1)
 #    print "core after mode_facts: {} ".format(unsat_core(res,true_clauses()))
+    return name_universe_elements(h,res,numerals)
+
+def name_universe_elements(h,res,numerals):
+    """ Replace the universe elements of Herbrand model h in facts res
+    with numerals, or else with skolems. """
     # if using numerals, replace the universe elements with them
     if numerals:
         m = numeral_assign(res,h)
@@ -1193,7 +1205,9 @@ def clauses_model_to_diagram(clauses1,ignore = None, implied = None,model = None
             # remove if possible the =constant predicates
             return ivy_logic.is_eq(fmla) and ivy_logic.is_constant(fmla.args[0])
         clauses1_weak = bound_quantifiers_clauses(h,clauses1,reps)
-        res = unsat_core(res,and_clauses(uc,axioms),clauses1_weak,unlikely=unlikely) # implied not used here
+        core = unsat_core(res,and_clauses(uc,axioms),clauses1_weak,unlikely=unlikely) # implied not used here
+        if core is not None: # else the diagram cannot be weakened
+            res = core
 #    print "clauses_model_to_diagram res = {}".format(res)
 
 #    print "foo = {}".format(unsat_core(and_clauses(uc,axioms),true_clauses(),clauses1))
@@ -0,0 +1,96 @@
+
+# ivy_termtab.py
+# This file is automatically generated. Do not edit.
+# pylint: disable=W,C,R
+_tabversion = '3.10'
+
+_lr_method = 'LALR'
+
+_lr_signature = 'termleftSEMIleftGLOBALLYEVENTUALLYleftIFleftELSEleftORleftANDleftTILDAleftEQLELTGEGTleftTILDAEQleftCOLONleftPLUSleftMINUSleftTIMESleftDIVleftDOLLARACTION ACTION AFTER ALIAS AND AROUND ARROW ASSERT ASSIGN ASSUME ATTRIBUTE AXIOM BEFORE CALL COLON COMMA CONCEPT CONJECTURE DECREASES DEFINITION DELEGATE DERIVED DESTRUCTOR DIV DOLLAR DOT DOTDOTDOT DOTS ELSE ENSURE ENSURES ENTRY EQ EVENTUALLY EXISTS EXPORT EXTRACT FALSE FORALL FRESH FROM FUNCTION GE GHOST GLOBALLY GT IF IFF IMPLEMENT IMPLEMENTATION IMPORT IN INCLUDE INDIV INIT INSTANTIATE INSTANTIATE INTERPRET INVARIANT ISOLATE LABEL LCB LE LET LOCAL LPAREN LT MACRO MATCH MAXIMIZING MINIMIZING MINUS MIXIN MIXIN MIXORD MODIFIES MODULE MODULE NAMED NATIVEQUOTE NULL OBJECT OF OLD OR PARAMETER PARAMS PLUS PRIVATE PROGRESS PROOF PROPERTY PTO RCB RELATION RELY REQUIRE REQUIRES RETURNS RPAREN SCENARIO SCHEMA SEMI SET SOME SPECIFICATION STATE STRUCT SYMBOL TEMPORAL THIS TILDA TILDAEQ TIMES TRUE TRUSTED TYPE UPDATE USING VAR VARIABLE VARIANT WHILE WITHaterm : SYMBOLaterm : aterm LPAREN terms RPARENatype : SYMBOLatype : atype DOT SYMBOLatype : THISvar : VARIABLEvar : VARIABLE COLON atypesimplevar : VARIABLEsimplevar : VARIABLE COLON SYMBOLterm : atermaterm : term DOT atermterm : OLD atermterm : varterm : term PLUS termterm : term MINUS termterm : term TIMES termterm : term DIV termterm : term IF fmla ELSE termterms : terms : termterms : terms COMMA termterm : LPAREN term RPARENvars : varvars : vars COMMA varsimplevars : simplevarsimplevars : simplevars COMMA simplevarapp : SYMBOLapp : SYMBOL LPAREN terms RPARENapp : term infix termapps : appapps : apps COMMA appatom : SYMBOLatom : SYMBOL LPAREN terms RPARENatoms : atomatoms : atoms COMMA atomlit : atomlit : SYMBOL EQ SYMBOLlit : SYMBOL TILDAEQ SYMBOLlit : TILDA litrelop : EQrelop : LErelop : LTrelop : GErelop : GTrelop : PTOinfix : PLUSinfix : MINUSinfix : TIMESinfix : DIVfmla : termfmla : term relop termfmla : term TILDAEQ termfmla : LPAREN fmla RPARENfmla : TRUEfmla : FALSEfmla : TILDA fmlafmla : fmla AND fmlafmla : fmla OR fmlafmla : fmla ARROW fmlafmla : fmla IFF fmlafmla : FORALL simplevars DOT fmla %prec SEMIfmla : EXISTS simplevars DOT fmla %prec SEMIfmla : GLOBALLY fmlafmla : EVENTUALLY fmlaterm : LPAREN DOLLAR SYMBOL simplevars DOT fmla RPAREN LPAREN terms RPARENterm : DOLLAR SYMBOL DOT fmla %prec SEMI'
+    
+_lr_action_items = {'ARROW':([4,6,7,8,16,22,23,24,25,26,29,31,35,36,37,40,41,42,45,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,91,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,50,-50,-55,-22,-5,-3,-7,50,-50,-63,-56,-64,-66,-2,-53,-57,50,-18,50,-58,-52,-51,-4,-61,-62,50,-65,]),'SYMBOL':([0,2,3,5,9,10,11,12,13,14,18,20,21,27,28,30,33,39,49,50,51,52,53,59,60,61,62,63,64,65,66,69,71,78,80,81,84,93,],[4,4,4,19,4,4,4,4,4,4,38,41,4,4,4,4,4,4,4,4,4,4,4,-45,4,4,-43,-42,-41,-44,-40,85,4,87,4,4,4,4,]),'GLOBALLY':([14,27,28,30,33,39,49,50,52,53,80,81,84,],[28,28,28,28,28,28,28,28,28,28,28,28,28,]),'IFF':([4,6,7,8,16,22,23,24,25,26,29,31,35,36,37,40,41,42,45,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,91,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,52,-50,-55,-22,-5,-3,-7,52,-50,-63,-56,-64,-66,-2,-53,-57,52,-18,52,-58,-52,-51,-4,-61,-62,52,-65,]),'COLON':([6,55,],[20,78,]),'DIV':([1,4,6,7,8,15,16,17,22,23,24,25,26,29,35,36,37,40,41,42,44,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,86,89,90,95,],[11,-1,-6,-13,-10,11,-10,11,11,11,-17,11,-10,-54,11,-55,-22,-5,-3,-7,11,11,-63,-56,-64,-66,-2,-53,-57,-59,11,-60,-58,11,11,-4,11,-61,-62,-65,]),'TRUE':([14,27,28,30,33,39,49,50,52,53,80,81,84,],[29,29,29,29,29,29,29,29,29,29,29,29,29,]),'MINUS':([1,4,6,7,8,15,16,17,22,23,24,25,26,29,35,36,37,40,41,42,44,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,86,89,90,95,],[12,-1,-6,-13,-10,12,-10,12,-16,12,-17,-15,-10,-54,12,-55,-22,-5,-3,-7,12,12,-63,-56,-64,-66,-2,-53,-57,-59,12,-60,-58,12,12,-4,12,-61,-62,-65,]),'DOT':([1,4,6,7,8,15,16,17,19,22,23,24,25,26,29,35,36,37,38,40,41,42,44,46,47,48,54,55,56,57,58,67,68,70,72,73,74,75,76,77,82,83,85,86,87,88,89,90,95,],[13,-1,-6,-13,-10,13,-10,13,39,-16,-14,-17,-15,-10,-54,13,-55,-22,39,-5,-3,-7,13,13,-63,-56,-25,-8,80,-64,81,84,-66,-2,-53,-57,-59,-18,-60,-58,-52,13,-4,13,-9,-26,-61,-62,-65,]),'PTO':([4,6,7,8,16,22,23,24,25,26,29,35,36,37,40,41,42,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,59,-55,-22,-5,-3,-7,59,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'LE':([4,6,7,8,16,22,23,24,25,26,29,35,36,37,40,41,42,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,64,-55,-22,-5,-3,-7,64,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'OLD':([0,2,3,9,10,11,12,13,14,21,27,28,30,33,39,49,50,51,52,53,59,60,61,62,63,64,65,66,71,80,81,84,93,],[2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,2,-45,2,2,-43,-42,-41,-44,-40,2,2,2,2,2,]),'LT':([4,6,7,8,16,22,23,24,25,26,29,35,36,37,40,41,42,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,63,-55,-22,-5,-3,-7,63,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'TILDA':([14,27,28,30,33,39,49,50,52,53,80,81,84,],[30,30,30,30,30,30,30,30,30,30,30,30,30,]),'COMMA':([4,6,7,8,16,21,22,23,24,25,26,29,35,36,37,40,41,42,43,44,47,48,54,55,56,57,58,67,68,70,72,73,74,75,76,77,82,83,85,86,87,88,89,90,93,94,95,],[-1,-6,-13,-10,-12,-19,-16,-14,-17,-15,-11,-54,-50,-55,-22,-5,-3,-7,71,-20,-63,-56,-25,-8,79,-64,79,79,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-21,-9,-26,-61,-62,-19,71,-65,]),'FORALL':([14,27,28,30,33,39,49,50,52,53,80,81,84,],[32,32,32,32,32,32,32,32,32,32,32,32,32,]),'PLUS':([1,4,6,7,8,15,16,17,22,23,24,25,26,29,35,36,37,40,41,42,44,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,86,89,90,95,],[10,-1,-6,-13,-10,10,-10,10,-16,-14,-17,-15,-10,-54,10,-55,-22,-5,-3,-7,10,10,-63,-56,-64,-66,-2,-53,-57,-59,10,-60,-58,10,10,-4,10,-61,-62,-65,]),'$end':([1,4,6,7,8,16,22,23,24,25,26,29,35,36,37,40,41,42,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[0,-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,-50,-55,-22,-5,-3,-7,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'EVENTUALLY':([14,27,28,30,33,39,49,50,52,53,80,81,84,],[33,33,33,33,33,33,33,33,33,33,33,33,33,]),'GT':([4,6,7,8,16,22,23,24,25,26,29,35,36,37,40,41,42,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,65,-55,-22,-5,-3,-7,65,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'EXISTS':([14,27,28,30,33,39,49,50,52,53,80,81,84,],[34,34,34,34,34,34,34,34,34,34,34,34,34,]),'DOLLAR':([0,2,3,9,10,11,12,13,14,21,27,28,30,33,39,49,50,51,52,53,59,60,61,62,63,64,65,66,71,80,81,84,93,],[5,5,18,5,5,5,5,5,5,5,18,5,5,5,5,5,5,5,5,5,-45,5,5,-43,-42,-41,-44,-40,5,5,5,5,5,]),'ELSE':([4,6,7,8,16,22,23,24,25,26,29,31,35,36,37,40,41,42,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,51,-50,-55,-22,-5,-3,-7,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'GE':([4,6,7,8,16,22,23,24,25,26,29,35,36,37,40,41,42,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,62,-55,-22,-5,-3,-7,62,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'TILDAEQ':([4,6,7,8,16,22,23,24,25,26,29,35,36,37,40,41,42,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,60,-55,-22,-5,-3,-7,60,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'LPAREN':([0,2,3,4,8,9,10,11,12,13,14,16,21,26,27,28,30,33,39,49,50,51,52,53,59,60,61,62,63,64,65,66,70,71,80,81,84,92,93,],[3,3,3,-1,21,3,3,3,3,3,27,21,3,21,27,27,27,27,27,27,27,3,27,27,-45,3,3,-43,-42,-41,-44,-40,-2,3,27,27,27,93,3,]),'VARIABLE':([0,2,3,9,10,11,12,13,14,21,27,28,30,32,33,34,38,39,49,50,51,52,53,59,60,61,62,63,64,65,66,71,79,80,81,84,93,],[6,6,6,6,6,6,6,6,6,6,6,6,6,55,6,55,55,6,6,6,6,6,6,-45,6,6,-43,-42,-41,-44,-40,6,55,6,6,6,6,]),'RPAREN':([4,6,7,8,16,17,21,22,23,24,25,26,29,35,36,37,40,41,42,43,44,45,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,86,89,90,91,93,94,95,],[-1,-6,-13,-10,-12,37,-19,-16,-14,-17,-15,-11,-54,-50,-55,-22,-5,-3,-7,70,-20,72,37,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-21,-61,-62,92,-19,95,-65,]),'TIMES':([1,4,6,7,8,15,16,17,22,23,24,25,26,29,35,36,37,40,41,42,44,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,86,89,90,95,],[9,-1,-6,-13,-10,9,-10,9,-16,9,-17,9,-10,-54,9,-55,-22,-5,-3,-7,9,9,-63,-56,-64,-66,-2,-53,-57,-59,9,-60,-58,9,9,-4,9,-61,-62,-65,]),'EQ':([4,6,7,8,16,22,23,24,25,26,29,35,36,37,40,41,42,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,66,-55,-22,-5,-3,-7,66,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,-51,-4,-61,-62,-65,]),'IF':([1,4,6,7,8,15,16,17,22,23,24,25,26,29,35,36,37,40,41,42,44,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,86,89,90,95,],[14,-1,-6,-13,-10,14,-10,14,-16,-14,-17,-15,-10,-54,14,-55,-22,-5,-3,-7,14,14,-63,-56,-64,-66,-2,-53,-57,-59,-18,-60,-58,-52,14,-4,14,-61,-62,-65,]),'AND':([4,6,7,8,16,22,23,24,25,26,29,31,35,36,37,40,41,42,45,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,91,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,49,-50,-55,-22,-5,-3,-7,49,-50,49,-56,49,49,-2,-53,-57,49,-18,49,49,-52,-51,-4,49,49,49,-65,]),'FALSE':([14,27,28,30,33,39,49,50,52,53,80,81,84,],[36,36,36,36,36,36,36,36,36,36,36,36,36,]),'THIS':([20,],[40,]),'OR':([4,6,7,8,16,22,23,24,25,26,29,31,35,36,37,40,41,42,45,46,47,48,57,68,70,72,73,74,75,76,77,82,83,85,89,90,91,95,],[-1,-6,-13,-10,-12,-16,-14,-17,-15,-11,-54,53,-50,-55,-22,-5,-3,-7,53,-50,53,-56,53,53,-2,-53,-57,53,-18,53,-58,-52,-51,-4,53,53,53,-65,]),}
+
+_lr_action = {}
+for _k, _v in _lr_action_items.items():
+   for _x,_y in zip(_v[0],_v[1]):
+      if not _x in _lr_action:  _lr_action[_x] = {}
+      _lr_action[_x][_k] = _y
+del _lr_action_items
+
+_lr_goto_items = {'term':([0,2,3,9,10,11,12,13,14,21,27,28,30,33,39,49,50,51,52,53,60,61,71,80,81,84,93,],[1,15,17,22,23,24,25,15,35,44,46,35,35,35,35,35,35,75,35,35,82,83,86,35,35,35,44,]),'terms':([21,93,],[43,94,]),'relop':([35,46,],[61,61,]),'atype':([20,],[42,]),'simplevars':([32,34,38,],[56,58,67,]),'fmla':([14,27,28,30,33,39,49,50,52,53,80,81,84,],[31,45,47,48,57,68,73,74,76,77,89,90,91,]),'var':([0,2,3,9,10,11,12,13,14,21,27,28,30,33,39,49,50,51,52,53,60,61,71,80,81,84,93,],[7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,7,]),'simplevar':([32,34,38,79,],[54,54,54,88,]),'aterm':([0,2,3,9,10,11,12,13,14,21,27,28,30,33,39,49,50,51,52,53,60,61,71,80,81,84,93,],[8,16,8,8,8,8,8,26,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,8,]),}
+
+_lr_goto = {}
+for _k, _v in _lr_goto_items.items():
+   for _x, _y in zip(_v[0], _v[1]):
+       if not _x in _lr_goto: _lr_goto[_x] = {}
+       _lr_goto[_x][_k] = _y
+del _lr_goto_items
+_lr_productions = [
+  ("S' -> term","S'",1,None,None,None),
+  ('aterm -> SYMBOL','aterm',1,'p_aterm_symbol','ivy_logic_parser.py',16),
+  ('aterm -> aterm LPAREN terms RPAREN','aterm',4,'p_aterm_aterm_terms','ivy_logic_parser.py',21),
+  ('atype -> SYMBOL','atype',1,'p_atype_symbol','ivy_logic_parser.py',41),
+  ('atype -> atype DOT SYMBOL','atype',3,'p_atype_atype_dot_symbol','ivy_logic_parser.py',46),
+  ('atype -> THIS','atype',1,'p_atype_this','ivy_logic_parser.py',52),
+  ('var -> VARIABLE','var',1,'p_var_variable','ivy_logic_parser.py',57),
+  ('var -> VARIABLE COLON atype','var',3,'p_var_variable_colon_symbol','ivy_logic_parser.py',62),
+  ('simplevar -> VARIABLE','simplevar',1,'p_simplevar_variable','ivy_logic_parser.py',67),
+  ('simplevar -> VARIABLE COLON SYMBOL','simplevar',3,'p_simplevar_variable_colon_symbol','ivy_logic_parser.py',72),
+  ('term -> aterm','term',1,'p_term_aterm','ivy_logic_parser.py',77),
+  ('aterm -> term DOT aterm','aterm',3,'p_term_term_dot_aterm','ivy_logic_parser.py',82),
+  ('term -> OLD aterm','term',2,'p_aterm_old_symbol','ivy_logic_parser.py',90),
+  ('term -> var','term',1,'p_term_var','ivy_logic_parser.py',95),
+  ('term -> term PLUS term','term',3,'p_term_term_PLUS_term','ivy_logic_parser.py',101),
+  ('term -> term MINUS term','term',3,'p_term_term_MINUS_term','ivy_logic_parser.py',106),
+  ('term -> term TIMES term','term',3,'p_term_term_TIMES_term','ivy_logic_parser.py',111),
+  ('term -> term DIV term','term',3,'p_term_term_DIV_term','ivy_logic_parser.py',116),
+  ('term -> term IF fmla ELSE term','term',5,'p_term_if_fmla_else_term','ivy_logic_parser.py',121),
+  ('terms -> <empty>','terms',0,'p_terms','ivy_logic_parser.py',147),
+  ('terms -> term','terms',1,'p_terms_term','ivy_logic_parser.py',151),
+  ('terms -> terms COMMA term','terms',3,'p_terms_terms_term','ivy_logic_parser.py',155),
+  ('term -> LPAREN term RPAREN','term',3,'p_term_lp_term_lp','ivy_logic_parser.py',161),
+  ('vars -> var','vars',1,'p_vars_var','ivy_logic_parser.py',165),
+  ('vars -> vars COMMA var','vars',3,'p_vars_vars_comma_var','ivy_logic_parser.py',169),
+  ('simplevars -> simplevar','simplevars',1,'p_simplevars_simplevar','ivy_logic_parser.py',174),
+  ('simplevars -> simplevars COMMA simplevar','simplevars',3,'p_simplevars_simplevars_comma_simplevar','ivy_logic_parser.py',178),
+  ('app -> SYMBOL','app',1,'p_app_symbol','ivy_logic_parser.py',185),
+  ('app -> SYMBOL LPAREN terms RPAREN','app',4,'p_app_symbol_lp_terms_rp','ivy_logic_parser.py',190),
+  ('app -> term infix term','app',3,'p_app_term_infix_term','ivy_logic_parser.py',195),
+  ('apps -> app','apps',1,'p_apps_app','ivy_logic_parser.py',201),
+  ('apps -> apps COMMA app','apps',3,'p_apps_apps_app','ivy_logic_parser.py',205),
+  ('atom -> SYMBOL','atom',1,'p_atom_symbol','ivy_logic_parser.py',212),
+  ('atom -> SYMBOL LPAREN terms RPAREN','atom',4,'p_atom_symbol_lp_terms_rp','ivy_logic_parser.py',217),
+  ('atoms -> atom','atoms',1,'p_atoms_atom','ivy_logic_parser.py',222),
+  ('atoms -> atoms COMMA atom','atoms',3,'p_atoms_atoms_atom','ivy_logic_parser.py',226),
+  ('lit -> atom','lit',1,'p_lit_atom','ivy_logic_parser.py',233),
+  ('lit -> SYMBOL EQ SYMBOL','lit',3,'p_lit_term_eq_term','ivy_logic_parser.py',238),
+  ('lit -> SYMBOL TILDAEQ SYMBOL','lit',3,'p_lit_term_tildaeq_term','ivy_logic_parser.py',243),
+  ('lit -> TILDA lit','lit',2,'p_lit_tilda_atom','ivy_logic_parser.py',248),
+  ('relop -> EQ','relop',1,'p_relop_eq','ivy_logic_parser.py',253),
+  ('relop -> LE','relop',1,'p_relop_le','ivy_logic_parser.py',257),
+  ('relop -> LT','relop',1,'p_relop_lt','ivy_logic_parser.py',261),
+  ('relop -> GE','relop',1,'p_relop_ge','ivy_logic_parser.py',265),
+  ('relop -> GT','relop',1,'p_relop_gt','ivy_logic_parser.py',269),
+  ('relop -> PTO','relop',1,'p_relop_pto','ivy_logic_parser.py',273),
+  ('infix -> PLUS','infix',1,'p_infix_plus','ivy_logic_parser.py',277),
+  ('infix -> MINUS','infix',1,'p_infix_minus','ivy_logic_parser.py',281),
+  ('infix -> TIMES','infix',1,'p_infix_times','ivy_logic_parser.py',285),
+  ('infix -> DIV','infix',1,'p_infix_div','ivy_logic_parser.py',289),
+  ('fmla -> term','fmla',1,'p_fmla_term','ivy_logic_parser.py',295),
+  ('fmla -> term relop term','fmla',3,'p_fmla_term_relop_term','ivy_logic_parser.py',299),
+  ('fmla -> term TILDAEQ term','fmla',3,'p_fmla_term_tildaeq_term','ivy_logic_parser.py',304),
+  ('fmla -> LPAREN fmla RPAREN','fmla',3,'p_fmla_lparen_fmla_rparen','ivy_logic_parser.py',309),
+  ('fmla -> TRUE','fmla',1,'p_fmla_true','ivy_logic_parser.py',313),
+  ('fmla -> FALSE','fmla',1,'p_fmla_false','ivy_logic_parser.py',318),
+  ('fmla -> TILDA fmla','fmla',2,'p_fmla_not_fmla','ivy_logic_parser.py',323),
+  ('fmla -> fmla AND fmla','fmla',3,'p_fmla_fmla_and_fmla','ivy_logic_parser.py',328),
+  ('fmla -> fmla OR fmla','fmla',3,'p_fmla_fmla_or_fmla','ivy_logic_parser.py',337),
+  ('fmla -> fmla ARROW fmla','fmla',3,'p_fmla_fmla_arrow_fmla','ivy_logic_parser.py',348),
+  ('fmla -> fmla IFF fmla','fmla',3,'p_fmla_fmla_iff_fmla','ivy_logic_parser.py',353),
+  ('fmla -> FORALL simplevars DOT fmla','fmla',4,'p_fmla_forall_vars_dot_fmla','ivy_logic_parser.py',372),
+  ('fmla -> EXISTS simplevars DOT fmla','fmla',4,'p_fmla_exists_vars_dot_fmla','ivy_logic_parser.py',377),
+  ('fmla -> GLOBALLY fmla','fmla',2,'p_fmla_globally_fmla','ivy_logic_parser.py',382),
+  ('fmla -> EVENTUALLY fmla','fmla',2,'p_fmla_eventually_fmla','ivy_logic_parser.py',387),
+  ('term -> LPAREN DOLLAR SYMBOL simplevars DOT fmla RPAREN LPAREN terms RPAREN','term',10,'p_term_namedbinder_vars_dot_fmla','ivy_logic_parser.py',392),
+  ('term -> DOLLAR SYMBOL DOT fmla','term',4,'p_term_namedbinder_dot_fmla','ivy_logic_parser.py',399),
+]
@@ -0,0 +1,204 @@
+#
+# Copyright (c) Microsoft Corporation. All Rights Reserved.
+#
+"""
+Driver that runs a compiled randomized tester (target=test) many
+times in parallel with distinct seeds.
+
+Usage:
+ivy_test_farm [farm params] [ivy_to_cpp params] file.ivy
+
+The tester is built once with "ivy_to_cpp target=test build=true",
+passing through any parameters not recognized by the farm (for
+example, isolate=... or test_iters=...). Then up to "jobs" instances
+are run concurrently until "runs" instances have completed. Each
+instance gets its own seed, its own trace file and its own UDP port
+offset, so that instances using udp_wrapper do not collide.
+
+When an instance fails, the remaining instances are stopped and the
+seed and trace of the failing instance are reported. A wall-clock
+budget in seconds can be given with "budget", after which no new
+instances are started and running ones are stopped. If the budget
+is exhausted before all runs have completed, this is an error.
+"""
+
+import os
+import sys
+import time
+import signal
+import subprocess
+
+import ivy_utils as iu
+
+opt_runs = iu.Parameter("runs","100")
+opt_jobs = iu.Parameter("jobs","0")
+opt_seed = iu.Parameter("seed","1")
+opt_iters = iu.Parameter("iters","")
+opt_budget = iu.Parameter("budget","0")
+opt_port_stride = iu.Parameter("port_stride","100")
+opt_trace_dir = iu.Parameter("trace_dir","")
+opt_keep_traces = iu.BooleanParameter("keep_traces",False)
+opt_stop_on_fail = iu.BooleanParameter("stop_on_fail",True)
+opt_build = iu.BooleanParameter("build",True)
+
+farm_params = [opt_runs,opt_jobs,opt_seed,opt_iters,opt_budget,opt_port_stride,
+               opt_trace_dir,opt_keep_traces,opt_stop_on_fail,opt_build]
+
+def usage():
+    print "usage: \n  {} [runs=N] [jobs=N] [seed=N] [budget=secs] ... file.ivy".format(sys.argv[0])
+    sys.exit(1)
+
+def int_param(param):
+    try:
+        return int(param.get())
+    except ValueError:
+        raise iu.IvyError(None,"bad parameter value: {}={}".format(param.key,param.get()))
+
+def read_params():
+    """ Split the command line into parameters of the farm and
+    parameters to be passed through to ivy_to_cpp. Returns the pass-through
+    parameters and the remaining positional arguments. """
+    mine = dict((p.key,p) for p in farm_params)
+    passed = []
+    args = sys.argv[1:]
+    while args and '=' in args[0]:
+        key,val = args[0].split('=',1)
+        if key in mine:
+            mine[key].set(val)
+        else:
+            passed.append(args[0])
+        args = args[1:]
+    return passed,args
+
+def find_classname(passed,filename):
+    """ Compute the name of the tester executable, as ivy_to_cpp would. """
+    basename = filename[:filename.rindex('.')]
+    outdir = ''
+    for p in passed:
+        if p.startswith('classname='):
+            basename = p.split('=',1)[1]
+        if p.startswith('outdir='):
+            outdir = p.split('=',1)[1]
+    return os.path.join(outdir,basename) if outdir else basename
+
+def build_tester(passed,filename):
+    cmd = ['ivy_to_cpp','target=test','build=true'] + passed + [filename]
+    print ' '.join(cmd)
+    sys.stdout.flush()
+    status = subprocess.call(cmd)
+    if status:
+        raise iu.IvyError(None,"failed to build tester")
+
+class Instance(object):
+    """ One running instance of the tester """
+    def __init__(self,exe,idx,seed,trace):
+        self.idx,self.seed,self.trace = idx,seed,trace
+        args = [exe,'seed={}'.format(seed),'out={}'.format(trace),
+                'port_offset={}'.format(idx * int_param(opt_port_stride))]
+        if opt_iters.get():
+            args.append('iters={}'.format(opt_iters.get()))
+        self.stderr = open(trace + '.err','w')
+        self.proc = subprocess.Popen(args,stdout=self.stderr,stderr=self.stderr)
+        self.status = None
+    def poll(self):
+        self.status = self.proc.poll()
+        if self.status is not None:
+            self.stderr.close()
+        return self.status
+    def stop(self):
+        if self.proc.poll() is None:
+            try:
+                self.proc.send_signal(signal.SIGTERM)
+            except OSError:
+                pass
+            self.proc.wait()
+        self.stderr.close()
+    def failed(self):
+        return self.status is not None and self.status != 0
+    def cleanup(self):
+        for name in [self.trace,self.trace+'.err']:
+            if os.path.exists(name):
+                os.remove(name)
+
+def default_jobs():
+    try:
+        import multiprocessing
+        return multiprocessing.cpu_count()
+    except NotImplementedError:
+        return 1
+
+def run_farm(exe,name):
+    runs = int_param(opt_runs)
+    jobs = int_param(opt_jobs) or default_jobs()
+    first_seed = int_param(opt_seed)
+    budget = int_param(opt_budget)
+    trace_dir = opt_trace_dir.get() or '.'
+    if not os.path.isdir(trace_dir):
+        os.makedirs(trace_dir)
+    start = time.time()
+    running = []
+    failures = []
+    passed = 0
+    started = 0
+    timed_out = False
+    while (started < runs and not (failures and opt_stop_on_fail.get())) or running:
+        if budget and time.time() - start > budget:
+            timed_out = True
+            break
+        while started < runs and len(running) < jobs and not (failures and opt_stop_on_fail.get()):
+            seed = first_seed + started
+            trace = os.path.join(trace_dir,'{}.{}.iev'.format(name,seed))
+            running.append(Instance(exe,started,seed,trace))
+            started += 1
+        still_running = []
+        for inst in running:
+            if inst.poll() is None:
+                still_running.append(inst)
+            elif inst.failed():
+                print "seed {}: FAIL (status {}), trace in {}".format(inst.seed,inst.status,inst.trace)
+                sys.stdout.flush()
+                failures.append(inst)
+            else:
+                passed += 1
+                if not opt_keep_traces.get():
+                    inst.cleanup()
+        running = still_running
+        if failures and opt_stop_on_fail.get():
+            for inst in running:
+                inst.stop()
+                inst.cleanup()
+            running = []
+        time.sleep(0.05)
+    for inst in running:
+        inst.stop()
+        inst.cleanup()
+    elapsed = time.time() - start
+    print "{} runs passed, {} failed in {:.1f}s{}".format(passed,len(failures),elapsed,
+                                                        " (budget exhausted)" if timed_out else "")
+    for inst in failures:
+        print "failing seed: {} trace: {}".format(inst.seed,inst.trace)
+    incomplete = timed_out and passed + len(failures) < runs
+    if incomplete:
+        print "error: budget exhausted after {} of {} runs".format(passed + len(failures),runs)
+    return failures,incomplete
+
+def main():
+    signal.signal(signal.SIGINT,signal.SIG_DFL)
+    with iu.ErrorPrinter():
+        passed,args = read_params()
+        if len(args) != 1 or not args[0].endswith('.ivy'):
+            usage()
+        filename = args[0]
+        name = find_classname(passed,filename)
+        if opt_build.get():
+            build_tester(passed,filename)
+        exe = os.path.abspath(name)
+        if not os.path.exists(exe):
+            raise iu.IvyError(None,"tester {} not found".format(exe))
+        failures,incomplete = run_farm(exe,os.path.basename(name))
+    if failures or incomplete:
+        sys.exit(1)
+    print "OK"
+
+if __name__ == "__main__":
+    main()
@@ -20,10 +20,12 @@ import itertools
 import ivy_cpp
 import ivy_cpp_types
 import ivy_theory as ith
+import ivy_build
 
 from collections import defaultdict
 from operator import mul
 import re
+import sys
 
 def all_state_symbols():
     syms = il.all_symbols()
@@ -214,20 +216,42 @@ def declare_hash_thunk(header):
     header.append("""
 template <typename D, typename R>
 struct thunk {
+    int __refs;  // number of hash_thunks sharing this thunk
+    thunk() : __refs(0) {}
     virtual R operator()(const D &) = 0;
     int ___ivy_choose(int rng,const char *name,int id) {
         return 0;
     }
+    virtual ~thunk() {}
 };
 template <typename D, typename R, class HashFun = hash_space::hash<D> >
 struct hash_thunk {
     thunk<D,R> *fun;
     hash_space::hash_map<D,R,HashFun> memo;
     hash_thunk() : fun(0) {}
-    hash_thunk(thunk<D,R> *fun) : fun(fun) {}
+    hash_thunk(thunk<D,R> *fun) : fun(fun) {
+        if (fun)
+            fun->__refs++;
+    }
+    hash_thunk(const hash_thunk &other) : fun(other.fun), memo(other.memo) {
+        if (fun)
+            fun->__refs++;
+    }
+    hash_thunk &operator=(const hash_thunk &other) {
+        if (other.fun)
+            other.fun->__refs++;
+        release();
+        fun = other.fun;
+        memo = other.memo;
+        return *this;
+    }
+    void release() {
+        if (fun && --fun->__refs == 0)
+            delete fun;
+        fun = 0;
+    }
     ~hash_thunk() {
-//        if (fun)
-//            delete fun;
+        release();
     }
     R &operator[](const D& arg){
         std::pair<typename hash_space::hash_map<D,R>::iterator,bool> foo = memo.insert(std::pair<D,R>(arg,R()));
@@ -393,6 +417,8 @@ def make_thunk(impl,vs,expr):
     name = '__thunk__{}'.format(thunk_counter)
     thunk_counter += 1
     thunk_class = 'z3_thunk' if target.get() in ["gen","test"] else 'thunk'
+    global quant_index_ok
+    saved_quant_index_ok,quant_index_ok = quant_index_ok,False  # thunks cannot see the indexes
     open_scope(impl,line='struct {} : {}<{},{}>'.format(name,thunk_class,D,R))
     syms = set()
     gather_referenced_symbols(expr,syms)
@@ -432,6 +458,7 @@ def make_thunk(impl,vs,expr):
             code_line(impl,'return res')
         close_scope(impl)
     close_scope(impl,semi=True)
+    quant_index_ok = saved_quant_index_ok
     return 'hash_thunk<{},{}>(new {}({}))'.format(D,R,name,','.join(envnames))
 
 def struct_hash_fun(field_names,field_sorts):
@@ -734,6 +761,7 @@ public:
     indent_level += 2
     emit_eval_sig(impl,'obj',used = used,classname=classname)
     emit_clear_progress(impl,'obj')
+    mark_written(impl,obj='obj.')
     indent_level -= 2
     impl.append("""
     }
@@ -819,10 +847,18 @@ def emit_action_gen(header,impl,name,action,classname):
         if x.is_numeral() and il.is_uninterpreted_sort(x.sort):
             raise iu.IvyError(None,'Cannot compile numeral {} of uninterpreted sort {}'.format(x,x.sort))
     syms = [x for x in used if is_local_sym(x) and not x.is_numeral()]
+    pre_used = ilu.used_symbols_ast(pre)
+    state_syms = [sym for sym in all_state_symbols()
+                  if sym in pre_used and sym not in pre_clauses.defidx # skip symbols not used in constraint
+                  and slv.solver_name(il.normalize_symbol(sym)) != None # skip interpreted symbols
+                  and sym_is_member(sym)]
     header.append("class " + caname + "_gen : public gen {\n  public:\n")
     for sym in syms:
         if not sym.name.startswith('__ts') and sym not in pre_clauses.defidx:
             declare_symbol(header,sym,classname=classname)
+    for sym in state_syms:
+        if sym in state_gen_syms:
+            header.append('    unsigned long long __sync_{};\n'.format(varname(sym)))
     header.append("    {}_gen();\n".format(caname))
     header.append("    bool generate(" + classname + "&);\n");
     header.append("    void execute(" + classname + "&);\n};\n");
@@ -831,29 +867,36 @@ def emit_action_gen(header,impl,name,action,classname):
     emit_sig(impl)
     for sym in syms:
         emit_decl(impl,sym)
+    for sym in state_syms:
+        if sym in state_gen_syms:
+            code_asgn(impl,'__sync_' + varname(sym),'0')
     
     indent(impl)
     impl.append('add("(assert {})");\n'.format(slv.formula_to_z3(pre).sexpr().replace('|!1','!1|').replace('\n',' "\n"')))
 #    impl.append('__ivy_modelfile << slvr << std::endl;\n')
     indent_level -= 1
     impl.append("}\n");
-    impl.append("bool " + caname + "_gen::generate(" + classname + "& obj) {\n    push();\n")
+    impl.append("bool " + caname + "_gen::generate(" + classname + "& obj) {\n")
     indent_level += 1
+    emit_sync_state(impl,[sym for sym in state_syms if sym in state_gen_syms])
+    code_line(impl,'push()')
     for cpptype in cpptypes:
         code_line(impl,cpptype.short_name()+'::prepare()')
-    pre_used = ilu.used_symbols_ast(pre)
-    for sym in all_state_symbols():
-        if sym in pre_used and sym not in pre_clauses.defidx: # skip symbols not used in constraint
-            if slv.solver_name(il.normalize_symbol(sym)) != None: # skip interpreted symbols
-                if sym_is_member(sym):
-                    emit_set(impl,sym)
+    for sym in state_syms:
+        if sym not in state_gen_syms:
+            emit_set(impl,sym)
     code_line(impl,'alits.clear()')
     for sym in syms:
         if not sym.name.startswith('__ts') and sym not in pre_clauses.defidx:
             emit_randomize(impl,sym,classname=classname)
+    emit_coverage(impl,'gen_call',action,name)
     impl.append("""
     // std::cout << slvr << std::endl;
     bool __res = solve();
+""")
+    if coverage_on():
+        code_line(impl,'if (!__res) __ivy_cov[{}]++'.format(coverage_site('gen_unsat',action,name)))
+    impl.append("""
     if (__res) {
 """)
     indent_level += 1
@@ -873,27 +916,99 @@ def emit_action_gen(header,impl,name,action,classname):
 """)
     open_scope(impl,line="void " + caname + "_gen::execute(" + classname + "& obj)")
     if action.formal_params:
-        code_line(impl,'__ivy_out << "> {}("'.format(name.split(':')[-1]) + ' << "," '.join(' << {}'.format(varname(p)) for p in action.formal_params) + ' << ")" << std::endl')
+        code_line(impl,'__ivy_out << "> {}("'.format(name.split(':')[-1]) + ' << "," '.join(' << {}'.format(varname(p)) for p in action.formal_params) + ' << ")" << __ivy_endl')
     else:
-        code_line(impl,'__ivy_out << "> {}"'.format(name.split(':')[-1]) + ' << std::endl')
+        code_line(impl,'__ivy_out << "> {}"'.format(name.split(':')[-1]) + ' << __ivy_endl')
     if opt_trace.get():
-        code_line(impl,'__ivy_out << "{" << std::endl')
+        code_line(impl,'__ivy_out << "{" << __ivy_endl')
     call = 'obj.{}('.format(caname) + ','.join(varname(p) for p in action.formal_params) + ')'
     if len(action.formal_returns) == 0:
         code_line(impl,call)
         if opt_trace.get():
-            code_line(impl,'__ivy_out << "}" << std::endl')
+            code_line(impl,'__ivy_out << "}" << __ivy_endl')
     else:
         if opt_trace.get():
             code_line(impl,ctypefull(action.formal_returns[0].sort,classname=classname)+' __res = '+call)
-            code_line(impl,'__ivy_out << "}" << std::endl')
-            code_line(impl,'__ivy_out << "= " << __res <<  std::endl')
+            code_line(impl,'__ivy_out << "}" << __ivy_endl')
+            code_line(impl,'__ivy_out << "= " << __res <<  __ivy_endl')
         else:
-            code_line(impl,'__ivy_out << "= " << ' + call + ' <<  std::endl')
+            code_line(impl,'__ivy_out << "= " << ' + call + ' <<  __ivy_endl')
     close_scope(impl)
     global_classname = None
 
 
+# The generators keep the solver encoding of the state symbols over
+# small sorts across calls (unless incremental_state=false). Each cell
+# of such a symbol is encoded by a clause "lit -> f(x) = v" and the
+# literal is passed to the solver as an assumption. The class has a
+# generation counter __sgen_f for each of these symbols, incremented
+# whenever f may change, like the counters of the quantifier indexes.
+# When the counter differs from the one seen at the last call, the
+# generator compares the cells of f with the values in the solver and
+# encodes only the cells that changed, with fresh literals. When too
+# many encodings are no longer in use, the solver is reset. The other
+# state symbols are encoded at each call between push and pop.
+
+state_gen_syms = set()  # state symbols with generation counters
+
+def is_incremental_sym(sym):
+    sort = sym.sort
+    dom = sort_domain(sort)
+    return (sym_is_member(sym) and slv.solver_name(il.normalize_symbol(sym)) != None
+            and not is_native_sym(sym) and not is_large_type(sort)
+            and sort.rng not in sort_to_cpptype and sort.rng.name not in im.module.sort_destructors
+            and ctype(sort.rng) in ["bool","int"] and not il.is_uninterpreted_sort(sort.rng)
+            and all(is_finite_iterable_sort(s) and not il.is_uninterpreted_sort(s) for s in dom))
+
+def init_state_gens():
+    global state_gen_syms
+    state_gen_syms = set()
+    if opt_incremental_state.get() and target.get() in ["gen","test"]:
+        state_gen_syms = set(sym for sym in all_state_symbols() if is_incremental_sym(sym))
+
+def mark_state_gens(header,syms=None,obj=''):
+    for sym in sorted(state_gen_syms if syms is None else syms,key=str):
+        if sym in state_gen_syms:
+            code_line(header,'++{}__sgen_{}'.format(obj,varname(sym)))
+
+def emit_state_gen_decls(header):
+    for sym in sorted(state_gen_syms,key=str):
+        header.append('    unsigned long long __sgen_{};\n'.format(varname(sym)))
+
+def emit_state_gen_init(impl):
+    for sym in sorted(state_gen_syms,key=str):
+        impl.append('    __sgen_{} = 1;\n'.format(varname(sym)))
+
+def emit_sync_state(impl,syms):
+    """ Encode the cells of syms that changed since the last call """
+    if not syms:
+        return
+    open_if(impl,'state_stale()')
+    code_line(impl,'reset_state()')
+    for sym in syms:
+        code_asgn(impl,'__sync_' + varname(sym),'0')
+    close_scope(impl)
+    offset = 0
+    for sym in syms:
+        name = varname(sym)
+        dom = sort_domain(sym.sort)
+        vs = variables(dom)
+        open_if(impl,'__sync_{} != obj.__sgen_{}'.format(name,name))
+        open_loop(impl,vs)
+        idx = ''
+        for v in vs:
+            idx = '({})*{}+{}'.format(idx,sort_card(v.sort),varname(v)) if idx else varname(v)
+        idx = '{}+{}'.format(offset,idx) if idx and offset else idx or str(offset)
+        val = 'obj.' + name + ''.join('[{}]'.format(varname(v)) for v in vs)
+        apply_expr = 'apply("{}"'.format(slv.solver_name(il.normalize_symbol(sym))) + ''.join(','+int_to_z3(v.sort,varname(v)) for v in vs) + ')'
+        open_if(impl,'cell_changed({},{})'.format(idx,val))
+        code_line(impl,'set_cell({},{},{})'.format(idx,apply_expr,val))
+        close_scope(impl)
+        close_loop(impl,vs)
+        code_asgn(impl,'__sync_' + name,'obj.__sgen_' + name)
+        close_scope(impl)
+        offset += reduce(mul,[sort_card(s) for s in dom],1)
+
 def emit_derived(header,impl,df,classname,inline=False):
     name = df.defines().name
     sort = df.defines().sort.rng
@@ -905,7 +1020,11 @@ def emit_derived(header,impl,df,classname,inline=False):
     action = ia.AssignAction(retval,rhs)
     action.formal_params = ps
     action.formal_returns = [retval]
-    emit_some_action(header,impl,name,action,classname,inline)
+    if inline or df.defines() not in memo_deps:
+        emit_some_action(header,impl,name,action,classname,inline)
+        return
+    emit_some_action(header,impl,memo_compute_name(name),action,classname)
+    emit_memo_lookup(header,impl,df.defines(),action,classname)
 
 
 def native_split(string):
@@ -1060,6 +1179,201 @@ def emit_method_decl(header,name,action,body=False,classname=None,inline=False):
         header.append(classname + '::')
     emit_param_decls(header,name,action.formal_params,ptypes=ptypes,classname=classname if inline else None)
     
+# With shards=N, the methods of the class (actions and derived
+# functions) are divided between the main implementation file and N-1
+# additional files X_shard<k>.cpp, so that they can be compiled in
+# parallel. Methods containing native code stay in the main file, as
+# the native code may refer to anything defined there, and so do
+# methods of the tester that use thunks. The other methods are grouped
+# by their top-level object and the groups are assigned to the file
+# with the least code so far. All the files include a shared header
+# X_shard.h that includes the class header and declares the operators
+# the methods may use from the main file.
+
+shard_chunks = []   # (method name, start, end) in the implementation code
+impl_shards = []    # text of the additional implementation files
+shard_header = None # text of the shared header
+
+def shard_count():
+    try:
+        return max(1,int(opt_shards.get()))
+    except ValueError:
+        raise iu.IvyError(None,"bad parameter value: shards={}".format(opt_shards.get()))
+
+def record_shard_chunk(impl,name,action,start):
+    if (shard_count() > 1 and impl is ivy_cpp.context.impls.code and
+        not any(isinstance(a,ia.NativeAction) for a in action.iter_subactions())):
+        # thunks of the tester derive from z3_thunk, defined in the main file
+        if not any('z3_thunk<' in s for s in impl[start:]):
+            shard_chunks.append((name,start,len(impl)))
+
+def split_shards(impl,basename,classname):
+    """ Move the recorded methods out of impl into the additional
+    implementation files """
+    global impl_shards,shard_header
+    groups = defaultdict(list)
+    for name,start,end in shard_chunks:
+        groups[name.split('.')[0]].append((start,end))
+    size = lambda chunks: sum(len(s) for start,end in chunks for s in impl[start:end])
+    moved = sum(size(chunks) for chunks in groups.values())
+    # the code following the methods is not counted, so that the REPL
+    # and class versions of the code are divided in the same way
+    last = max([end for name,start,end in shard_chunks] or [len(impl)])
+    loads = [sum(len(s) for s in impl[:last]) - moved] + [0] * (shard_count() - 1)
+    assigned = [[] for load in loads]
+    for key in sorted(groups,key=lambda key:(-size(groups[key]),key)):
+        idx = loads.index(min(loads))
+        loads[idx] += size(groups[key])
+        assigned[idx].extend(groups[key])
+    shard_header = emit_shard_header(basename,classname)
+    impl_shards = []
+    for chunks in assigned[1:]:
+        if not chunks:
+            continue
+        code = ['#include "{}_shard.h"\n\n'.format(basename)]
+        for start,end in sorted(chunks):
+            code.extend(impl[start:end])
+            impl[start:end] = [''] * (end - start)
+        impl_shards.append(''.join(code))
+    if impl_shards:
+        idx = impl.index('#include "' + basename + '.h"\n\n')
+        impl[idx] = '#include "{}_shard.h"\n\n'.format(basename)
+
+def emit_shard_header(basename,classname):
+    code = ['#ifndef {}_SHARD_H\n#define {}_SHARD_H\n'.format(classname.upper(),classname.upper())]
+    code.append('#include "{}.h"\n'.format(basename))
+    code.append('#include <sstream>\n#include <algorithm>\n#include <iostream>\n#include <string>\n')
+    for dom in all_ctuples():
+        t = ctuple(dom)
+        code.append('bool operator==(const {}::{} &x, const {}::{} &y);\n'.format(classname,t,classname,t))
+    sort_names = [s for s in sorted(il.sig.sorts) if isinstance(il.sig.sorts[s],il.EnumeratedSort)]
+    for sort_name in sort_names + sorted(im.module.sort_destructors):
+        if sort_name not in encoded_sorts:
+            cfsname = classname + '::' + varname(sort_name)
+            code.append('std::ostream &operator <<(std::ostream &s, const {} &t);\n'.format(cfsname))
+    for cpptype in cpptypes:
+        code.append(cpptype.declarations())
+    code.append('#endif\n')
+    return ''.join(code)
+
+# Object locks. With object_locks=true (for target=class), the state of
+# the class is divided by the objects of the module hierarchy that
+# declare it, and each object has its own recursive mutex, so that
+# exported actions using disjoint objects can be called concurrently
+# from different threads. The footprint of an exported action is the
+# set of state symbols and derived functions referenced by the action,
+# the actions it calls and the definitions of the derived functions
+# it uses, whether they are read or modified. An action locks the
+# objects of its footprint on entry and unlocks them on exit. An
+# action that runs native code locks all objects.
+#
+# To avoid deadlock, locks are always acquired in increasing order of
+# their indexes (the objects sorted by name) and __lock() acquires all
+# of them. As with the single mutex, the constructor returns with all
+# the locks held, and the caller releases them with __unlock(). Since
+# an action's footprint includes those of the actions it calls, nested
+# calls only re-acquire locks already held. However, an import called
+# by an exported action must not call __lock(), or an exported action
+# needing a lock its caller does not hold. The memo tables of derived
+# functions and the quantifier indexes are protected by the locks of
+# the symbols they depend on. Coverage counters are not protected.
+
+object_lock_names = []
+object_locks = dict()       # exported action -> lock indexes
+object_footprints = dict()  # exported action -> symbols, None for all
+
+def lock_object_name(sym):
+    """ The innermost object of the hierarchy declaring sym """
+    name = sym.name
+    while iu.ivy_compose_character in name:
+        name = name.rsplit(iu.ivy_compose_character,1)[0]
+        if name in im.module.hierarchy:
+            return name
+    return ''
+
+def action_footprint(name,lockable):
+    syms = set()
+    for callee in ia.call_set(name,im.module.actions):
+        action = im.module.actions.get(callee)
+        if action is None:
+            continue
+        if any(isinstance(a,ia.NativeAction) for a in action.iter_subactions()):
+            return None
+        gather_referenced_symbols(action,syms)
+    if any(ldf.formula.defines() in syms for ldf in im.module.native_definitions):
+        return None
+    return set(sym for sym in syms if sym in lockable)
+
+def init_object_locks():
+    global object_lock_names,object_locks,object_footprints
+    object_lock_names,object_locks,object_footprints = [],dict(),dict()
+    if not opt_object_locks.get():
+        return
+    if emit_main:
+        raise iu.IvyError(None,"object_locks=true requires target=class")
+    lockable = set(sym for sym in all_state_symbols() if sym_is_member(sym)) | set(is_derived)
+    object_lock_names = sorted(set(lock_object_name(sym) for sym in lockable))
+    index = dict((n,idx) for idx,n in enumerate(object_lock_names))
+    for name in im.module.public_actions:
+        fp = action_footprint(name,lockable)
+        object_footprints[name] = fp
+        object_locks[name] = (range(len(object_lock_names)) if fp is None else
+                              sorted(set(index[lock_object_name(sym)] for sym in fp)))
+
+def emit_object_lock_decls(header,classname):
+    if not object_lock_names:
+        return
+    header.append("""
+    // object locks: OBJECTS
+#ifdef _WIN32
+    void *__object_mutex[NUM];
+#else
+    pthread_mutex_t __object_mutex[NUM];
+#endif
+    void __lock_object(int);
+    void __unlock_object(int);
+    struct __object_guard {
+        CLASSNAME *obj;
+        const int *locks;
+        int num;
+        __object_guard(CLASSNAME *obj, const int *locks, int num) : obj(obj), locks(locks), num(num) {
+            for (int idx = 0; idx < num; idx++)
+                obj->__lock_object(locks[idx]);
+        }
+        ~__object_guard() {
+            for (int idx = num - 1; idx >= 0; idx--)
+                obj->__unlock_object(locks[idx]);
+        }
+    };
+""".replace('CLASSNAME',classname).replace('NUM',str(len(object_lock_names)))
+       .replace('OBJECTS',' '.join('{}={}'.format(idx,n or '(top)') for idx,n in enumerate(object_lock_names))))
+
+def emit_object_lock_init(impl):
+    if not object_lock_names:
+        return
+    impl.append("""#ifdef _WIN32
+for (int idx = 0; idx < NUM; idx++)
+    __object_mutex[idx] = CreateMutex(NULL,FALSE,NULL);
+#else
+{
+    pthread_mutexattr_t attr;
+    pthread_mutexattr_init(&attr);
+    pthread_mutexattr_settype(&attr,PTHREAD_MUTEX_RECURSIVE);
+    for (int idx = 0; idx < NUM; idx++)
+        pthread_mutex_init(&__object_mutex[idx],&attr);
+    pthread_mutexattr_destroy(&attr);
+}
+#endif
+""".replace('NUM',str(len(object_lock_names))))
+
+def emit_object_guard(code,name):
+    locks = object_locks[name]
+    if not locks:
+        return
+    code_line(code,'static const int __locks[] = {{{}}}'.format(','.join(map(str,locks))))
+    code_line(code,'__object_guard __guard(this,__locks,{})'.format(len(locks)))
+
+
 def emit_action(header,impl,name,classname):
     action = im.module.actions[name]
     emit_some_action(header,impl,name,action,classname)
@@ -1076,7 +1390,7 @@ def trace_action(impl,name,action):
             first = False
             impl.append(' << {}'.format(varname(arg.rep.name)))
         impl.append(' << ")"')
-    impl.append(' << std::endl;\n')
+    impl.append(' << __ivy_endl;\n')
 
 def emit_some_action(header,impl,name,action,classname,inline=False):
     global indent_level
@@ -1086,14 +1400,25 @@ def emit_some_action(header,impl,name,action,classname,inline=False):
         header.append(';\n')
     global thunks
     thunks = impl
+    global coverage_dead
+    old_coverage_dead = coverage_dead
+    if not inline and name in im.module.actions and coverage_actions is not None:
+        coverage_dead = name not in coverage_actions
+    start = len(impl)
     code = []
     emit_method_decl(code,name,action,body=True,classname=classname,inline=inline)
     code.append('{\n')
     indent_level += 1
+    if not inline and name in object_locks:
+        emit_object_guard(code,name)
+    if not inline and name in im.module.actions:
+        emit_coverage(code,'action',action,name)
+    if not inline and not emit_main and name in im.module.public_actions:
+        mark_memos(code,object_footprints.get(name))
     if name in import_callers:
         trace_action(code,name,action)
         if opt_trace.get():
-            code_line(code,'__ivy_out << "{" << std::endl')
+            code_line(code,'__ivy_out << "{" << __ivy_endl')
     if len(action.formal_returns) == 1:
         indent(code)
         p = action.formal_returns[0]
@@ -1104,7 +1429,7 @@ def emit_some_action(header,impl,name,action,classname,inline=False):
         action.emit(code)
     if name in import_callers:
         if opt_trace.get():
-            code_line(code,'__ivy_out << "}" << std::endl')
+            code_line(code,'__ivy_out << "}" << __ivy_endl')
     pt,rt = get_param_types(action)
     if len(action.formal_returns) == 1 and not isinstance(rt[0],ReturnRefType):
         indent(code)
@@ -1112,6 +1437,9 @@ def emit_some_action(header,impl,name,action,classname,inline=False):
     indent_level -= 1
     code.append('}\n')
     impl.extend(code)
+    coverage_dead = old_coverage_dead
+    if not inline:
+        record_shard_chunk(impl,name,action,start)
 
 def init_method():
     asserts = []
@@ -1176,6 +1504,160 @@ def close_scope(impl,semi=False):
     indent(impl)
     impl.append('}'+(';' if semi else '')+'\n')
 
+# Coverage counters. With option "coverage=true", each coverage site
+# (action entry, branch of an if or choice, assertion, success or
+# failure of a "some" choice, call to and failure of a generator) gets
+# a counter in the global array __ivy_cov. At exit, the counters are
+# dumped in a compact binary file. The mapping from counters to source
+# locations is written by ivy_to_cpp to a file "<basename>.cov.map". See
+# ivy_coverage.py for the format and for the merge/report tool.
+
+# Only methods that can actually run get coverage sites. An action
+# whose body is inlined into its callers (a "before" or "implement"
+# monitor, say) is still emitted as a method, but is never called, so
+# its sites would always read zero. The same holds for the import
+# stubs "imp__*", which the REPL and test harness override, and for
+# ".init", which only the initial state generator of the tester calls
+# (otherwise the constructor runs the initializers). The hits of
+# inlined code are counted at the sites in the caller.
+
+coverage_sites = []
+coverage_actions = None
+coverage_dead = False
+
+def find_coverage_actions():
+    global coverage_actions
+    roots = list(im.module.public_actions)
+    if target.get() in ["gen","test"]:
+        roots.append('.init')
+    coverage_actions = set()
+    for root in roots:
+        coverage_actions.update(ia.call_set(root,im.module.actions))
+    if emit_main:
+        coverage_actions = set(a for a in coverage_actions if not a.startswith('imp__'))
+
+def coverage_on():
+    return opt_coverage.get() and not coverage_dead
+
+def coverage_site(kind,ast,desc=''):
+    desc = ' '.join(desc.split())  # the map is tab-separated, one site per line
+    coverage_sites.append((kind,iu.lineno_str(ast),desc))
+    return len(coverage_sites) - 1
+
+def emit_coverage(impl,kind,ast,desc=''):
+    if coverage_on():
+        code_line(impl,'__ivy_cov[{}]++'.format(coverage_site(kind,ast,desc)))
+
+def coverage_map_lines():
+    return ['{}\t{}\t{}\t{}'.format(idx,kind,loc,desc) for idx,(kind,loc,desc) in enumerate(coverage_sites)]
+
+def coverage_fingerprint():
+    import zlib
+    return zlib.crc32('\n'.join(coverage_map_lines())) & 0xffffffff
+
+def write_coverage_map(fname):
+    lines = coverage_map_lines()
+    f = open(fname,'w')
+    f.write('# ivy coverage map fingerprint={:08x} sites={}\n'.format(coverage_fingerprint(),len(lines)))
+    for line in lines:
+        f.write(line+'\n')
+    f.close()
+
+def emit_coverage_table(impl,basename):
+    impl.append("""
+unsigned long long __ivy_cov[NUM_SITES+1];
+std::string __ivy_cov_file = "BASENAME.cov";
+
+static void __ivy_cov_put(FILE *f, unsigned long long x, int bytes) {
+    for (int i = 0; i < bytes; i++)
+        putc((x >> (8*i)) & 0xff, f);
+}
+
+void __ivy_cov_dump() {
+    FILE *f = fopen(__ivy_cov_file.c_str(),"wb");
+    if (!f)
+        return;
+    fwrite("IVYCOV01",1,8,f);
+    __ivy_cov_put(f,FINGERPRINTu,4);
+    __ivy_cov_put(f,NUM_SITES,4);
+    for (unsigned i = 0; i < NUM_SITES; i++) {
+        unsigned long long x = __ivy_cov[i];
+        while (x >= 0x80) {   // LEB128 varint
+            putc((x & 0x7f) | 0x80, f);
+            x >>= 7;
+        }
+        putc(x, f);
+    }
+    fclose(f);
+}
+
+struct __ivy_cov_dumper {
+    ~__ivy_cov_dumper() { __ivy_cov_dump(); }
+} __ivy_cov_dumper_inst;
+
+// Forked branches of the tester (see start_branches) each dump their
+// counters to the coverage file with suffix .<branch>. When they are
+// done, the parent adds the counts of each branch since the fork to
+// its own, so the shared prefix is counted once, removes the branch
+// files and dumps the total.
+
+std::vector<unsigned long long> __ivy_cov_counts() {
+    return std::vector<unsigned long long>(__ivy_cov,__ivy_cov+NUM_SITES);
+}
+
+std::string __ivy_cov_branch_file(int branch) {
+    std::ostringstream s;
+    s << __ivy_cov_file << "." << branch;
+    return s.str();
+}
+
+static bool __ivy_cov_get(FILE *f, unsigned long long &x, int bytes) {
+    x = 0;
+    for (int i = 0; i < bytes; i++) {
+        int c = getc(f);
+        if (c == EOF)
+            return false;
+        x |= ((unsigned long long)c) << (8*i);
+    }
+    return true;
+}
+
+static void __ivy_cov_add_branch(int branch, const std::vector<unsigned long long> &prefix) {
+    std::string fname = __ivy_cov_branch_file(branch);
+    FILE *f = fopen(fname.c_str(),"rb");
+    if (!f)
+        return;
+    char magic[8];
+    unsigned long long fingerprint, sites;
+    if (fread(magic,1,8,f) == 8 && !memcmp(magic,"IVYCOV01",8)
+        && __ivy_cov_get(f,fingerprint,4) && fingerprint == FINGERPRINTu
+        && __ivy_cov_get(f,sites,4) && sites == NUM_SITES) {
+        for (unsigned i = 0; i < NUM_SITES; i++) {
+            unsigned long long x = 0;
+            int c, shift = 0;
+            do {
+                if ((c = getc(f)) == EOF)
+                    break;
+                x |= ((unsigned long long)(c & 0x7f)) << shift;
+                shift += 7;
+            } while (c & 0x80);
+            if (c == EOF)
+                break;
+            __ivy_cov[i] += x - prefix[i];
+        }
+    }
+    fclose(f);
+    remove(fname.c_str());
+}
+
+void __ivy_cov_join_branches(int branches, const std::vector<unsigned long long> &prefix) {
+    for (int branch = 0; branch < branches; branch++)
+        __ivy_cov_add_branch(branch,prefix);
+    __ivy_cov_dump();
+}
+""".replace('NUM_SITES',str(len(coverage_sites))).replace('FINGERPRINT','0x{:08x}'.format(coverage_fingerprint()))
+                .replace('BASENAME',basename.replace('\\','/')))
+
 # This generates the "tick" method, called by the test environment to
 # represent passage of time. For each progress property, if it is not
 # satisfied the counter is incremented else it is set to zero. For each
@@ -1266,6 +1748,186 @@ def csortcard(s):
     card = sort_card(s)
     return str(card) if card else "0"
 
+# The state of the class can be saved in a __snapshot and restored
+# from it. The snapshot holds a copy of every member representing the
+# state, including the hash_thunks of functions over large sorts (which
+# share their thunks by reference counting) and values of the C++ types
+# of structs and variants. The quantifier indexes and memoized derived
+# functions are not saved, but invalidated on restore.
+
+def snapshot_members():
+    res = [sym for sym in all_state_symbols() if sym_is_member(sym) and slv.solver_name(sym) != None]
+    return res + [df.args[0].rep for df in im.module.progress]
+
+def emit_snapshot(header,impl,classname):
+    syms = snapshot_members()
+    progress = set(df.args[0].rep for df in im.module.progress)
+    header.append('    struct __snapshot {\n')
+    for sym in syms:
+        header.append('        ' + sym_decl(sym,c_type = 'int' if sym in progress else None) + ';\n')
+    header.append('    };\n')
+    header.append('    void __save(__snapshot &) const;\n')
+    header.append('    void __restore(const __snapshot &);\n')
+    impl.append('void {}::__save({}::__snapshot &__s) const {{\n'.format(classname,classname))
+    for sym in syms:
+        impl.append('    __ivy_copy(__s.{},{});\n'.format(varname(sym),varname(sym)))
+    impl.append('}\n')
+    impl.append('void {}::__restore(const {}::__snapshot &__s) {{\n'.format(classname,classname))
+    for sym in syms:
+        impl.append('    __ivy_copy({},__s.{});\n'.format(varname(sym),varname(sym)))
+    global indent_level
+    indent_level += 1
+    mark_written(impl)
+    indent_level -= 1
+    impl.append('}\n')
+
+def emit_ser_bench(impl,classname):
+    """ Emit a micro-benchmark of the binary and compact serializers
+    on each type with __ser and __deser. The tester or REPL runs it when
+    given the option ser_bench=N, where N is the number of iterations. """
+    impl.append("""
+#include <ctime>
+
+template <class S, class D, class T>
+void __ivy_ser_bench_one(const char *type, const char *fmt, const T &val, int iters) {
+    S ser;
+    __ser(ser,val);
+    size_t bytes = ser.res.size();
+    std::clock_t start = std::clock();
+    for (int i = 0; i < iters; i++) {
+        S s;
+        __ser(s,val);
+    }
+    double enc = (double)(std::clock() - start) / CLOCKS_PER_SEC;
+    D check(ser.res);
+    T copy;
+    __deser(check,copy);
+    check.end();
+    if (!(copy == val))
+        std::cout << type << " " << fmt << ": round trip failed" << std::endl;
+    start = std::clock();
+    for (int i = 0; i < iters; i++) {
+        D d(ser.res);
+        T res;
+        __deser(d,res);
+        d.end();
+    }
+    double dec = (double)(std::clock() - start) / CLOCKS_PER_SEC;
+    std::cout << type << " " << fmt << ": " << bytes << " bytes, encode "
+              << (iters ? 1e9 * enc / iters : 0.0) << " ns, decode "
+              << (iters ? 1e9 * dec / iters : 0.0) << " ns, encode "
+              << (enc > 0 ? bytes * iters / enc / 1e6 : 0.0) << " MB/s, decode "
+              << (dec > 0 ? bytes * iters / dec / 1e6 : 0.0) << " MB/s" << std::endl;
+}
+
+template <class T>
+void __ivy_ser_bench(const char *type, int iters) {
+    T val = T();
+    __ivy_ser_bench_one<ivy_binary_ser,ivy_binary_deser>(type,"binary",val,iters);
+    __ivy_ser_bench_one<ivy_compact_ser,ivy_compact_deser>(type,"compact",val,iters);
+}
+
+void __ivy_ser_bench_all(int iters) {
+    __ivy_ser_bench<int>("int",iters);
+    __ivy_ser_bench<bool>("bool",iters);
+    __ivy_ser_bench<__strlit>("string",iters);
+""")
+    names = [s for s in sorted(il.sig.sorts) if isinstance(il.sig.sorts[s],il.EnumeratedSort)]
+    names += sorted(im.module.sort_destructors)
+    for sort_name in names:
+        if sort_name not in encoded_sorts:
+            impl.append('    __ivy_ser_bench<{}::{}>("{}",iters);\n'.format(classname,varname(sort_name),sort_name))
+    impl.append('}\n')
+
+# Trace output. Lines of the trace are ended with __ivy_endl, which
+# flushes the output only when it goes to the console, so that tracing
+# to a file (out=...) is buffered. With trace_format=binary, each line
+# is written as a record consisting of its length as a varint followed
+# by its text, after the header "IVYTRC01". Since the records carry
+# their length, a reader can index the trace without scanning the text
+# (see ivy_ev_parser.EventIndex).
+
+def emit_trace_runtime(impl):
+    impl.append("""
+char __ivy_out_buf[1 << 16];
+bool __ivy_trace_flush = true;
+bool __ivy_trace_binary = TRACE_BINARY;
+
+std::ostream &__ivy_endl(std::ostream &s) {
+    s.put('\\n');
+    if (__ivy_trace_flush)
+        s.flush();
+    return s;
+}
+
+class ivy_trace_framer : public std::streambuf {
+    std::streambuf *dest;
+    std::string line;
+    void put_record() {
+        unsigned long long len = line.size();
+        while (len >= 0x80) {
+            dest->sputc((char)((len & 0x7f) | 0x80));
+            len >>= 7;
+        }
+        dest->sputc((char)len);
+        dest->sputn(line.data(),line.size());
+        line.clear();
+    }
+public:
+    ivy_trace_framer() : dest(0) {}
+    void attach(std::streambuf *d) {
+        dest = d;
+        dest->sputn("IVYTRC01",8);
+    }
+    ~ivy_trace_framer() {
+        if (!dest)
+            return;
+        if (line.size())
+            put_record();
+        dest->pubsync();
+    }
+protected:
+    int overflow(int c) {
+        if (c == EOF)
+            return 0;
+        if (c == '\\n')
+            put_record();
+        else
+            line.push_back((char)c);
+        return c;
+    }
+    std::streamsize xsputn(const char *s, std::streamsize n) {
+        const char *end = s + n;
+        while (s < end) {
+            const char *nl = (const char *)memchr(s,'\\n',end - s);
+            if (!nl) {
+                line.append(s,end - s);
+                break;
+            }
+            line.append(s,nl - s);
+            put_record();
+            s = nl + 1;
+        }
+        return n;
+    }
+    int sync() {
+        return dest->pubsync();
+    }
+};
+
+// Defined after __ivy_out, so that it is destroyed first, writing the
+// last record.
+ivy_trace_framer __ivy_trace_framer;
+""".replace('TRACE_BINARY','true' if opt_trace_format.get() == 'binary' else 'false'))
+
+def bounded_ser_card(sort):
+    """ If values of sort are non-negative ints below a known bound,
+    return the bound as a C++ literal, else None. """
+    card = sort_card(sort)
+    if ctype(sort) != 'int' or not card or card > (1 << 32) or sort_has_negative_values(sort):
+        return None
+    return str(card) + 'LL'
+
 def check_member_names(classname):
     names = map(varname,(list(il.sig.symbols) + list(il.sig.sorts) + list(im.module.actions)))
     if classname in names:
@@ -1334,6 +1996,14 @@ def find_import_callers():
 def module_to_cpp_class(classname,basename):
     global the_classname
     the_classname = classname
+    global coverage_sites
+    coverage_sites = []
+    global coverage_actions
+    coverage_actions = None
+    global shard_chunks
+    shard_chunks = []
+    global impl_shards
+    impl_shards = []
     global encoded_sorts
     encoded_sorts = set()
     check_member_names(classname)
@@ -1372,9 +2042,24 @@ def module_to_cpp_class(classname,basename):
 
     header.append("typedef std::string __strlit;\n")
     header.append("extern std::ofstream __ivy_out;\n")
+    header.append("std::ostream &__ivy_endl(std::ostream &s);\n")
+    header.append("extern int __ivy_port_offset;\n")
+    if opt_coverage.get():
+        header.append("extern unsigned long long __ivy_cov[];\n")
+        header.append("extern std::string __ivy_cov_file;\n")
+        header.append("std::vector<unsigned long long> __ivy_cov_counts();\n")
+        header.append("std::string __ivy_cov_branch_file(int branch);\n")
+        header.append("void __ivy_cov_join_branches(int branches, const std::vector<unsigned long long> &prefix);\n")
     header.append("void __ivy_exit(int);\n")
     
     declare_hash_thunk(header)
+    header.append("""
+template <typename T> void __ivy_copy(T &dst, const T &src) {dst = src;}
+template <typename T, size_t N> void __ivy_copy(T (&dst)[N], const T (&src)[N]) {
+    for (size_t i = 0; i < N; i++)
+        __ivy_copy(dst[i],src[i]);
+}
+""")
 
     once_memo = set()
     for native in im.module.natives:
@@ -1392,6 +2077,7 @@ def module_to_cpp_class(classname,basename):
 
 """)
 
+    init_object_locks()
     header.append('class ' + classname + ' {\n  public:\n')
     header.append("    typedef {} ivy_class;\n".format(classname))
     header.append("""
@@ -1403,6 +2089,7 @@ def module_to_cpp_class(classname,basename):
     void __lock();
     void __unlock();
 """)
+    emit_object_lock_decls(header,classname)
     header.append("""
 #ifdef _WIN32
     std::vector<DWORD> thread_ids;\n
@@ -1449,6 +2136,8 @@ def module_to_cpp_class(classname,basename):
 #include <netinet/in.h>
 #include <netinet/ip.h> 
 #include <sys/select.h>
+#include <sys/wait.h>
+#include <sys/mman.h>
 #include <unistd.h>
 #define _open open
 #define _dup2 dup2
@@ -1459,7 +2148,9 @@ def module_to_cpp_class(classname,basename):
 """)
     impl.append("typedef {} ivy_class;\n".format(classname))
     impl.append("std::ofstream __ivy_out;\n")
+    emit_trace_runtime(impl)
     impl.append("std::ofstream __ivy_modelfile;\n")
+    impl.append("int __ivy_port_offset = 0;\n")
     impl.append("void __ivy_exit(int code){exit(code);}\n")
 
     impl.append("""
@@ -1603,7 +2294,23 @@ void CLASSNAME::install_timer(timer *r) {
     void CLASSNAME::__lock() { pthread_mutex_lock(&mutex); }
     void CLASSNAME::__unlock() { pthread_mutex_unlock(&mutex); }
 #endif
-""".replace('CLASSNAME',classname))
+""".replace('CLASSNAME',classname) if not object_lock_names else """
+#ifdef _WIN32
+    void CLASSNAME::__lock_object(int idx) { WaitForSingleObject(__object_mutex[idx],INFINITE); }
+    void CLASSNAME::__unlock_object(int idx) { ReleaseMutex(__object_mutex[idx]); }
+#else
+    void CLASSNAME::__lock_object(int idx) { pthread_mutex_lock(&__object_mutex[idx]); }
+    void CLASSNAME::__unlock_object(int idx) { pthread_mutex_unlock(&__object_mutex[idx]); }
+#endif
+    void CLASSNAME::__lock() {
+        for (int idx = 0; idx < NUM; idx++)
+            __lock_object(idx);
+    }
+    void CLASSNAME::__unlock() {
+        for (int idx = NUM - 1; idx >= 0; idx--)
+            __unlock_object(idx);
+    }
+""".replace('CLASSNAME',classname).replace('NUM',str(len(object_lock_names))))
     native_exprs = []
     for n in im.module.natives:
         native_exprs.extend(n.args[2:])
@@ -1652,6 +2359,7 @@ struct ivy_ser {
     virtual void  close_field() = 0;
     virtual void  open_tag(int, const std::string &) {throw deser_err();}
     virtual void  close_tag() {}
+    virtual void  set_bounded(long long inp, long long card) {set(inp);}
     virtual ~ivy_ser(){}
 };
 struct ivy_binary_ser : public ivy_ser {
@@ -1697,6 +2405,7 @@ struct ivy_deser {
     virtual void  close_field() = 0;
     virtual int   open_tag(const std::vector<std::string> &) {throw deser_err();}
     virtual void  close_tag() {}
+    virtual void  get_bounded(long long &res, long long card) {get(res);}
     virtual void  end() = 0;
     virtual ~ivy_deser(){}
 };
@@ -1717,8 +2426,11 @@ struct ivy_binary_deser : public ivy_deser {
         while (pos < inp.size() && inp[pos]) {
             if (inp[pos] == '\"')
                 throw deser_err();
+            res.push_back(inp[pos++]);
         }
-        res.push_back(inp[pos++]);
+        if (pos >= inp.size())
+            throw deser_err();
+        pos++;
     }
     void open_list() {
         long long len;
@@ -1750,6 +2462,123 @@ struct ivy_binary_deser : public ivy_deser {
             throw deser_err();
     }
 };
+
+// Compact binary format. Integers are zigzag-encoded varints, except
+// for values of sorts of known cardinality, which use the least number
+// of bytes that can hold any value of the sort. Strings are prefixed
+// with their length. The deserializer reads from a view of the input
+// buffer, which must outlive it.
+
+struct ivy_compact_ser : public ivy_ser {
+    std::vector<char> res;
+    void put_varint(unsigned long long inp) {
+        while (inp >= 0x80) {
+            res.push_back((char)((inp & 0x7f) | 0x80));
+            inp >>= 7;
+        }
+        res.push_back((char)inp);
+    }
+    void set(long long inp) {
+        put_varint((((unsigned long long)inp) << 1) ^ (unsigned long long)(inp >> 63));
+    }
+    void set(bool inp) {
+        set((long long)inp);
+    }
+    void set(const std::string &inp) {
+        put_varint(inp.size());
+        res.insert(res.end(),inp.begin(),inp.end());
+    }
+    void set_bounded(long long inp, long long card) {
+        for (unsigned long long lim = card - 1; lim; lim >>= 8) {
+            res.push_back((char)(inp & 0xff));
+            inp >>= 8;
+        }
+    }
+    void open_list(int len) {
+        put_varint(len);
+    }
+    void close_list() {}
+    void open_list_elem() {}
+    void close_list_elem() {}
+    void open_struct() {}
+    void close_struct() {}
+    virtual void  open_field(const std::string &) {}
+    void close_field() {}
+    virtual void  open_tag(int tag, const std::string &) {
+        put_varint(tag);
+    }
+    virtual void  close_tag() {}
+};
+
+struct ivy_compact_deser : public ivy_deser {
+    const char *inp;
+    size_t size;
+    size_t pos;
+    std::vector<long long> lenstack;
+    ivy_compact_deser(const char *inp, size_t size) : inp(inp),size(size),pos(0) {}
+    ivy_compact_deser(const std::vector<char> &buf) : inp(buf.empty() ? 0 : &buf[0]),size(buf.size()),pos(0) {}
+    unsigned long long get_varint() {
+        unsigned long long res = 0;
+        for (int shift = 0; shift < 64; shift += 7) {
+            if (pos >= size)
+                throw deser_err();
+            unsigned char byte = inp[pos++];
+            res |= ((unsigned long long)(byte & 0x7f)) << shift;
+            if (!(byte & 0x80))
+                return res;
+        }
+        throw deser_err();
+    }
+    void get(long long &res) {
+        unsigned long long v = get_varint();
+        res = (long long)(v >> 1) ^ -(long long)(v & 1);
+    }
+    void get(std::string &res) {
+        unsigned long long len = get_varint();
+        if (len > size - pos)
+            throw deser_err();
+        res.assign(inp + pos,len);
+        pos += len;
+    }
+    void get_bounded(long long &res, long long card) {
+        unsigned long long v = 0;
+        int shift = 0;
+        for (unsigned long long lim = card - 1; lim; lim >>= 8, shift += 8) {
+            if (pos >= size)
+                throw deser_err();
+            v |= ((unsigned long long)(unsigned char)inp[pos++]) << shift;
+        }
+        if (v >= (unsigned long long)card)
+            throw deser_err();
+        res = v;
+    }
+    void open_list() {
+        lenstack.push_back(get_varint());
+    }
+    void close_list() {
+        lenstack.pop_back();
+    }
+    bool open_list_elem() {
+        return lenstack.back();
+    }
+    void close_list_elem() {
+        lenstack.back()--;
+    }
+    void open_struct() {}
+    void close_struct() {}
+    virtual void  open_field(const std::string &) {}
+    void close_field() {}
+    int open_tag(const std::vector<std::string> &tags) {
+        unsigned long long res = get_varint();
+        if (res >= tags.size())
+            throw deser_err();
+        return res;
+    }
+    void end() {
+        if (pos != size)
+            throw deser_err();
+    }
+};
 struct out_of_bounds {
     std::string txt;
     int pos;
@@ -1828,9 +2657,27 @@ void __deser<bool>(ivy_deser &inp, bool &res) {
     res = thing;
 }
 
+// values of sorts of known cardinality
+
+inline void __ser_bounded(ivy_ser &res, const int &inp, long long card) {
+    res.set_bounded(inp,card);
+}
+
+inline void __deser_bounded(ivy_deser &inp, int &res, long long card) {
+    long long temp;
+    inp.get_bounded(temp,card);
+    res = temp;
+}
+
 class gen;
 
 """)
+    impl.append("""
+// The serializer used by the network wrappers, chosen by ser_format
+typedef ivy_{0}_ser ivy_wire_ser;
+typedef ivy_{0}_deser ivy_wire_deser;
+
+""".format(opt_ser_format.get()))
     if target.get() in ["gen","test"]:
         impl.append("""
 template <class T> void __from_solver( gen &g, const  z3::expr &v, T &res);
@@ -2012,6 +2859,11 @@ class z3_thunk : public thunk<D,R> {
     for sname in il.sig.interp:
         header.append('    int __CARD__' + varname(sname) + ';\n')
     find_import_callers()
+    init_quant_indexes()
+    init_memos()
+    init_state_gens()
+    global quant_index_ok
+    quant_index_ok = True
     for ldf in im.module.definitions + im.module.native_definitions:
         with ivy_ast.ASTContext(ldf):
             emit_derived(header,impl,ldf.formula,classname)
@@ -2041,9 +2893,15 @@ class z3_thunk : public thunk<D,R> {
     emit_param_decls(header,classname,im.module.params)
     header.append(';\n');
     im.module.actions['.init'] = init_method()
+    find_coverage_actions()
     for a in im.module.actions:
         emit_action(header,impl,a,classname)
     emit_tick(header,impl,classname)
+    emit_snapshot(header,impl,classname)
+    quant_index_ok = False
+    emit_quant_index_decls(header)
+    emit_memo_decls(header)
+    emit_state_gen_decls(header)
     header.append('};\n')
 
     impl.append(classname + '::')
@@ -2054,6 +2912,7 @@ class z3_thunk : public thunk<D,R> {
     impl.append('#else\n');
     impl.append('pthread_mutex_init(&mutex,NULL);\n')
     impl.append('#endif\n');
+    emit_object_lock_init(impl)
     impl.append('__lock();\n');
     enums = set(sym.sort.name for sym in il.sig.constructors)  
 #    for sortname in enums:
@@ -2062,6 +2921,9 @@ class z3_thunk : public thunk<D,R> {
     for sortname in il.sig.interp:
         if sortname in il.sig.sorts:
             impl.append('    __CARD__{} = {};\n'.format(varname(sortname),csortcard(il.sig.sorts[sortname])))
+    emit_memo_init(impl)
+    emit_state_gen_init(impl)
+    emit_quant_index_init(impl)
     if target.get() not in ["gen","test"]:
         emit_one_initial_state(impl)
     for native in im.module.natives:
@@ -2075,6 +2937,9 @@ class z3_thunk : public thunk<D,R> {
             indent_code(impl,code)
             close_loop(impl,vs)
             indent_level -= 1
+    indent_level += 1
+    mark_memos(impl)
+    indent_level -= 1
 
     impl.append('}\n')
 
@@ -2144,7 +3009,11 @@ class z3_thunk : public thunk<D,R> {
                     for d,v in zip(dom,vs):
                         open_loop(impl,[v])
                     code_line(impl,'res.open_field("'+memname(sym)+'")')
-                    code_line(impl,'__ser<' + ctype(sym.sort.rng,classname=classname) + '>(res,t.' + memname(sym) + subscripts(vs) + ')')
+                    card = bounded_ser_card(sym.sort.rng)
+                    if card is not None:
+                        code_line(impl,'__ser_bounded(res,t.' + memname(sym) + subscripts(vs) + ',' + card + ')')
+                    else:
+                        code_line(impl,'__ser<' + ctype(sym.sort.rng,classname=classname) + '>(res,t.' + memname(sym) + subscripts(vs) + ')')
                     code_line(impl,'res.close_field()')
                     for d,v in zip(dom,vs):
                         close_loop(impl,[v])
@@ -2164,7 +3033,7 @@ class z3_thunk : public thunk<D,R> {
                 close_scope(impl)
                 impl.append('template <>\n')
                 open_scope(impl,line='void  __ser<' + cfsname + '>(ivy_ser &res, const ' + cfsname + '&t)')
-                code_line(impl,'__ser(res,(int)t)')
+                code_line(impl,'__ser_bounded(res,(int)t,{})'.format(len(sort.extension)))
                 close_scope(impl)
 
 
@@ -2227,7 +3096,11 @@ class z3_thunk : public thunk<D,R> {
                             card = sort_card(v.sort)
                             code_line(impl,'inp.open_list('+str(card)+')')
                             open_loop(impl,[v])
-                        code_line(impl,'__deser(inp,res.'+fname+''.join('[{}]'.format(varname(v)) for v in vs) + ')')
+                        card = bounded_ser_card(sym.sort.rng)
+                        if card is not None:
+                            code_line(impl,'__deser_bounded(inp,res.'+fname+''.join('[{}]'.format(varname(v)) for v in vs) + ',' + card + ')')
+                        else:
+                            code_line(impl,'__deser(inp,res.'+fname+''.join('[{}]'.format(varname(v)) for v in vs) + ')')
                         for v in vs:
                             close_loop(impl,[v])
                             code_line(impl,'inp.close_list()')
@@ -2295,7 +3168,7 @@ class z3_thunk : public thunk<D,R> {
                     impl.append('template <>\n')
                     open_scope(impl,line='void __deser<' + cfsname + '>(ivy_deser &inp, ' + cfsname + ' &res)')
                     code_line(impl,'int __res')
-                    code_line(impl,'__deser(inp,__res)')
+                    code_line(impl,'__deser_bounded(inp,__res,{})'.format(len(sort.extension)))
                     code_line(impl,'res = ({})__res'.format(cfsname))
                     close_scope(impl)
                 if target.get() in ["test","gen"]:
@@ -2321,31 +3194,18 @@ class z3_thunk : public thunk<D,R> {
                     emit_all_ctuples_to_solver(impl,classname)
 
 
+                emit_action_table(impl,classname)
                 emit_repl_boilerplate1a(header,impl,classname)
-                for actname in sorted(im.module.public_actions):
-                    username = actname[4:] if actname.startswith("ext:") else actname
-                    action = im.module.actions[actname]
-                    argstrings = ['_arg<{}>(args,{},{})'.format(ctype(x.sort,classname=classname),idx,csortcard(x.sort)) for idx,x in enumerate(action.formal_params)]
-                    getargs = ','.join(argstrings)
-                    thing = "ivy.methodname(getargs)"
-                    if action.formal_returns:
-                        thing = '__ivy_out << "= " << ' + thing + " << std::endl"
-                    if target.get() == "repl" and opt_trace.get():
-                        if action.formal_params:
-                            trace_code = '__ivy_out << "{}("'.format(actname.split(':')[-1]) + ' << "," '.join(' << {}'.format(arg) for arg in argstrings) + ' << ") {" << std::endl'
-                        else:
-                            trace_code = '__ivy_out << "{} {{"'.format(actname.split(':')[-1]) + ' << std::endl'
-                        thing = trace_code + ';\n                    ' + thing + ';\n                    __ivy_out << "}" << std::endl' 
-                    impl.append("""
-                if (action == "actname") {
-                    check_arity(args,numargs,action);
-                    thing;
-                }
-                else
-    """.replace('thing',thing).replace('actname',username).replace('methodname',varname(actname)).replace('numargs',str(len(action.formal_params))).replace('getargs',getargs))
                 emit_repl_boilerplate2(header,impl,classname)
+                if target.get() == "repl":
+                    emit_replay(impl,classname)
+                if target.get() == "test":
+                    emit_start_branches(impl,classname)
+                    emit_snapshot_file(impl,classname)
 
 
+                if opt_ser_bench.get():
+                    emit_ser_bench(impl,classname)
                 impl.append("int "+ opt_main.get() + "(int argc, char **argv){\n")
                 impl.append("        int test_iters = TEST_ITERS;\n".replace('TEST_ITERS',opt_test_iters.get()))
                 impl.append("""
@@ -2353,6 +3213,11 @@ class z3_thunk : public thunk<D,R> {
     int seed = 1;
     int sleep_ms = 10;
     int final_ms = 0; 
+    int branches = 0;
+    int branch_at = -1;
+    bool branch_fork = true;
+    std::string snapshot_file;
+    std::string restore_file;
     std::vector<char *> pargs; // positional args
     pargs.push_back(argv[0]);
     for (int i = 1; i < argc; i++) {
@@ -2364,11 +3229,20 @@ class z3_thunk : public thunk<D,R> {
             std::string param = arg.substr(0,p);
             std::string value = arg.substr(p+1);
             if (param == "out") {
-                __ivy_out.open(value.c_str());
+                __ivy_out.rdbuf()->pubsetbuf(__ivy_out_buf,sizeof(__ivy_out_buf));
+                __ivy_out.open(value.c_str(),std::ios::out | std::ios::binary);
                 if (!__ivy_out) {
                     std::cerr << "cannot open to write: " << value << std::endl;
                     return 1;
                 }
+                __ivy_trace_flush = false;
+            }
+            else if (param == "trace_format") {
+                if (value != "text" && value != "binary") {
+                    std::cerr << "trace_format must be text or binary" << std::endl;
+                    return 1;
+                }
+                __ivy_trace_binary = (value == "binary");
             }
             else if (param == "iters") {
                 test_iters = atoi(value.c_str());
@@ -2379,12 +3253,33 @@ class z3_thunk : public thunk<D,R> {
             else if (param == "seed") {
                 seed = atoi(value.c_str());
             }
+            else if (param == "branches") {
+                branches = atoi(value.c_str());
+            }
+            else if (param == "branch_at") {
+                branch_at = atoi(value.c_str());
+            }
+            else if (param == "branch_fork") {
+                branch_fork = (value == "true");
+            }
+            else if (param == "snapshot") {
+                snapshot_file = value;
+            }
+            else if (param == "restore") {
+                restore_file = value;
+            }
             else if (param == "delay") {
                 sleep_ms = atoi(value.c_str());
             }
             else if (param == "wait") {
                 final_ms = atoi(value.c_str());
             }
+            else if (param == "port_offset") {
+                __ivy_port_offset = atoi(value.c_str());
+            }
+            COVERAGE_PARAM
+            SER_BENCH_PARAM
+            REPLAY_PARAM
             else if (param == "modelfile") {
                 __ivy_modelfile.open(value.c_str());
                 if (!__ivy_modelfile) {
@@ -2401,9 +3296,20 @@ class z3_thunk : public thunk<D,R> {
     srand(seed);
     if (!__ivy_out.is_open())
         __ivy_out.basic_ios<char>::rdbuf(std::cout.rdbuf());
+    if (__ivy_trace_binary) {
+        __ivy_trace_framer.attach(__ivy_out.basic_ios<char>::rdbuf());
+        __ivy_out.basic_ios<char>::rdbuf(&__ivy_trace_framer);
+    }
     argc = pargs.size();
     argv = &pargs[0];
-""")
+""".replace('COVERAGE_PARAM',"""else if (param == "coverage") {
+                __ivy_cov_file = value;
+            }""" if opt_coverage.get() else '').replace('SER_BENCH_PARAM',"""else if (param == "ser_bench") {
+                __ivy_ser_bench_all(atoi(value.c_str()));
+                return 0;
+            }""" if opt_ser_bench.get() else '').replace('REPLAY_PARAM',"""else if (param == "replay") {
+                __ivy_replay_file = value;
+            }""" if target.get() == "repl" else ''))
                 impl.append("    if (argc == "+str(len(im.module.params)+2)+"){\n")
                 impl.append("        argc--;\n")
                 impl.append("        int fd = _open(argv[argc],0);\n")
@@ -2449,6 +3355,12 @@ class z3_thunk : public thunk<D,R> {
 
 
         
+    if opt_coverage.get():
+        emit_coverage_table(impl,basename)
+
+    if shard_count() > 1:
+        split_shards(impl,basename,classname)
+
     return ivy_cpp.context.globals.get_file(), ivy_cpp.context.impls.get_file()
 
 
@@ -2821,31 +3733,416 @@ def get_all_bounds(header,variables,body,exists,varnames):
     return [b] + get_all_bounds(header,variables,body,exists,varnames)
 
 
+# Quantifiers are compiled to loops over the bounds found by
+# get_bounds. The loop exits as soon as the value of the quantifier is
+# decided, and the body is tested lazily, so that nested quantifiers
+# in a conjunct or disjunct are evaluated only when the earlier ones
+# do not decide the result. Before each loop, quantified subformulas
+# and derived function applications that do not depend on the loop
+# variables are evaluated once and the results reused.
+#
+# With option quant_index=true, existential queries of the form
+# "exists N. r(N,x)", where r is a state relation over small sorts,
+# are answered from a secondary index counting, for each value of the
+# arguments in which r is not quantified, the tuples of r that hold.
+# An index is built when it is first queried, and then maintained by
+# the assignments to the relation, which update the counts of the
+# points they write. Each indexed relation also has a generation
+# counter, incremented when the relation is modified in bulk (by native
+# code, by the test generator or when a snapshot is restored), and an
+# index is rebuilt lazily when it is queried after this. This is sound
+# as long as the state is modified only by actions of the class.
+
+def needs_temps(expr):
+    """ True if evaluating expr requires auxiliary code """
+    if isinstance(expr,(lg.ForAll,lg.Exists,il.Some,ivy_ast.Some)):
+        return True
+    return any(needs_temps(a) for a in getattr(expr,'args',[]))
+
+def hoist_invariants(header,expr,bound):
+    """ Evaluate quantified subformulas and derived function applications
+    in expr that do not depend on the variables in bound, returning expr
+    with these replaced by temporaries. """
+    if isinstance(expr,(il.Some,ivy_ast.Some)):
+        return expr
+    if (isinstance(expr,(lg.ForAll,lg.Exists)) or il.is_app(expr) and expr.rep in is_derived and expr.args):
+        if not any(v in bound for v in lu.free_variables(expr)):
+            val = code_eval(header,expr)
+            if not re.match(r'^\w+$',val):
+                tmp = new_temp(header,sort=expr.sort)
+                code_asgn(header,tmp,val)
+                val = tmp
+            return il.Symbol(val,expr.sort)
+    if il.is_binder(expr):
+        body = hoist_invariants(header,expr.body,bound | set(il.binder_vars(expr)))
+        return expr if body is expr.body else expr.clone([body])
+    args = getattr(expr,'args',None)
+    if not args:
+        return expr
+    new_args = [hoist_invariants(header,a,bound) for a in args]
+    if all(x is y for x,y in zip(new_args,args)):
+        return expr
+    return expr.clone(new_args)
+
+def code_test(header,fmla,pol):
+    """ Return code testing whether the value of fmla is pol """
+    if isinstance(fmla,lg.Not):
+        return code_test(header,fmla.args[0],not pol)
+    code = code_eval(header,fmla)
+    return code if pol else '!' + code
+
+def emit_quant_exit(header,fmla,pol,res,val):
+    """ Emit code that sets res to val and exits the loop if the value
+    of fmla is pol. """
+    if isinstance(fmla,lg.Not):
+        emit_quant_exit(header,fmla.args[0],not pol,res,val)
+        return
+    if isinstance(fmla,lg.Implies) and needs_temps(fmla):
+        # not converted to lg.Or, which does not preserve the order of
+        # the arguments, so that the generated code is deterministic
+        if pol:
+            emit_quant_exit(header,fmla.args[0],not pol,res,val)
+            emit_quant_exit(header,fmla.args[1],pol,res,val)
+        else:
+            open_if(header,code_test(header,fmla.args[0],True))
+            emit_quant_exit(header,fmla.args[1],pol,res,val)
+            close_scope(header)
+        return
+    if needs_temps(fmla) and len(fmla.args) > 1:
+        if isinstance(fmla,lg.Or if pol else lg.And):
+            for arg in fmla.args:
+                emit_quant_exit(header,arg,pol,res,val)
+            return
+        if isinstance(fmla,lg.And if pol else lg.Or):
+            open_if(header,code_test(header,fmla.args[0],pol))
+            emit_quant_exit(header,type(fmla)(*fmla.args[1:]),pol,res,val)
+            close_scope(header)
+            return
+        if isinstance(fmla,lg.Ite):
+            open_if(header,code_eval(header,fmla.args[0]))
+            emit_quant_exit(header,fmla.args[1],pol,res,val)
+            close_scope(header)
+            open_scope(header,line='else')
+            emit_quant_exit(header,fmla.args[2],pol,res,val)
+            close_scope(header)
+            return
+    open_if(header,code_test(header,fmla,pol))
+    code_asgn(header,res,str(int(val)))
+    code_line(header,'break')
+    close_scope(header)
+
+quant_indexed = dict()   # indexed relation -> list of index names
+quant_indexes = dict()   # (relation,quantified positions) -> index name
+quant_index_ok = False   # true when emitting code of class members
+
+def quant_index_pattern(variables,body,exists):
+    """ If "exists variables. body" (or "forall variables. body" when not
+    exists) can be answered from an index, return the relation, the
+    tuple of quantified positions and the other arguments. """
+    if not exists:
+        if not isinstance(body,lg.Not):
+            return None
+        body = body.args[0]
+    if not (il.is_app(body) and body.args and body.rep in quant_indexed):
+        return None
+    pos = tuple(idx for idx,a in enumerate(body.args) if a in variables)
+    if len(pos) != len(variables) or len(set(body.args[i] for i in pos)) != len(pos):
+        return None
+    rest = [a for idx,a in enumerate(body.args) if idx not in pos]
+    if any(v in lu.free_variables(a) for a in rest for v in variables):
+        return None
+    return body.rep,pos,rest
+
+def is_indexable_relation(sym):
+    sort = sym.sort
+    return (opt_quant_index.get() and sym.is_relation() and len(sort.dom) > 0
+            and sym in all_state_symbols() and sym_is_member(sym) and not is_large_type(sort)
+            and all(is_finite_iterable_sort(s) for s in sort.dom))
+
+def find_quant_indexes(ast,res):
+    if isinstance(ast,lg.Exists) or isinstance(ast,lg.ForAll):
+        body = ast.body.args[0] if isinstance(ast,lg.ForAll) and isinstance(ast.body,lg.Not) else ast.body
+        if il.is_app(body) and is_indexable_relation(body.rep):
+            res.add(body.rep)
+    for arg in getattr(ast,'args',[]):
+        find_quant_indexes(arg,res)
+
+def init_quant_indexes():
+    global quant_indexed,quant_indexes
+    quant_indexed,quant_indexes = dict(),dict()
+    if not opt_quant_index.get():
+        return
+    rels = set()
+    for ldf in im.module.definitions:
+        find_quant_indexes(ldf.formula,rels)
+    for name,action in im.module.actions.iteritems():
+        find_quant_indexes(action,rels)
+    for name,ini in im.module.initializers:
+        find_quant_indexes(ini,rels)
+    for rel in rels:
+        quant_indexed[rel] = []
+
+def quant_index_name(rel,pos):
+    if (rel,pos) not in quant_indexes:
+        name = '__qidx_{}_{}'.format(varname(rel),'_'.join(str(p) for p in pos))
+        quant_indexes[(rel,pos)] = name
+        quant_indexed[rel].append(name)
+    return quant_indexes[(rel,pos)]
+
+def mark_quant_indexes(header,rels=None,obj=''):
+    """ Invalidate the indexes of rels (default all relations) """
+    for rel in sorted(quant_indexed if rels is None else rels,key=str):
+        if rel in quant_indexed:
+            code_line(header,'++' + obj + '__qidx_gen_' + varname(rel))
+
+def is_maintained_index(lhs):
+    """ True if an assignment to lhs updates the indexes of lhs.rep
+    instead of invalidating them """
+    return quant_index_ok and il.is_app(lhs) and lhs.rep in quant_indexed
+
+def quant_index_point(header,lhs):
+    """ Evaluate the arguments of lhs once, returning lhs applied to
+    the values """
+    args = []
+    for a in lhs.args:
+        val = code_eval(header,a)
+        if not re.match(r'^\w+$',val):
+            tmp = new_temp(header,sort=a.sort)
+            code_asgn(header,tmp,val)
+            val = tmp
+        args.append(il.Symbol(val,a.sort))
+    return lhs.rep(*args)
+
+def emit_quant_index_count(header,point,delta):
+    """ Add delta to the counts of point in the indexes of its relation,
+    if the point holds """
+    code_line(header,'__qidx_{}_count({})'.format(varname(point.rep),
+                                                 ', '.join([varname(a.name) for a in point.args] + [delta])))
+
+def emit_quant_index_decls(header):
+    global indent_level
+    for rel in sorted(quant_indexed,key=str):
+        header.append('    unsigned long long __qidx_gen_{};\n'.format(varname(rel)))
+    for (rel,pos),name in sorted(quant_indexes.iteritems(),key=lambda x: x[1]):
+        vs = variables(rel.sort.dom)
+        free = [v for idx,v in enumerate(vs) if idx not in pos]
+        dims = ''.join('[{}]'.format(sort_card(v.sort)) for v in free) or '[1]'
+        elem = name + (''.join('[{}]'.format(varname(v)) for v in free) or '[0]')
+        header.append('    unsigned long long {}_built;\n'.format(name))
+        header.append('    int {}{};\n'.format(name,dims))
+        header.append('    bool {}_get({}) {{\n'.format(name,', '.join('int ' + varname(v) for v in free)))
+        old_indent = indent_level
+        indent_level = 2
+        open_if(header,'{}_built != __qidx_gen_{}'.format(name,varname(rel)))
+        open_loop(header,free)
+        code_asgn(header,elem,'0')
+        close_loop(header,free)
+        open_loop(header,vs)
+        open_if(header,code_eval(header,rel(*vs)))
+        code_line(header,'++' + elem)
+        close_scope(header)
+        close_loop(header,vs)
+        code_asgn(header,name+'_built','__qidx_gen_'+varname(rel))
+        close_scope(header)
+        code_line(header,'return ' + elem + ' != 0')
+        indent_level = old_indent
+        header.append('    }\n')
+    for rel in sorted(quant_indexed,key=str):
+        vs = variables(rel.sort.dom)
+        header.append('    void __qidx_{}_count({}) {{\n'.format(varname(rel),', '.join(['int ' + varname(v) for v in vs] + ['int __delta'])))
+        old_indent = indent_level
+        indent_level = 2
+        names = quant_indexed[rel]
+        if names:
+            open_if(header,code_eval(header,rel(*vs)))
+            for name in names:
+                pos = [p for r,p in quant_indexes if quant_indexes[(r,p)] == name][0]
+                elem = name + (''.join('[{}]'.format(varname(v)) for idx,v in enumerate(vs) if idx not in pos) or '[0]')
+                open_if(header,'{}_built == __qidx_gen_{}'.format(name,varname(rel)))
+                code_line(header,elem + ' += __delta')
+                close_scope(header)
+            close_scope(header)
+        indent_level = old_indent
+        header.append('    }\n')
+
+def emit_quant_index_init(impl):
+    for rel in sorted(quant_indexed,key=str):
+        impl.append('    __qidx_gen_{} = 1;\n'.format(varname(rel)))
+    for name in sorted(quant_indexes.values()):
+        impl.append('    {}_built = 0;\n'.format(name))
+
+def mark_written(header,syms=None,obj='',indexed=False):
+    """ Invalidate the indexes, memoized derived functions and solver
+    encodings that depend on syms (default all symbols). If indexed
+    is true, the indexes have been updated. """
+    if not indexed:
+        mark_quant_indexes(header,syms,obj)
+    mark_memos(header,syms,obj)
+    mark_state_gens(header,syms,obj)
+
+# With option memo_derived=lazy or memo_derived=eager, the values of
+# derived functions and relations are cached. A definition is
+# memoized if its arguments range over small sorts and it depends,
+# directly or through other definitions, only on state symbols of the
+# class (not on native code or on itself). Its dependencies are the
+# symbols used in the body of the definition. Each memoized function f
+# has a generation counter __memo_gen_f, incremented by every
+# assignment to one of its dependencies, after native code and when
+# the tester loads an initial state. The cache is kept across calls of
+# exported actions, except with target=class, where code embedding the
+# class may write the state members directly. There, an exported action
+# invalidates on entry the memoized functions reading its footprint (or
+# all of them without object locks), so that the cache is kept only for
+# the duration of a call.
+#
+# With memo_derived=lazy, each entry of the cache has its own
+# generation stamp and is computed when it is read and out of date.
+# With memo_derived=eager, the whole table is recomputed at the first
+# read after a change, so that other reads are simple lookups. Lazy
+# caching is better when few entries are read between changes.
+
+memo_deps = dict()     # memoized derived symbol -> state symbols it depends on
+memo_readers = dict()  # state symbol -> memoized derived symbols reading it
+memo_max_entries = 1 << 16
+
+def memo_compute_name(name):
+    return '__memo_compute_' + name
+
+def memo_dependencies(ldf):
+    """ The state symbols a definition depends on, or None if it cannot
+    be memoized """
+    sym = ldf.formula.defines()
+    dom = sort_domain(sym.sort)
+    if ldf not in im.module.definitions or not all(is_finite_iterable_sort(s) for s in dom):
+        return None
+    if reduce(mul,[sort_card(s) for s in dom],1) > memo_max_entries:
+        return None
+    syms = set()
+    gather_referenced_symbols(ldf.formula.args[1],syms,ldf.formula.args[0].args)
+    if sym in syms or any(is_native_sym(s) or s in is_derived and is_derived[s] not in im.module.definitions
+                          for s in syms):
+        return None
+    return set(s for s in syms if s not in is_derived)
+
+def init_memos():
+    global memo_deps,memo_readers
+    memo_deps,memo_readers = dict(),dict()
+    if opt_memo_derived.get() == 'none':
+        return
+    for ldf in im.module.definitions:
+        deps = memo_dependencies(ldf)
+        if deps is not None:
+            memo_deps[ldf.formula.defines()] = deps
+            for dep in deps:
+                memo_readers.setdefault(dep,set()).add(ldf.formula.defines())
+
+def mark_memos(header,syms=None,obj=''):
+    """ Invalidate the memoized functions reading syms (default all) """
+    funs = set(memo_deps) if syms is None else set(f for s in syms for f in memo_readers.get(s,[]))
+    for fun in sorted(funs,key=str):
+        code_line(header,'++{}__memo_gen_{}'.format(obj,varname(fun)))
+
+def memo_is_table(sym):
+    return opt_memo_derived.get() == 'eager' or not sort_domain(sym.sort)
+
+def emit_memo_decls(header):
+    for sym in sorted(memo_deps,key=str):
+        dims = ''.join('[{}]'.format(sort_card(s)) for s in sort_domain(sym.sort))
+        header.append('    unsigned long long __memo_gen_{};\n'.format(varname(sym)))
+        header.append('    unsigned long long __memo_built_{}{};\n'.format(varname(sym),'' if memo_is_table(sym) else dims))
+        header.append('    {} __memo_{}{};\n'.format(ctype(sym.sort.rng),varname(sym),dims))
+
+def emit_memo_init(impl):
+    global indent_level
+    indent_level += 1
+    for sym in sorted(memo_deps,key=str):
+        code_asgn(impl,'__memo_gen_' + varname(sym),'1')
+        vs = [] if memo_is_table(sym) else variables(sort_domain(sym.sort))
+        open_loop(impl,vs)
+        code_asgn(impl,'__memo_built_' + varname(sym) + ''.join('[{}]'.format(varname(v)) for v in vs),'0')
+        close_loop(impl,vs)
+    indent_level -= 1
+
+def emit_memo_lookup(header,impl,sym,action,classname):
+    """ Emit the method of a memoized function, reading the cache and
+    calling the compute method if it is out of date """
+    global indent_level
+    emit_method_decl(header,sym.name,action)
+    header.append(';\n')
+    start = len(impl)
+    code = []
+    emit_method_decl(code,sym.name,action,body=True,classname=classname)
+    code.append('{\n')
+    indent_level += 1
+    ps = action.formal_params
+    name = varname(sym)
+    compute = lambda args: funname(memo_compute_name(sym.name)) + '(' + ','.join(args) + ')'
+    entry = lambda args: '__memo_' + name + ''.join('[{}]'.format(a) for a in args)
+    args = [varname(p.name) for p in ps]
+    bounds = ' && '.join('0 <= {} && {} < {}'.format(a,a,sort_card(p.sort)) for a,p in zip(args,ps)
+                         if ctype(p.sort) != 'bool')
+    if memo_is_table(sym):
+        vs = variables(sort_domain(sym.sort))
+        vargs = [varname(v) for v in vs]
+        open_if(code,'__memo_built_{} != __memo_gen_{}'.format(name,name))
+        open_loop(code,vs)
+        code_asgn(code,entry(vargs),compute(vargs))
+        close_loop(code,vs)
+        code_asgn(code,'__memo_built_' + name,'__memo_gen_' + name)
+        close_scope(code)
+        if bounds:
+            open_if(code,bounds)
+        code_line(code,'return ' + entry(args))
+        if bounds:
+            close_scope(code)
+            code_line(code,'return ' + compute(args))
+    else:
+        built = '__memo_built_' + name + ''.join('[{}]'.format(a) for a in args)
+        if bounds:
+            open_if(code,bounds)
+        open_if(code,'{} != __memo_gen_{}'.format(built,name))
+        code_asgn(code,entry(args),compute(args))
+        code_asgn(code,built,'__memo_gen_' + name)
+        close_scope(code)
+        code_line(code,'return ' + entry(args))
+        if bounds:
+            close_scope(code)
+            code_line(code,'return ' + compute(args))
+    indent_level -= 1
+    code.append('}\n')
+    impl.extend(code)
+    record_shard_chunk(impl,sym.name,action,start)
+
 def emit_quant(variables,body,header,code,exists=False):
     global indent_level
     if len(variables) == 0:
         body.emit(header,code)
         return
+    pat = quant_index_pattern(variables,body,exists) if quant_index_ok else None
+    if pat is not None:
+        rel,pos,rest = pat
+        code.append(('' if exists else '!') + quant_index_name(rel,pos) + '_get(' +
+                    ', '.join(code_eval(header,a) for a in rest) + ')')
+        return
     v0 = variables[0]
     variables = variables[1:]
     check_iterable_sort(v0.sort)
+    body = hoist_invariants(header,body,set([v0] + variables))
     res = new_temp(header)
     idx = v0.name
-    indent(header)
-    header.append(res + ' = ' + str(0 if exists else 1) + ';\n')
-    indent(header)
+    code_asgn(header,res,str(0 if exists else 1))
     lo,hi = get_bounds(header,v0,variables,body,exists)
-    header.append('for (int ' + idx + ' = ' + lo + '; ' + idx + ' < ' + hi + '; ' + idx + '++) {\n')
-    indent_level += 1
-    subcode = []
-    emit_quant(variables,body,header,subcode,exists)
-    indent(header)
-    header.append('if (' + ('!' if not exists else ''))
-    header.extend(subcode)
-    header.append(') '+ res + ' = ' + str(1 if exists else 0) + ';\n')
-    indent_level -= 1
-    indent(header)
-    header.append('}\n')
+    open_scope(header,line='for (int ' + idx + ' = ' + lo + '; ' + idx + ' < ' + hi + '; ' + idx + '++) ')
+    if variables:
+        subcode = []
+        emit_quant(variables,body,header,subcode,exists)
+        open_if(header,('' if exists else '!') + ''.join(subcode))
+        code_asgn(header,res,str(1 if exists else 0))
+        code_line(header,'break')
+        close_scope(header)
+    else:
+        emit_quant_exit(header,body,exists,res,exists)
+    close_scope(header)
     code.append(res)    
 
 
@@ -2920,6 +4217,9 @@ def emit_some(self,header,code):
     code_line(header,some+'= 1')
     close_scope(header)
     close_loop(header,vs)
+    if coverage_on():
+        code_line(header,'__ivy_cov[{}+!{}]++'.format(coverage_site('some_found',self,str(self)),some))
+        coverage_site('some_empty',self,str(self))
     if isinstance(self,ivy_ast.Some):
         code.append(some)
        
@@ -3002,6 +4302,11 @@ def emit_traced_lhs(self,trace,captured_args):
     return captured_args[num_args:]
 
 def emit_assign_simple(self,header):
+    indexed = is_maintained_index(self.args[0])
+    if indexed:
+        point = quant_index_point(header,self.args[0])
+        self = self.clone([point,self.args[1]])
+        emit_quant_index_count(header,point,'-1')
     code = []
     indent(code)
     if opt_trace.get() and ':' not in self.args[0].rep.name:
@@ -3018,7 +4323,7 @@ def emit_assign_simple(self,header):
         rhs = []
         self.args[1].emit(header,rhs)
         code.extend(rhs)
-        trace.extend(' << "," << (' + ''.join(rhs) + ') << ")" << std::endl;\n')
+        trace.extend(' << "," << (' + ''.join(rhs) + ') << ")" << __ivy_endl;\n')
         header.extend(trace)
     else:
         self.args[0].emit(header,code)
@@ -3030,8 +4335,132 @@ def emit_assign_simple(self,header):
             self.args[1].emit(header,code)
     code.append(';\n')    
     header.extend(code)
+    if indexed:
+        emit_quant_index_count(header,self.args[0],'1')
+    mark_written(header,[self.args[0].rep],indexed=indexed)
+
+# Many assignments to functions over large sorts change the function at
+# just one point, for example "f(X) := v if X = x else f(X)" or
+# "r(X,Y) := r(X,Y) | X = x & Y = y". Wrapping the old value in a new
+# thunk for each of these would make lookups linear in the number of
+# updates, so we recognize them and update the memo table of the
+# hash_thunk in place. Thunks are created only for assignments that are
+# genuinely symbolic.
+
+def conjuncts(fmla):
+    if isinstance(fmla,il.And):
+        return [c for a in fmla.args for c in conjuncts(a)]
+    return [fmla]
+
+def guard_bindings(cond,vs):
+    """ Split the conjunction cond into equations binding variables in
+    vs to terms not containing the variables vs, guards not containing
+    the variables vs, and a residual condition. Returns a dictionary of
+    bindings, the list of guards and the list of residual conjuncts,
+    with the bindings substituted. """
+    bindings = dict()
+    guards = []
+    rest = []
+    for c in conjuncts(cond):
+        cvs = lu.free_variables(c)
+        if not any(v in cvs for v in vs):
+            guards.append(c)
+            continue
+        if isinstance(c,lg.Eq):
+            x,y = c.args
+            if y in vs and y not in bindings:
+                x,y = y,x
+            if x in vs and x not in bindings and not any(v in lu.free_variables(y) for v in vs):
+                bindings[x] = y
+                continue
+        rest.append(c)
+    rest = [lu.substitute(c,bindings) for c in rest]
+    return bindings,guards,rest
+
+def point_bindings(cond,vs):
+    """ If cond is a conjunction of equations binding each variable in vs to
+    a term not containing the variables vs, and of guards not containing the
+    variables vs, return the binding as a dictionary, and the guards. Else
+    return None. """
+    bindings,guards,rest = guard_bindings(cond,vs)
+    if rest or len(bindings) != len(vs):
+        return None
+    return bindings,guards
+
+def match_guarded_update(lhs,rhs):
+    """ If the assignment lhs := rhs changes lhs only where some condition
+    holds, return a pair (cond,val), such that the assignment is
+    equivalent to lhs := val if cond else lhs. If the assignment
+    changes nothing, return (false,lhs). Otherwise return None."""
+    vs = [a for a in lhs.args if il.is_variable(a)]
+    if len(set(vs)) != len(vs) or any(lu.free_variables(a) for a in lhs.args if not il.is_variable(a)):
+        return None
+    if rhs == lhs:
+        return (il.Or(),lhs)
+    if isinstance(rhs,il.Ite):
+        cond,val = rhs.args[0],rhs.args[1]
+        if rhs.args[1] == lhs and isinstance(rhs.args[0],il.Not):
+            cond,val = rhs.args[0].args[0],rhs.args[2]
+        elif rhs.args[2] != lhs:
+            return None
+    elif isinstance(rhs,il.Or) and len(rhs.args) == 2 and lhs in rhs.args:
+        cond = [a for a in rhs.args if a != lhs][0]
+        val = il.And()
+    elif isinstance(rhs,il.And) and len(rhs.args) == 2 and lhs in rhs.args:
+        cond = [a for a in rhs.args if a != lhs][0]
+        if not isinstance(cond,il.Not):
+            return None
+        cond = cond.args[0]
+        val = il.Or()
+    else:
+        return None
+    return cond,val
+
+def match_point_update(lhs,rhs):
+    """ If the assignment lhs := rhs changes the function lhs.rep at
+    (at most) one point, return a tuple (point,value,guards), where
+    point is a list of terms, value is the new value at the point and the
+    update applies if all guards hold. If the assignment changes
+    nothing, return (None,None,[]). Otherwise return None."""
+    gu = match_guarded_update(lhs,rhs)
+    if gu is None:
+        return None
+    cond,val = gu
+    if cond == il.Or():
+        return (None,None,[])
+    vs = [a for a in lhs.args if il.is_variable(a)]
+    pb = point_bindings(cond,vs)
+    if pb is None:
+        return None
+    bindings,guards = pb
+    point = [bindings.get(a,a) for a in lhs.args]
+    val = lu.substitute(val,bindings)
+    if lu.free_variables(val):
+        return None
+    return point,val,guards
+
+def emit_point_update(self,header,point,val,guards):
+    lhs = self.args[0]
+    if guards:
+        open_if(header,code_eval(header,il.And(*guards)))
+    if lhs.rep in ilu.used_symbols_ast(val):
+        tmp = il.Symbol(new_temp(header,sort=val.sort),val.sort)
+        code_asgn(header,varname(tmp),code_eval(header,val))
+        val = tmp
+    asgn = ia.AssignAction(lhs.rep(*point),val)
+    if hasattr(self,'lineno'):
+        asgn.lineno = self.lineno
+    emit_assign_simple(asgn,header)
+    if guards:
+        close_scope(header)
 
 def emit_assign_large(self,header):
+    pu = match_point_update(self.args[0],self.args[1])
+    if pu is not None:
+        point,val,guards = pu
+        if point is not None:
+            emit_point_update(self,header,point,val,guards)
+        return
     dom = self.args[0].rep.sort.dom
     vs = variables(dom)
     vs = [x if isinstance(x,il.Variable) else y for x,y in zip(self.args[0].args,vs)]
@@ -3040,57 +4469,131 @@ def emit_assign_large(self,header):
     global thunks
 
     code_line(header,varname(self.args[0].rep)+' = ' + make_thunk(thunks,vs,expr))
+    mark_written(header,[self.args[0].rep])
+
+# An assignment to a function over small sorts is compiled to a loop
+# over the free variables of the left-hand side. A temporary copy of
+# the new value is needed only if the right-hand side may read the
+# function at a point other than the one being written (for example
+# r(X,Y) := r(Y,X)). If the right-hand side has the form "val if cond
+# else lhs", the equations in cond binding variables of the left-hand
+# side are used to restrict the loop to the points that may change.
+# The terms substituted into the left-hand side are also reads, since
+# they are evaluated at each iteration.
+
+def reads_elsewhere(expr,lhs):
+    """ True if evaluating expr may read lhs.rep at a point other than
+    lhs. """
+    if expr == lhs:
+        return False
+    if isinstance(expr,il.Symbol) and expr == lhs.rep:
+        return True
+    if il.is_app(expr):
+        if expr.rep == lhs.rep:
+            return True
+        if expr.rep in is_derived:
+            ldf = is_derived[expr.rep]
+            if ldf in im.module.native_definitions:
+                return True
+            syms = set()
+            gather_referenced_symbols(ldf.formula.args[1],syms,ldf.formula.args[0].args)
+            if lhs.rep in syms:
+                return True
+    if il.is_binder(expr) and any(v in lhs.args for v in il.binder_vars(expr)):
+        return lhs.rep in ilu.used_symbols_ast(expr)
+    return any(reads_elsewhere(a,lhs) for a in expr.args)
+
+def emit_assign_loop(header,lhs,cond,val,vs):
+    """ Emit code for lhs := (val if cond else lhs), iterating over the
+    variables vs. The condition cond may be None. """
+    if any(reads_elsewhere(x,lhs) for x in lhs.args):
+        # The points written depend on lhs.rep, so we write every point
+        # of lhs.rep, comparing it to the points of the original lhs.
+        avs = []
+        eqs = []
+        for a,v in zip(lhs.args,variables(lhs.rep.sort.dom)):
+            if isinstance(a,il.Variable) and a not in avs:
+                avs.append(a)
+            else:
+                avs.append(v)
+                eqs.append(il.Equals(v,a))
+        whole = lhs.rep(*avs)
+        val = il.Ite(il.And(*eqs),val if cond is None else il.Ite(cond,val,lhs),whole)
+        lhs,cond,vs = whole,None,avs
+    reads = ([cond] if cond is not None else []) + [val] + list(lhs.args)
+    if any(reads_elsewhere(x,lhs) for x in reads):
+        if cond is not None:
+            val = il.Ite(cond,val,lhs)
+            cond = None
+        global temp_ctr
+        tmp = '__tmp' + str(temp_ctr)
+        temp_ctr += 1
+        cards = [sort_card(v.sort) for v in vs]
+        code_line(header,'std::vector<' + ctype(val.sort) + '> ' + tmp + '(' + str(reduce(mul,cards,1)) + ')')
+        idx = varname(vs[0].name)
+        for v,card in zip(vs[1:],cards[1:]):
+            idx = '(' + idx + ') * ' + str(card) + ' + ' + varname(v.name)
+        idx = tmp + '[' + idx + ']'
+        open_loop(header,vs)
+        code_line(header,idx + ' = ' + code_eval(header,val))
+        close_loop(header,vs)
+        val = idx
+    open_loop(header,vs)
+    if cond is not None:
+        open_if(header,code_eval(header,cond))
+    # an assignment to every point invalidates the indexes instead
+    whole = cond is None and len(set(lhs.args)) == len(lhs.args) and all(il.is_variable(a) for a in lhs.args)
+    indexed = is_maintained_index(lhs) and not whole
+    if indexed:
+        point = quant_index_point(header,lhs)
+        emit_quant_index_count(header,point,'-1')
+    code = []
+    indent(code)
+    (point if indexed else lhs).emit(header,code)
+    code.append(' = ' + (val if isinstance(val,str) else code_eval(header,val)) + ';\n')
+    header.extend(code)
+    if indexed:
+        emit_quant_index_count(header,point,'1')
+    if cond is not None:
+        close_scope(header)
+    close_loop(header,vs)
+    mark_written(header,[lhs.rep],indexed=indexed)
 
 def emit_assign(self,header):
-    global indent_level
     with ivy_ast.ASTContext(self):
 #        if is_large_type(self.args[0].rep.sort) and lu.free_variables(self.args[0]):
         if is_large_lhs(self.args[0]):
             emit_assign_large(self,header)
             return
-        vs = list(lu.free_variables(self.args[0]))
+        lhs,rhs = self.args
+        vs = list(lu.free_variables(lhs))
         for v in vs:
             check_iterable_sort(v.sort)
         if len(vs) == 0:
             emit_assign_simple(self,header)
             return
-        global temp_ctr
-        tmp = '__tmp' + str(temp_ctr)
-        temp_ctr += 1
-        indent(header)
-        header.append(ctype(self.args[1].sort) + '  ' + tmp)
-        for v in vs:
-            header.append('[' + str(sort_card(v.sort)) + ']')
-        header.append(';\n')
-        for idx in vs:
-            indent(header)
-            vn = varname(idx.name)
-            header.append('for (int ' + vn + ' = 0; ' + vn + ' < ' + str(sort_card(idx.sort)) + '; ' + vn + '++) {\n')
-            indent_level += 1
-        code = []
-        indent(code)
-        code.append(tmp + ''.join('['+varname(v.name)+']' for v in vs) + ' = ')
-        self.args[1].emit(header,code)
-        code.append(';\n')    
-        header.extend(code)
-        for idx in vs:
-            indent_level -= 1
-            indent(header)
-            header.append('}\n')
-        for idx in vs:
-            indent(header)
-            vn = varname(idx.name)
-            header.append('for (int ' + vn + ' = 0; ' + vn + ' < ' + str(sort_card(idx.sort)) + '; ' + vn + '++) {\n')
-            indent_level += 1
-        code = []
-        indent(code)
-        self.args[0].emit(header,code)
-        code.append(' = ' + tmp + ''.join('['+varname(v.name)+']' for v in vs) + ';\n')
-        header.extend(code)
-        for idx in vs:
-            indent_level -= 1
-            indent(header)
-            header.append('}\n')
+        cond,val,guards = None,rhs,[]
+        gu = match_guarded_update(lhs,rhs)
+        if gu is not None:
+            if gu[0] == il.Or():
+                return
+            bindings,guards,rest = guard_bindings(gu[0],vs)
+            lhs = lu.substitute(lhs,bindings)
+            val = lu.substitute(gu[1],bindings)
+            cond = il.And(*rest) if rest else None
+            vs = [v for v in vs if v not in bindings]
+        if guards:
+            open_if(header,code_eval(header,il.And(*guards)))
+        if vs:
+            emit_assign_loop(header,lhs,cond,val,vs)
+        else:
+            if cond is not None:
+                open_if(header,code_eval(header,cond))
+            emit_assign_simple(ia.AssignAction(lhs,val),header)
+            if cond is not None:
+                close_scope(header)
+        if guards:
+            close_scope(header)
     
 ia.AssignAction.emit = emit_assign
 
@@ -3115,6 +4618,7 @@ def emit_sequence(self,header):
 ia.Sequence.emit = emit_sequence
 
 def emit_assert(self,header):
+    emit_coverage(header,'assert',self)
     code = []
     indent(code)
     code.append('ivy_assert(')
@@ -3184,6 +4688,8 @@ def emit_call(self,header):
         self.args[1].emit(header,code)
         code.append(' = ' + retval + ';\n')
     header.extend(code)
+    if len(self.args) == 2:
+        mark_written(header,[self.args[1].rep])
     if target.get() in ["gen","test"]:
         indent(header)
         header.append('___ivy_stack.pop_back();\n')
@@ -3226,15 +4732,18 @@ def emit_if(self,header):
     header.extend(code)
     header.append('){\n')
     indent_level += 1
+    emit_coverage(header,'if_true',self)
     self.args[1].emit(header)
     indent_level -= 1
     indent(header)
     header.append('}\n')
-    if len(self.args) == 3:
+    if len(self.args) == 3 or coverage_on():
         indent(header)
         header.append('else {\n')
         indent_level += 1
-        self.args[2].emit(header)
+        emit_coverage(header,'if_false',self)
+        if len(self.args) == 3:
+            self.args[2].emit(header)
         indent_level -= 1
         indent(header)
         header.append('}\n')
@@ -3269,6 +4778,7 @@ def emit_choice(self,header):
             header.append('if(' + tmp + ' == ' + str(idx) + ')');
         header.append('{\n')
         indent_level += 1
+        emit_coverage(header,'choice',self,str(idx))
         arg.emit(header)
         indent_level -= 1
         indent(header)
@@ -3303,6 +4813,7 @@ def emit_native_action(self,header):
         return s[:-1] if s.endswith('%') else s
     fields = [(nfun(idx)(self.args[int(s)+1]) if idx % 2 == 1 else dm(s)) for idx,s in enumerate(fields)]
     indent_code(header,''.join(fields))
+    mark_written(header)
 
 ia.NativeAction.emit = emit_native_action
 
@@ -3347,7 +4858,7 @@ int ask_ret(int bound) {
             __ivy_exit(1);
         }
     }
-    """.replace('classname',classname).replace('CLOSE_TRACE','__ivy_out << "}" << std::endl;' if opt_trace.get() else ''))
+    """.replace('classname',classname).replace('CLOSE_TRACE','__ivy_out << "}" << __ivy_endl;' if opt_trace.get() else ''))
 
     emit_param_decls(impl,classname+'_repl',im.module.params)
     impl.append(' : '+classname+'('+','.join(map(varname,im.module.params))+'){}\n')
@@ -3370,7 +4881,7 @@ int ask_ret(int bound) {
                     first = False
                     impl.append(' << {}'.format(varname(arg.rep.name)))
                 impl.append(' << ")"')
-            impl.append(' << std::endl;\n')
+            impl.append(' << __ivy_endl;\n')
             if action.formal_returns:
                 impl.append('    return ask_ret(__CARD__{});\n'.format(action.formal_returns[0].sort))
             impl.append('}\n')
@@ -3565,6 +5076,387 @@ public:
         try {
             parse_command(cmd,action,args);
             ivy.__lock();
+            const __ivy_action_entry *entry = __ivy_find_action(action.data(),action.size());
+            if (entry) {
+                check_arity(args,entry->arity,action);
+                entry->handler(ivy,args);
+            }
+            else
+""".replace('classname',classname))
+
+
+# The REPL finds the exported actions in a table sorted by name. Each
+# entry has a handler that converts the arguments and calls the action.
+
+def emit_action_table(impl,classname):
+    impl.append("""
+typedef void (*__ivy_action_handler)(classname_repl &, std::vector<ivy_value> &);
+
+struct __ivy_action_entry {
+    const char *name;
+    unsigned arity;
+    __ivy_action_handler handler;
+};
+""".replace('classname',classname))
+    username = lambda actname: actname[4:] if actname.startswith("ext:") else actname
+    actnames = sorted(im.module.public_actions,key=username)
+    for actname in actnames:
+        action = im.module.actions[actname]
+        argstrings = ['_arg<{}>(args,{},{})'.format(ctype(x.sort,classname=classname),idx,csortcard(x.sort)) for idx,x in enumerate(action.formal_params)]
+        thing = 'ivy.{}({})'.format(varname(actname),','.join(argstrings))
+        if action.formal_returns:
+            thing = '__ivy_out << "= " << ' + thing + " << __ivy_endl"
+        if target.get() == "repl" and opt_trace.get():
+            if action.formal_params:
+                trace_code = '__ivy_out << "{}("'.format(actname.split(':')[-1]) + ' << "," '.join(' << {}'.format(arg) for arg in argstrings) + ' << ") {" << __ivy_endl'
+            else:
+                trace_code = '__ivy_out << "{} {{"'.format(actname.split(':')[-1]) + ' << __ivy_endl'
+            thing = trace_code + ';\n    ' + thing + ';\n    __ivy_out << "}" << __ivy_endl'
+        impl.append("""
+void __ivy_handle_methodname(classname_repl &ivy, std::vector<ivy_value> &args) {
+    thing;
+}
+""".replace('thing',thing).replace('methodname',varname(actname)).replace('classname',classname))
+    impl.append('\n__ivy_action_entry __ivy_actions[] = {\n')
+    for actname in actnames:
+        impl.append('    {{"{}",{},__ivy_handle_{}}},\n'.format(username(actname),len(im.module.actions[actname].formal_params),varname(actname)))
+    impl.append('    {0,0,0}\n};\n')
+    impl.append("""
+const int __ivy_num_actions = NUM;
+
+const __ivy_action_entry *__ivy_find_action(const char *name, size_t len) {
+    int lo = 0, hi = __ivy_num_actions;
+    while (lo < hi) {
+        int mid = (lo + hi) / 2;
+        int cmp = strncmp(__ivy_actions[mid].name,name,len);
+        if (cmp == 0 && __ivy_actions[mid].name[len])
+            cmp = 1;
+        if (cmp < 0)
+            lo = mid + 1;
+        else if (cmp > 0)
+            hi = mid;
+        else
+            return &__ivy_actions[mid];
+    }
+    return 0;
+}
+""".replace('NUM',str(len(actnames))))
+
+# Replay mode. With the option replay=file, the REPL executes the
+# commands in the file instead of reading them from the standard input,
+# and then exits. The file is mapped into memory (on Windows, it is
+# read into a buffer) and the commands are parsed in place. Each action
+# has its own vector of argument values, which is reused from one
+# command to the next, so that once the buffers have grown to fit,
+# parsing a command allocates no memory. There is no prompt and the
+# output is flushed only at exit.
+#
+# The file may be a text file with one command per line, as read by the
+# REPL, or a binary file as written by ivy_replay. A binary file starts
+# with the 8-byte magic "IVYCMD01", followed by the number of action
+# names and the names. Then there is one record per command: the index
+# of the name of its action, the number of arguments and the arguments.
+# A value is a tag followed by its contents: 0 for an atom (its text), 1
+# for an array (the number of elements and the elements) and 2 for a
+# struct (the number of fields and, for each field, its name and its
+# value). Numbers are unsigned LEB128 varints and texts are prefixed by
+# their length.
+
+def emit_replay(impl,classname):
+    impl.append("""
+std::string __ivy_replay_file;
+
+struct replay_error {
+    std::string txt;
+    replay_error(const std::string &txt) : txt(txt) {}
+};
+
+inline void __replay_white(const char *&p, const char *end) {
+    while (p < end && (*p == ' ' || *p == '\\t' || *p == '\\r'))
+        p++;
+}
+
+void __replay_ident(const char *line, const char *&p, const char *end, std::string &res) {
+    const char *start = p;
+    while (p < end && is_ident(*p))
+        p++;
+    if (p == start)
+        throw_syntax(p - line);
+    res.assign(start,p);
+}
+
+// Like parse_value, but reuses the storage of res
+
+void __replay_value(const char *line, const char *&p, const char *end, ivy_value &res) {
+    __replay_white(p,end);
+    res.pos = p - line;
+    res.atom.clear();
+    size_t num = 0;
+    if (p < end && *p == '[') {
+        while (true) {
+            p++;
+            __replay_white(p,end);
+            if (p < end && *p == ']')
+                break;
+            if (num == res.fields.size())
+                res.fields.push_back(ivy_value());
+            __replay_value(line,p,end,res.fields[num++]);
+            __replay_white(p,end);
+            if (p < end && *p == ']')
+                break;
+            if (!(p < end && *p == ','))
+                throw_syntax(p - line);
+        }
+        p++;
+    }
+    else if (p < end && *p == '{') {
+        while (true) {
+            p++;
+            __replay_white(p,end);
+            if (num == res.fields.size())
+                res.fields.push_back(ivy_value());
+            ivy_value &field = res.fields[num++];
+            field.pos = p - line;
+            __replay_ident(line,p,end,field.atom);
+            __replay_white(p,end);
+            if (!(p < end && *p == ':'))
+                throw_syntax(p - line);
+            p++;
+            field.fields.resize(1);
+            __replay_value(line,p,end,field.fields[0]);
+            __replay_white(p,end);
+            if (p < end && *p == '}')
+                break;
+            if (!(p < end && *p == ','))
+                throw_syntax(p - line);
+        }
+        p++;
+    }
+    else if (p < end && *p == '"') {
+        const char *start = ++p;
+        while (p < end && *p != '"')
+            p++;
+        if (p == end)
+            throw_syntax(p - line);
+        res.atom.assign(start,p++);
+    }
+    else
+        __replay_ident(line,p,end,res.atom);
+    res.fields.resize(num);
+}
+
+void __replay_call(classname_repl &ivy, const __ivy_action_entry *entry, std::vector<ivy_value> &args) {
+    ivy.__lock();
+    try {
+        entry->handler(ivy,args);
+    }
+    catch (...) {
+        ivy.__unlock();
+        throw;
+    }
+    ivy.__unlock();
+}
+
+void __replay_text(classname_repl &ivy, const char *begin, const char *end) {
+    std::vector<std::vector<ivy_value> > pool(__ivy_num_actions);
+    int lineno = 0;
+    for (const char *line = begin; line < end; ) {
+        const char *eol = (const char *)memchr(line,'\\n',end - line);
+        if (!eol)
+            eol = end;
+        lineno++;
+        const char *p = line;
+        try {
+            __replay_white(p,eol);
+            if (p != eol) {
+                const char *name = p;
+                while (p < eol && is_ident(*p))
+                    p++;
+                if (p == name)
+                    throw_syntax(p - line);
+                const __ivy_action_entry *entry = __ivy_find_action(name,p - name);
+                if (!entry)
+                    std::cerr << "undefined action: " << std::string(name,p - name) << std::endl;
+                else {
+                    std::vector<ivy_value> &args = pool[entry - __ivy_actions];
+                    unsigned num = 0;
+                    __replay_white(p,eol);
+                    if (p < eol && *p == '(') {
+                        do {
+                            p++;
+                            if (num == args.size())
+                                args.push_back(ivy_value());
+                            __replay_value(line,p,eol,args[num++]);
+                            __replay_white(p,eol);
+                        } while (p < eol && *p == ',');
+                        if (!(p < eol && *p == ')'))
+                            throw_syntax(p - line);
+                        p++;
+                        __replay_white(p,eol);
+                    }
+                    if (p != eol)
+                        throw_syntax(p - line);
+                    if (num != entry->arity) {
+                        std::string action(entry->name);
+                        throw bad_arity(action,entry->arity);
+                    }
+                    __replay_call(ivy,entry,args);
+                }
+            }
+        }
+        catch (syntax_error& err) {
+            std::cerr << "line " << lineno << ":" << err.pos << ": syntax error" << std::endl;
+        }
+        catch (out_of_bounds &err) {
+            std::cerr << "line " << lineno << ":" << err.pos << ": " << err.txt << " bad value" << std::endl;
+        }
+        catch (bad_arity &err) {
+            std::cerr << "action " << err.action << " takes " << err.num  << " input parameters" << std::endl;
+        }
+        line = eol + 1;
+    }
+}
+
+struct replay_binary_reader {
+    const char *p, *end;
+    replay_binary_reader(const char *p, const char *end) : p(p), end(end) {}
+    unsigned long long get_varint() {
+        unsigned long long res = 0;
+        for (int shift = 0; shift < 64; shift += 7) {
+            if (p >= end)
+                throw replay_error("truncated record");
+            unsigned char byte = *p++;
+            res |= ((unsigned long long)(byte & 0x7f)) << shift;
+            if (!(byte & 0x80))
+                return res;
+        }
+        throw replay_error("bad number");
+    }
+    unsigned long long get_count() {
+        unsigned long long res = get_varint();
+        if (res > (unsigned long long)(end - p))
+            throw replay_error("bad count");
+        return res;
+    }
+    void get_text(std::string &res) {
+        unsigned long long len = get_count();
+        res.assign(p,len);
+        p += len;
+    }
+    void get_value(ivy_value &res) {
+        unsigned long long tag = get_varint();
+        res.pos = 0;
+        res.atom.clear();
+        size_t num = 0;
+        if (tag == 0)
+            get_text(res.atom);
+        else if (tag == 1 || tag == 2) {
+            num = get_count();
+            if (res.fields.size() < num)
+                res.fields.resize(num);
+            for (size_t i = 0; i < num; i++) {
+                if (tag == 2) {
+                    ivy_value &field = res.fields[i];
+                    get_text(field.atom);
+                    field.fields.resize(1);
+                    get_value(field.fields[0]);
+                }
+                else
+                    get_value(res.fields[i]);
+            }
+        }
+        else
+            throw replay_error("bad value");
+        res.fields.resize(num);
+    }
+};
+
+void __replay_binary(classname_repl &ivy, const char *begin, const char *end) {
+    replay_binary_reader inp(begin,end);
+    std::vector<std::string> names(inp.get_count());
+    std::vector<const __ivy_action_entry *> entries;
+    for (size_t i = 0; i < names.size(); i++) {
+        inp.get_text(names[i]);
+        entries.push_back(__ivy_find_action(names[i].data(),names[i].size()));
+    }
+    std::vector<std::vector<ivy_value> > pool(names.size());
+    for (int cmdno = 1; inp.p < inp.end; cmdno++) {
+        unsigned long long idx = inp.get_varint();
+        if (idx >= names.size())
+            throw replay_error("bad action index");
+        std::vector<ivy_value> &args = pool[idx];
+        unsigned long long num = inp.get_count();
+        if (args.size() < num)
+            args.resize(num);
+        for (size_t i = 0; i < num; i++)
+            inp.get_value(args[i]);
+        try {
+            if (!entries[idx])
+                std::cerr << "undefined action: " << names[idx] << std::endl;
+            else if (num != entries[idx]->arity)
+                throw bad_arity(names[idx],entries[idx]->arity);
+            else
+                __replay_call(ivy,entries[idx],args);
+        }
+        catch (out_of_bounds &err) {
+            std::cerr << "command " << cmdno << ": " << err.txt << " bad value" << std::endl;
+        }
+        catch (bad_arity &err) {
+            std::cerr << "action " << err.action << " takes " << err.num  << " input parameters" << std::endl;
+        }
+    }
+}
+
+int __ivy_replay(classname_repl &ivy, const std::string &fname) {
+    __ivy_trace_flush = false;
+#ifdef _WIN32
+    std::ifstream f(fname.c_str(),std::ios::in | std::ios::binary);
+    if (!f) {
+        std::cerr << "cannot open to read: " << fname << std::endl;
+        return 1;
+    }
+    std::vector<char> buf((std::istreambuf_iterator<char>(f)),std::istreambuf_iterator<char>());
+    const char *data = buf.size() ? &buf[0] : "";
+    size_t size = buf.size();
+#else
+    int fd = ::open(fname.c_str(),O_RDONLY);
+    struct stat st;
+    if (fd < 0 || fstat(fd,&st) < 0) {
+        std::cerr << "cannot open to read: " << fname << std::endl;
+        return 1;
+    }
+    size_t size = st.st_size;
+    void *map = 0;
+    const char *data = "";
+    if (size) {
+        map = mmap(0,size,PROT_READ,MAP_PRIVATE,fd,0);
+        if (map == MAP_FAILED) {
+            perror("mmap failed");
+            return 1;
+        }
+        madvise(map,size,MADV_SEQUENTIAL);
+        data = (const char *)map;
+    }
+    ::close(fd);
+#endif
+    int res = 0;
+    try {
+        if (size >= 8 && memcmp(data,"IVYCMD01",8) == 0)
+            __replay_binary(ivy,data + 8,data + size);
+        else
+            __replay_text(ivy,data,data + size);
+    }
+    catch (replay_error &err) {
+        std::cerr << fname << ": " << err.txt << std::endl;
+        res = 1;
+    }
+#ifndef _WIN32
+    if (map)
+        munmap(map,size);
+#endif
+    __ivy_out.flush();
+    return res;
+}
 """.replace('classname',classname))
 
 
@@ -3638,6 +5530,7 @@ def emit_repl_boilerplate3(header,impl,classname):
 
     ivy.__unlock();
 
+    REPLAY
     cmd_reader *cr = new cmd_reader(ivy);
 
     // The main thread runs the console reader
@@ -3646,7 +5539,160 @@ def emit_repl_boilerplate3(header,impl,classname):
         cr->read();
     return 0;
 
+""".replace('classname',classname).replace('REPLAY',"""if (__ivy_replay_file.size())
+        return __ivy_replay(ivy,__ivy_replay_file);
+""" if target.get() == "repl" else ''))
+
+# With tester options branches=N and branch_at=K (by default half the
+# number of iterations), the tester runs K iterations, then explores N
+# continuations of the state it reached, each with its own random seed
+# (seed+1, ..., seed+N), for the remaining iterations. Each
+# continuation ends with "test_completed". On POSIX systems, the
+# continuations are run in child processes created by fork, one after
+# the other, and the tester fails if any of them fails. With
+# branch_fork=false or on Windows, they are run in the tester process,
+# restoring a snapshot of the state before each. Only the state of the
+# class is restored, so branching is meant for tests driven by the
+# generators, not by network input.
+
+def emit_start_branches(impl,classname):
+    impl.append("""
+int start_branches(classname_repl &ivy, classname::__snapshot *&snapshot, int branches, bool branch_fork, int seed) {
+#ifndef _WIN32
+    if (branch_fork) {
+        __ivy_out.flush();
+        COV_PREFIX
+        int failed = 0;
+        for (int branch = 0; branch < branches; branch++) {
+            pid_t pid = fork();
+            if (pid < 0) {
+                perror("fork failed");
+                __ivy_exit(1);
+            }
+            if (pid == 0) {
+                srand(seed + branch + 1);
+                COV_CHILD
+                return branch;
+            }
+            int status;
+            if (waitpid(pid,&status,0) < 0 || !WIFEXITED(status) || WEXITSTATUS(status)) {
+                std::cerr << "branch " << branch << " (seed " << seed + branch + 1 << ") failed" << std::endl;
+                failed = 1;
+            }
+        }
+        COV_JOIN
+        _exit(failed);  // the branches have written the trace
+    }
+#endif
+    snapshot = new classname::__snapshot;
+    ivy.__save(*snapshot);
+    srand(seed + 1);
+    return 0;
+}
+""".replace('classname',classname)
+       .replace('COV_PREFIX','std::vector<unsigned long long> cov_prefix = __ivy_cov_counts();' if opt_coverage.get() else '')
+       .replace('COV_CHILD','__ivy_cov_file = __ivy_cov_branch_file(branch);' if opt_coverage.get() else '')
+       .replace('COV_JOIN','__ivy_cov_join_branches(branches,cov_prefix);' if opt_coverage.get() else ''))
+
+# With tester option snapshot=FILE, the state reached after branch_at
+# iterations is written to FILE, and with restore=FILE the tester
+# starts from the state in FILE instead of a generated initial state,
+# at iteration branch_at, after reseeding with the seed. A failure of
+# branch B of a run with seed S can thus be reproduced from the
+# snapshot of that run with restore=FILE seed=S+B+1, as far as the
+# generators make the same choices. The file holds the __snapshot in
+# the compact format of the serializer. A function over a large sort
+# (a hash_thunk) is written as its values over the whole domain, so
+# the domain must be finite and of at most snapshot_file_thresh
+# elements. Values of native or variant types cannot be saved.
+
+snapshot_file_thresh = 1 << 20
+
+def snapshot_file_blocker():
+    for sym in snapshot_members():
+        if is_native_sym(sym) or il.is_uninterpreted_sort(sym.sort.rng) and sym.sort.rng in sort_to_cpptype:
+            return sym
+        cards = map(sort_card,sym.sort.dom if hasattr(sym.sort,'dom') else [])
+        if not all(cards) or reduce(mul,cards,1) > snapshot_file_thresh:
+            return sym
+    return None
+
+def emit_snapshot_elems(impl,sym,classname,indent_by,elem):
+    """ Emit a loop over the values of member sym of the snapshot "s",
+    calling elem with the C++ expression for each value """
+    if is_large_type(sym.sort):
+        dom = sym.sort.dom
+        dims = map(sort_card,dom)
+        ctys = [ctypefull(d,classname=classname) for d in dom]
+        args = ['__i{}'.format(i) if cty == 'int' else '({}) __i{}'.format(cty,i) for i,cty in enumerate(ctys)]
+        key = args[0] if len(dom) == 1 else '{}({})'.format(ctuple(dom,classname=classname),','.join(args))
+        val = 's.{}[{}]'.format(varname(sym),key)
+    else:
+        dims = ctype_function(sym.sort,classname=classname)[1]
+        val = 's.{}{}'.format(varname(sym),''.join('[__i{}]'.format(i) for i in range(len(dims))))
+    for i,d in enumerate(dims):
+        impl.append('    ' * (i+indent_by) + 'for (int __i{0} = 0; __i{0} < {1}; __i{0}++)\n'.format(i,d))
+    impl.append('    ' * (len(dims)+indent_by) + elem(val) + ';\n')
+
+def emit_snapshot_file(impl,classname):
+    progress = set(df.args[0].rep for df in im.module.progress)
+    blocker = snapshot_file_blocker()
+    if blocker is not None:
+        impl.append("""
+bool __ivy_write_snapshot(const std::string &fname, classname::__snapshot &s) {
+    std::cerr << "cannot write a snapshot file: the state component NAME cannot be serialized" << std::endl;
+    return false;
+}
+
+bool __ivy_read_snapshot(const std::string &fname, classname::__snapshot &s) {
+    std::cerr << "cannot read a snapshot file: the state component NAME cannot be serialized" << std::endl;
+    return false;
+}
+""".replace('classname',classname).replace('NAME',str(blocker)))
+        return
+    impl.append("""
+bool __ivy_write_snapshot(const std::string &fname, classname::__snapshot &s) {
+    ivy_compact_ser res;
+    res.set(std::string("ivy snapshot classname"));
 """.replace('classname',classname))
+    for sym in snapshot_members():
+        cty = 'int' if sym in progress else ctype(sym.sort.rng,classname=classname)
+        emit_snapshot_elems(impl,sym,classname,1,lambda val: '__ser<{}>(res,{})'.format(cty,val))
+    impl.append("""    std::ofstream f(fname.c_str(),std::ios::out | std::ios::binary);
+    f.write(res.res.size() ? &res.res[0] : 0,res.res.size());
+    f.close();
+    if (!f) {
+        std::cerr << "cannot write snapshot file: " << fname.c_str() << std::endl;
+        return false;
+    }
+    return true;
+}
+
+bool __ivy_read_snapshot(const std::string &fname, classname::__snapshot &s) {
+    std::ifstream f(fname.c_str(),std::ios::in | std::ios::binary);
+    if (!f) {
+        std::cerr << "cannot open snapshot file: " << fname.c_str() << std::endl;
+        return false;
+    }
+    std::vector<char> buf((std::istreambuf_iterator<char>(f)),std::istreambuf_iterator<char>());
+    try {
+        ivy_compact_deser inp(buf);
+        std::string tag;
+        inp.get(tag);
+        if (tag != "ivy snapshot classname")
+            throw deser_err();
+""".replace('classname',classname))
+    for sym in snapshot_members():
+        emit_snapshot_elems(impl,sym,classname,2,lambda val: '__deser(inp,{})'.format(val))
+    impl.append("""        inp.end();
+    }
+    catch (deser_err &) {
+        std::cerr << "not a snapshot of this tester: " << fname.c_str() << std::endl;
+        return false;
+    }
+    return true;
+}
+""")
 
 def emit_repl_boilerplate3test(header,impl,classname):
     impl.append("""
@@ -3683,7 +5729,32 @@ def emit_repl_boilerplate3test(header,impl,classname):
     LARGE_INTEGER freq;
     QueryPerformanceFrequency(&freq);
 #endif
-    for(int cycle = 0; cycle < test_iters; cycle++) {
+    if (branch_at < 0)
+        branch_at = test_iters / 2;
+    classname::__snapshot *snapshot = 0;
+    int branch = -1;
+    int first_cycle = 0;
+    if (restore_file.size()) {
+        classname::__snapshot restored;
+        if (!__ivy_read_snapshot(restore_file,restored))
+            __ivy_exit(1);
+        ivy.__restore(restored);
+        srand(seed);
+        first_cycle = branch_at;
+    }
+    while (true) {
+    for(int cycle = first_cycle; cycle < test_iters; cycle++) {
+
+        if (cycle == branch_at && branch < 0) {
+            if (snapshot_file.size()) {
+                classname::__snapshot saved;
+                ivy.__save(saved);
+                if (!__ivy_write_snapshot(snapshot_file,saved))
+                    __ivy_exit(1);
+            }
+            if (branches > 0)
+                branch = start_branches(ivy,snapshot,branches,branch_fork,seed);
+        }
 
         int choices = num_gens + readers.size() + timers.size();
         int rnd = choices ? (rand() % choices) : 0;
@@ -3785,10 +5856,18 @@ def emit_repl_boilerplate3test(header,impl,classname):
             }
         }            
     }
+        if (!snapshot || ++branch == branches)
+            break;
+        __ivy_out << "test_completed" << __ivy_endl;
+        ivy.__restore(*snapshot);
+        srand(seed + branch + 1);
+        first_cycle = branch_at;
+    }
+    delete snapshot;
 #ifdef _WIN32
                 Sleep(final_ms);  // HACK: wait for late responses
 #endif
-    __ivy_out << "test_completed" << std::endl;
+    __ivy_out << "test_completed" << __ivy_endl;
     for (unsigned i = 0; i < readers.size(); i++)
         delete readers[i];
     readers.clear();
@@ -3818,7 +5897,7 @@ public:
     z3::model model;
 
 protected:
-    gen(): slvr(ctx), model(ctx,(Z3_model)0) {}
+    gen(): slvr(ctx), model(ctx,(Z3_model)0), state_retired(0), state_ctr(0) {}
 
     hash_map<std::string, z3::sort> enum_sorts;
     hash_map<Z3_sort, z3::func_decl_vector> enum_values;
@@ -3829,6 +5908,12 @@ protected:
     std::vector<Z3_symbol> decl_names;
     std::vector<Z3_func_decl> decls;
     std::vector<z3::expr> alits;
+    std::vector<z3::expr> fmlas;        // formulas added by the constructor
+    std::vector<z3::expr> state_lits;   // assumption literal of each state cell
+    std::vector<int> state_vals;        // value of each state cell in the solver
+    std::vector<bool> state_known;      // cells encoded since the last reset
+    unsigned state_retired;             // encodings no longer assumed
+    unsigned state_ctr;
 
 
 public:
@@ -4064,6 +6149,39 @@ public:
         randomize(decl_name,3,args);
     }
 
+    bool cell_changed(unsigned idx, int value) {
+        if (idx >= state_vals.size()) {
+            state_lits.resize(idx+1,ctx.bool_val(true));
+            state_vals.resize(idx+1);
+            state_known.resize(idx+1,false);
+        }
+        return !state_known[idx] || state_vals[idx] != value;
+    }
+
+    void set_cell(unsigned idx, const z3::expr &apply_expr, int value) {
+        std::ostringstream ss;
+        ss << "slit:" << state_ctr++;
+        z3::expr lit = ctx.bool_const(ss.str().c_str());
+        slvr.add(!lit || apply_expr == int_to_z3(apply_expr.get_sort(),value));
+        if (state_known[idx])
+            state_retired++;
+        state_lits[idx] = lit;
+        state_vals[idx] = value;
+        state_known[idx] = true;
+    }
+
+    bool state_stale() {
+        return state_retired > 1024 + 2 * state_lits.size();
+    }
+
+    void reset_state() {
+        slvr.reset();
+        for (unsigned i = 0; i < fmlas.size(); i++)
+            slvr.add(fmlas[i]);
+        state_known.assign(state_known.size(),false);
+        state_retired = 0;
+    }
+
     void push(){
         slvr.push();
     }
@@ -4142,6 +6260,7 @@ public:
         z3::expr fmla(ctx,Z3_parse_smtlib2_string(ctx, z3inp.c_str(), sort_names.size(), &sort_names[0], &sorts[0], decl_names.size(), &decl_names[0], &decls[0]));
         ctx.check_error();
 
+        fmlas.push_back(fmla);
         slvr.add(fmla);
     }
 
@@ -4149,10 +6268,22 @@ public:
         // std::cout << alits.size();
         static bool show_model = true;
         while(true){
-            z3::check_result res = slvr.check(alits.size(),&alits[0]);
+            std::vector<z3::expr> assumptions;
+            for (unsigned i = 0; i < state_lits.size(); i++)
+                if (state_known[i])
+                    assumptions.push_back(state_lits[i]);
+            assumptions.insert(assumptions.end(),alits.begin(),alits.end());
+            z3::check_result res = slvr.check(assumptions.size(),&assumptions[0]);
             if (res != z3::unsat)
                 break;
-            z3::expr_vector core = slvr.unsat_core();
+            z3::expr_vector all_core = slvr.unsat_core();
+            std::vector<z3::expr> core;  // the state literals can't be deleted
+            for (unsigned i = 0; i < all_core.size(); i++)
+                for (unsigned j = 0; j < alits.size(); j++)
+                    if (z3::eq(alits[j],all_core[i])) {
+                        core.push_back(all_core[i]);
+                        break;
+                    }
             if (core.size() == 0){
 //                if (__ivy_modelfile.is_open()) 
 //                    __ivy_modelfile << "begin unsat:\\n" << slvr << "end unsat:\\n" << std::endl;
@@ -4202,6 +6333,15 @@ opt_compiler = iu.EnumeratedParameter("compiler",["g++","cl","default"],"default
 opt_main = iu.Parameter("main","main")
 opt_stdafx = iu.BooleanParameter("stdafx",False)
 opt_outdir = iu.Parameter("outdir","")
+opt_coverage = iu.BooleanParameter("coverage",False)
+opt_quant_index = iu.BooleanParameter("quant_index",False)
+opt_memo_derived = iu.EnumeratedParameter("memo_derived",["none","lazy","eager"],"none")
+opt_incremental_state = iu.BooleanParameter("incremental_state",True)
+opt_object_locks = iu.BooleanParameter("object_locks",False)
+opt_ser_bench = iu.BooleanParameter("ser_bench",False)
+opt_ser_format = iu.EnumeratedParameter("ser_format",["binary","compact"],"binary")
+opt_trace_format = iu.EnumeratedParameter("trace_format",["text","binary"],"text")
+opt_shards = iu.Parameter("shards","1")
 
 emit_main = True
 
@@ -4209,6 +6349,8 @@ def main():
     ia.set_determinize(True)
     slv.set_use_native_enums(True)
     iso.set_interpret_all_sorts(True)
+    params = [a for a in sys.argv[1:] if '=' in a and a.split('=',1)[0] not in
+              ['target','build','pgo','pgo_trace','classname','outdir','isolate','object_locks']]
     ivy_init.read_params()
     iu.set_parameters({'coi':'false',"create_imports":'true',"enforce_axioms":'true','ui':'none','isolate_mode':'test'})
     if target.get() == "gen":
@@ -4226,21 +6368,21 @@ def main():
         ivy_init.ivy_init(create_isolate=False)
 
         isolate = ic.isolate.get()
-        if isolate != None:
-            isolates = [isolate]
-        else:
-            if isolate == 'all':
-                if target.get() == 'repl':
-                    isolates = sorted(list(m for m in im.module.isolates if isinstance(m,ivy_ast.ExtractDef)))
-                else:
-                    isolates = sorted(list(m for m in im.module.isolates if not isinstance(m,ivy_ast.ExtractDef)))
+        if isolate == 'all':
+            if target.get() == 'repl':
+                isolates = sorted(list(m for m in im.module.isolates if isinstance(im.module.isolates[m],ivy_ast.ExtractDef)))
             else:
-                isolates = [isolate]
+                isolates = sorted(list(m for m in im.module.isolates if not isinstance(im.module.isolates[m],ivy_ast.ExtractDef)))
+        else:
+            isolates = [isolate]
                 
-            if len(isolates) == 0:
-                isolates = [None]
+        if len(isolates) == 0:
+            isolates = [None]
 
-        for the_isolate in isolates:
+        basenames = []
+        sources = dict()
+        skip_imports = set()
+        for isolate in isolates:
             with im.module.copy():
                 with iu.ErrorPrinter():
 
@@ -4269,48 +6411,38 @@ def main():
                     f = open(outfile(basename+'.cpp'),'w')
                     f.write(impl)
                     f.close()
-                if opt_build.get():
-                    import platform
-                    import os
-                    if platform.system() == 'Windows':
-                        if 'Z3DIR' in os.environ:
-                            z3incspec = '/I %Z3DIR%\\include'
-                            z3libspec = '/LIBPATH:%Z3DIR%\\lib /LIBPATH:%Z3DIR%\\bin'
-                        else:
-                            import z3
-                            z3path = os.path.dirname(os.path.abspath(z3.__file__))
-                            z3incspec = '/I {}'.format(z3path)
-                            z3libspec = '/LIBPATH:{}'.format(z3path)
-                        vsdir = find_vs()
-                        if opt_compiler.get() != 'g++':
-                            cmd = '"{}\\VC\\vcvarsall.bat"& cl /EHsc /Zi {}.cpp ws2_32.lib'.format(vsdir,basename)
-                            if target.get() in ['gen','test']:
-                                cmd = '"{}\\VC\\vcvarsall.bat"& cl /EHsc /Zi {} {}.cpp ws2_32.lib libz3.lib /link {}'.format(vsdir,z3incspec,basename,z3libspec)
-                        else:
-                            cmd = "g++ -I %Z3DIR%/include -L %Z3DIR%/lib -L %Z3DIR%/bin -g -o {} {}.cpp -lws2_32".format(basename,basename)
-                            if target.get() in ['gen','test']:
-                                cmd = cmd + ' -lz3'
-                        if opt_outdir.get():
-                            cmd = 'cd {} & '.format(opt_outdir.get()) + cmd
-                    else:
-                        if 'Z3DIR' in os.environ:
-                            paths = '-I $Z3DIR/include -L $Z3DIR/lib -Wl,-rpath=$Z3DIR/lib' 
-                        else:
-                            _dir = os.path.dirname(os.path.abspath(__file__))
-                            paths = '-I {} -L {} -Wl,-rpath={}'.format(_dir,_dir,_dir)
-                        if emit_main:
-                            cmd = "g++ {} -g -o {} {}.cpp".format(paths,basename,basename)
-                        else:
-                            cmd = "g++ {} -g -c {}.cpp".format(paths,basename)
-                        if target.get() in ['gen','test']:
-                            cmd = cmd + ' -lz3'
-                        cmd += ' -pthread'
-                    print cmd
-                    import sys
-                    sys.stdout.flush()
-                    status = os.system(cmd)
-                    if status:
-                        exit(1)
+                    if opt_coverage.get():
+                        write_coverage_map(outfile(basename+'.cov.map'))
+                    sources[basename] = [basename+'.cpp']
+                    if impl_shards:
+                        f = open(outfile(basename+'_shard.h'),'w')
+                        f.write(shard_header)
+                        f.close()
+                    for idx,shard in enumerate(impl_shards):
+                        name = '{}_shard{}.cpp'.format(basename,idx+1)
+                        f = open(outfile(name),'w')
+                        f.write(shard)
+                        f.close()
+                        sources[basename].append(name)
+                basenames.append(basename)
+                # calls leading to imports that return values can't be replayed for pgo=true
+                skip_imports.update(imp.imported()[5:] for imp in im.module.imports if not imp.scope()
+                                    and imp.imported() in im.module.actions
+                                    and im.module.actions[imp.imported()].formal_returns)
+        if ivy_build.opt_pgo.get():
+            with iu.ErrorPrinter():
+                ivy_build.build_pgo(basenames,isolates,sources,opt_outdir.get(),emit_main,sys.argv[1],params,skip_imports)
+        elif opt_build.get():
+            with iu.ErrorPrinter():
+                ivy_build.build(basenames,sources,opt_outdir.get(),emit_main,target.get() in ['gen','test'],
+                                pch_header(),find_vs,opt_compiler.get())
+
+def pch_header():
+    """ The headers shared by all generated code, to be precompiled """
+    res = ivy_build.pch_includes
+    if target.get() in ["gen","test"]:
+        res += '#include "z3++.h"\n'
+    return res + hash_h
 
 def outfile(name):
     return (opt_outdir.get() + '/' + name) if opt_outdir.get() else name
@@ -35,7 +35,7 @@ from ivy_logic_utils import used_symbols_clauses, rename_clauses, clauses_using_
     relations_clauses, eq_lit, condition_clauses, or_clauses, ite_clauses, and_clauses, false_clauses, true_clauses,\
     formula_to_clauses, clauses_to_formula, formula_to_clauses_tseitin, is_ground_clause, \
     relations_clause, Clauses, sym_inst, negate_clauses, negate
-from ivy_solver import unsat_core, clauses_imply, clauses_imply_formula, clauses_sat, clauses_case, get_model_clauses, clauses_model_to_clauses, get_small_model
+from ivy_solver import unsat_core, clauses_imply, clauses_imply_formula, clauses_sat, clauses_case, get_model_clauses, clauses_model_to_clauses, get_small_model, ModelFacts, name_universe_elements
 import ivy_logic
 import ivy_logic_utils as lu
 import ivy_utils as iu
@@ -587,6 +587,13 @@ class History(object):
 #            print "core = {}".format(unsat_core(post,true_clauses()))
             return None
 
+        if isinstance(final_cond,list):
+            final_cond = or_clauses(*[fc.cond() for fc in final_cond])
+        all_clauses = and_clauses(post,final_cond) if final_cond != None else post
+        # the symbols of the history are collected and evaluated in
+        # the model once, and projected onto each time below
+        facts = ModelFacts(model,all_clauses)
+
         # we reconstruct the sub-model for each state composing the
         # recorded renamings in reverse order. Here "renaming" maps
         # symbols representing a past time onto current time skolems
@@ -596,11 +603,7 @@ class History(object):
             img = set(renaming[s] for s in renaming if not s.is_skolem())
             ignore = lambda s: self.ignore(s,img,renaming)
             # get the sub-mode for the given past time as a formula
-            
-            if isinstance(final_cond,list):
-                final_cond = or_clauses(*[fc.cond() for fc in final_cond])
-            all_clauses = and_clauses(post,final_cond) if final_cond != None else post
-            clauses = clauses_model_to_clauses(all_clauses,ignore = ignore, model = model, numerals=use_numerals())
+            clauses = name_universe_elements(model,facts.facts(ignore),use_numerals())
             # map this formula into the past using inverse map
             clauses = rename_clauses(clauses,inverse_map(renaming))
             # remove tautology equalities, TODO: not sure if this is correct here
@@ -5,7 +5,8 @@ from ivy_resolution import mgu_eq
 from ivy_logic import *
 from ivy_logic_utils import * 
 import ivy_congclos as congclos
-from collections import defaultdict
+from ivy_congclos import is_ground_term
+from collections import defaultdict, OrderedDict
 import ivy_logic
 
 def verbose():
@@ -115,14 +116,71 @@ def get_specializations(cl,specs):
         for lit in clspecs:
             specs[lit.atom.args[0].rep].add(lit.atom.args[1].rep)
 
-def make_index():
-    return [[],[],defaultdict(make_index)]
-
-def index_lookup(index,lit):
-    index = index[lit.polarity][lit.atom.relname]
-    for t in lit.atom.args:
-        index = index[2]["V" if isinstance(t,Variable) else t.rep]
-    return index
+class IndexNode(object):
+    """ A node of a literal index. The path from the root to a node is
+    the sequence of keys of the arguments of a literal (see
+    index_key). A node holds the unit
+    literals and the clause literals (as (clause,literal) pairs) with
+    its path. """
+
+    def __init__(self):
+        self.units = []
+        self.watches = OrderedDict()
+        self.children = dict()
+        self.classes = None
+        self.version = None
+
+    def child(self,key):
+        res = self.children.get(key)
+        if res is None:
+            res = self.children[key] = IndexNode()
+            self.classes = None
+        return res
+
+    def class_children(self,term):
+        """ The children whose key is equal to term in the current
+        equational theory. The children are grouped by the
+        representatives of their keys, and the grouping is recomputed
+        only when the theory changes. """
+        # adding terms to the closure can merge classes by congruence,
+        # so term and the keys are added before grouping
+        equational_theory.find(term)
+        if self.classes is None or self.version != equational_theory.version:
+            keys = [key for key in self.children if key != "V"]
+            for key in keys:
+                equational_theory.find(key)
+            self.classes = defaultdict(list)
+            for key in keys:
+                self.classes[equational_theory.find(key)].append(self.children[key])
+            self.version = equational_theory.version
+        return self.classes.get(equational_theory.find(term),[])
+
+def index_key(term):
+    """ The key of an argument in the index: the term itself if it is
+    ground, else "V". Candidates found with the index must still be
+    checked by matching. """
+    return term if is_ground_term(term) else "V"
+
+class LitIndex(object):
+    """ Discrimination tree of literals, with one tree for each polarity
+    and relation """
+
+    def __init__(self):
+        self.roots = [dict(),dict()]
+
+    def root(self,lit):
+        return self.roots[lit.polarity].get(lit.atom.relname)
+
+    def lookup(self,lit):
+        """ The node of lit, created if needed """
+        roots = self.roots[lit.polarity]
+        name = lit.atom.relname
+        node = roots.get(name)
+        if node is None:
+            node = roots[name] = IndexNode()
+        for t in lit.atom.args:
+            node = node.child(index_key(t))
+        return node
 
 equational_theory = None
 
@@ -147,82 +205,80 @@ def find_term(term):
         return term
     return equational_theory.find(term)
 
-def ground_match(term,index):
+def ground_match(term,node):
     if equational_theory == None:
-        yield term.rep
-    else:
-        trep = equational_theory.find(term)
-        for t2 in index:
-            if equational_theory.find_by_name(t2) is trep:
-                yield t2
+        child = node.children.get(term)
+        return [child] if child is not None else []
+    return node.class_children(term)
 
-def find_subsumed_rec(index, terms, idx):
+def find_subsumed_rec(node, terms, idx):
     if idx >= len(terms):
-        yield index
+        yield node
         return
     t = terms[idx]
-    if isinstance(t,Variable):
-        for x,sub_index in index[2].iteritems():
-            for y in find_subsumed_rec(sub_index, terms, idx+1):
+    if not is_ground_term(t):
+        for sub_node in node.children.itervalues():
+            for y in find_subsumed_rec(sub_node, terms, idx+1):
                 yield y
     else:
-        for t2 in ground_match(t,index[2]):
-            for y in find_subsumed_rec(index[2][t2], terms, idx+1):
+        for sub_node in ground_match(t,node):
+            for y in find_subsumed_rec(sub_node, terms, idx+1):
                 yield y
         
-def find_subsuming_rec(index, terms, idx):
+def find_subsuming_rec(node, terms, idx):
     if idx >= len(terms):
-        yield index
+        yield node
         return
     t = terms[idx]
-    if "V" in index[2]:
-        for y in find_subsuming_rec(index[2]["V"], terms, idx+1):
+    if "V" in node.children:
+        for y in find_subsuming_rec(node.children["V"], terms, idx+1):
             yield y
-    if not isinstance(t,Variable):
-        for t2 in ground_match(t,index[2]):
-            for y in find_subsuming_rec(index[2][t2], terms, idx+1):
+    if is_ground_term(t):
+        for sub_node in ground_match(t,node):
+            for y in find_subsuming_rec(sub_node, terms, idx+1):
                 yield y
 
-def find_unifying_rec(index, terms, idx):
+def find_unifying_rec(node, terms, idx):
     if idx >= len(terms):
-        yield index
+        yield node
         return
     t = terms[idx]
-    if isinstance(t,Variable) or t.rep.startswith('__v'):
-        for x,sub_index in index[2].iteritems():
-            for y in find_unifying_rec(sub_index, terms, idx+1):
+    if not is_ground_term(t) or t.rep.startswith('__v'):
+        for sub_node in node.children.itervalues():
+            for y in find_unifying_rec(sub_node, terms, idx+1):
                 yield y
     else:
-        if "V" in index[2]:
-            for y in find_unifying_rec(index[2]["V"], terms, idx+1):
+        if "V" in node.children:
+            for y in find_unifying_rec(node.children["V"], terms, idx+1):
                 yield y
-        for t2 in ground_match(t,index[2]):
-            for y in find_unifying_rec(index[2][t2], terms, idx+1):
+        for sub_node in ground_match(t,node):
+            for y in find_unifying_rec(sub_node, terms, idx+1):
                 yield y
 
+def find_rec(find,index,lit):
+    node = index.root(lit)
+    if node is None:
+        return iter([])
+    return find(node,lit.atom.args,0)
 
 def find_subsumed(index,lit):
-    index = index[lit.polarity][lit.atom.relname]
-    return find_subsumed_rec(index,lit.atom.args,0)
+    return find_rec(find_subsumed_rec,index,lit)
 
 def find_subsuming(index,lit):
-    index = index[lit.polarity][lit.atom.relname]
-    return find_subsuming_rec(index,lit.atom.args,0)
+    return find_rec(find_subsuming_rec,index,lit)
 
 def find_unifying(index,lit):
-    index = index[lit.polarity][lit.atom.relname]
-    return find_unifying_rec(index,lit.atom.args,0)
+    return find_rec(find_unifying_rec,index,lit)
 
 def lit_rep(lit):
     if equational_theory == None:
         return lit
-    terms = [(a if isinstance(a,Variable) else equational_theory.find(a)) for a in lit.atom.args]
-    return Literal(lit.polarity,Atom(lit.atom.relname,terms))
+    return equational_theory.lit_rep(lit)
 
 def clause_rep(clause):
     if equational_theory == None:
         return clause
-    return [lit_rep(l) for l in clause]
+    return equational_theory.clause_rep(clause)
 
 def lit_subsume_mod_eq(lit1,lit2,env):
     return lit_subsume(lit_rep(lit1),lit_rep(lit2),env)
@@ -236,9 +292,10 @@ class UnitRes(object):
 
     def __init__(self,clauses):
         self.clauses = [] # copy the clauses
-        self.index = [defaultdict(make_index),defaultdict(make_index)]
+        self.index = LitIndex()
         self.unit_queue = []
-        self.subsumed = []
+        self.subsumed = set()
+        self.simplified = 0 # clauses below this index are simplified
         self.unsat = False
         self.used_units = 0
         self.stack = []
@@ -259,8 +316,8 @@ class UnitRes(object):
 
     def unit_subsumed_basic(self,lit):
         subsuming = find_subsuming(self.index,lit)
-        for index in subsuming:
-            for lit2_idx in index[0]:
+        for node in subsuming:
+            for lit2_idx in node.units:
                 lit2 = self.unit_queue[lit2_idx]
                 if lit_subsume_mod_eq(lit2,lit,dict()):
                     return True
@@ -280,7 +337,7 @@ class UnitRes(object):
             lit = lit_rep(canonize_literal_vars(cl[0]))
             if not is_taut_lit(lit) and not self.unit_subsumed(lit):
                 litid = lit_id(lit)
-                index_lookup(self.index,lit)[0].append(len(self.unit_queue))
+                self.index.lookup(lit).units.append(len(self.unit_queue))
                 self.unit_queue.append(lit)
                 self.unit_queue_gen.append(gen)
                 self.unit_ids.add(litid)
@@ -309,25 +366,24 @@ class UnitRes(object):
                             self.add_clause_basic(new_cl,gen)
 
     def update_equational_theory(self,lit):
-        if lit.polarity == 1 and lit.atom.relname == '=':
+        if is_ground_equality_lit(lit):
             t0,t1 = lit.atom.args[0],lit.atom.args[1]
-            if isinstance(t0,Constant) and isinstance(t1,Constant):
-                equational_theory.union(t0,t1)
-                if verbose():
-                    print "merged %s %s" % (t0,t1)
+            equational_theory.union(t0,t1)
+            if verbose():
+                print "merged %s %s" % (t0,t1)
 
     def get_watching(self,lit):
-        return index_lookup(self.index,lit)[1]
+        return self.index.lookup(lit).watches
 
     def deindex(self,i):
         for j in range(0,len(self.clauses[i])):
             lit = self.clauses[i][j]
             wl = self.get_watching(lit)
-            wl.remove((i,j))
+            del wl[(i,j)]
 
     def reindex(self,i):
         for j,lit in enumerate(self.clauses[i]):
-            self.get_watching(lit).append((i,j))
+            self.get_watching(lit)[(i,j)] = None
 
     def index_unit_terms(self,i):
         used = set()
@@ -352,8 +408,8 @@ class UnitRes(object):
 
     def unit_subsumed_by_used(self,lit):
         subsuming = find_subsuming(self.index,lit)
-        for index in subsuming:
-            for lit2_idx in index[0]:
+        for node in subsuming:
+            for lit2_idx in node.units:
                 if lit2_idx < self.used_units:
                     lit2 = self.unit_queue[lit2_idx]
                     if lit_subsume_mod_eq(lit2,lit,dict()):
@@ -436,7 +492,7 @@ class UnitRes(object):
             indices = list(find_unifying(self.index,Literal(1 - lit.polarity,lit.atom))) # save this in cas index changes
             lit = lit_rep(canonize_literal_unique(lit))
             for index in indices:
-                wl = index[1]
+                wl = index.watches
     #        print "%s -- %s" % (lit,wl)
                 for i,j in list(wl): # copy the list in case we modify it
                     cl = self.clauses[i]
@@ -452,7 +508,7 @@ class UnitRes(object):
                     if match and self.allow_eqs(lit,eqs,False,cl):
                         if atom_subsume(lit.atom,lit2.atom):
                             self.deindex(i)
-                            self.subsumed.append(i)
+                            self.subsumed.add(i)
         #                print "lit: %s" % lit
                         new_cl = [substitute_lit(lit1, subs) for k,lit1 in enumerate(cl) if k != j] + [Literal(0,eq) for eq in eqs]
                         if not new_specialization and not (specs == None):
@@ -469,7 +525,7 @@ class UnitRes(object):
                                 return
                 
                 if keep:
-                    self.resolve_units(lit,index[0],gen,False) # have to unify against units too!
+                    self.resolve_units(lit,index.units,gen,False) # have to unify against units too!
                     if self.unsat:
                         return
             # if we are not keeping this unit as a consequence,
@@ -524,6 +580,34 @@ class UnitRes(object):
                 self.index_unit_terms(j) # this lit might get rewritten later
         ivy_logic.allow_unsorted = save_thing
 
+    def simplify(self,simp):
+        """
+        Replace each clause cl that is not subsumed by simp(cl), which
+        must be a sub-clause of cl. Returns true if any clause was
+        replaced, in which case propagate should be called again. The
+        clauses are simplified only once, so the index is kept across
+        rounds of propagation and simplification.
+        """
+        changed = False
+        while self.simplified < len(self.clauses) and not self.unsat:
+            i = self.simplified
+            self.simplified += 1
+            if i in self.subsumed:
+                continue
+            cl = self.clauses[i]
+            new_cl = simp(cl)
+            if len(new_cl) < len(cl):
+                self.deindex(i)
+                self.subsumed.add(i)
+                self.add_clause(new_cl,self.clauses_gen[i])
+                changed = True
+        return changed
+
+    def consequences(self):
+        """ The units and the clauses that are not subsumed """
+        return ([[lit] for lit in self.unit_queue]
+                + [cl for i,cl in enumerate(self.clauses) if i not in self.subsumed])
+
 def keep_atom(atom):
     name = atom.relname
     if name.is_skolem():
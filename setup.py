@@ -14,7 +14,7 @@ setup(name='ms_ivy',
           'tarjan'
       ],
       entry_points = {
-        'console_scripts': ['ivy=ivy.ivy:main','ivy_check=ivy.ivy_check:main','ivy_to_cpp=ivy.ivy_to_cpp:main','ivy_show=ivy.ivy_show:main','ivy_ev_viewer=ivy.ivy_ev_viewer:main',],
+        'console_scripts': ['ivy=ivy.ivy:main','ivy_check=ivy.ivy_check:main','ivy_to_cpp=ivy.ivy_to_cpp:main','ivy_show=ivy.ivy_show:main','ivy_ev_viewer=ivy.ivy_ev_viewer:main','ivy_test_farm=ivy.ivy_test_farm:main','ivy_coverage=ivy.ivy_coverage:main','ivy_replay=ivy.ivy_replay:main','ivy_infer=ivy.ivy_infer:main','ivy_bmc=ivy.ivy_bmc:main',],
         },
       zip_safe=False)
 
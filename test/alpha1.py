@@ -0,0 +1,69 @@
+# Checks that the cube cache of ivy_alpha gives the same abstract
+# states as fresh cube tests, on the states reached by a few abstract
+# steps of the bakery example, sequentially and with alpha_jobs=2, and
+# times the runs. The reference keys cube tests by the cube alone, in
+# a table used for one state only, so it does not depend on
+# TheoryIndex or on cube_key.
+
+import sys
+import re
+import time
+
+import ivy.ivy_init as ivy_init
+import ivy.ivy_module as im
+import ivy.ivy_isolate as ivy_isolate
+import ivy.ivy_art as ivy_art
+import ivy.ivy_alpha as ivy_alpha
+import ivy.ivy_interp as itp
+
+fn = '../examples/ivy/bakery.ivy'
+depth = 2
+width = 4
+
+class UncachedDomain(ivy_alpha.ProgressiveDomain):
+    def cube_key(self,cube):
+        return tuple((lit.polarity,lit.atom) for lit in cube)
+
+def alpha_uncached(state):
+    d = UncachedDomain(state.domain.concept_spaces,verbose = False,cache = dict())
+    state.clauses = d.post(state.clauses,state.domain.background_theory(state.in_scope),{},[])
+
+def clause_key(clauses):
+    # the order of literals, and so where sorts are printed, may vary
+    lit_key = lambda l: re.sub(r':\w+','',str(l))
+    return sorted('|'.join(sorted(lit_key(l) for l in c)) for c in clauses.clauses)
+
+def reach(mod,abstractor):
+    """ Abstract states reached by breadth-first search, following
+    only the first few states of each level """
+    ag = ivy_art.AnalysisGraph(initializer=abstractor)
+    frontier = [ag.states[0]]
+    with itp.EvalContext(check=False):
+        for d in range(depth):
+            new = []
+            for s in frontier:
+                for a in sorted(mod.public_actions):
+                    new.append(ag.execute_action(a,prestate=s,abstractor=abstractor))
+            frontier = new[:width]
+    return [clause_key(s.clauses) for s in ag.states]
+
+with im.Module():
+    ivy_init.source_file(fn,ivy_init.open_read(fn),create_isolate=False)
+    with im.module.copy():
+        ivy_isolate.create_isolate(None)
+        mod = im.module
+        with mod.theory_context():
+            ivy_alpha.opt_jobs.set('1')
+            before = time.time()
+            expected = reach(mod,alpha_uncached)
+            print 'uncached: {} states in {:.3f}s'.format(len(expected),time.time() - before)
+            for jobs in ['1','2']:
+                ivy_alpha.opt_jobs.set(jobs)
+                ivy_alpha.cube_caches.clear()
+                before = time.time()
+                res = reach(mod,ivy_alpha.alpha)
+                print 'cached, alpha_jobs={}: {} states in {:.3f}s'.format(jobs,len(res),time.time() - before)
+                if res != expected:
+                    print 'cached abstract states differ'
+                    sys.exit(1)
+print 'OK'
@@ -0,0 +1,24 @@
+import pexpect
+import sys
+
+def run(name,opts,res):
+    child = pexpect.spawn('./{}'.format(name))
+    child.logfile = sys.stdout
+    try:
+        child.expect('>')
+        child.sendline('a')
+        child.expect('>')
+        child.sendline('bench(100000)')
+        child.expect('>')
+        child.sendline('get(99999)')
+        child.expect('= 99999')
+        child.expect('>')
+        child.sendline('test(5)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('test(100000)')
+        child.expect('= 0')
+        return True
+    except pexpect.EOF:
+        print child.before
+        return False
@@ -0,0 +1,76 @@
+# Checks the congruence closure of ivy_congclos: union and find with
+# congruences, undo with push and pop, and the explanations of
+# equalities, and that the literal index of ivy_unitres groups
+# applications by their classes rather than by their head symbols.
+
+import sys
+
+import ivy.ivy_logic as il
+import ivy.ivy_congclos as cc
+import ivy.ivy_unitres as ur
+
+s = il.UninterpretedSort('s')
+a,b,c,d = [il.Symbol(n,s) for n in ['a','b','c','d']]
+f = il.Symbol('f',il.FunctionSort(s,s))
+g = il.Symbol('g',il.FunctionSort(s,s,s))
+
+failures = []
+
+def check(cond,msg):
+    if not cond:
+        print 'failed: {}'.format(msg)
+        failures.append(msg)
+
+def same(cl,t1,t2):
+    # adding t2 can merge the class of t1 by congruence
+    cl.find(t1),cl.find(t2)
+    return cl.find(t1) == cl.find(t2)
+
+cl = cc.CongClos()
+cl.union(a,b)
+check(cl.find(b) == a,'a is the label of {a,b}')
+check(same(cl,f(a),f(b)),'f(a) = f(b) by congruence')
+check(not same(cl,f(a),f(c)),'f(a) ~= f(c)')
+
+cl.push()
+version = cl.version
+cl.union(c,b)
+check(cl.version != version,'union changes the version')
+check(same(cl,f(c),f(a)),'f(c) = f(a) after c = b')
+check(same(cl,g(f(a),c),g(f(c),b)),'g(f(a),c) = g(f(c),b)')
+cl.union(f(a),d)
+check(same(cl,f(f(c)),f(d)),'f(f(c)) = f(d)')
+cl.pop()
+check(not same(cl,c,a),'pop undoes c = b')
+check(not same(cl,f(c),f(a)),'pop undoes f(c) = f(a)')
+check(not same(cl,f(a),d),'pop undoes f(a) = d')
+check(same(cl,f(a),f(b)),'pop keeps f(a) = f(b)')
+check(f(c) not in cl.tab or cl.find(f(c)) == f(c),'pop removes the classes of new terms')
+
+cl.push()
+cl.union(b,c)
+cl.union(c,d)
+expl = cl.explain(f(a),f(d))
+check(expl is not None and set(expl) == set([(a,b),(b,c),(c,d)]),
+      'f(a) = f(d) is explained by a = b, b = c, c = d: {}'.format(expl))
+check(cl.explain(a,b) == [(a,b)],'a = b is explained by itself')
+check(cl.explain(a,f(a)) is None,'a ~= f(a) has no explanation')
+cl.pop()
+check(cl.explain(f(a),f(d)) is None,'pop undoes the explanation')
+
+# The index children of f(a) and f(b) must not be grouped with f(c),
+# which has the same head symbol but is in another class.
+
+cl = cc.CongClos()
+with ur.EqualityTheory(cl):
+    node = ur.IndexNode()
+    fa,fb,fc = node.child(f(a)),node.child(f(b)),node.child(f(c))
+    check(node.class_children(f(c)) == [fc],'f(c) only matches itself')
+    cl.union(a,b)
+    check(set(node.class_children(f(a))) == set([fa,fb]),'f(a) matches f(a) and f(b)')
+    check(node.class_children(f(c)) == [fc],'f(c) still only matches itself')
+    check(node.class_children(f(d)) == [],'f(d) matches nothing')
+
+if failures:
+    sys.exit(1)
+print 'OK'
@@ -0,0 +1,34 @@
+import pexpect
+import sys
+
+def run(name,opts,res):
+    child = pexpect.spawn('./{}'.format(name))
+    child.logfile = sys.stdout
+    try:
+        child.expect('>')
+        child.sendline('mark(1)')
+        child.expect('>')
+        child.sendline('mark(1)')
+        child.expect(r'< dup\(1\)')
+        child.expect('>')
+        child.sendline('mark(2)')
+        child.expect('>')
+        child.sendeof()
+        child.expect(pexpect.EOF)
+        child.close()
+        if child.exitstatus != 0:
+            return False
+        child = pexpect.spawn('ivy_coverage {}.cov.map {}.cov'.format(name,name))
+        child.logfile = sys.stdout
+        child.expect(r'3 action +coverage1.ivy: line 20: mark')
+        child.expect(r'1 if_true')
+        child.expect(r'2 if_false')
+        child.expect(r'action +2/2 covered')
+        child.expect(r'assert +1/1 covered')
+        child.expect(r'if_false +1/1 covered')
+        child.expect(r'if_true +1/1 covered')
+        child.expect(pexpect.EOF)
+        return True
+    except pexpect.EOF:
+        print child.before
+        return False
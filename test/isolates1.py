@@ -0,0 +1,58 @@
+# Checks the actions assigned to isolates by the name trie against the
+# definition by prefixes, on a generated program with many objects,
+# and times the completeness check.
+
+import sys
+import time
+import StringIO
+
+import ivy.ivy_module as im
+import ivy.ivy_compiler as ivy_compiler
+import ivy.ivy_isolate as ivy_isolate
+
+objects = 50
+actions = 10
+
+def program():
+    lines = ["#lang ivy1.7", "", "type t", ""]
+    for i in range(objects):
+        lines.append("object o{} = {{".format(i))
+        lines.append("    relation r(X:t)")
+        for j in range(actions):
+            lines.append("    action a{}(x:t)".format(j))
+        lines.append("    object spec = {")
+        lines.append("        before a0 { assert true }")
+        lines.append("    }")
+        lines.append("    object impl = {")
+        for j in range(actions):
+            lines.append("        implement a{}(x:t) {{".format(j))
+            if i > 0:
+                lines.append("            call o{}.a{}(x);".format(i-1,j))
+            lines.append("            r(x) := true")
+            lines.append("        }")
+        lines.append("    }")
+        lines.append("}")
+        lines.append("export o{}.a0".format(i))
+    for i in range(objects):
+        lines.append("isolate iso{} = o{} with o{}".format(i,i,max(i-1,0)))
+    return '\n'.join(lines) + '\n'
+
+with im.Module():
+    ivy_compiler.ivy_load_file(StringIO.StringIO(program()),create_isolate=False)
+    mod = im.module
+    before = time.time()
+    missing = ivy_isolate.check_isolate_completeness(mod)
+    print 'completeness: {:.3f}s'.format(time.time() - before)
+    if missing:
+        sys.exit(1)
+    for name,isolate in mod.isolates.iteritems():
+        verified,present = ivy_isolate.get_isolate_info(mod,isolate,'impl')
+        save_privates = mod.privates
+        ivy_isolate.set_privates(mod,isolate)
+        verified_actions = set(a for a in mod.actions if ivy_isolate.vstartswith_eq_some(a,verified,mod))
+        present_actions = set(a for a in mod.actions if ivy_isolate.startswith_eq_some(a,present,mod))
+        mod.privates = save_privates
+        if (verified_actions,present_actions) != ivy_isolate.get_isolate_actions_present(mod,name,isolate):
+            print '{}: wrong actions'.format(name)
+            sys.exit(1)
+print 'OK'
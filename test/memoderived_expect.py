@@ -0,0 +1,40 @@
+import pexpect
+import sys
+
+def run(name,opts,res):
+    child = pexpect.spawn('./{}'.format(name))
+    child.logfile = sys.stdout
+    try:
+        child.expect('>')
+        child.sendline('set(1,2)')
+        child.expect('>')
+        child.sendline('setp(1)')
+        child.expect('>')
+        child.sendline('isreach(2)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('isreach(3)')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('istotal')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('setc(2)')
+        child.expect('>')
+        child.sendline('isboth(2)')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('isboth(1)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('count')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('clear')
+        child.expect('>')
+        child.sendline('count')
+        child.expect('= 0')
+        return True
+    except pexpect.EOF:
+        print child.before
+        return False
@@ -0,0 +1,73 @@
+// Throughput benchmark for object locks (object_locks=true).
+//
+// usage: bench [threads=4] [iters=1000000] [global=false]
+//
+// Thread i calls c<i%4>.work repeatedly. With global=true, each call is
+// wrapped in __lock()/__unlock(), which serializes the calls as a single
+// class mutex would. Every 64th call of thread 0 is to "all", which
+// needs the locks of all objects.
+
+#include "objlocks.h"
+#include <pthread.h>
+#include <stdlib.h>
+#include <string>
+#include <vector>
+#include <iostream>
+#include <sys/time.h>
+
+static objlocks *obj;
+static int iters = 1000000;
+static bool global = false;
+
+static void *run(void *arg) {
+    long thread = (long)arg;
+    for (int i = 0; i < iters; i++) {
+        int x = (i * 7 + thread) % 32;
+        if (global)
+            obj->__lock();
+        if (thread == 0 && i % 64 == 63)
+            obj->all(x);
+        else switch (thread % 4) {
+            case 0: obj->c0__work(x); break;
+            case 1: obj->c1__work(x); break;
+            case 2: obj->c2__work(x); break;
+            case 3: obj->c3__work(x); break;
+        }
+        if (global)
+            obj->__unlock();
+    }
+    return 0;
+}
+
+int main(int argc, char **argv) {
+    int threads = 4;
+    for (int i = 1; i < argc; i++) {
+        std::string arg = argv[i];
+        size_t p = arg.find('=');
+        std::string param = arg.substr(0,p), value = p == std::string::npos ? "" : arg.substr(p+1);
+        if (param == "threads")
+            threads = atoi(value.c_str());
+        else if (param == "iters")
+            iters = atoi(value.c_str());
+        else if (param == "global")
+            global = (value == "true");
+        else {
+            std::cerr << "unknown option: " << param << std::endl;
+            return 1;
+        }
+    }
+    obj = new objlocks;
+    obj->__unlock();  // the constructor returns with all locks held
+    struct timeval start,end;
+    gettimeofday(&start,0);
+    std::vector<pthread_t> ids(threads);
+    for (long t = 0; t < threads; t++)
+        pthread_create(&ids[t],0,run,(void *)t);
+    for (int t = 0; t < threads; t++)
+        pthread_join(ids[t],0);
+    gettimeofday(&end,0);
+    double secs = (end.tv_sec - start.tv_sec) + (end.tv_usec - start.tv_usec) / 1e6;
+    std::cout << "threads: " << threads << " global: " << (global ? "true" : "false")
+              << " calls/s: " << (long long)(threads * (double)iters / secs) << std::endl;
+    return 0;
+}
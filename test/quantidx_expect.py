@@ -0,0 +1,59 @@
+import pexpect
+import sys
+
+def run(name,opts,res):
+    child = pexpect.spawn('./{}'.format(name))
+    child.logfile = sys.stdout
+    try:
+        child.expect('>')
+        child.sendline('set(1,2)')
+        child.expect('>')
+        child.sendline('setp(1)')
+        child.expect('>')
+        child.sendline('has(2)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('has(3)')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('none(3)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('total')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('mixed')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('sym')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('set(2,1)')
+        child.expect('>')
+        child.sendline('sym')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('clear(1,2)')
+        child.expect('>')
+        child.sendline('has(2)')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('has(1)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('set(3,2)')
+        child.expect('>')
+        child.sendline('has(2)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('a')
+        child.expect('>')
+        child.sendline('has(1)')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('has(2)')
+        child.expect('= 0')
+        return True
+    except pexpect.EOF:
+        print child.before
+        return False
@@ -0,0 +1,46 @@
+import pexpect
+import sys
+
+def run(name,opts,res):
+    child = pexpect.spawn('./{}'.format(name))
+    child.logfile = sys.stdout
+    try:
+        child.expect('>')
+        child.sendline('a')
+        child.expect('>')
+        child.sendline('set(1,2)')
+        child.expect('>')
+        child.sendline('swap')
+        child.expect('>')
+        child.sendline('test(2,1)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('test(1,2)')
+        child.expect('= 0')
+        child.expect('>')
+        child.sendline('row(3)')
+        child.expect('>')
+        child.sendline('tests(3,4)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('shift(2)')
+        child.expect('>')
+        child.sendline('getf(2)')
+        child.expect('= 3')
+        child.expect('>')
+        child.sendline('idx(3)')
+        child.expect('>')
+        child.sendline('getg(3,0)')
+        child.expect('= 4')
+        child.expect('>')
+        child.sendline('getg(4,1)')
+        child.expect('= 1')
+        child.expect('>')
+        child.sendline('cp')
+        child.expect('>')
+        child.sendline('tests(2,1)')
+        child.expect('= 1')
+        return True
+    except pexpect.EOF:
+        print child.before
+        return False
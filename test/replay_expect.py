@@ -0,0 +1,24 @@
+import pexpect
+import sys
+
+def run(name,opts,res):
+    with open('replay_cmds.txt','w') as f:
+        f.write('recv({src:3,col:blue,ok:true})\n')
+        f.write('add(2,5)\n')
+        f.write('get\n')
+        f.write('sum\n')
+        f.write('count(3)\n')
+        f.write('count(4)\n')
+    child = pexpect.spawn('./{} replay=replay_cmds.txt'.format(name))
+    child.logfile = sys.stdout
+    try:
+        child.expect(r'= {src:3,col:blue,ok:1}')
+        child.expect('= 7')
+        child.expect('= 1')
+        child.expect('= 0')
+        child.expect(pexpect.EOF)
+        child.close()
+        return child.exitstatus == 0
+    except pexpect.EOF:
+        print child.before
+        return False
@@ -64,6 +64,10 @@ checks = [
           ['strat1','error: The verification condition is not in logic epr'],
           ['skolem1','error: failed checks: 1'],
           ['ifstar1','OK'],
+          ['proving10','OK'],
+          ['test_liveness2','OK'],
+          ['test_liveness2_bad','for temporal property test_liveness2_bad.ivy: line 35: toggle.iso.spec.stays_off'],
+          ['houdini','houdini=true',r'inductive invariant consists of the following conjectures:\s+\S+ line 40: mutex\s+\S+ line 41: sem\s+\S+ line 45: dep\s[\s\S]*\nOK'],
       ]
     ],
 ]
@@ -84,6 +88,25 @@ tests = [
          ['token_ring','isolate=iso_n','test_completed'],
          ['token_ring','isolate=iso_pt','test_completed'],
       ]
+     ],
+    ['.',
+      [
+         ['genbench','test_completed'],
+         ['genbench','incremental_state=false','test_completed'],
+      ]
+     ]
+]
+
+# tester runs with options: [name, build options, tester options, result]
+tester_runs = [
+    ['../doc/examples/testing',
+      [
+         ['trivnet','','iters=10 branches=3 branch_at=5',r'test_completed[\s\S]*test_completed[\s\S]*test_completed'],
+         ['trivnet','','iters=10 branches=3 branch_at=5 branch_fork=false',r'test_completed[\s\S]*test_completed[\s\S]*test_completed'],
+         ['trivnet','','iters=10 branch_at=5 snapshot=trivnet.snap','test_completed'],
+         ['trivnet','','iters=10 branch_at=5 restore=trivnet.snap seed=9','test_completed'],
+         ['trivnet','','restore=nosuchfile.snap','cannot open snapshot file'],
+      ]
      ]
 ]
 
@@ -104,6 +127,23 @@ repls = [
          ['paraminit','isolate=iso_foo',None],
          ['paraminit3','isolate=iso_foo',None],
       ]
+     ],
+    ['.',
+      [
+         ['udp_compact','isolate=iso_impl','ser_format=compact',None],
+         ['bigupdate',None],
+         ['relasgn',None],
+         ['relasgn','shards=3','relasgn_expect'],
+         ['relasgn','pgo=true','pgo_trace=relasgn_pgo.iev','relasgn_expect'],
+         ['quantidx',None],
+         ['quantidx','quant_index=true','quantidx_expect'],
+         ['serbench','ser_bench=true',None],
+         ['memoderived',None],
+         ['memoderived','memo_derived=lazy','memoderived_expect'],
+         ['memoderived','memo_derived=eager','memoderived_expect'],
+         ['replay',None],
+         ['coverage1','coverage=true',None],
+      ]
      ]
 ]
 
@@ -116,11 +156,74 @@ to_cpps = [
          ['paraminit','target=repl','error: cannot compile initial constraint on "foo.bit" because type t is large. suggest using "after init"'],
          ['paraminit2','target=repl','isolate=iso_foo','initial condition depends on stripped parameter'],
       ]
+     ],
+    ['objlocks',
+      [
+         ['objlocks','target=class','object_locks=true','build=true',None],
+      ]
+     ],
+    ['.',
+      [
+         ['relasgn','target=repl','build=true',None],
+         ['relasgn','target=repl','build=true','unchanged, using cached build'],
+         ['relasgn','target=repl','build=true','pch=true','build_cache=false',r'-include \S*ivy_pch\.h -o relasgn'],
+         ['relasgn','target=class','build=true','pgo=true','pgo_trace=relasgn_pgo.iev',None],
+         ['relasgn','target=repl','build=true','pgo=true','test_iters=20',None],
+      ]
+     ]
+]
+
+infers = [
+    ['../doc/examples',
+      [
+         ['client_server_example','conjecture .*~semaphore'],
+      ]
+     ],
+    ['.',
+      [
+         ['infer1',r'conjecture \(q\(V0\) \| ~p\(V0\)\)'],
+         ['infer2','assertion failed in b'],
+         ['infer3','conjecture conj1 is false'],
+      ]
+     ]
+]
+
+bmcs = [
+    ['../doc/examples',
+      [
+         ['client_server_example','bound=4','OK'],
+      ]
+     ],
+    ['../doc/examples/testing',
+      [
+         ['pingpong_bad','isolate=iso_l','assertion failed in left_player.hit'],
+      ]
+     ]
+]
+
+farms = [
+    ['../doc/examples/testing',
+      [
+         ['trivnet','runs=4','OK'],
+         ['pingpong_bad','isolate=iso_l','runs=4','failing seed'],
+      ]
+     ]
+]
+
+scripts = [
+    ['.',
+      [
+         ['alpha1','OK'],
+         ['congclos1','OK'],
+         ['isolates1','OK'],
+         ['unitres1','OK'],
+      ]
      ]
 ]
 
 
 class Test(object):
+    expect_timeout = 30
     def __init__(self,dir,args):
         self.dir,self.name,self.res,self.opts = dir,args[0],args[-1],args[1:-1]
     def run(self):
@@ -149,7 +252,7 @@ class Test(object):
         child = spawn(command)
 #        child.logfile = sys.stdout
         try:
-            child.expect(self.res)
+            child.expect(self.res,timeout=self.expect_timeout)
             return True
         except pexpect.EOF:
             print child.before
@@ -161,8 +264,8 @@ class IvyCheck(Test):
     def command(self):
         import platform
         if platform.system() == 'Windows':
-            return 'ivy_check {}.ivy'.format(self.name)
-        return 'timeout 100 ivy_check {}.ivy'.format(self.name)
+            return 'ivy_check {} {}.ivy'.format(' '.join(self.opts),self.name)
+        return 'timeout 100 ivy_check {} {}.ivy'.format(' '.join(self.opts),self.name)
 
 class IvyTest(Test):
     def command(self):
@@ -172,6 +275,13 @@ class IvyTest(Test):
     def preprocess_commands(self):
         return ['ivy_to_cpp target=test build=true '+' '.join(self.opts) + ' '+self.name+'.ivy']
 
+class IvyTestRun(IvyTest):
+    def command(self):
+        return './{} {}'.format(self.name,self.opts[1])
+
+    def preprocess_commands(self):
+        return ['ivy_to_cpp target=test build=true '+self.opts[0]+' '+self.name+'.ivy']
+
 class IvyRepl(Test):
     def command(self):
         return './'+self.name
@@ -188,6 +298,44 @@ class IvyToCpp(Test):
         res = 'ivy_to_cpp ' + ' '.join(self.opts) + ' '+self.name+'.ivy'
         print 'compiling: {}'.format(res)
         return res
+    def expect(self):
+        # with no expected output, the command must succeed
+        if self.res != None:
+            return Test.expect(self)
+        child = spawn(self.command())
+        child.expect(pexpect.EOF,timeout=self.expect_timeout)
+        child.close()
+        if child.exitstatus != 0:
+            print child.before
+            return False
+        return True
+
+class IvyInfer(Test):
+    def command(self):
+        import platform
+        if platform.system() == 'Windows':
+            return 'ivy_infer {} {}.ivy'.format(' '.join(self.opts),self.name)
+        return 'timeout 100 ivy_infer {} {}.ivy'.format(' '.join(self.opts),self.name)
+
+class IvyBmc(Test):
+    def command(self):
+        import platform
+        if platform.system() == 'Windows':
+            return 'ivy_bmc {} {}.ivy'.format(' '.join(self.opts),self.name)
+        return 'timeout 100 ivy_bmc {} {}.ivy'.format(' '.join(self.opts),self.name)
+
+class IvyTestFarm(Test):
+    expect_timeout = 300
+    def command(self):
+        import platform
+        if platform.system() == 'Windows':
+            return 'ivy_test_farm {} {}.ivy'.format(' '.join(self.opts),self.name)
+        return 'timeout 300 ivy_test_farm {} {}.ivy'.format(' '.join(self.opts),self.name)
+
+class IvyScript(Test):
+    expect_timeout = 300
+    def command(self):
+        return 'python {}.py'.format(self.name)
 
 all_tests = []
 
@@ -199,8 +347,13 @@ def get_tests(cls,arr):
 
 get_tests(IvyCheck,checks)
 get_tests(IvyTest,tests)
+get_tests(IvyTestRun,tester_runs)
 get_tests(IvyRepl,repls)
 get_tests(IvyToCpp,to_cpps)
+get_tests(IvyInfer,infers)
+get_tests(IvyBmc,bmcs)
+get_tests(IvyTestFarm,farms)
+get_tests(IvyScript,scripts)
 
 num_failures = 0
 for test in all_tests:
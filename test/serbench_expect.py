@@ -0,0 +1,15 @@
+import pexpect
+import sys
+
+def run(name,opts,res):
+    child = pexpect.spawn('./{} ser_bench=100'.format(name))
+    child.logfile = sys.stdout
+    try:
+        for t in ['int','bool','string','color','msg']:
+            for fmt in ['binary','compact']:
+                if child.expect(['round trip failed','{} {}: \d+ bytes'.format(t,fmt)]) == 0:
+                    return False
+        return True
+    except pexpect.EOF:
+        print child.before
+        return False
@@ -0,0 +1,16 @@
+import pexpect
+import sys
+
+def run(name,opts,res):
+    child = pexpect.spawn('./{}'.format(name))
+    child.logfile = sys.stdout
+    try:
+        child.expect('>')
+        child.sendline('foo.send(0,1,{src:0,ack:true,col:blue,val:40000,num:3})')
+        child.expect(r'< foo.recv\(1,{src:0,ack:1,col:blue,val:40000,num:3}\)')
+        child.sendline('foo.send(1,0,{src:1,ack:false,col:green,val:65535,num:0})')
+        child.expect(r'< foo.recv\(0,{src:1,ack:0,col:green,val:65535,num:0}\)')
+        return True
+    except pexpect.EOF:
+        print child.before
+        return False
@@ -0,0 +1,102 @@
+# Benchmark of unit resolution on the clause sets produced when
+# computing diagrams for some of the examples in doc/examples. For
+# each exported action, we compute the image of the initial states, the
+# diagram of one of its models, and the preimage of the diagram, and
+# we time ivy_solver.clauses_case on the image and the preimage. We
+# also time it on the image of the initial states after a sequence of
+# steps, which exercises the equational reasoning.
+#
+# Each result is checked against clauses_case with the children of the
+# index nodes found by scanning them all, as before they were grouped
+# by class. The script exits with status 1 if the results differ.
+
+import sys
+import time
+
+import ivy.ivy_init as ivy_init
+import ivy.ivy_module as im
+import ivy.ivy_isolate as ivy_isolate
+import ivy.ivy_actions as act
+import ivy.ivy_logic_utils as lut
+import ivy.ivy_solver as slv
+import ivy.ivy_transrel as itr
+import ivy.ivy_unitres as ur
+
+steps = 16
+
+examples = [
+    ('client_server_example',None),
+    ('trivnet',None),
+    ('udp_test','foo.iso'),
+]
+
+def initial_states(mod,axioms):
+    init = mod.init_cond
+    if mod.initializers:
+        action = act.Sequence(*[a for n,a in mod.initializers])
+        init = itr.forward_image(init,axioms,action.update(mod,None))
+    return init
+
+def clause_sets(mod):
+    axioms = mod.background_theory()
+    init = initial_states(mod,axioms)
+    for name in sorted(mod.public_actions):
+        upd = mod.actions[name].update(mod,None)
+        post = itr.forward_image(init,axioms,upd)
+        model = itr.small_model_clauses(lut.and_clauses(post,axioms),shrink=False)
+        if model is None:
+            continue
+        ignore = lambda s: s.is_skolem() or itr.is_new(s)
+        diagram = slv.clauses_model_to_diagram(post,ignore,model=model,axioms=axioms,
+                                               weaken=False,numerals=True)
+        yield name,post
+        yield name,itr.reverse_image(diagram,axioms,upd)
+    names = sorted(mod.public_actions)
+    state = init
+    for i in range(steps):
+        state = itr.forward_image(state,axioms,mod.actions[names[i % len(names)]].update(mod,None))
+    yield '{} steps'.format(steps),state
+
+def scan_class_children(self,term):
+    find = ur.equational_theory.find
+    find(term)
+    keys = [key for key in self.children if key != "V"]
+    for key in keys:
+        find(key)
+    return [self.children[key] for key in keys if find(key) == find(term)]
+
+def clauses_case_scan(clauses):
+    class_children = ur.IndexNode.class_children
+    ur.IndexNode.class_children = scan_class_children
+    try:
+        return slv.clauses_case(clauses)
+    finally:
+        ur.IndexNode.class_children = class_children
+
+def clause_key(clauses):
+    return sorted(str(f) for f in clauses.fmlas)
+
+total = 0.0
+for example,isolate in examples:
+    fn = '../doc/examples/' + example + '.ivy'
+    with im.Module():
+        ivy_init.source_file(fn,ivy_init.open_read(fn),create_isolate=False)
+        with im.module.copy():
+            ivy_isolate.create_isolate(isolate)
+            mod = im.module
+            with mod.theory_context():
+                for name,clauses in clause_sets(mod):
+                    before = time.time()
+                    res = slv.clauses_case(clauses)
+                    elapsed = time.time() - before
+                    total += elapsed
+                    if not slv.clauses_sat(lut.and_clauses(res,clauses)):
+                        print '{}: {}: result is inconsistent'.format(example,name)
+                        sys.exit(1)
+                    if clause_key(res) != clause_key(clauses_case_scan(clauses)):
+                        print '{}: {}: result differs from the scanned index'.format(example,name)
+                        sys.exit(1)
+                    print '{}: {}: {} clauses -> {} clauses in {:.3f}s'.format(
+                        example,name,len(clauses.clauses),len(res.clauses),elapsed)
+print 'total: {:.3f}s'.format(total)
+print 'OK'